@@ -0,0 +1,74 @@
+"""Бенчмарк памяти, занимаемой элементами ответов: схемы pydantic против компактных записей.
+
+Для каждого элемента строится схема (`model_validate_json`), затем схема
+преобразуется в компактную запись (`to_compact`). Выводится количество байтов
+на элемент, которое удерживают в памяти `count` элементов в каждом из
+представлений, и время преобразования.
+
+Запуск:
+    python benchmarks/bench_compact.py --items 100000
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import fixtures  # noqa: E402
+from ozonapi.seller.core.compact import to_compact  # noqa: E402
+from ozonapi.seller.schemas.fbs import PostingFBSPosting  # noqa: E402
+from ozonapi.seller.schemas.prices_and_stocks import ProductInfoPricesItem, ProductInfoStocksItem  # noqa: E402
+from ozonapi.seller.schemas.products import ProductInfoListItem  # noqa: E402
+
+CASES = (
+    ("product_info_list", ProductInfoListItem, fixtures.product_info_list_item),
+    ("posting_fbs_list", PostingFBSPosting, fixtures.posting_fbs_item),
+    ("product_info_prices", ProductInfoPricesItem, fixtures.product_info_prices_item),
+    ("product_info_stocks", ProductInfoStocksItem, fixtures.product_info_stocks_item),
+)
+
+
+def retained(build) -> tuple[object, int]:
+    """Возвращает результат построения и объем памяти, который он удерживает."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def main(count: int) -> None:
+    for name, model, factory in CASES:
+        bodies = [json.dumps(factory(i)).encode() for i in range(count)]
+        models, models_size = retained(lambda: [model.model_validate_json(body) for body in bodies])
+
+        started = time.perf_counter()
+        for item in models:
+            to_compact(item)
+        elapsed = time.perf_counter() - started
+        del models
+
+        # Схема каждого элемента удаляется сразу после преобразования, остаются только записи
+        records, records_size = retained(lambda: [to_compact(model.model_validate_json(body)) for body in bodies])
+        del records, bodies
+
+        print(
+            f"{name:<20} items={count} "
+            f"pydantic={models_size / count:>6.0f}B/item "
+            f"compact={records_size / count:>6.0f}B/item "
+            f"ratio={models_size / records_size:.2f}x "
+            f"to_compact={elapsed / count * 1e6:.1f}us/item"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100000)
+    args = parser.parse_args()
+    main(args.items)
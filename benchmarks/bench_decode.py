@@ -0,0 +1,81 @@
+"""Бенчмарк разбора больших ответов API: словарь + валидация против `model_validate_json`.
+
+Сравнивает прежний путь `Model(**json.loads(body))` с прямой валидацией байтов
+через `Model.model_validate_json(body)` по времени и пиковому потреблению памяти,
+а также построение схемы без валидации (`ResponseMode.CONSTRUCT`).
+
+Запуск:
+    python benchmarks/bench_decode.py --items 1000 --repeat 5
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import fixtures  # noqa: E402
+from ozonapi.seller.core.response import construct_model  # noqa: E402
+from ozonapi.seller.schemas.fbs import PostingFBSListResponse  # noqa: E402
+from ozonapi.seller.schemas.prices_and_stocks import ProductInfoPricesResponse, ProductInfoStocksResponse  # noqa: E402
+from ozonapi.seller.schemas.products import ProductInfoListResponse  # noqa: E402
+
+CASES = (
+    ("product_info_list", ProductInfoListResponse, fixtures.product_info_list_response),
+    ("posting_fbs_list", PostingFBSListResponse, fixtures.posting_fbs_list_response),
+    ("product_info_prices", ProductInfoPricesResponse, fixtures.product_info_prices_response),
+    ("product_info_stocks", ProductInfoStocksResponse, fixtures.product_info_stocks_response),
+)
+
+
+def via_dict(model, body: bytes):
+    return model(**json.loads(body))
+
+
+def via_json(model, body: bytes):
+    return model.model_validate_json(body)
+
+
+def via_construct(model, body: bytes):
+    return construct_model(model, json.loads(body))
+
+
+def measure(decode, model, body: bytes, repeat: int) -> tuple[float, int]:
+    """Возвращает лучшее время разбора в секундах и пиковое выделение памяти в байтах."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decode(model, body)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    result = decode(model, body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return best, peak
+
+
+def main(items: int, repeat: int) -> None:
+    for name, model, factory in CASES:
+        body = fixtures.encode(factory(items))
+        dict_time, dict_peak = measure(via_dict, model, body, repeat)
+        json_time, json_peak = measure(via_json, model, body, repeat)
+        construct_time, construct_peak = measure(via_construct, model, body, repeat)
+        print(
+            f"{name:<20} body={len(body) / 1024:>8.0f}KiB "
+            f"dict={dict_time * 1000:>7.1f}ms/{dict_peak / 2 ** 20:>6.1f}MiB "
+            f"json={json_time * 1000:>7.1f}ms/{json_peak / 2 ** 20:>6.1f}MiB "
+            f"construct={construct_time * 1000:>7.1f}ms/{construct_peak / 2 ** 20:>6.1f}MiB "
+            f"speedup={dict_time / json_time:.2f}x memory={json_peak / dict_peak:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.items, args.repeat)
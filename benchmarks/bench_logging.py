@@ -0,0 +1,90 @@
+"""Бенчмарк затрат процессора на логирование запросов при выключенном уровне INFO.
+
+Запускает локальную заглушку Seller API (`fake_ozon`) и выполняет серию
+последовательных запросов `v4/product/info/stocks` без схемы ответа со
+страницами по 1000 товаров. Сравниваются встроенный `LoggingMiddleware` и
+воспроизведение прежнего логирования, которое при любом уровне лога
+сериализовало тело запроса, форматировало сообщения и вычисляло размер
+ответа через `len(str(data))`. Заглушка работает в том же процессе, поэтому
+ее затраты входят в оба замера одинаково; разница показывает затраты логирования.
+
+Запуск:
+    python benchmarks/bench_logging.py --requests 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import fake_ozon  # noqa: E402
+from ozonapi.seller.core import APIConfig, APIManager, LoggingMiddleware, Middleware  # noqa: E402
+
+PAYLOAD = {"cursor": "", "filter": {"visibility": "ALL"}, "limit": 1000}
+
+
+class LegacyLoggingMiddleware(Middleware):
+    """Логирование в виде до отказа от форматирования при выключенном уровне."""
+
+    async def pre_send(self, ctx):
+        payload = json.dumps(ctx.payload)
+        snippet = payload if len(payload) < 200 else payload[:200] + "..."
+        log_context = {"method": ctx.method, "endpoint": ctx.versioned_endpoint, "payload": snippet}
+        ctx.client.logger.info(f"Отправка запроса к API: {log_context}")
+
+    async def post_receive(self, ctx):
+        log_context = {
+            "endpoint": ctx.versioned_endpoint,
+            "status_code": ctx.status,
+            "response_size": len(str(ctx.data)),
+        }
+        ctx.client.logger.info(f"Получен ответ от API: {log_context}")
+
+
+async def run(base_url: str, legacy: bool, requests: int) -> list[float]:
+    """Выполняет серию запросов и возвращает процессорное время каждого запроса."""
+    config = APIConfig(client_id="bench", api_key="bench", base_url=base_url, max_retries=0, log_level="ERROR")
+    cpu_times = []
+    async with APIManager(config=config) as api:
+        if legacy:
+            logging_middleware = next(item for item in api.middleware if isinstance(item, LoggingMiddleware))
+            api.remove_middleware(logging_middleware)
+            api.add_middleware(LegacyLoggingMiddleware())
+        for _ in range(requests):
+            started = time.process_time()
+            await api._request(api_version="v4", endpoint="product/info/stocks", payload=PAYLOAD)
+            cpu_times.append(time.process_time() - started)
+    await APIManager.shutdown()
+    return cpu_times
+
+
+async def main(requests: int) -> None:
+    server = await fake_ozon.start_server()
+    base_url = str(server.make_url("")).rstrip("/")
+    try:
+        # Прогрев соединений и кешей интерпретатора
+        await run(base_url, False, 10)
+        results = {}
+        for legacy in (True, False):
+            cpu_times = await run(base_url, legacy, requests)
+            results[legacy] = statistics.median(cpu_times)
+            print(
+                f"{'legacy' if legacy else 'current':<8} "
+                f"cpu_mean={statistics.mean(cpu_times) * 1000:.3f}ms "
+                f"cpu_p50={results[legacy] * 1000:.3f}ms"
+            )
+        print(f"saved_p50={(results[True] - results[False]) * 1000:.3f}ms per request")
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,88 @@
+"""Микробенчмарк накладных расходов механизма повторов на один запрос.
+
+Сравнивает обертку успешного запроса (без сбоев) двумя способами:
+созданием декоратора tenacity на каждый запрос, как было раньше, и
+предварительно созданной политикой `RetryPolicy` с общим `RetryBudget`.
+Запрос заменен пустой корутиной, поэтому замер показывает только
+стоимость механизма повторов.
+
+Запуск:
+    python benchmarks/bench_retry.py --requests 100000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ozonapi.seller.core.exceptions import APIServerError, APITooManyRequestsError  # noqa: E402
+from ozonapi.seller.core.retry import RetryBudget, RetryPolicy  # noqa: E402
+
+
+async def execute_request() -> dict:
+    return {"result": "ok"}
+
+
+async def with_policy(policy: RetryPolicy, budget: RetryBudget) -> dict:
+    """Повторяет запрос по предварительно созданной политике."""
+    budget.deposit()
+    attempt = 0
+    while True:
+        try:
+            return await execute_request()
+        except policy.retry_on as e:
+            attempt += 1
+            if attempt > policy.max_retries:
+                raise
+            if not isinstance(e, APITooManyRequestsError) and not budget.try_withdraw():
+                raise
+            await asyncio.sleep(policy.get_delay(attempt, e))
+
+
+async def with_tenacity() -> dict:
+    """Создает декоратор повторов на каждый запрос."""
+    from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+    decorator = retry(
+        retry=retry_if_exception_type((APIServerError, APITooManyRequestsError, asyncio.TimeoutError)),
+        stop=stop_after_attempt(6),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        after=lambda retry_state: None,
+        reraise=True,
+    )
+    return await decorator(execute_request)()
+
+
+async def measure(factory, requests: int) -> float:
+    """Возвращает среднее время одного запроса в микросекундах."""
+    started = time.perf_counter()
+    for _ in range(requests):
+        await factory()
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def main(requests: int) -> None:
+    policy = RetryPolicy(max_retries=5, min_wait=2, max_wait=10)
+    budget = RetryBudget()
+
+    baseline = await measure(execute_request, requests)
+    print(f"{'no retry':<18} {baseline:.3f}us/request")
+    policy_time = await measure(lambda: with_policy(policy, budget), requests)
+    print(f"{'retry policy':<18} {policy_time:.3f}us/request overhead={policy_time - baseline:.3f}us")
+
+    try:
+        import tenacity  # noqa: F401
+    except ImportError:
+        print(f"{'tenacity':<18} skipped: tenacity is not installed")
+        return
+    tenacity_time = await measure(with_tenacity, requests)
+    print(f"{'tenacity per call':<18} {tenacity_time:.3f}us/request overhead={tenacity_time - baseline:.3f}us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,79 @@
+"""Бенчмарк задержки последовательных запросов с пуловыми и одноразовыми HTTP-сессиями.
+
+Запускает локальный aiohttp-сервер, имитирующий API Ozon, и выполняет серию
+последовательных запросов через `APIManager._request` в двух режимах:
+с сохранением сессии между запросами и с созданием сессии на каждый запрос.
+Запросы отправляются с паузой, чтобы ограничитель запросов не влиял на замер.
+
+Запуск:
+    python benchmarks/bench_sessions.py --requests 500
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ozonapi.seller.core import APIConfig, APIManager  # noqa: E402
+
+
+async def start_server() -> TestServer:
+    """Запускает локальную заглушку API."""
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response({"result": {"ok": True}})
+
+    app = web.Application()
+    app.router.add_post("/v1/bench", handler)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    return server
+
+
+async def run(base_url: str, pooled: bool, requests: int, pause: float) -> tuple[list[float], dict]:
+    """Выполняет серию последовательных запросов и возвращает задержки и счетчики соединений."""
+    APIManager._session_manager = None
+    config = APIConfig(
+        client_id="bench", api_key="bench", base_url=base_url,
+        session_pooling=pooled, max_requests_per_second=50, max_retries=0,
+    )
+    latencies = []
+    async with APIManager(config=config) as api:
+        for _ in range(requests):
+            started = time.perf_counter()
+            await api._request(endpoint="bench", payload={})
+            latencies.append(time.perf_counter() - started)
+            await asyncio.sleep(pause)
+        stats = (await APIManager.get_session_stats())["bench"]
+    await APIManager.shutdown()
+    return latencies, stats
+
+
+async def main(requests: int, pause: float) -> None:
+    server = await start_server()
+    base_url = str(server.make_url("")).rstrip("/")
+    try:
+        for pooled in (False, True):
+            latencies, stats = await run(base_url, pooled, requests, pause)
+            print(
+                f"pooled={pooled!s:<5} "
+                f"mean={statistics.mean(latencies) * 1000:.3f}ms "
+                f"p50={statistics.median(latencies) * 1000:.3f}ms "
+                f"connections_created={stats['connections_created']} "
+                f"connections_reused={stats['connections_reused']}"
+            )
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--pause", type=float, default=0.05, help="Пауза между запросами в секундах")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.pause))
@@ -0,0 +1,71 @@
+"""Локальная заглушка api-seller.ozon.ru для бенчмарков.
+
+Отвечает на несколько методов Seller API заранее закодированными ответами из
+`fixtures`, поэтому затраты сервера на запрос минимальны и одинаковы для всех
+сравниваемых клиентов. Время поступления запросов записывается, чтобы
+проверять фактическую частоту запросов на стороне сервера.
+"""
+import json
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import fixtures
+
+ARRIVALS = web.AppKey("arrivals", list)
+
+PRODUCT_INFO_LIMIT = json.dumps({
+    "daily_create": {"limit": 1000, "reset_at": "2024-01-16T00:00:00Z", "usage": 10},
+    "daily_update": {"limit": 5000, "reset_at": "2024-01-16T00:00:00Z", "usage": 100},
+    "total": {"limit": 100000, "usage": 5000},
+}).encode()
+
+
+def _json(body: bytes, status: int = 200) -> web.Response:
+    return web.Response(body=body, status=status, content_type="application/json")
+
+
+def create_app(catalog_size: int = 10000) -> web.Application:
+    """Создает приложение заглушки.
+
+    Args:
+        catalog_size: Количество товаров в каталоге для постраничных методов
+    """
+    stocks = [fixtures.encode(fixtures.product_info_stocks_item(i)) for i in range(catalog_size)]
+    arrivals: list[float] = []
+
+    @web.middleware
+    async def authorize(request: web.Request, handler):
+        arrivals.append(time.monotonic())
+        headers = request.headers
+        if "Authorization" not in headers and ("Client-Id" not in headers or "Api-Key" not in headers):
+            return _json(b'{"code": 7, "message": "Client-Id and Api-Key headers are required"}', status=401)
+        return await handler(request)
+
+    async def product_info_limit(request: web.Request) -> web.Response:
+        return _json(PRODUCT_INFO_LIMIT)
+
+    async def product_info_stocks(request: web.Request) -> web.Response:
+        payload = await request.json()
+        limit = min(int(payload.get("limit") or 100), 1000)
+        start = int(payload.get("cursor") or 0)
+        page = stocks[start:start + limit]
+        cursor = str(start + limit) if start + limit < len(stocks) else ""
+        return _json(
+            b'{"cursor": "' + cursor.encode() + b'", "total": ' + str(len(stocks)).encode()
+            + b', "items": [' + b",".join(page) + b"]}"
+        )
+
+    app = web.Application(middlewares=[authorize])
+    app[ARRIVALS] = arrivals
+    app.router.add_post("/v4/product/info/limit", product_info_limit)
+    app.router.add_post("/v4/product/info/stocks", product_info_stocks)
+    return app
+
+
+async def start_server(catalog_size: int = 10000) -> TestServer:
+    """Запускает заглушку на свободном порту локального хоста."""
+    server = TestServer(create_app(catalog_size), host="127.0.0.1")
+    await server.start_server()
+    return server
@@ -0,0 +1,263 @@
+"""Синтетические ответы API для бенчмарков.
+
+Структура элементов повторяет реальные ответы Ozon Seller API, значения
+варьируются по номеру элемента, чтобы исключить кеширование строк.
+"""
+import json
+
+
+def product_info_list_item(i: int) -> dict:
+    """Элемент ответа /v3/product/info/list."""
+    return {
+        "barcodes": [f"OZN{1000000000 + i}"],
+        "color_image": [],
+        "commissions": [
+            {
+                "delivery_amount": 100.0,
+                "percent": 15.0,
+                "return_amount": 50.0,
+                "sale_schema": schema,
+                "value": 150.0 + i % 100,
+                "currency_code": "RUB",
+            }
+            for schema in ("FBO", "FBS", "RFBS")
+        ],
+        "created_at": "2024-01-15T10:00:00.000Z",
+        "currency_code": "RUB",
+        "description_category_id": 17028922,
+        "discounted_fbo_stocks": 0,
+        "errors": [],
+        "has_discounted_fbo_item": False,
+        "id": 100000000 + i,
+        "images": [f"https://cdn1.ozone.ru/s3/multimedia-{i}/{n}.jpg" for n in range(5)],
+        "images360": [],
+        "is_archived": False,
+        "is_autoarchived": False,
+        "is_discounted": False,
+        "is_kgt": False,
+        "is_prepayment_allowed": True,
+        "is_super": False,
+        "marketing_price": "",
+        "min_price": str(900 + i % 100),
+        "model_info": {"count": 1, "model_id": 200000000 + i},
+        "name": f"Товар номер {i} с достаточно длинным названием для реалистичности",
+        "offer_id": f"OFFER-{i:08d}",
+        "old_price": str(1500 + i % 100),
+        "price": str(1000 + i % 100),
+        "price_indexes": {
+            "color_index": "COLOR_INDEX_WITHOUT_INDEX",
+            "external_index_data": {
+                "minimal_price": "990", "minimal_price_currency": "RUB", "price_index_value": 1.01,
+            },
+            "ozon_index_data": {
+                "minimal_price": "980", "minimal_price_currency": "RUB", "price_index_value": 1.02,
+            },
+            "self_marketplaces_index_data": {
+                "minimal_price": "995", "minimal_price_currency": "RUB", "price_index_value": 1.0,
+            },
+        },
+        "primary_image": [f"https://cdn1.ozone.ru/s3/multimedia-{i}/0.jpg"],
+        "sources": [
+            {
+                "sku": 300000000 + i,
+                "source": "sds",
+                "created_at": "2024-01-15T10:00:00.000Z",
+                "quant_code": "",
+                "shipment_type": "SHIPMENT_TYPE_GENERAL",
+            }
+        ],
+        "statuses": {
+            "status": "price_sent",
+            "status_failed": "",
+            "moderate_status": "approved",
+            "validation_status": "success",
+            "status_name": "Готов к продаже",
+            "status_description": "",
+            "is_created": True,
+            "status_tooltip": "",
+            "status_updated_at": "2024-02-01T12:00:00.000Z",
+        },
+        "stocks": {
+            "has_stock": True,
+            "stocks": [
+                {"present": i % 50, "reserved": i % 3, "sku": 300000000 + i, "source": "fbs"},
+                {"present": i % 70, "reserved": 0, "sku": 300000000 + i, "source": "fbo"},
+            ],
+        },
+        "type_id": 91565,
+        "updated_at": "2024-02-01T12:00:00.000Z",
+        "vat": "0.2",
+        "visibility_details": {"has_price": True, "has_stock": True},
+        "volume_weight": 0.5,
+    }
+
+
+def product_info_stocks_item(i: int) -> dict:
+    """Элемент ответа /v4/product/info/stocks."""
+    return {
+        "offer_id": f"OFFER-{i:08d}",
+        "product_id": 100000000 + i,
+        "stocks": [
+            {
+                "present": i % 50,
+                "reserved": i % 3,
+                "shipment_type": "SHIPMENT_TYPE_GENERAL",
+                "sku": 300000000 + i,
+                "type": warehouse_type,
+                "warehouse_ids": [22142605386000],
+            }
+            for warehouse_type in ("fbs", "fbo")
+        ],
+    }
+
+
+def product_info_prices_item(i: int) -> dict:
+    """Элемент ответа /v5/product/info/prices."""
+    index_data = {"min_price": 990.0, "min_price_currency": "RUB", "price_index_value": 1.01}
+    return {
+        "acquiring": 1.5,
+        "commissions": {
+            "sales_percent_fbo": 15.0,
+            "sales_percent_fbs": 16.0,
+            "fbo_direct_flow_trans_min_amount": 30.0,
+            "fbo_direct_flow_trans_max_amount": 60.0,
+            "fbo_deliv_to_customer_amount": 25.0,
+            "fbo_return_flow_amount": 20.0,
+            "fbs_first_mile_min_amount": 0.0,
+            "fbs_first_mile_max_amount": 25.0,
+            "fbs_direct_flow_trans_min_amount": 40.0,
+            "fbs_direct_flow_trans_max_amount": 70.0,
+            "fbs_deliv_to_customer_amount": 25.0,
+            "fbs_return_flow_amount": 20.0,
+        },
+        "marketing_actions": {
+            "actions": [
+                {
+                    "date_from": "2024-01-01T00:00:00Z",
+                    "date_to": "2024-12-31T23:59:59Z",
+                    "title": f"Акция {i % 10}",
+                    "value": 10.0,
+                }
+            ],
+            "current_period_from": "2024-01-01T00:00:00Z",
+            "current_period_to": "2024-12-31T23:59:59Z",
+            "ozon_actions_exist": True,
+        },
+        "offer_id": f"OFFER-{i:08d}",
+        "price": {
+            "auto_action_enabled": False,
+            "auto_add_to_ozon_actions_list_enabled": False,
+            "currency_code": "RUB",
+            "marketing_price": 950.0,
+            "marketing_seller_price": 980.0,
+            "min_price": 900.0,
+            "net_price": 700.0,
+            "old_price": 1500.0,
+            "price": 1000.0 + i % 100,
+            "retail_price": 0.0,
+            "vat": 0.2,
+        },
+        "price_indexes": {
+            "color_index": "WITHOUT_INDEX",
+            "external_index_data": index_data,
+            "ozon_index_data": index_data,
+            "self_marketplaces_index_data": index_data,
+        },
+        "product_id": 100000000 + i,
+        "volume_weight": 0.5,
+    }
+
+
+def posting_fbs_item(i: int) -> dict:
+    """Элемент ответа /v3/posting/fbs/list."""
+    return {
+        "addressee": None,
+        "analytics_data": None,
+        "available_actions": ["arbitration"],
+        "barcodes": None,
+        "cancellation": None,
+        "customer": None,
+        "delivering_date": "2023-11-03T10:00:00Z",
+        "delivery_method": {
+            "id": 21321684811000,
+            "name": "Курьерская доставка",
+            "warehouse_id": 15588127982000,
+            "tpl_provider": "Ozon Логистика",
+            "tpl_provider_id": 24,
+            "warehouse": "Основной склад",
+        },
+        "financial_data": None,
+        "in_process_at": "2023-11-03T09:00:00Z",
+        "is_express": False,
+        "is_multibox": False,
+        "legal_info": None,
+        "multi_box_qty": None,
+        "optional": None,
+        "order_id": 500000000 + i,
+        "order_number": f"ORDER-{i}",
+        "parent_posting_number": None,
+        "pickup_code_verified_at": None,
+        "posting_number": f"{40000000 + i}-0001-1",
+        "products": [
+            {
+                "name": f"Товар номер {i}",
+                "offer_id": f"OFFER-{i:08d}",
+                "price": 1500.0,
+                "quantity": 1 + i % 3,
+                "sku": 300000000 + i,
+                "currency_code": "RUB",
+                "is_blr_traceable": False,
+                "is_marketplace_buyout": False,
+                "imei": None,
+            }
+        ],
+        "prr_option": None,
+        "quantum_id": None,
+        "requirements": {
+            "products_requiring_gtd": [],
+            "products_requiring_country": [],
+            "products_requiring_mandatory_mark": [],
+        },
+        "shipment_date": "2023-11-04T18:00:00Z",
+        "shipment_date_without_delay": "2023-11-04T18:00:00Z",
+        "status": "awaiting_packaging",
+        "substatus": "posting_created",
+        "tpl_integration_type": "non_integrated",
+        "tracking_number": None,
+        "tariffication": {
+            "current_tariff_rate": 10.0,
+            "current_tariff_type": "discount",
+            "current_tariff_charge": "150.0",
+            "current_tariff_charge_currency_code": "RUB",
+            "next_tariff_rate": 10.0,
+            "next_tariff_type": "discount",
+            "next_tariff_charge": "150.0",
+            "next_tariff_starts_at": None,
+            "next_tariff_charge_currency_code": "RUB",
+        },
+    }
+
+
+def product_info_list_response(count: int = 1000) -> dict:
+    """Ответ /v3/product/info/list с `count` товарами."""
+    return {"items": [product_info_list_item(i) for i in range(count)]}
+
+
+def product_info_stocks_response(count: int = 1000) -> dict:
+    """Ответ /v4/product/info/stocks с `count` товарами."""
+    return {"cursor": "next", "total": count, "items": [product_info_stocks_item(i) for i in range(count)]}
+
+
+def product_info_prices_response(count: int = 1000) -> dict:
+    """Ответ /v5/product/info/prices с `count` товарами."""
+    return {"cursor": "next", "total": count, "items": [product_info_prices_item(i) for i in range(count)]}
+
+
+def posting_fbs_list_response(count: int = 1000) -> dict:
+    """Ответ /v3/posting/fbs/list с `count` отправлениями."""
+    return {"result": {"has_next": False, "postings": [posting_fbs_item(i) for i in range(count)]}}
+
+
+def encode(data: dict) -> bytes:
+    """Кодирует ответ в байты так же, как его отдает сервер."""
+    return json.dumps(data, ensure_ascii=False).encode()
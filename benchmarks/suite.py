@@ -0,0 +1,364 @@
+"""Набор бенчмарков клиента против локальной заглушки Seller API.
+
+Измеряет:
+    overhead    — накладные расходы клиента на запрос по сравнению с aiohttp
+                  (тот же запрос, чтение тела и валидация той же схемой),
+                  в том числе с подключенным сборщиком метрик запросов
+    throughput  — фактическую частоту запросов на стороне сервера при
+                  заданном `max_requests_per_second`
+    fairness    — очередность и разброс ожидания 10 000 одновременных задач
+                  в ограничителе запросов
+    pagination  — скорость выгрузки каталога итератором `iter_product_info_stocks`
+    parse       — время и пиковую память разбора больших ответов
+    startup     — время импорта библиотеки и создания/закрытия `SellerAPI`
+
+Результаты записываются в JSON (`--output`) и сравниваются с сохраненными
+базовыми значениями (`--baseline`). Метрика считается ухудшившейся, если
+она хуже базовой больше чем на допуск. Базовые значения зависят от машины,
+поэтому сохраняйте их на той же машине, где выполняется сравнение.
+
+Запуск:
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --quick --baseline benchmarks/baseline.json --check
+    python benchmarks/suite.py --only overhead,fairness --save-baseline benchmarks/baseline.json
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Awaitable, Callable
+
+import aiohttp
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(BENCHMARKS_DIR, "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+import bench_decode  # noqa: E402
+import fake_ozon  # noqa: E402
+import fixtures  # noqa: E402
+from ozonapi.seller import SellerAPI, SellerAPIConfig  # noqa: E402
+from ozonapi.seller.core import APIManager, RequestMetrics  # noqa: E402
+from ozonapi.seller.core.token_bucket import TokenBucket, acquire  # noqa: E402
+from ozonapi.seller.schemas.prices_and_stocks import ProductInfoStocksRequest  # noqa: E402
+from ozonapi.seller.schemas.products import ProductInfoLimitResponse  # noqa: E402
+
+# Направление улучшения и допустимое относительное ухудшение метрик. Допуски
+# метрик времени велики, потому что замеры на общей машине колеблются на десятки
+# процентов. Метрики, которых нет в списке, выводятся для сведения и не сравниваются
+METRICS: dict[str, tuple[str, float]] = {
+    "overhead.overhead_p50_us": ("lower", 0.50),
+    "overhead.client_p50_us": ("lower", 0.50),
+    "throughput.utilization": ("higher", 0.05),
+    "throughput.max_window_rps": ("lower", 0.05),
+    "fairness.utilization": ("higher", 0.10),
+    "fairness.wait_p99_ms": ("lower", 0.25),
+    "fairness.max_displacement": ("lower", 0.0),
+    "fairness.jain_index": ("higher", 0.02),
+    "pagination.items_per_second": ("higher", 0.35),
+    "parse.product_info_list_ms": ("lower", 0.50),
+    "parse.product_info_list_peak_mib": ("lower", 0.10),
+    "parse.posting_fbs_list_ms": ("lower", 0.50),
+    "parse.posting_fbs_list_peak_mib": ("lower", 0.10),
+    "parse.product_info_prices_ms": ("lower", 0.50),
+    "parse.product_info_prices_peak_mib": ("lower", 0.10),
+    "parse.product_info_stocks_ms": ("lower", 0.50),
+    "parse.product_info_stocks_peak_mib": ("lower", 0.10),
+    "startup.import_ozonapi_ms": ("lower", 0.50),
+    "startup.import_seller_api_ms": ("lower", 0.50),
+    "startup.construct_close_us": ("lower", 0.50),
+}
+
+
+def make_config(base_url: str, **kwargs: Any) -> SellerAPIConfig:
+    """Конфигурация клиента для заглушки: без повторов, кеша и объединения запросов."""
+    return SellerAPIConfig(
+        client_id="bench", api_key="bench", base_url=base_url, max_retries=0,
+        response_cache=False, coalesce_requests=False, **kwargs,
+    )
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+async def reset_manager() -> None:
+    """Закрывает общие ресурсы клиента между бенчмарками."""
+    await APIManager.shutdown()
+    APIManager._session_manager = None
+
+
+async def paced(count: int, interval: float, call: Callable[[], Awaitable[Any]]) -> list[float]:
+    """Выполняет вызовы последовательно с паузой и возвращает время каждого вызова в секундах."""
+    durations = []
+    for _ in range(count):
+        started = time.perf_counter()
+        await call()
+        durations.append(time.perf_counter() - started)
+        await asyncio.sleep(interval)
+    return durations
+
+
+async def bench_overhead(base_url: str, requests: int) -> dict[str, float]:
+    """Сравнивает время запроса через клиент и напрямую через aiohttp.
+
+    Запросы выполняются с паузой, превышающей интервал ограничителя, поэтому
+    замер не включает ожидание токенов.
+    """
+    url = f"{base_url}/v4/product/info/limit"
+    headers = {"Client-Id": "bench", "Api-Key": "bench"}
+    interval = 1.5 / 50
+
+    async with aiohttp.ClientSession(headers=headers) as session:
+        async def raw_call():
+            async with session.post(url, json={}) as response:
+                ProductInfoLimitResponse.model_validate_json(await response.read())
+
+        await paced(10, 0, raw_call)
+        raw = await paced(requests, interval, raw_call)
+
+    await reset_manager()
+    async with SellerAPI(config=make_config(base_url, max_requests_per_second=50)) as api:
+        await paced(10, interval, api.product_info_limit)
+        client = await paced(requests, interval, api.product_info_limit)
+        APIManager.set_request_metrics(RequestMetrics())
+        try:
+            measured = await paced(requests, interval, api.product_info_limit)
+        finally:
+            APIManager.set_request_metrics(None)
+    await reset_manager()
+
+    raw_p50, client_p50 = statistics.median(raw), statistics.median(client)
+    return {
+        "raw_p50_us": raw_p50 * 1e6,
+        "client_p50_us": client_p50 * 1e6,
+        "overhead_p50_us": (client_p50 - raw_p50) * 1e6,
+        "overhead_mean_us": (statistics.mean(client) - statistics.mean(raw)) * 1e6,
+        "client_p99_us": percentile(client, 0.99) * 1e6,
+        "metrics_overhead_p50_us": (statistics.median(measured) - client_p50) * 1e6,
+    }
+
+
+async def bench_throughput(server, rate: int, duration: float) -> dict[str, float]:
+    """Измеряет фактическую частоту запросов на сервере при одновременной отправке запросов.
+
+    Первые `rate` запросов проходят сразу (емкость корзины), поэтому
+    установившаяся частота считается по запросам после первой секунды.
+    """
+    base_url = str(server.make_url("")).rstrip("/")
+    arrivals = server.app[fake_ozon.ARRIVALS]
+    await reset_manager()
+    async with SellerAPI(config=make_config(base_url, max_requests_per_second=rate)) as api:
+        await api.product_info_limit()
+        await asyncio.sleep(1.5)
+        arrivals.clear()
+        total = int(rate * (duration + 1))
+        started = time.monotonic()
+        await asyncio.gather(*(api.product_info_limit() for _ in range(total)))
+        elapsed = time.monotonic() - started
+    await reset_manager()
+
+    times = sorted(arrivals)
+    steady = [moment for moment in times if moment >= times[0] + 1.0]
+    steady_rps = (len(steady) - 1) / (steady[-1] - steady[0]) if len(steady) > 1 else 0.0
+    # Наибольшее количество запросов, пришедших на сервер за любую секунду
+    max_window, start = 0, 0
+    for end, moment in enumerate(times):
+        while moment - times[start] >= 1.0:
+            start += 1
+        max_window = max(max_window, end - start + 1)
+    return {
+        "configured_rps": rate,
+        "requests": total,
+        "elapsed_s": elapsed,
+        "achieved_rps": steady_rps,
+        "utilization": steady_rps / rate,
+        "max_window_rps": max_window,
+    }
+
+
+async def bench_fairness(tasks: int, rate: float, groups: int = 100) -> dict[str, float]:
+    """Проверяет очередность и равномерность ожидания задач в ограничителе запросов.
+
+    Задачи получают токены из двух уровней иерархии (инстанс и client_id),
+    как запросы клиента. Задача `i` относится к группе `i % groups`.
+    """
+    instance, client = TokenBucket(rate), TokenBucket(rate)
+    # Задачи появляются, когда корзины уже пусты: все задачи ждут в очереди
+    instance._tokens = client._tokens = 0.0
+    order: list[int] = []
+    waits = [0.0] * tasks
+
+    async def task(index: int) -> None:
+        started = time.perf_counter()
+        await acquire((instance, client))
+        waits[index] = time.perf_counter() - started
+        order.append(index)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(task(i) for i in range(tasks)))
+    elapsed = time.perf_counter() - started
+
+    displacement = max(abs(position - index) for position, index in enumerate(order))
+    group_waits = [statistics.mean(waits[group::groups]) for group in range(groups)]
+    jain = sum(group_waits) ** 2 / (groups * sum(wait * wait for wait in group_waits))
+    return {
+        "tasks": tasks,
+        "configured_rate": rate,
+        "elapsed_s": elapsed,
+        "utilization": tasks / elapsed / rate,
+        "wait_p50_ms": percentile(waits, 0.5) * 1000,
+        "wait_p99_ms": percentile(waits, 0.99) * 1000,
+        "wait_max_ms": max(waits) * 1000,
+        "max_displacement": displacement,
+        "jain_index": jain,
+    }
+
+
+async def bench_pagination(base_url: str, catalog_size: int) -> dict[str, float]:
+    """Измеряет скорость выгрузки каталога итератором с упреждающей загрузкой страниц."""
+    await reset_manager()
+    async with SellerAPI(config=make_config(base_url, max_requests_per_second=50)) as api:
+        started = time.perf_counter()
+        count = 0
+        async for _ in api.iter_product_info_stocks(ProductInfoStocksRequest(limit=1000)):
+            count += 1
+        elapsed = time.perf_counter() - started
+    await reset_manager()
+    return {"items": count, "elapsed_s": elapsed, "items_per_second": count / elapsed}
+
+
+def bench_parse(items: int, repeat: int) -> dict[str, float]:
+    """Измеряет время валидации и пиковую память разбора больших ответов."""
+    results = {}
+    for name, model, factory in bench_decode.CASES:
+        body = fixtures.encode(factory(items))
+        best, peak = bench_decode.measure(bench_decode.via_json, model, body, repeat)
+        results[f"{name}_body_kib"] = len(body) / 1024
+        results[f"{name}_ms"] = best * 1000
+        results[f"{name}_peak_mib"] = peak / 2 ** 20
+    return results
+
+
+def import_time(statement: str, repeat: int) -> float:
+    """Возвращает лучшее время импорта в отдельном процессе в секундах."""
+    code = (
+        f"import sys, time; sys.path.insert(0, {SRC_DIR!r}); started = time.perf_counter(); "
+        f"{statement}; print(time.perf_counter() - started)"
+    )
+    return min(
+        float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+        for _ in range(repeat)
+    )
+
+
+async def bench_startup(clients: int, repeat: int) -> dict[str, float]:
+    """Измеряет время импорта библиотеки и создания и закрытия клиентов."""
+    config = make_config("http://127.0.0.1:9")
+    SellerAPI(config=config)  # первый экземпляр создает общие ресурсы
+    started = time.perf_counter()
+    for _ in range(clients):
+        await SellerAPI(config=config).close()
+    elapsed = time.perf_counter() - started
+    await reset_manager()
+    return {
+        "import_ozonapi_ms": import_time("import ozonapi", repeat) * 1000,
+        "import_seller_api_ms": import_time("from ozonapi import SellerAPI", repeat) * 1000,
+        "construct_close_us": elapsed / clients * 1e6,
+    }
+
+
+async def run(only: set[str], quick: bool) -> dict[str, dict[str, float]]:
+    catalog_size = 2000 if quick else 10000
+    server = await fake_ozon.start_server(catalog_size)
+    base_url = str(server.make_url("")).rstrip("/")
+    results: dict[str, dict[str, float]] = {}
+    benchmarks: dict[str, Callable[[], Awaitable[dict[str, float]]]] = {
+        "overhead": lambda: bench_overhead(base_url, 50 if quick else 200),
+        "throughput": lambda: bench_throughput(server, 50, 2 if quick else 5),
+        "fairness": lambda: bench_fairness(10000, 5000),
+        "pagination": lambda: bench_pagination(base_url, catalog_size),
+        "parse": lambda: asyncio.to_thread(bench_parse, 200 if quick else 1000, 3 if quick else 5),
+        "startup": lambda: bench_startup(200 if quick else 1000, 3 if quick else 5),
+    }
+    try:
+        for name, benchmark in benchmarks.items():
+            if only and name not in only:
+                continue
+            results[name] = await benchmark()
+            print(f"{name}: " + ", ".join(f"{key}={value:.4g}" for key, value in results[name].items()))
+    finally:
+        await server.close()
+    return results
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]]) -> list[str]:
+    """Сравнивает результаты с базовыми значениями.
+
+    Returns:
+        Описания ухудшившихся метрик
+    """
+    regressions = []
+    for key, (direction, tolerance) in METRICS.items():
+        group, metric = key.split(".")
+        if metric not in results.get(group, {}) or metric not in baseline.get(group, {}):
+            continue
+        value, base = results[group][metric], baseline[group][metric]
+        if direction == "lower":
+            limit = base * (1 + tolerance) if base >= 0 else base * (1 - tolerance)
+            worse = value > limit
+        else:
+            limit = base * (1 - tolerance)
+            worse = value < limit
+        status = "REGRESSION" if worse else "ok"
+        print(f"{status:<10} {key:<40} {value:>12.4g} baseline={base:.4g} limit={limit:.4g}")
+        if worse:
+            regressions.append(key)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", default="", help="Бенчмарки через запятую (по умолчанию все)")
+    parser.add_argument("--quick", action="store_true", help="Уменьшенные объемы для быстрой проверки")
+    parser.add_argument("--output", help="Файл для результатов в JSON")
+    parser.add_argument("--baseline", help="Файл базовых значений для сравнения")
+    parser.add_argument("--save-baseline", help="Сохранить результаты как базовые значения")
+    parser.add_argument("--check", action="store_true", help="Код возврата 1 при ухудшении метрик")
+    args = parser.parse_args()
+
+    only = {name for name in args.only.split(",") if name}
+    results = asyncio.run(run(only, args.quick))
+    report = {
+        "meta": {
+            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2, ensure_ascii=False)
+            file.write("\n")
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if baseline["meta"].get("quick") != args.quick:
+            print("Базовые значения получены в другом режиме (--quick), сравнение может быть неточным")
+        regressions = compare(results, baseline["results"])
+    return 1 if args.check and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,34 +21,19 @@ async def get_fbs_unfulfilled_postings_and_print_detailed_info():
         # Понижаем уровень логирования для наглядности
         config=SellerAPIConfig(log_level="DEBUG")
     ) as api:
-        # Параметры для выборки необработанных отправлений
-        limit = 1000    # Определен в схеме запроса, здесь указан для наглядности
-        offset = 0
-
-        # Выбираем все необработанные отправления
-        postings = list()
-        while True:
-            result = await api.posting_fbs_unfulfilled_list(
+        # Выбираем все необработанные отправления: iter_posting_fbs_unfulfilled_list() сам сдвигает offset
+        # и запрашивает следующую страницу, пока обрабатывается текущая
+        postings = [
+            posting async for posting in api.iter_posting_fbs_unfulfilled_list(
                 PostingFBSUnfulfilledListRequest(
                     filter=PostingFBSUnfulfilledListFilter(
                         delivering_date_from=datetime.datetime.now() - datetime.timedelta(days=5),
                         delivering_date_to=datetime.datetime.now(),
                     ),
-                    limit=limit,    # Максимум 1000, согласно документации PostingFBSUnfulfilledListRequest
-                    offset=offset,  # Сдвиг выборки
+                    limit=1000,     # Максимум 1000, согласно документации PostingFBSUnfulfilledListRequest
                 )
             )
-
-            # Добавляем выбранные за одну итерацию данные в общий список
-            postings.extend(result.result.postings)
-
-            if len(postings) >= result.result.count:
-                # Если выбрали всё, то выходим из цикла
-                break
-            else:
-                # Увеличиваем сдвиг на limit
-                offset += limit
-            # Переходим к следующей итерации
+        ]
 
         # Формируем список задач на параллельную выборку детализированной информации по каждому отправлению
         tasks = list()
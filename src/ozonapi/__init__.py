@@ -32,9 +32,14 @@ Examples:
     if __name__ == '__main__':
         limits = asyncio.run(get_product_info_limit())
 """
+from typing import TYPE_CHECKING
+
 from .infrastructure import logging
 from .infrastructure.logging import ozonapi_logger as logger
-from .seller import SellerAPI, SellerAPIConfig
+from .seller.common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .seller import SellerAPI, SellerAPIConfig, ResponseMode
 
 
 __version__ = "0.19.5"
@@ -44,4 +49,9 @@ __repository__ = "https://github.com/a-ulianov/OzonAPI"
 __docs__ = "https://github.com/a-ulianov/OzonAPI#readme"
 __issues__ = "https://github.com/a-ulianov/OzonAPI/issues"
 
-__all__ = ["SellerAPI", "SellerAPIConfig", "logging", "logger"]
\ No newline at end of file
+__all__ = ["SellerAPI", "SellerAPIConfig", "ResponseMode", "logging", "logger"]
+
+# Методы API и схемы импортируются при первом обращении к SellerAPI
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".seller": ("SellerAPI", "SellerAPIConfig", "ResponseMode"),
+})
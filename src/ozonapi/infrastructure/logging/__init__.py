@@ -17,6 +17,8 @@ Key Features:
 Exported Classes:
     LoggerManager: Manages logging lifecycle for specific domain
     LoggingSettings: Configuration model for logging parameters
+    SharedLoggingPipeline: Single process-wide pipeline for many short-lived instances
+    ContextLoggerAdapter: Adds instance identity to records of a shared logger
 
 Example Usage:
     Basic Configuration:
@@ -52,6 +54,15 @@ Configuration Parameters:
       that receives settings and formatter, and returns additional handlers to add
       to the logging pipeline. Handlers are automatically cleaned up during shutdown.
 
+Many Short-Lived Instances:
+    >>> pipeline = SharedLoggingPipeline('api.client')
+    >>> logger = pipeline.get_logger(LoggingSettings(LEVEL='INFO'))  # one per settings
+    >>> log = ContextLoggerAdapter(logger, {'client_id': '123', 'instance': 1})
+    >>> log.info('Connected')  # name: 'api.client[123]-[1]'
+
+    All loggers of the pipeline share one queue and one listener thread,
+    attaching an instance registers no loggers, handlers or threads.
+
 Shutdown Behavior:
     - Stops all logging operations for the domain
     - Removes all handlers (including custom handlers) and clears queues
@@ -68,10 +79,14 @@ Warning:
       close their resources
 """
 
-__all__ = ['LoggerManager', 'LoggingSettings', 'ozonapi_logger', 'manager']
+__all__ = [
+    'LoggerManager', 'LoggingSettings', 'SharedLoggingPipeline', 'ContextLoggerAdapter', 'ContextFilter',
+    'ozonapi_logger', 'manager',
+]
 
 from .manager import LoggerManager
 from .config import LoggingSettings
+from .pipeline import ContextFilter, ContextLoggerAdapter, SharedLoggingPipeline
 
 manager = LoggerManager('ozonapi')
 manager.configure(LoggingSettings())
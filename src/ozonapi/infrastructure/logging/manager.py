@@ -194,11 +194,14 @@ class LoggerManager:
 
     @staticmethod
     def _cleanup_logger(logger: logging.Logger) -> None:
-        """Safely remove all logger components."""
+        """Safely remove all logger components and restore default propagation."""
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
             handler.close()
         logger.filters.clear()
+        # Non-propagating loggers receive handlers from third-party tools
+        # (e.g. pytest log capture), which would block later configuration
+        logger.propagate = True
 
     def _add_custom_handlers(self, logger, settings, handler_factory):
         """Add custom handlers to logger"""
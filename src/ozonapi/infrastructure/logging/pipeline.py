@@ -0,0 +1,188 @@
+"""Process-wide logging pipeline shared by short-lived component instances.
+
+Unlike LoggerManager, which builds a separate pipeline (handlers, queue and
+listener thread) per domain, SharedLoggingPipeline keeps one queue and one
+QueueListener thread for the whole process. Output handlers are created once
+per distinct LoggingSettings and reused by every instance with the same
+settings, so attaching an instance costs a dictionary lookup and releasing
+it costs nothing.
+
+Instance identity is carried by ContextLoggerAdapter instead of per-instance
+logger names, so no loggers are registered in `logging` per instance.
+"""
+
+import atexit
+import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
+from typing import Any, Mapping, MutableMapping, Optional
+
+from .config import LoggingSettings
+from .formatters import get_formatter
+from .handlers import create_handlers
+
+
+class ContextLoggerAdapter(logging.LoggerAdapter):
+    """Logger adapter attaching instance identity to records of a shared logger.
+
+    The identity is stored in `record.context` and is rendered into the
+    record name by ContextFilter only for records that are actually emitted.
+    Extra fields passed to a logging call are merged with the identity.
+
+    Example:
+        >>> adapter = ContextLoggerAdapter(logger, {'client_id': '123', 'instance': 1})
+        >>> adapter.info('Request sent')  # name: 'ozonapi.seller.client[123]-[1]'
+    """
+
+    def __init__(self, logger: logging.Logger, context: Mapping[str, Any]):
+        super().__init__(logger, dict(context))
+        self._record_extra = {'context': self.extra}
+
+    def process(self, msg: Any, kwargs: MutableMapping[str, Any]) -> tuple[Any, MutableMapping[str, Any]]:
+        """Attach instance context to the record extra fields."""
+        extra = kwargs.get('extra')
+        kwargs['extra'] = {**extra, 'context': self.extra} if extra else self._record_extra
+        return msg, kwargs
+
+
+class ContextFilter(logging.Filter):
+    """Renders `record.context` of ContextLoggerAdapter into the record name.
+
+    The record name becomes `<display_name>[value1]-[value2]`, so text output
+    keeps identifying the instance that produced the record.
+
+    Args:
+        display_name: Logger name shown in records
+    """
+
+    def __init__(self, display_name: str):
+        super().__init__()
+        self.display_name = display_name
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = getattr(record, 'context', None)
+        if context:
+            record.name = self.display_name + '-'.join(f'[{value}]' for value in context.values())
+        else:
+            record.name = self.display_name
+        return True
+
+
+class _SinkQueueHandler(QueueHandler):
+    """Puts records into the shared queue together with the output handlers of their sink."""
+
+    def __init__(self, queue: Queue, handlers: list[logging.Handler]):
+        super().__init__(queue)
+        self.sink_handlers = tuple(handlers)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put_nowait((self.sink_handlers, record))
+
+    def close(self) -> None:
+        for handler in self.sink_handlers:
+            handler.close()
+        super().close()
+
+
+class _SinkQueueListener(QueueListener):
+    """Passes each record from the shared queue to the output handlers of its sink."""
+
+    def handle(self, item: tuple[tuple[logging.Handler, ...], logging.LogRecord]) -> None:
+        handlers, record = item
+        record = self.prepare(record)
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class SharedLoggingPipeline:
+    """Single process-wide logging pipeline for a domain.
+
+    Loggers returned by `get_logger()` are created once per distinct settings
+    and named `<domain>` for the first settings and `<domain>.<n>` for others;
+    records show `<domain>` plus instance context in both cases. With
+    `USE_ASYNC`, all loggers share one queue and one listener thread, started
+    on first use and stopped on interpreter exit or `shutdown()`.
+
+    Args:
+        domain: Logger name shown in records (e.g. 'ozonapi.seller.client')
+        max_queue_size: Size of the shared queue for async mode
+
+    Example:
+        >>> pipeline = SharedLoggingPipeline('app.client')
+        >>> logger = pipeline.get_logger(LoggingSettings(LEVEL='DEBUG'))
+        >>> log = ContextLoggerAdapter(logger, {'client_id': '123'})
+    """
+
+    def __init__(self, domain: str, max_queue_size: int = LoggingSettings.model_fields['MAX_QUEUE_SIZE'].default):
+        self._domain = domain
+        self._max_queue_size = max_queue_size
+        self._loggers: dict[tuple, logging.Logger] = {}
+        self._listener: Optional[_SinkQueueListener] = None
+        self._lock = threading.Lock()
+
+    @property
+    def listener(self) -> Optional[QueueListener]:
+        """Listener thread of the shared queue, if async mode is in use."""
+        return self._listener
+
+    def get_logger(self, settings: LoggingSettings) -> logging.Logger:
+        """Get logger writing to outputs configured by settings.
+
+        Args:
+            settings: Logging configuration; NAME and MAX_QUEUE_SIZE are ignored
+
+        Returns:
+            Logger shared by all callers with the same settings
+        """
+        key = (
+            settings.LEVEL, settings.JSON, settings.FORMAT, settings.USE_ASYNC,
+            settings.DIR, settings.FILE, settings.MAX_BYTES, settings.BACKUP_FILES_COUNT,
+        )
+        logger = self._loggers.get(key)
+        if logger is None:
+            with self._lock:
+                logger = self._loggers.get(key)
+                if logger is None:
+                    logger = self._create_logger(settings, len(self._loggers))
+                    self._loggers[key] = logger
+        return logger
+
+    def _create_logger(self, settings: LoggingSettings, number: int) -> logging.Logger:
+        """Create logger with output handlers for settings."""
+        logger = logging.getLogger(f'{self._domain}.{number}' if number else self._domain)
+        logger.setLevel(settings.LEVEL)
+        logger.propagate = False
+        logger.addFilter(ContextFilter(self._domain))
+
+        handlers = create_handlers(settings, get_formatter(settings.JSON, settings.FORMAT))
+        if settings.USE_ASYNC:
+            logger.addHandler(_SinkQueueHandler(self._get_listener().queue, handlers))
+        else:
+            for handler in handlers:
+                logger.addHandler(handler)
+        return logger
+
+    def _get_listener(self) -> _SinkQueueListener:
+        """Start the shared listener thread on first use."""
+        if self._listener is None:
+            self._listener = _SinkQueueListener(Queue(maxsize=self._max_queue_size))
+            self._listener.start()
+            atexit.register(self.shutdown)
+        return self._listener
+
+    def shutdown(self) -> None:
+        """Flush the queue, stop the listener thread and close all output handlers."""
+        with self._lock:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+                atexit.unregister(self.shutdown)
+            for logger in self._loggers.values():
+                for handler in logger.handlers[:]:
+                    logger.removeHandler(handler)
+                    handler.close()
+                logger.filters.clear()
+                logger.propagate = True
+            self._loggers.clear()
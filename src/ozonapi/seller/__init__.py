@@ -1,33 +1,61 @@
-from .core import APIConfig as SellerAPIConfig
-from .methods import (
-    SellerBetaAPI,
-    SellerBarcodeAPI,
-    SellerCategoryAPI,
-    SellerFBSAPI,
-    SellerFBOAPI,
-    SellerPricesAndStocksAPI,
-    SellerProductAPI,
-    SellerWarehouseAPI,
-    SellerFBSAssemblyLabelingAPI,
-)
+from typing import TYPE_CHECKING
 
+from .common.lazy import lazy_exports
 
-class SellerAPI(
-    SellerBetaAPI,
-    SellerBarcodeAPI,
-    SellerCategoryAPI,
-    SellerFBOAPI,
-    SellerFBSAPI,
-    SellerFBSAssemblyLabelingAPI,
-    SellerPricesAndStocksAPI,
-    SellerProductAPI,
-    SellerWarehouseAPI,
-):
-    """
-    Основной класс для работы с Seller API Ozon.
-    Объединяет все доступные методы API в единый интерфейс.
-    """
-    pass
+__all__ = [
+    "SellerAPI",
+    "SellerAPIConfig",
+    "ResponseMode",
+    "RateLimiterBackend",
+    "InProcessBackend",
+    "FileLockBackend",
+    "RedisBackend",
+    "ResponseCache",
+    "ResponseStore",
+    "FileResponseStore",
+    "RequestMetrics",
+    "RequestTiming",
+    "Middleware",
+    "RequestContext",
+    "CategoryIndex",
+    "CategoryNode",
+    "AttributeValueStore",
+    "DictionaryKey",
+    "CompactRecord",
+    "to_compact",
+    "from_compact",
+]
 
-__all__ = ["SellerAPI", "SellerAPIConfig"]
+if TYPE_CHECKING:
+    from .api import SellerAPI
+    from .catalog import AttributeValueStore, CategoryIndex, CategoryNode, DictionaryKey
+    from .core import (
+        APIConfig as SellerAPIConfig,
+        CompactRecord,
+        FileLockBackend,
+        FileResponseStore,
+        InProcessBackend,
+        Middleware,
+        RateLimiterBackend,
+        RedisBackend,
+        RequestContext,
+        RequestMetrics,
+        RequestTiming,
+        ResponseCache,
+        ResponseMode,
+        ResponseStore,
+        from_compact,
+        to_compact,
+    )
+
+# Классы методов API и схемы импортируются при первом обращении к SellerAPI
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".api": ("SellerAPI",),
+    ".catalog": ("AttributeValueStore", "CategoryIndex", "CategoryNode", "DictionaryKey"),
+    ".core": (
+        "APIConfig as SellerAPIConfig", "CompactRecord", "FileLockBackend", "FileResponseStore", "InProcessBackend",
+        "Middleware", "RateLimiterBackend", "RedisBackend", "RequestContext", "RequestMetrics", "RequestTiming",
+        "ResponseCache", "ResponseMode", "ResponseStore", "from_compact", "to_compact",
+    ),
+})
 
@@ -0,0 +1,12 @@
+"""Локальные индексы справочников Ozon: дерева категорий и значений характеристик."""
+__all__ = [
+    "AttributeDictionary",
+    "AttributeValue",
+    "AttributeValueStore",
+    "CategoryIndex",
+    "CategoryNode",
+    "DictionaryKey",
+]
+
+from .attribute_values import AttributeDictionary, AttributeValue, AttributeValueStore, DictionaryKey
+from .category_index import CategoryIndex, CategoryNode
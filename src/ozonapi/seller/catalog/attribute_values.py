@@ -0,0 +1,393 @@
+import asyncio
+import bisect
+import heapq
+import json
+import os
+import tempfile
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, NamedTuple, Optional, Union
+
+from .category_index import normalize_text, tokenize
+from ..common.enumerations.localization import Language
+from ..core.pagination import get_field
+from ..core.response import ResponseMode
+from ..schemas.attributes_and_characteristics import DescriptionCategoryAttributeValuesRequest
+
+if TYPE_CHECKING:
+    from ..methods.attributes_and_characteristics.description_category_attribute_values import \
+        DescriptionCategoryAttributeValuesMixin
+
+
+class DictionaryKey(NamedTuple):
+    """Ключ справочника значений характеристики.
+
+    Attributes:
+        description_category_id: Идентификатор категории
+        type_id: Идентификатор типа товара
+        attribute_id: Идентификатор характеристики
+        language: Язык значений
+    """
+    description_category_id: int
+    type_id: int
+    attribute_id: int
+    language: str = Language.DEFAULT.value
+
+    @classmethod
+    def create(
+            cls,
+            description_category_id: int,
+            type_id: int,
+            attribute_id: int,
+            language: Union[Language, str, None] = None,
+    ) -> "DictionaryKey":
+        """Создает ключ, приводя язык к строковому значению."""
+        language = getattr(language, "value", language) or Language.DEFAULT.value
+        return cls(description_category_id, type_id, attribute_id, language)
+
+
+class AttributeValue(NamedTuple):
+    """Значение справочника характеристики.
+
+    Attributes:
+        id: Идентификатор значения
+        value: Значение
+        info: Дополнительное описание
+        picture: Ссылка на изображение
+    """
+    id: int
+    value: str
+    info: str = ""
+    picture: str = ""
+
+
+def trigrams(text: str) -> set[str]:
+    """Возвращает триграммы нормализованного текста для нечеткого поиска."""
+    text = f"  {normalize_text(text)} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class AttributeDictionary:
+    """Локальная копия справочника значений характеристики с поисковыми индексами.
+
+    Значения хранятся по идентификаторам. Для поиска строятся индекс точных
+    значений, индекс начала слов и (при первом нечетком поиске) индекс
+    триграмм. Новые значения добавляются в индексы без их перестроения.
+
+    Args:
+        key: Ключ справочника
+        values: Значения справочника (опционально)
+        last_value_id: Идентификатор последнего загруженного значения (опционально)
+        synced_at: Время последней синхронизации в секундах Unix (опционально)
+    """
+
+    def __init__(
+            self,
+            key: DictionaryKey,
+            values: Iterable[AttributeValue] = (),
+            last_value_id: int = 0,
+            synced_at: float = 0.0,
+    ) -> None:
+        self.key = key
+        self.last_value_id = last_value_id
+        self.synced_at = synced_at
+        self._values: dict[int, AttributeValue] = {}
+        self._exact: dict[str, list[int]] = {}
+        self._words: dict[str, list[int]] = {}
+        self._sorted_words: Optional[list[str]] = None
+        self._trigrams: Optional[dict[str, list[int]]] = None
+        self._trigram_counts: dict[int, int] = {}
+        self.add(values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[AttributeValue]:
+        return iter(self._values.values())
+
+    def __contains__(self, value_id: int) -> bool:
+        return value_id in self._values
+
+    def add(self, values: Iterable[AttributeValue]) -> int:
+        """Добавляет или заменяет значения и обновляет индексы.
+
+        Returns:
+            Количество новых значений
+        """
+        added = 0
+        for value in values:
+            previous = self._values.get(value.id)
+            if previous is not None:
+                if previous == value:
+                    continue
+                self._unindex(previous)
+            else:
+                added += 1
+            self._values[value.id] = value
+            self._index(value)
+            self.last_value_id = max(self.last_value_id, value.id)
+        return added
+
+    def _index(self, value: AttributeValue) -> None:
+        self._exact.setdefault(normalize_text(value.value), []).append(value.id)
+        for word in set(tokenize(value.value)):
+            ids = self._words.get(word)
+            if ids is None:
+                ids = self._words[word] = []
+                self._sorted_words = None
+            ids.append(value.id)
+        if self._trigrams is not None:
+            self._index_trigrams(value)
+
+    def _index_trigrams(self, value: AttributeValue) -> None:
+        value_trigrams = trigrams(value.value)
+        for trigram in value_trigrams:
+            self._trigrams.setdefault(trigram, []).append(value.id)
+        self._trigram_counts[value.id] = len(value_trigrams)
+
+    def _unindex(self, value: AttributeValue) -> None:
+        self._exact[normalize_text(value.value)].remove(value.id)
+        for word in set(tokenize(value.value)):
+            self._words[word].remove(value.id)
+        if self._trigrams is not None:
+            for trigram in trigrams(value.value):
+                self._trigrams[trigram].remove(value.id)
+            del self._trigram_counts[value.id]
+
+    def get(self, value_id: int) -> Optional[AttributeValue]:
+        """Возвращает значение по идентификатору или None, если значения нет."""
+        return self._values.get(value_id)
+
+    def find(self, value: str) -> list[AttributeValue]:
+        """Возвращает значения, точно совпадающие с `value` без учета регистра и различия `е`/`ё`."""
+        return [self._values[value_id] for value_id in self._exact.get(normalize_text(value), ())]
+
+    def search(self, query: str, limit: Optional[int] = 20) -> list[AttributeValue]:
+        """Ищет значения, в которых есть слова, начинающиеся со слов запроса.
+
+        Args:
+            query: Поисковый запрос, например `"сам гал"`
+            limit: Максимальное количество результатов (опционально)
+
+        Returns:
+            Найденные значения: сначала точные совпадения, затем по возрастанию длины значения
+        """
+        if self._sorted_words is None:
+            self._sorted_words = sorted(self._words)
+        words = self._sorted_words
+        found: Optional[set[int]] = None
+        for word in tokenize(query):
+            matches: set[int] = set()
+            position = bisect.bisect_left(words, word)
+            while position < len(words) and words[position].startswith(word):
+                matches.update(self._words[words[position]])
+                position += 1
+            found = matches if found is None else found & matches
+            if not found:
+                return []
+        if found is None:
+            return []
+        normalized = normalize_text(query)
+        values = (self._values[value_id] for value_id in found)
+
+        def order(item: AttributeValue) -> tuple[bool, int, int]:
+            return normalize_text(item.value) != normalized, len(item.value), item.id
+
+        if limit is None:
+            return sorted(values, key=order)
+        return heapq.nsmallest(limit, values, key=order)
+
+    def fuzzy_search(self, query: str, limit: Optional[int] = 10, threshold: float = 0.3) -> list[AttributeValue]:
+        """Ищет значения, похожие на запрос, по совпадению триграмм (например, с опечатками).
+
+        Индекс триграмм строится при первом вызове.
+
+        Args:
+            query: Поисковый запрос
+            limit: Максимальное количество результатов (опционально)
+            threshold: Минимальное сходство от 0 до 1 (коэффициент Жаккара по триграммам)
+
+        Returns:
+            Найденные значения по убыванию сходства
+        """
+        if self._trigrams is None:
+            self._trigrams = {}
+            for value in self._values.values():
+                self._index_trigrams(value)
+
+        query_trigrams = trigrams(query)
+        shared: Counter[int] = Counter()
+        for trigram in query_trigrams:
+            shared.update(self._trigrams.get(trigram, ()))
+
+        scored = []
+        for value_id, count in shared.items():
+            score = count / (len(query_trigrams) + self._trigram_counts[value_id] - count)
+            if score >= threshold:
+                scored.append((-score, len(self._values[value_id].value), value_id))
+        best = sorted(scored) if limit is None else heapq.nsmallest(limit, scored)
+        return [self._values[value_id] for _, _, value_id in best]
+
+    def resolve(self, value: str, threshold: float = 0.5) -> Optional[AttributeValue]:
+        """Подбирает значение справочника для произвольного текста.
+
+        Возвращает точное совпадение, иначе самое похожее значение со сходством
+        не ниже `threshold` или None.
+        """
+        exact = self.find(value)
+        if exact:
+            return exact[0]
+        similar = self.fuzzy_search(value, limit=1, threshold=threshold)
+        return similar[0] if similar else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Формирует представление справочника для сохранения."""
+        return {
+            "key": list(self.key),
+            "last_value_id": self.last_value_id,
+            "synced_at": self.synced_at,
+            "values": [list(value) for value in self._values.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AttributeDictionary":
+        """Восстанавливает справочник из представления `to_dict()`."""
+        return cls(
+            DictionaryKey(*data["key"]),
+            (AttributeValue(*value) for value in data["values"]),
+            last_value_id=data["last_value_id"],
+            synced_at=data["synced_at"],
+        )
+
+
+class AttributeValueStore:
+    """Локальное хранилище справочников значений характеристик.
+
+    Справочники загружаются через `description_category_attribute_values()` и
+    далее дополняются только новыми значениями: запрос начинается с
+    `last_value_id` последнего загруженного значения. Если задан каталог,
+    справочники сохраняются на диск с атомарной заменой файла и загружаются
+    при первом обращении, поэтому поиск значений не требует запросов к API.
+
+    Args:
+        directory: Каталог для сохранения справочников (опционально)
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        self.directory = directory
+        self._dictionaries: dict[DictionaryKey, AttributeDictionary] = {}
+        self._locks: dict[DictionaryKey, asyncio.Lock] = {}
+
+    def _path(self, key: DictionaryKey) -> str:
+        return os.path.join(
+            self.directory,
+            f"v{self.FORMAT_VERSION}",
+            f"{key.description_category_id}_{key.type_id}_{key.attribute_id}_{key.language}.json",
+        )
+
+    def _read(self, key: DictionaryKey) -> Optional[AttributeDictionary]:
+        try:
+            with open(self._path(key), "rb") as file:
+                return AttributeDictionary.from_dict(json.loads(file.read()))
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError):
+            # Поврежденный или недописанный файл загружается из API заново
+            return None
+
+    def _write(self, dictionary: AttributeDictionary) -> None:
+        path = self._path(dictionary.key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(json.dumps(dictionary.to_dict(), ensure_ascii=False, separators=(",", ":")).encode())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    async def get(self, key: DictionaryKey) -> Optional[AttributeDictionary]:
+        """Возвращает справочник из памяти или с диска без запросов к API.
+
+        Returns:
+            Справочник или None, если он еще не загружался
+        """
+        dictionary = self._dictionaries.get(key)
+        if dictionary is None and self.directory is not None:
+            dictionary = await asyncio.to_thread(self._read, key)
+            if dictionary is not None:
+                self._dictionaries.setdefault(key, dictionary)
+        return self._dictionaries.get(key)
+
+    async def sync(
+            self,
+            api: "DescriptionCategoryAttributeValuesMixin",
+            key: DictionaryKey,
+            limit: int = 2000,
+    ) -> AttributeDictionary:
+        """Загружает новые значения справочника и сохраняет его.
+
+        Запрашиваются только значения с идентификатором больше `last_value_id`
+        уже загруженных. Кеш ответов API при этом не используется, иначе
+        последняя пустая страница выдавалась бы из кеша и новые значения не
+        загружались бы до его истечения. Одновременные синхронизации одного
+        справочника выполняются по очереди.
+
+        Args:
+            api: Клиент API
+            key: Ключ справочника
+            limit: Количество значений в одном запросе (максимум 2000)
+
+        Returns:
+            Справочник с загруженными значениями
+        """
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+
+        async with lock:
+            dictionary = await self.get(key)
+            if dictionary is None:
+                dictionary = self._dictionaries[key] = AttributeDictionary(key)
+
+            request = DescriptionCategoryAttributeValuesRequest(
+                description_category_id=key.description_category_id,
+                type_id=key.type_id,
+                attribute_id=key.attribute_id,
+                language=key.language,
+                last_value_id=dictionary.last_value_id or None,
+                limit=limit,
+            )
+            added = 0
+            with api.response_mode(ResponseMode.DICT), api.bypass_response_cache():
+                async for page in api.iter_description_category_attribute_values(request, pages=True):
+                    added += dictionary.add(
+                        AttributeValue(
+                            get_field(item, "id"),
+                            get_field(item, "value") or "",
+                            get_field(item, "info") or "",
+                            get_field(item, "picture") or "",
+                        )
+                        for item in get_field(page, "result") or ()
+                    )
+            dictionary.synced_at = time.time()
+
+            if self.directory is not None and (added or not os.path.exists(self._path(key))):
+                await asyncio.to_thread(self._write, dictionary)
+            return dictionary
+
+    async def search(self, key: DictionaryKey, query: str, limit: Optional[int] = 20) -> list[AttributeValue]:
+        """Ищет значения в загруженном справочнике по началу слов (см. `AttributeDictionary.search()`).
+
+        Returns:
+            Найденные значения или пустой список, если справочник не загружен
+        """
+        dictionary = await self.get(key)
+        return [] if dictionary is None else dictionary.search(query, limit)
@@ -0,0 +1,275 @@
+import bisect
+import json
+import re
+from typing import Any, Iterable, Iterator, NamedTuple, Optional, Union
+
+from ..core.pagination import get_field
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize_text(text: str) -> str:
+    """Приводит текст к виду для поиска: нижний регистр, `ё` заменяется на `е`."""
+    return text.lower().replace("ё", "е")
+
+
+def tokenize(text: str) -> list[str]:
+    """Делит текст на слова для поиска."""
+    return _WORD.findall(normalize_text(text))
+
+
+class CategoryNode(NamedTuple):
+    """Категория или тип товара в индексе дерева категорий.
+
+    Attributes:
+        index: Порядковый номер узла при обходе дерева в глубину
+        description_category_id: Идентификатор категории. Для типа товара — идентификатор
+            категории, к которой он относится (нужен вместе с `type_id` в запросах характеристик)
+        type_id: Идентификатор типа товара или None для категории
+        name: Название категории или типа товара
+        disabled: Нельзя создавать товары в категории или типе
+        parent_id: Идентификатор родительской категории или None для корневых категорий
+    """
+    index: int
+    description_category_id: Optional[int]
+    type_id: Optional[int]
+    name: str
+    disabled: bool
+    parent_id: Optional[int]
+
+    @property
+    def is_type(self) -> bool:
+        """Узел является типом товара."""
+        return self.type_id is not None
+
+
+class CategoryIndex:
+    """Индекс дерева категорий и типов товаров.
+
+    Строится один раз по ответу `description_category_tree()` и позволяет без
+    обхода дерева за O(1) находить категории и типы по идентификаторам,
+    получать путь от корня, родителя, потомков и доступные для создания
+    товаров типы, а также искать категории и типы по началу слов названия.
+
+    Узлы хранятся в порядке обхода дерева в глубину, поэтому поддерево узла —
+    непрерывный отрезок списка узлов. Индекс сохраняется в компактный снимок
+    (`to_snapshot()`), который загружается быстрее валидации ответа API.
+
+    Args:
+        nodes: Узлы в порядке обхода дерева в глубину
+        ends: Для каждого узла — номер узла, следующего за его поддеревом
+    """
+
+    SNAPSHOT_VERSION = 1
+
+    def __init__(self, nodes: list[CategoryNode], ends: list[int]) -> None:
+        self._nodes = nodes
+        self._ends = ends
+        self._categories: dict[int, int] = {}
+        self._types: dict[int, list[int]] = {}
+        self._parents: list[Optional[int]] = [None] * len(nodes)
+        self._paths: list[tuple[int, ...]] = [()] * len(nodes)
+        self._words: dict[str, list[int]] = {}
+
+        for node in nodes:
+            if node.is_type:
+                self._types.setdefault(node.type_id, []).append(node.index)
+            elif node.description_category_id is not None:
+                self._categories.setdefault(node.description_category_id, node.index)
+
+        # Родитель узла — ближайший предшествующий узел, поддерево которого содержит узел
+        stack: list[int] = []
+        for node in nodes:
+            while stack and ends[stack[-1]] <= node.index:
+                stack.pop()
+            if stack:
+                parent = stack[-1]
+                self._parents[node.index] = parent
+                self._paths[node.index] = self._paths[parent] + (node.index,)
+            else:
+                self._paths[node.index] = (node.index,)
+            stack.append(node.index)
+            for word in set(tokenize(node.name)):
+                self._words.setdefault(word, []).append(node.index)
+
+        self._sorted_words = sorted(self._words)
+        self._leaves = tuple(
+            node.index for node in nodes if ends[node.index] == node.index + 1 and not node.disabled
+        )
+
+    @classmethod
+    def from_tree(cls, items: Iterable[Any]) -> "CategoryIndex":
+        """Строит индекс по элементам дерева категорий.
+
+        Args:
+            items: Корневые элементы дерева: схемы `DescriptionCategoryTreeItem` или словари
+
+        Returns:
+            Индекс дерева категорий
+        """
+        nodes: list[CategoryNode] = []
+        ends: list[int] = []
+
+        def add(item: Any, parent_id: Optional[int]) -> None:
+            index = len(nodes)
+            category_id = get_field(item, "description_category_id") or None
+            type_id = get_field(item, "type_id") or None
+            if type_id is not None:
+                name = get_field(item, "type_name") or ""
+                category_id = category_id or parent_id
+            else:
+                name = get_field(item, "category_name") or ""
+            nodes.append(CategoryNode(
+                index, category_id, type_id, name, bool(get_field(item, "disabled")), parent_id,
+            ))
+            ends.append(index + 1)
+            child_parent_id = category_id if type_id is None else parent_id
+            for child in get_field(item, "children") or ():
+                add(child, child_parent_id)
+            ends[index] = len(nodes)
+
+        for item in items:
+            add(item, None)
+        return cls(nodes, ends)
+
+    @classmethod
+    def from_response(cls, response: Any) -> "CategoryIndex":
+        """Строит индекс по ответу `description_category_tree()` в любом режиме ответа.
+
+        Args:
+            response: Ответ: схема `DescriptionCategoryTreeResponse`, словарь или байты
+
+        Returns:
+            Индекс дерева категорий
+        """
+        if isinstance(response, (bytes, bytearray)):
+            response = json.loads(response)
+        return cls.from_tree(get_field(response, "result") or ())
+
+    def to_snapshot(self) -> bytes:
+        """Сохраняет индекс в компактный снимок.
+
+        Узлы сохраняются по столбцам, вспомогательные индексы строятся заново при загрузке.
+
+        Returns:
+            Снимок индекса для `from_snapshot()`
+        """
+        nodes = self._nodes
+        return json.dumps({
+            "version": self.SNAPSHOT_VERSION,
+            "category_id": [node.description_category_id for node in nodes],
+            "type_id": [node.type_id for node in nodes],
+            "name": [node.name for node in nodes],
+            "disabled": [int(node.disabled) for node in nodes],
+            "parent_id": [node.parent_id for node in nodes],
+            "end": self._ends,
+        }, ensure_ascii=False, separators=(",", ":")).encode()
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Union[bytes, str]) -> "CategoryIndex":
+        """Загружает индекс из снимка без валидации схем.
+
+        Args:
+            snapshot: Снимок, сохраненный `to_snapshot()`
+
+        Returns:
+            Индекс дерева категорий
+
+        Raises:
+            ValueError: Если снимок сохранен в другой версии формата
+        """
+        data = json.loads(snapshot)
+        if data.get("version") != cls.SNAPSHOT_VERSION:
+            raise ValueError(f"Неподдерживаемая версия снимка индекса категорий: {data.get('version')}")
+        nodes = [
+            CategoryNode(index, category_id, type_id, name, bool(disabled), parent_id)
+            for index, (category_id, type_id, name, disabled, parent_id) in enumerate(zip(
+                data["category_id"], data["type_id"], data["name"], data["disabled"], data["parent_id"],
+            ))
+        ]
+        return cls(nodes, data["end"])
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __iter__(self) -> Iterator[CategoryNode]:
+        return iter(self._nodes)
+
+    def get_category(self, description_category_id: int) -> Optional[CategoryNode]:
+        """Возвращает категорию по идентификатору или None, если категории нет."""
+        index = self._categories.get(description_category_id)
+        return None if index is None else self._nodes[index]
+
+    def get_type(self, type_id: int, description_category_id: Optional[int] = None) -> Optional[CategoryNode]:
+        """Возвращает тип товара по идентификатору или None, если типа нет.
+
+        Args:
+            type_id: Идентификатор типа товара
+            description_category_id: Идентификатор категории, если тип встречается в нескольких категориях
+        """
+        for index in self._types.get(type_id, ()):
+            node = self._nodes[index]
+            if description_category_id is None or node.description_category_id == description_category_id:
+                return node
+        return None
+
+    def get_types(self, type_id: int) -> list[CategoryNode]:
+        """Возвращает все вхождения типа товара в дерево категорий."""
+        return [self._nodes[index] for index in self._types.get(type_id, ())]
+
+    def get_parent(self, node: CategoryNode) -> Optional[CategoryNode]:
+        """Возвращает родительскую категорию узла или None для корневой категории."""
+        parent = self._parents[node.index]
+        return None if parent is None else self._nodes[parent]
+
+    def get_children(self, node: CategoryNode) -> list[CategoryNode]:
+        """Возвращает непосредственных потомков узла."""
+        children = []
+        index, end = node.index + 1, self._ends[node.index]
+        while index < end:
+            children.append(self._nodes[index])
+            index = self._ends[index]
+        return children
+
+    def get_path(self, node: CategoryNode) -> list[CategoryNode]:
+        """Возвращает путь от корневой категории до узла включительно."""
+        return [self._nodes[index] for index in self._paths[node.index]]
+
+    def get_leaves(self, node: Optional[CategoryNode] = None) -> list[CategoryNode]:
+        """Возвращает узлы последнего уровня, в которых можно создавать товары.
+
+        Args:
+            node: Узел, в поддереве которого ищутся узлы (по умолчанию все дерево)
+        """
+        leaves = self._leaves
+        if node is None:
+            return [self._nodes[index] for index in leaves]
+        start = bisect.bisect_left(leaves, node.index)
+        end = bisect.bisect_left(leaves, self._ends[node.index])
+        return [self._nodes[index] for index in leaves[start:end]]
+
+    def search(self, query: str, limit: Optional[int] = None) -> list[CategoryNode]:
+        """Ищет категории и типы товаров, в названии которых есть слова, начинающиеся со слов запроса.
+
+        Регистр и различие `е`/`ё` не учитываются.
+
+        Args:
+            query: Поисковый запрос, например `"чехол смартф"`
+            limit: Максимальное количество результатов (опционально)
+
+        Returns:
+            Найденные узлы в порядке обхода дерева
+        """
+        found: Optional[set[int]] = None
+        for word in tokenize(query):
+            matches: set[int] = set()
+            position = bisect.bisect_left(self._sorted_words, word)
+            while position < len(self._sorted_words) and self._sorted_words[position].startswith(word):
+                matches.update(self._words[self._sorted_words[position]])
+                position += 1
+            found = matches if found is None else found & matches
+            if not found:
+                return []
+        if found is None:
+            return []
+        return [self._nodes[index] for index in sorted(found)[:limit]]
@@ -0,0 +1,50 @@
+import sys
+from importlib.util import resolve_name
+from typing import Any, Callable
+
+
+def lazy_exports(
+        package: str,
+        exports: dict[str, tuple[str, ...]],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Формирует `__getattr__` и `__dir__` пакета с отложенным импортом модулей.
+
+    Модуль пакета импортируется при первом обращении к одному из его имен,
+    полученное значение сохраняется в пакете, поэтому повторные обращения не
+    проходят через `__getattr__`. Импорт `from package import Name` загружает
+    только модуль, в котором определено `Name`.
+
+    Args:
+        package: Имя пакета (`__name__`)
+        exports: Относительные имена модулей и экспортируемые из них имена.
+            Имя вида `"APIConfig as SellerAPIConfig"` экспортируется под псевдонимом
+
+    Returns:
+        Функции `__getattr__` и `__dir__` для модуля пакета
+
+    Examples:
+        Базовое применение:
+            __getattr__, __dir__ = lazy_exports(__name__, {
+                ".v1__product_archive": ("ProductArchiveRequest", "ProductArchiveResponse"),
+            })
+    """
+    modules = {}
+    for module, names in exports.items():
+        for name in names:
+            source, _, alias = name.partition(" as ")
+            modules[alias or source] = (resolve_name(module, package), source)
+
+    def __getattr__(name: str) -> Any:
+        if name not in modules:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module, source = modules[name]
+        # Импорт через __import__ учитывается в `python -X importtime`
+        __import__(module)
+        value = getattr(sys.modules[module], source)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(modules))
+
+    return __getattr__, __dir__
@@ -0,0 +1,13 @@
+import pydantic
+from pydantic import ConfigDict
+
+
+class BaseModel(pydantic.BaseModel):
+    """Базовая схема запросов и ответов Seller API.
+
+    Схема валидации и сериализации pydantic строится не при импорте модуля,
+    а при первом использовании схемы (создании экземпляра, валидации ответа,
+    `model_dump()` …), поэтому импорт библиотеки не тратит время на схемы
+    неиспользуемых методов.
+    """
+    model_config = ConfigDict(defer_build=True)
@@ -5,10 +5,48 @@ __all__ = [
     "RateLimiterManager",
     "MethodRateLimiterManager",
     "APIConfig",
+    "ResponseMode",
+    "TokenBucket",
+    "RateLimiterBackend",
+    "InProcessBackend",
+    "FileLockBackend",
+    "RedisBackend",
+    "BucketSpec",
+    "cache_response",
+    "ResponseCache",
+    "ResponseStore",
+    "FileResponseStore",
+    "CompactRecord",
+    "compact_type",
+    "to_compact",
+    "from_compact",
+    "RequestMetrics",
+    "RequestTiming",
+    "Middleware",
+    "RequestContext",
+    "LimitingMiddleware",
+    "LoggingMiddleware",
+    "DecodingMiddleware",
+    "RetryMiddleware",
 ]
 
+from .compact import CompactRecord, compact_type, from_compact, to_compact
 from .config import APIConfig
 from .core import APIManager
+from .metrics import RequestMetrics, RequestTiming
+from .middleware import (
+    DecodingMiddleware,
+    LimitingMiddleware,
+    LoggingMiddleware,
+    Middleware,
+    RequestContext,
+    RetryMiddleware,
+)
+from .rate_limit_backend import BucketSpec, FileLockBackend, InProcessBackend, RateLimiterBackend, RedisBackend
 from .rate_limiter import RateLimiterManager
+from .response import ResponseMode
+from .response_cache import cache_response, ResponseCache
+from .response_store import FileResponseStore, ResponseStore
 from .sessions import SessionManager
+from .token_bucket import TokenBucket
 from .method_rate_limiter import method_rate_limit, MethodRateLimiterManager
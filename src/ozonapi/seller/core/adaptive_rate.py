@@ -0,0 +1,229 @@
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Mapping, Optional
+
+from .token_bucket import TokenBucket
+from ...infrastructure.logging import ozonapi_logger as logger
+
+# Заголовки, в которых сервер может сообщить время до сброса ограничения
+RETRY_AFTER_HEADERS = ("Retry-After", "X-RateLimit-Reset", "RateLimit-Reset")
+RATE_LIMIT_REMAINING_HEADERS = ("X-RateLimit-Remaining", "RateLimit-Remaining")
+# Числовые значения больше порога считаются моментом сброса в секундах Unix-времени
+EPOCH_THRESHOLD = 1e9
+
+
+def parse_retry_after(headers: Optional[Mapping[str, Any]]) -> Optional[float]:
+    """Определяет по заголовкам ответа, сколько секунд следует подождать перед следующим запросом.
+
+    Поддерживаются `Retry-After` в секундах или в формате HTTP-даты, а также
+    `X-RateLimit-Reset` / `RateLimit-Reset` в секундах. Числовое значение
+    больше `EPOCH_THRESHOLD` считается моментом сброса в Unix-времени.
+
+    Args:
+        headers: Заголовки ответа
+
+    Returns:
+        Время ожидания в секундах или None, если сервер его не сообщил
+    """
+    if not headers:
+        return None
+
+    for name in RETRY_AFTER_HEADERS:
+        value = headers.get(name)
+        if not isinstance(value, str) or not value.strip():
+            continue
+        value = value.strip()
+        try:
+            seconds = float(value)
+        except ValueError:
+            pass
+        else:
+            if seconds > EPOCH_THRESHOLD:
+                seconds -= time.time()
+            return max(seconds, 0.0)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            continue
+        return max(retry_at.timestamp() - time.time(), 0.0)
+
+    return None
+
+
+def is_rate_limit_exhausted(headers: Optional[Mapping[str, Any]]) -> bool:
+    """Проверяет, сообщил ли сервер об исчерпании лимита запросов в успешном ответе."""
+    if not headers:
+        return False
+
+    for name in RATE_LIMIT_REMAINING_HEADERS:
+        value = headers.get(name)
+        if isinstance(value, str):
+            try:
+                return float(value) <= 0
+            except ValueError:
+                return False
+
+    return False
+
+
+class AdaptiveRateLimiter:
+    """Адаптивный ограничитель запросов по схеме AIMD.
+
+    Пока ответы успешны, ограничение растет линейно: на `increase` запросов
+    в секунду за каждую секунду работы на текущей скорости. На ответ 429
+    ограничение умножается на `decrease`, но не чаще одного раза за `cooldown`
+    секунд и только по запросам, отправленным после предыдущего снижения:
+    ответы 429 на запросы, уже находившиеся в пути, его повторно не снижают.
+    Время из `Retry-After` приостанавливает выдачу токенов, но не более чем
+    на `max_pause` секунд.
+
+    Args:
+        max_rate: Верхняя граница ограничения в запросах в секунду
+        min_rate: Нижняя граница ограничения в запросах в секунду
+        increase: Прирост ограничения в запросах в секунду за секунду успешной работы
+        decrease: Множитель снижения ограничения при ответе 429
+        cooldown: Минимальный интервал между снижениями ограничения в секундах
+        max_pause: Максимальное время приостановки по заголовкам ответа в секундах
+    """
+
+    __slots__ = (
+        "limiter", "max_rate", "min_rate", "increase", "decrease", "cooldown", "max_pause",
+        "_rate", "_decreased_at", "_paused_until", "successes", "throttled",
+    )
+
+    def __init__(
+            self,
+            max_rate: float,
+            min_rate: float = 1.0,
+            increase: float = 1.0,
+            decrease: float = 0.5,
+            cooldown: float = 1.0,
+            max_pause: float = 60.0,
+    ) -> None:
+        self.max_rate = float(max_rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.max_pause = max_pause
+        self._rate = self.max_rate
+        self._decreased_at = float("-inf")
+        self._paused_until = 0.0
+        self.successes = 0
+        self.throttled = 0
+        self.limiter = TokenBucket(self._rate, 1)
+
+    @property
+    def rate(self) -> float:
+        """Текущее ограничение в запросах в секунду."""
+        return self._rate
+
+    def on_success(self, headers: Optional[Mapping[str, Any]] = None) -> None:
+        """Учитывает успешный ответ и повышает ограничение."""
+        self.successes += 1
+        if headers is not None and is_rate_limit_exhausted(headers):
+            retry_after = parse_retry_after(headers)
+            if retry_after:
+                self._pause(retry_after)
+            return
+
+        if self._rate < self.max_rate:
+            self._rate = min(self.max_rate, self._rate + self.increase / self._rate)
+            self.limiter.set_rate(self._rate)
+
+    def on_throttled(self, sent_at: float, headers: Optional[Mapping[str, Any]] = None) -> None:
+        """Учитывает ответ 429 и снижает ограничение.
+
+        Args:
+            sent_at: Время отправки запроса по `time.monotonic()`
+            headers: Заголовки ответа
+        """
+        self.throttled += 1
+        now = time.monotonic()
+
+        if sent_at >= self._decreased_at and now - self._decreased_at >= self.cooldown:
+            self._rate = max(self.min_rate, self._rate * self.decrease)
+            self._decreased_at = now
+            self.limiter.set_rate(self._rate)
+            # Накопленный запас токенов после снижения не расходуется пачкой
+            self.limiter.pause(1 / self._rate)
+            logger.debug("Получен ответ 429, ограничение снижено до %.2f запросов в сек", self._rate)
+
+        retry_after = parse_retry_after(headers)
+        if retry_after:
+            self._pause(retry_after)
+
+    def _pause(self, seconds: float) -> None:
+        """Приостанавливает выдачу токенов на указанное время, но не более `max_pause`."""
+        seconds = min(seconds, self.max_pause)
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self.limiter.pause(seconds)
+
+    def get_state(self) -> dict[str, Any]:
+        """Формирует текущее состояние ограничителя."""
+        return {
+            "rate": self._rate,
+            "min_rate": self.min_rate,
+            "max_rate": self.max_rate,
+            "paused_for": max(self._paused_until - time.monotonic(), 0.0),
+            "successes": self.successes,
+            "throttled": self.throttled,
+            "waiters": self.limiter.waiters,
+        }
+
+
+class AdaptiveRateManager:
+    """Менеджер адаптивных ограничителей запросов по client_id и конечным точкам API."""
+
+    def __init__(self) -> None:
+        self._limiters: dict[tuple[str, str], AdaptiveRateLimiter] = {}
+
+    def get_limiter(
+            self,
+            client_id: str,
+            endpoint: str,
+            max_rate: float,
+            min_rate: float = 1.0,
+            increase: float = 1.0,
+            decrease: float = 0.5,
+            max_pause: float = 60.0,
+    ) -> AdaptiveRateLimiter:
+        """Возвращает адаптивный ограничитель для client_id и конечной точки, создавая его при необходимости.
+
+        Args:
+            client_id: Идентификатор клиента
+            endpoint: Конечная точка API вместе с версией, например `v3/product/list`
+            max_rate: Верхняя граница ограничения в запросах в секунду
+            min_rate: Нижняя граница ограничения в запросах в секунду
+            increase: Прирост ограничения в запросах в секунду за секунду успешной работы
+            decrease: Множитель снижения ограничения при ответе 429
+            max_pause: Максимальное время приостановки по заголовкам ответа в секундах
+
+        Returns:
+            AdaptiveRateLimiter: Ограничитель конечной точки
+        """
+        key = (client_id, endpoint)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(max_rate, min_rate, increase, decrease, max_pause=max_pause)
+            self._limiters[key] = limiter
+        return limiter
+
+    def get_state(self, client_id: Optional[str] = None) -> dict[str, dict[str, dict[str, Any]]]:
+        """Формирует состояние адаптивных ограничителей.
+
+        Args:
+            client_id: Идентификатор клиента для отбора (опционально)
+
+        Returns:
+            Состояние ограничителей в виде `{client_id: {endpoint: состояние}}`
+        """
+        state: dict[str, dict[str, dict[str, Any]]] = {}
+        for (limiter_client_id, endpoint), limiter in tuple(self._limiters.items()):
+            if client_id is None or limiter_client_id == client_id:
+                state.setdefault(limiter_client_id, {})[endpoint] = limiter.get_state()
+        return state
+
+    def clear(self) -> None:
+        """Сбрасывает состояние всех адаптивных ограничителей."""
+        self._limiters.clear()
@@ -0,0 +1,231 @@
+import asyncio
+import contextvars
+import json
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Mapping, Optional, Sequence
+
+from .exceptions import APIClientError
+from .pagination import get_field
+
+# Загружает элементы по ключам одним запросом. Возвращает элементы по ключам,
+# отсутствующие ключи означают, что элемент не найден. Значением может быть
+# исключение, которое получит только вызов с этим ключом
+LoadBatch = Callable[[list[Hashable]], Awaitable[Mapping[Hashable, Any]]]
+
+# Ошибки запроса, вызванные отдельными ключами. Часть с такой ошибкой делится
+# пополам, пока ошибка не останется только у вызовов с ошибочными ключами
+SPLIT_ON_ERRORS: tuple[type[Exception], ...] = (APIClientError, ValueError)
+
+
+class BatchLoader:
+    """Собирает отдельные запросы элементов по ключам в общие запросы.
+
+    Ключи, запрошенные в течение `window` секунд, загружаются одним вызовом
+    `load_batch`. Если набрано `max_batch_size` ключей, запрос отправляется
+    сразу. Одинаковые ключи загружаются один раз. Общие запросы выполняются
+    в пустом контексте (`contextvars.Context`), а не в контексте одного из
+    вызовов. Каждый вызов получает свой элемент, None, если элемент не
+    найден, или свою ошибку: если запрос
+    отклонен из-за ошибочного ключа (`APIClientError`, ошибка валидации),
+    ключи делятся пополам и запрашиваются повторно, чтобы ошибку получили
+    только вызовы с ошибочными ключами. Ключи делятся по уровням: если на
+    `max_uniform_levels` уровнях подряд все части отклонены с той же ошибкой,
+    что и весь запрос, она считается ошибкой всего запроса и передается всем
+    вызовам без дальнейшего деления. Так ошибка, не зависящая от ключей,
+    обходится в 2 ** (max_uniform_levels + 1) − 1 запросов вместо 2n − 1.
+
+    Args:
+        load_batch: Загружает элементы по списку ключей
+        max_batch_size: Максимальное количество ключей в одном запросе
+        window: Время сбора ключей в секундах
+        split_on: Ошибки, при которых ключи делятся для поиска ошибочных
+        max_uniform_levels: Количество уровней деления, после которого ошибка всех частей
+            считается ошибкой всего запроса
+    """
+
+    def __init__(
+            self,
+            load_batch: LoadBatch,
+            max_batch_size: int = 1000,
+            window: float = 0.005,
+            split_on: tuple[type[Exception], ...] = SPLIT_ON_ERRORS,
+            max_uniform_levels: int = 3,
+    ) -> None:
+        self.load_batch = load_batch
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self.split_on = split_on
+        self.max_uniform_levels = max_uniform_levels
+        self._pending: dict[Hashable, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        self.loads = 0
+        self.batches = 0
+
+    async def load(self, key: Hashable) -> Any:
+        """Загружает элемент по ключу в составе общего запроса.
+
+        Args:
+            key: Ключ элемента
+
+        Returns:
+            Элемент или None, если элемент не найден
+        """
+        self.loads += 1
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._dispatch, context=contextvars.Context())
+        # Отмена одного вызова не отменяет загрузку ключа для других вызовов
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Sequence[Hashable]) -> list[Any]:
+        """Загружает элементы по ключам в составе общих запросов.
+
+        Returns:
+            Элементы в порядке ключей (None для ненайденных)
+
+        Raises:
+            Exception: Первая ошибка загрузки ключей
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        """Отправляет собранные ключи в отдельной задаче."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        # Общий запрос не наследует контекст вызова, открывшего окно сбора ключей
+        # (режим ответа, ограничитель и правила кеширования выполняющегося метода)
+        task = contextvars.Context().run(asyncio.ensure_future, self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[Hashable, asyncio.Future]) -> None:
+        try:
+            error = await self._resolve(batch)
+            if error is not None:
+                await self._split(batch, error)
+        except BaseException:
+            for future in batch.values():
+                if not future.done():
+                    future.cancel()
+            raise
+
+    async def _resolve(self, batch: dict[Hashable, asyncio.Future]) -> Optional[Exception]:
+        """Загружает ключи и передает результаты вызовам.
+
+        Returns:
+            Ошибка из `split_on`, по которой ключи нужно разделить, иначе None
+        """
+        self.batches += 1
+        try:
+            results = await self.load_batch(list(batch))
+        except self.split_on as e:
+            return e
+        except Exception as e:
+            self._fail(batch, e)
+            return None
+
+        for key, future in batch.items():
+            if future.done():
+                continue
+            result = results.get(key)
+            if isinstance(result, Exception):
+                self._fail({key: future}, result)
+            else:
+                future.set_result(result)
+        return None
+
+    async def _split(self, batch: dict[Hashable, asyncio.Future], error: Exception) -> None:
+        """Делит отклоненные ключи пополам, пока ошибка не останется только у ошибочных ключей."""
+        failed = [(batch, error)]
+        # Все части всех уровней отклонены с ошибкой всего запроса
+        uniform = True
+        level = 0
+        while failed:
+            if uniform and level >= self.max_uniform_levels:
+                for part, part_error in failed:
+                    self._fail(part, part_error)
+                return
+            parts = []
+            for part, part_error in failed:
+                if len(part) == 1:
+                    self._fail(part, part_error)
+                    continue
+                keys = list(part)
+                middle = len(keys) // 2
+                parts.append({key: part[key] for key in keys[:middle]})
+                parts.append({key: part[key] for key in keys[middle:]})
+            if not parts:
+                return
+            errors = await asyncio.gather(*(self._resolve(part) for part in parts))
+            level += 1
+            failed = [(part, part_error) for part, part_error in zip(parts, errors) if part_error is not None]
+            uniform = uniform and len(failed) == len(parts) and all(
+                _same_error(part_error, error) for _, part_error in failed
+            )
+
+    @staticmethod
+    def _fail(batch: dict[Hashable, asyncio.Future], error: Exception) -> None:
+        for future in batch.values():
+            if not future.done():
+                future.set_exception(error)
+                # Ошибка передается ожидающим вызовам, даже если все они уже отменены
+                future.exception()
+
+    def get_state(self) -> dict[str, int]:
+        """Формирует статистику загрузчика.
+
+        Returns:
+            Статистика в виде `{"loads": ..., "batches": ..., "pending": ...}`, где `loads` —
+            запрошенные ключи, `batches` — выполненные общие запросы
+        """
+        return {"loads": self.loads, "batches": self.batches, "pending": len(self._pending)}
+
+
+def _same_error(first: Exception, second: Exception) -> bool:
+    """Проверяет, что ошибки запросов совпадают по типу, сообщению и подробностям."""
+    return (
+        type(first) is type(second)
+        and first.args == second.args
+        and getattr(first, "details", None) == getattr(second, "details", None)
+    )
+
+
+def single_key(**lookups: Any) -> tuple[str, Hashable]:
+    """Возвращает имя и значение единственного заданного идентификатора.
+
+    Raises:
+        ValueError: Если задан не один идентификатор
+    """
+    given = [(name, value) for name, value in lookups.items() if value is not None]
+    if len(given) != 1:
+        raise ValueError(f"Укажите ровно один из идентификаторов: {', '.join(lookups)}")
+    return given[0]
+
+
+def index_items(
+        response: Any,
+        get_keys: Callable[[Any], Iterable[Hashable]],
+        field: str = "items",
+) -> dict[Hashable, Any]:
+    """Индексирует элементы ответа по ключам независимо от режима ответа.
+
+    Args:
+        response: Ответ: схема, словарь или байты
+        get_keys: Возвращает ключи элемента, по которым его можно запросить
+        field: Имя поля ответа со списком элементов
+
+    Returns:
+        Элементы по ключам
+    """
+    if isinstance(response, (bytes, bytearray)):
+        response = json.loads(response)
+    return {key: item for item in get_field(response, field) or () for key in get_keys(item)}
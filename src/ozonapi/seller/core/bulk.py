@@ -0,0 +1,163 @@
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, NamedTuple, Optional, Sequence, TypeVar
+
+from annotated_types import MaxLen
+from pydantic import BaseModel
+
+from .exceptions import APIBulkError
+from .pagination import get_field
+
+ItemT = TypeVar("ItemT")
+RequestT = TypeVar("RequestT", bound=BaseModel)
+
+# Объединяет ответы успешно выполненных частей в один ответ
+MergeResponses = Callable[[list[Any]], Any]
+
+
+class ChunkError(NamedTuple):
+    """Ошибка выполнения части пакетного запроса.
+
+    Attributes:
+        index: Порядковый номер части, начиная с 0
+        items: Элементы (идентификаторы) части
+        error: Исключение, которым завершился запрос части
+    """
+    index: int
+    items: list[Any]
+    error: Exception
+
+
+def max_items(model: type[BaseModel], field: str) -> Optional[int]:
+    """Возвращает объявленное в схеме запроса максимальное количество элементов списка.
+
+    Args:
+        model: Схема запроса
+        field: Имя поля со списком
+
+    Returns:
+        Значение `max_length` поля или None, если ограничение не задано
+    """
+    for constraint in model.model_fields[field].metadata:
+        if isinstance(constraint, MaxLen):
+            return constraint.max_length
+    return None
+
+
+def chunked(items: Sequence[ItemT], size: int) -> list[list[ItemT]]:
+    """Делит элементы на части не больше `size` элементов с сохранением порядка."""
+    return [list(items[start:start + size]) for start in range(0, len(items), size)]
+
+
+def merge_lists(field: str) -> MergeResponses:
+    """Создает функцию объединения ответов, склеивающую списки поля `field` по порядку частей.
+
+    Остальные поля берутся из ответа первой части.
+    """
+    def merge(responses: list[Any]) -> Any:
+        combined = [item for response in responses for item in get_field(response, field) or ()]
+        first = responses[0]
+        if isinstance(first, dict):
+            return {**first, field: combined}
+        return first.model_copy(update={field: combined})
+    return merge
+
+
+def merge_flags(field: str = "result") -> MergeResponses:
+    """Создает функцию объединения ответов с логическим полем `field`: результат истинен, если истинен у всех частей."""
+    def merge(responses: list[Any]) -> Any:
+        value = all(get_field(response, field) for response in responses)
+        first = responses[0]
+        if isinstance(first, dict):
+            return {**first, field: value}
+        return first.model_copy(update={field: value})
+    return merge
+
+
+async def execute_chunks(
+        fetch: Callable[[RequestT], Awaitable[Any]],
+        make_request: Callable[[list[ItemT]], RequestT],
+        chunks: Sequence[list[ItemT]],
+        merge: Optional[MergeResponses] = None,
+        concurrency: int = 8,
+) -> Any:
+    """Параллельно запрашивает готовые части и объединяет ответы.
+
+    Запросы частей выполняются одновременно (не более `concurrency`) через
+    ограничители запросов. Ошибка одной части не прерывает остальные.
+
+    Args:
+        fetch: Метод API, выполняющий запрос части
+        make_request: Формирует запрос из элементов части
+        chunks: Части с элементами (идентификаторами)
+        merge: Объединяет ответы частей в один ответ. Если не задана,
+            возвращается список ответов в порядке частей
+        concurrency: Максимальное количество одновременных запросов
+
+    Returns:
+        Объединенный ответ. В режиме ответа `ResponseMode.BYTES` ответы
+        частей перед объединением преобразуются в словари
+
+    Raises:
+        ValueError: Если не передано ни одной части
+        APIBulkError: Если запрос хотя бы одной части завершился ошибкой.
+            Содержит объединенный ответ успешных частей и ошибки по частям
+    """
+    if not chunks:
+        raise ValueError("Не передано ни одного элемента для запроса")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(chunk: list[ItemT]) -> Any:
+        async with semaphore:
+            response = await fetch(make_request(chunk))
+        if merge is not None and isinstance(response, (bytes, bytearray)):
+            return json.loads(response)
+        return response
+
+    results = await asyncio.gather(*(run(chunk) for chunk in chunks), return_exceptions=True)
+
+    responses, errors = [], []
+    for index, (chunk, result) in enumerate(zip(chunks, results)):
+        if isinstance(result, Exception):
+            errors.append(ChunkError(index, chunk, result))
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            responses.append(result)
+
+    if merge is None:
+        response = responses
+    else:
+        response = merge(responses) if responses else None
+    if errors:
+        raise APIBulkError(response, errors, len(chunks))
+    return response
+
+
+async def execute_chunked(
+        fetch: Callable[[RequestT], Awaitable[Any]],
+        make_request: Callable[[list[ItemT]], RequestT],
+        items: Sequence[ItemT],
+        chunk_size: int,
+        merge: Optional[MergeResponses] = None,
+        concurrency: int = 8,
+) -> Any:
+    """Делит элементы на максимальные части по `chunk_size`, параллельно запрашивает их и объединяет ответы.
+
+    Args:
+        fetch: Метод API, выполняющий запрос части
+        make_request: Формирует запрос из элементов части
+        items: Элементы (идентификаторы) в любом количестве
+        chunk_size: Максимальное количество элементов в одном запросе
+        merge: Объединяет ответы частей в один ответ (см. `execute_chunks()`)
+        concurrency: Максимальное количество одновременных запросов
+
+    Returns:
+        Объединенный ответ или список ответов частей
+
+    Raises:
+        ValueError: Если не передано ни одного элемента
+        APIBulkError: Если запрос хотя бы одной части завершился ошибкой
+    """
+    return await execute_chunks(fetch, make_request, chunked(items, chunk_size), merge, concurrency)
@@ -0,0 +1,142 @@
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_object_setattr = object.__setattr__
+
+
+class CompactRecord:
+    """Базовый класс компактных записей схем ответа.
+
+    Компактная запись хранит значения полей схемы в слотах без словаря
+    атрибутов экземпляра и служебных данных pydantic, поэтому занимает в
+    несколько раз меньше памяти. Поля доступны по тем же именам, что и в
+    схеме, только для чтения. Вложенные схемы хранятся компактными записями,
+    списки — кортежами. Классы записей создаются функцией `compact_type()`.
+    """
+
+    __slots__ = ()
+
+    _model: ClassVar[type[BaseModel]]
+    _fields: ClassVar[tuple[str, ...]]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Запись {type(self).__name__} доступна только для чтения")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Запись {type(self).__name__} доступна только для чтения")
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self) -> tuple:
+        return _restore, (self._model, tuple(getattr(self, name) for name in self._fields))
+
+    def to_model(self) -> BaseModel:
+        """Преобразует запись в экземпляр схемы (см. `from_compact()`)."""
+        return from_compact(self)
+
+
+def _restore(model: type[BaseModel], values: tuple) -> CompactRecord:
+    """Восстанавливает запись при распаковке `pickle`."""
+    cls = compact_type(model)
+    record = cls.__new__(cls)
+    for name, value in zip(cls._fields, values):
+        _object_setattr(record, name, value)
+    return record
+
+
+@lru_cache(maxsize=None)
+def compact_type(model: type[BaseModel]) -> type[CompactRecord]:
+    """Возвращает класс компактной записи схемы.
+
+    Класс создается один раз для каждой схемы.
+
+    Args:
+        model: Схема ответа
+
+    Returns:
+        Класс записи с полями схемы, например `CompactProductInfoListItem`
+    """
+    fields = tuple(model.model_fields)
+    return type(f"Compact{model.__name__}", (CompactRecord,), {
+        "__slots__": fields,
+        "__module__": __name__,
+        "__doc__": f"Компактная запись схемы `{model.__name__}` (поля только для чтения).",
+        "_model": model,
+        "_fields": fields,
+    })
+
+
+@lru_cache(maxsize=None)
+def _get_setters(model: type[BaseModel]) -> tuple[type[CompactRecord], tuple[tuple[str, Callable], ...]]:
+    """Формирует и кеширует класс записи и функции заполнения ее слотов."""
+    cls = compact_type(model)
+    return cls, tuple((name, getattr(cls, name).__set__) for name in cls._fields)
+
+
+def _to_compact_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return to_compact(value)
+    if isinstance(value, list):
+        return tuple([_to_compact_value(item) for item in value])
+    return value
+
+
+def _from_compact_value(value: Any) -> Any:
+    if isinstance(value, CompactRecord):
+        return from_compact(value)
+    if isinstance(value, tuple):
+        return [_from_compact_value(item) for item in value]
+    return value
+
+
+def to_compact(instance: BaseModel) -> CompactRecord:
+    """Преобразует экземпляр схемы в компактную запись.
+
+    Вложенные схемы преобразуются в записи, списки — в кортежи. Остальные
+    значения (строки, числа, даты, перечисления) переносятся без копирования.
+
+    Args:
+        instance: Экземпляр схемы, например элемент ответа `ProductInfoListItem`
+
+    Returns:
+        Компактная запись с полями схемы
+
+    Examples:
+        Базовое применение:
+            response = await api.product_info_list(request)
+            items = [to_compact(item) for item in response.items]
+            print(items[0].offer_id, items[0].stocks.has_stock)
+    """
+    cls, setters = _get_setters(type(instance))
+    record = cls.__new__(cls)
+    values = instance.__dict__
+    for name, setter in setters:
+        setter(record, _to_compact_value(values.get(name)))
+    return record
+
+
+def from_compact(record: CompactRecord) -> BaseModel:
+    """Преобразует компактную запись обратно в экземпляр схемы без повторной валидации.
+
+    Args:
+        record: Компактная запись, полученная `to_compact()`
+
+    Returns:
+        Экземпляр схемы, равный исходному
+    """
+    return record._model.model_construct(**{
+        name: _from_compact_value(getattr(record, name)) for name in record._fields
+    })
@@ -1,6 +1,7 @@
 from typing import Optional
 
 from ...infrastructure import logging
+from .response import ResponseMode
 
 from pydantic import Field, field_validator, ConfigDict, model_validator
 from pydantic_settings import BaseSettings
@@ -16,10 +17,21 @@ class APIConfig(BaseSettings):
         max_requests_per_second: Максимальное количество запросов в секунду (опционально, 50 по документации Ozon)
         min_instance_ttl: Длительность памяти об активных клиентах в секундах для ограничения запросов (опционально)
         connector_limit: Лимит одновременных соединений для клиента (опционально)
+        session_pooling: Сохранять HTTP-сессии и keep-alive соединения между запросами (опционально)
+        session_idle_timeout: Время простоя в секундах, после которого пуловая сессия закрывается (опционально)
+        keepalive_timeout: Время удержания простаивающего keep-alive соединения в секундах (опционально)
         request_timeout: Максимальное время ожидания ответа на запрос в секундах (опционально)
         max_retries: Максимальное количество повторных попыток для неудачных запросов (опционально)
         retry_min_wait: Минимальная задержка между повторами неудачных запросов в секундах (опционально)
         retry_max_wait: Максимальная задержка между повторами неудачных запросов в секундах (опционально)
+        response_mode: Режим формирования ответов методов API (опционально, по умолчанию `ResponseMode.VALIDATE`)
+        adaptive_rate_limit: Адаптивно подстраивать ограничение запросов к каждой конечной точке по ответам 429 (опционально)
+        adaptive_min_rate: Нижняя граница адаптивного ограничения в запросах в секунду (опционально)
+        adaptive_increase: Прирост адаптивного ограничения в запросах в секунду за секунду успешной работы (опционально)
+        adaptive_decrease: Множитель снижения адаптивного ограничения при ответе 429 (опционально)
+        coalesce_requests: Объединять одновременные одинаковые запросы на чтение в один (опционально)
+        batch_window: Время сбора отдельных запросов товаров в общий запрос в секундах (опционально)
+        response_cache: Кешировать ответы справочных методов (опционально)
 
         log_level: Уровень логирования (опционально)
         log_json: Выводить в JSON (опционально)
@@ -30,6 +42,7 @@ class APIConfig(BaseSettings):
         log_file: Имя файла логов (опционально, при указании логирует в файл)
         log_max_bytes: Максимальный размер файла логов в байтах (опционально)
         log_backup_files_count: Кол-во файлов архивных логов, которые нужно хранить (опционально)
+        log_sample_rate: Доля вызовов API, для которых записываются сообщения об отправке запроса и ответе (опционально, по умолчанию 1.0)
 
 
     Notes:
@@ -76,6 +89,20 @@ class APIConfig(BaseSettings):
         ge=1,
         description="Лимит одновременных соединений для клиента"
     )
+    session_pooling: bool = Field(
+        default=True,
+        description="Сохранять HTTP-сессии и keep-alive соединения между запросами"
+    )
+    session_idle_timeout: float = Field(
+        default=300.0,
+        gt=0,
+        description="Время простоя в секундах, после которого пуловая сессия закрывается"
+    )
+    keepalive_timeout: float = Field(
+        default=15.0,
+        gt=0,
+        description="Время удержания простаивающего keep-alive соединения в секундах"
+    )
     request_timeout: float = Field(
         default=30.0,
         gt=0,
@@ -97,6 +124,43 @@ class APIConfig(BaseSettings):
         gt=0,
         description="Максимальная задержка между повторами неудачных запросов в секундах"
     )
+    response_mode: ResponseMode = Field(
+        default=ResponseMode.VALIDATE,
+        description="Режим формирования ответов методов API"
+    )
+    adaptive_rate_limit: bool = Field(
+        default=True,
+        description="Адаптивно подстраивать ограничение запросов к каждой конечной точке по ответам 429"
+    )
+    adaptive_min_rate: float = Field(
+        default=1.0,
+        gt=0,
+        description="Нижняя граница адаптивного ограничения в запросах в секунду"
+    )
+    adaptive_increase: float = Field(
+        default=1.0,
+        gt=0,
+        description="Прирост адаптивного ограничения в запросах в секунду за секунду успешной работы"
+    )
+    adaptive_decrease: float = Field(
+        default=0.5,
+        gt=0,
+        lt=1,
+        description="Множитель снижения адаптивного ограничения при ответе 429"
+    )
+    coalesce_requests: bool = Field(
+        default=True,
+        description="Объединять одновременные одинаковые запросы на чтение в один"
+    )
+    batch_window: float = Field(
+        default=0.005,
+        ge=0,
+        description="Время сбора отдельных запросов товаров в общий запрос в секундах"
+    )
+    response_cache: bool = Field(
+        default=True,
+        description="Кешировать ответы справочных методов"
+    )
 
     log_level: Optional[str] = Field(
         'ERROR', pattern='^(DEBUG|INFO|WARNING|ERROR|CRITICAL)$',
@@ -127,6 +191,11 @@ class APIConfig(BaseSettings):
     log_backup_files_count: Optional[int] = Field(
         5, description="Кол-во архивных файлов."
     )
+    log_sample_rate: float = Field(
+        1.0, gt=0, le=1,
+        description="Доля вызовов API, для которых записываются сообщения об отправке запроса и ответе. "
+                    "Ошибки и повторы записываются всегда."
+    )
     logger: Optional[logging.Logger] = Field(
         None, description="Корневой логер раздела seller. Поле заполняется системой."
     )
@@ -1,34 +1,60 @@
 import asyncio
 import hashlib
+import itertools
 import json
-from logging import Logger
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from logging import Logger, LoggerAdapter
 from types import TracebackType
-from typing import Any, Literal, Optional, ClassVar
+from typing import Any, AsyncIterator, Iterable, Iterator, Literal, Optional, ClassVar, Sequence, TypeVar, Union, overload
 
 import aiohttp
 from dotenv import load_dotenv
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from pydantic import BaseModel
 
+from .adaptive_rate import AdaptiveRateLimiter, AdaptiveRateManager, parse_retry_after
+from .batch_loader import BatchLoader, LoadBatch
 from .config import APIConfig
-from .method_rate_limiter import MethodRateLimiterManager
+from .method_rate_limiter import MethodRateLimiterManager, current_method_limiter
+from .metrics import RequestMetrics, RequestTiming
+from .middleware import BUILTIN_MIDDLEWARE, DEFAULT_PIPELINE, Middleware, MiddlewarePipeline, RequestContext
+from .rate_limit_backend import RateLimiterBackend
 from .rate_limiter import RateLimiterManager
+from .response import ResponseMode, construct_model
+from .response_cache import ResponseCache, current_cache_policy
+from .response_store import ResponseStore, StoreKey
+from .retry import RetryBudget, RetryPolicy, is_idempotent
 from .sessions import SessionManager
+from .single_flight import SingleFlight, is_read_only, payload_digest
+from .streaming import STREAM_CHUNK_SIZE, JSONArrayScanner, StreamedPage, decode_item
+from .token_bucket import TokenBucket
 from .exceptions import (
     APIClientError,
     APIConflictError,
     APIError,
     APIForbiddenError,
     APINotFoundError,
-    APIServerError, APITooManyRequestsError,
+    APIServerError,
+    APITooManyRequestsError,
+    APITimeoutError,
+    APINetworkError,
+    APIConnectError,
 )
 
 from ...infrastructure import logging
-from ...infrastructure.logging import LoggingSettings
+from ...infrastructure.logging import ContextLoggerAdapter, LoggingSettings, SharedLoggingPipeline
+
+ResponseModelT = TypeVar("ResponseModelT", bound=BaseModel)
+
+# Режимы ответа, заданные через APIManager.response_mode() в текущем контексте, по id экземпляра
+_response_modes: ContextVar[dict[int, ResponseMode]] = ContextVar("ozonapi_response_modes", default={})
+
+# id экземпляров, для которых кеш ответов отключен через APIManager.bypass_response_cache() в текущем контексте
+_cache_bypass: ContextVar[frozenset[int]] = ContextVar("ozonapi_cache_bypass", default=frozenset())
+
+# Заменяет учет попытки запроса, пока сборщик метрик не подключен
+_NO_TIMING: AbstractContextManager[None] = nullcontext()
 
 
 class APIManager:
@@ -42,16 +68,26 @@ class APIManager:
     # Общие менеджеры для всех экземпляров класса
     _session_manager: ClassVar[Optional[SessionManager]] = None
     _method_rate_limiter_manager: ClassVar[Optional[MethodRateLimiterManager]] = None
+    _adaptive_rate_manager: ClassVar[AdaptiveRateManager] = AdaptiveRateManager()
+    _retry_budget: ClassVar[RetryBudget] = RetryBudget()
+    _single_flight: ClassVar[SingleFlight] = SingleFlight()
+    _response_cache: ClassVar[ResponseCache] = ResponseCache()
+    _response_store: ClassVar[Optional[ResponseStore]] = None
+    _request_metrics: ClassVar[Optional[RequestMetrics]] = None
     _initialized: ClassVar[bool] = False
 
     _class_logger: ClassVar[Logger] = APIConfig().logger
+    # Общий для всех экземпляров конвейер логирования с одним потоком записи
+    _logging_pipeline: ClassVar[SharedLoggingPipeline] = SharedLoggingPipeline("ozonapi.seller.client")
+    _instance_numbers: ClassVar[Iterator[int]] = itertools.count(1)
 
     def __init__(
             self,
             client_id: Optional[str] = None,
             api_key: Optional[str] = None,
             token: Optional[str] = None,
-            config: Optional[APIConfig] = None
+            config: Optional[APIConfig] = None,
+            middleware: Sequence[Middleware] = (),
     ) -> None:
         """
         Инициализация клиента API Ozon.
@@ -61,6 +97,8 @@ class APIManager:
             api_key: Ключ API для аутентификации
             token: OAuth-токен Ozon Seller API
             config: Конфигурация клиента
+            middleware: Собственные middleware запросов, выполняемые после встроенных
+                (см. `add_middleware()`)
         """
         self._config = self.load_config(config)
 
@@ -72,22 +110,26 @@ class APIManager:
 
         self._instance_id = id(self)
         self._closed = False
-        self._logging_manager = None
-        self._instance_logger_number = None
-        self._instance_logger: Logger = self._get_instance_logger()
+        self._retry_policies: dict[tuple[str, Optional[bool]], RetryPolicy] = {}
+        self._batch_loaders: dict[str, BatchLoader] = {}
+        self._middleware: tuple[Middleware, ...] = BUILTIN_MIDDLEWARE + tuple(middleware)
+        self._pipeline = MiddlewarePipeline(self._middleware) if middleware else DEFAULT_PIPELINE
 
         if self._token is not None and self._client_id is None:
             self._client_id = "OAuth {}".format(int(hashlib.sha256(self._token.encode()).hexdigest()[:10], 16) % 10000000)
 
-        self._rate_limiter = RateLimiterManager(
-            instance=self,
-            logger=logging.manager.get_logger(f"seller.client[{self._client_id}]-[{self._instance_logger_number}].rate_limiter")
-        )
+        self._instance_logger_number = next(APIManager._instance_numbers)
+        self._instance_logger: LoggerAdapter = self._get_instance_logger()
+
+        self._rate_limiter = RateLimiterManager(instance=self, logger=self._instance_logger)
 
         if APIManager._session_manager is None:
             APIManager._session_manager = SessionManager(
                 timeout=self._config.request_timeout,
                 connector_limit=self._config.connector_limit,
+                pooled=self._config.session_pooling,
+                idle_timeout=self._config.session_idle_timeout,
+                keepalive_timeout=self._config.keepalive_timeout,
                 instance_logger=logging.manager.get_logger(f"seller.client[{self._client_id}].session")
             )
         if APIManager._method_rate_limiter_manager is None:
@@ -96,7 +138,7 @@ class APIManager:
                 instance_logger=logging.manager.get_logger(f"seller.client[{self._client_id}].method_rate_limiter")
             )
 
-        self.logger.debug(f"API-клиент инициализирован")
+        self.logger.debug("API-клиент инициализирован")
 
     @classmethod
     def load_config(cls, user_config: APIConfig | None = None) -> APIConfig:
@@ -114,39 +156,28 @@ class APIManager:
                 )
             )
 
-    def _get_instance_logger(self) -> Logger:
-        """Инициализирует и возвращает настроенный логер для экземпляра.
+    def _get_instance_logger(self) -> LoggerAdapter:
+        """Возвращает логер экземпляра на общем конвейере логирования процесса.
 
-        Последнее значение `[x]` в домене обозначает порядковый номер активного
-        экземпляра менеджера для данного ClientID.
+        Логер с обработчиками создается один раз для каждого набора настроек
+        логирования, экземпляр получает только адаптер с ClientID и порядковым
+        номером экземпляра в процессе, которые выводятся в имени записи:
+        `ozonapi.seller.client[ClientID]-[x]`. Создание и закрытие экземпляра
+        не создает логеров, обработчиков и потоков.
         """
-
-        log_instance_count = 1
-
-        while True:
-            self._logging_manager = logging.LoggerManager(
-                f"ozonapi.seller.client[{self._client_id}]-[{log_instance_count}]"
+        logger = self._logging_pipeline.get_logger(
+            LoggingSettings.model_construct(
+                LEVEL=self._config.log_level,
+                JSON=self._config.log_json,
+                FORMAT=self._config.log_format,
+                USE_ASYNC=self._config.log_use_async,
+                DIR=self._config.log_dir,
+                FILE=self._config.log_file,
+                MAX_BYTES=self._config.log_max_bytes,
+                BACKUP_FILES_COUNT=self._config.log_backup_files_count,
             )
-
-            try:
-                self._logging_manager.configure(
-                    LoggingSettings(
-                        LEVEL=self._config.log_level,
-                        JSON=self._config.log_json,
-                        FORMAT=self._config.log_format,
-                        DIR=self._config.log_dir,
-                        FILE=self._config.log_file,
-                        MAX_BYTES=self._config.log_max_bytes,
-                        BACKUP_FILES_COUNT=self._config.log_backup_files_count,
-                    )
-                )
-            except RuntimeError:
-                log_instance_count += 1
-            else:
-                self._instance_logger_number = log_instance_count
-                break
-
-        return self._logging_manager.get_logger()
+        )
+        return ContextLoggerAdapter(logger, {"client_id": self._client_id, "instance": self._instance_logger_number})
 
     @classmethod
     async def initialize(cls) -> None:
@@ -210,8 +241,7 @@ class APIManager:
         if APIManager._session_manager:
             await APIManager._session_manager.remove_instance(self._client_id, self._instance_id)
 
-        self.logger.debug(f"Работа API-клиента завершена")
-        self._logging_manager.shutdown()
+        self.logger.debug("Работа API-клиента завершена")
 
     @property
     def client_id(self) -> str:
@@ -234,38 +264,296 @@ class APIManager:
         return "oauth" if self._token else "api_key"
 
     @property
-    def logger(self):
+    def logger(self) -> LoggerAdapter:
         """Возвращает логер экземпляра."""
         return self._instance_logger
 
-    def _create_retry_decorator(self):
-        """Создает декоратор повторов на основе конфигурации."""
+    @property
+    def middleware(self) -> tuple[Middleware, ...]:
+        """Цепочка middleware запросов экземпляра, включая встроенные."""
+        return self._middleware
 
-        def log_retry(retry_state):
-            self.logger.debug(
-                f"Попытка [{retry_state.attempt_number}/{self._config.max_retries}]. Запрос вернул ошибку: {retry_state.outcome.exception()}"
-            )
+    def add_middleware(self, middleware: Middleware, before: Optional[type[Middleware]] = None) -> None:
+        """Добавляет middleware в цепочку запросов экземпляра.
 
-        return retry(
-            retry=retry_if_exception_type(
-                (
-                    # Обрабатываемые механизмом retry ошибки
-                    APIServerError,
-                    APITooManyRequestsError,
-                    asyncio.TimeoutError
-                )
-            ),
-            stop=stop_after_attempt(self._config.max_retries + 1),
-            wait=wait_exponential(
-                multiplier=1,
-                min=self._config.retry_min_wait,
-                max=self._config.retry_max_wait
-            ),
-            # before_sleep=before_sleep_log(self.logger, 30),
-            after=log_retry,
-            reraise=True,
+        Встроенные middleware выполняются в порядке `LimitingMiddleware`, `LoggingMiddleware`,
+        `DecodingMiddleware`, `RetryMiddleware`. По умолчанию собственные middleware
+        выполняются после них: на этапе `post_receive` уже сформирован `ctx.result`,
+        а на этапе `on_error` уже принято решение о повторе в `ctx.retry_delay`.
+        Цепочка пересобирается при изменении и не влияет на время запроса.
+
+        Args:
+            middleware: Добавляемое middleware
+            before: Класс middleware, перед первым экземпляром которого нужно
+                добавить новое, например `DecodingMiddleware` для доступа к телу ответа
+                до формирования результата (по умолчанию в конец цепочки)
+
+        Raises:
+            ValueError: Если middleware класса `before` нет в цепочке
+
+        Examples:
+            Базовое применение:
+                class AuthMiddleware(Middleware):
+                    async def pre_send(self, ctx: RequestContext) -> None:
+                        ctx.headers = {"Authorization": f"Bearer {await tokens.get()}"}
+
+                api.add_middleware(AuthMiddleware())
+        """
+        chain = list(self._middleware)
+        if before is None:
+            chain.append(middleware)
+        else:
+            for index, item in enumerate(chain):
+                if isinstance(item, before):
+                    chain.insert(index, middleware)
+                    break
+            else:
+                raise ValueError(f"В цепочке нет middleware {before.__name__}")
+        self._set_middleware(chain)
+
+    def remove_middleware(self, middleware: Middleware) -> None:
+        """Удаляет middleware из цепочки запросов экземпляра.
+
+        Args:
+            middleware: Удаляемое middleware, в том числе встроенное
+        """
+        self._set_middleware(item for item in self._middleware if item is not middleware)
+
+    def _set_middleware(self, middleware: Iterable[Middleware]) -> None:
+        """Заменяет цепочку middleware и заранее отбирает обработчики этапов."""
+        self._middleware = tuple(middleware)
+        self._pipeline = MiddlewarePipeline(self._middleware)
+
+    @contextmanager
+    def response_mode(self, mode: Union[ResponseMode, str]) -> Iterator["APIManager"]:
+        """Задает режим формирования ответов методов API в пределах блока `with`.
+
+        Режим действует только для данного экземпляра и только в текущем контексте
+        выполнения (задаче asyncio), переопределяя `APIConfig.response_mode`.
+
+        Args:
+            mode: Режим формирования ответа по `ResponseMode`
+
+        Yields:
+            Текущий экземпляр API-клиента
+
+        Examples:
+            async with SellerAPI(client_id, api_key) as api:
+                with api.response_mode(ResponseMode.DICT):
+                    stocks = await api.product_info_stocks()  # dict
+        """
+        modes = _response_modes.get()
+        token = _response_modes.set({**modes, self._instance_id: ResponseMode(mode)})
+        try:
+            yield self
+        finally:
+            _response_modes.reset(token)
+
+    def _get_response_mode(self) -> ResponseMode:
+        """Возвращает режим формирования ответа для текущего вызова."""
+        return _response_modes.get().get(self._instance_id, self._config.response_mode)
+
+    @contextmanager
+    def bypass_response_cache(self) -> Iterator["APIManager"]:
+        """Отключает кеш ответов и постоянное хранилище ответов в пределах блока `with`.
+
+        Кешируемые методы (см. `cache_response`) запрашивают ответ у API, не
+        читая и не сохраняя его в кеше. Действует только для данного экземпляра
+        и только в текущем контексте выполнения (задаче asyncio).
+
+        Yields:
+            Текущий экземпляр API-клиента
+
+        Examples:
+            async with SellerAPI(client_id, api_key) as api:
+                with api.bypass_response_cache():
+                    warehouses = await api.warehouse_list()  # всегда из API
+        """
+        token = _cache_bypass.set(_cache_bypass.get() | {self._instance_id})
+        try:
+            yield self
+        finally:
+            _cache_bypass.reset(token)
+
+    def _is_response_cache_enabled(self) -> bool:
+        """Проверяет, кешируются ли ответы методов API в текущем вызове."""
+        return self._config.response_cache and self._instance_id not in _cache_bypass.get()
+
+    def _get_cached_response(self, name: str, *args: Any, **kwargs: Any) -> Optional[Any]:
+        """Возвращает актуальный ответ кешируемого метода API, сохраненный в любом режиме ответа.
+
+        Сначала проверяется ответ в текущем режиме, затем в остальных.
+
+        Args:
+            name: Имя метода API
+            *args: Позиционные аргументы вызова
+            **kwargs: Именованные аргументы вызова
+
+        Returns:
+            Закешированный ответ или None
+        """
+        if not self._is_response_cache_enabled():
+            return None
+        cache_key = getattr(type(self), name)._cache_key
+        current = self._get_response_mode()
+        for mode in (current, *(mode for mode in ResponseMode if mode is not current)):
+            response = self._response_cache.peek(cache_key(self, mode, *args, **kwargs))
+            if response is not None:
+                return response
+        return None
+
+    def _get_adaptive_limiter(self, endpoint: str) -> Optional[AdaptiveRateLimiter]:
+        """Возвращает адаптивный ограничитель конечной точки для client_id, если он включен в конфигурации."""
+        if not self._config.adaptive_rate_limit:
+            return None
+        return self._adaptive_rate_manager.get_limiter(
+            self._client_id,
+            endpoint,
+            max_rate=self._config.max_requests_per_second,
+            min_rate=self._config.adaptive_min_rate,
+            increase=self._config.adaptive_increase,
+            decrease=self._config.adaptive_decrease,
+            max_pause=self._config.retry_max_wait,
         )
 
+    @staticmethod
+    def _decode_response(response_model: type[BaseModel], body: bytes, mode: ResponseMode) -> Any:
+        """Формирует ответ из тела запроса в соответствии с режимом."""
+        if mode is ResponseMode.VALIDATE:
+            return response_model.model_validate_json(body)
+        if mode is ResponseMode.BYTES:
+            return body
+        data = json.loads(body)
+        if mode is ResponseMode.DICT:
+            return data
+        return construct_model(response_model, data)
+
+    @staticmethod
+    def _decode_response_timed(
+            response_model: type[BaseModel], body: bytes, mode: ResponseMode, timing: RequestTiming
+    ) -> Any:
+        """Формирует ответ как `_decode_response()`, учитывая длительность разбора JSON и формирования по схеме."""
+        if mode is ResponseMode.BYTES:
+            return body
+        started = time.perf_counter()
+        if mode is ResponseMode.VALIDATE:
+            # pydantic разбирает JSON и валидирует ответ за один проход, разбор отдельно не измеряется
+            result = response_model.model_validate_json(body)
+            timing.validate = time.perf_counter() - started
+            return result
+        data = json.loads(body)
+        decoded = time.perf_counter()
+        timing.decode = decoded - started
+        if mode is ResponseMode.DICT:
+            return data
+        result = construct_model(response_model, data)
+        timing.validate = time.perf_counter() - decoded
+        return result
+
+    def _measure_attempt(
+            self, metrics: Optional[RequestMetrics], endpoint: str, attempt: int
+    ) -> AbstractContextManager[Optional[RequestTiming]]:
+        """Возвращает учет попытки запроса в сборщике метрик или заглушку, если сборщик не подключен."""
+        if metrics is None:
+            return _NO_TIMING
+        return metrics.measure(self._client_id, endpoint, attempt)
+
+    async def _acquire(
+            self,
+            method_limiter: Optional[TokenBucket],
+            adaptive_limiter: Optional[AdaptiveRateLimiter],
+            timing: Optional[RequestTiming] = None,
+    ) -> None:
+        """Ожидает разрешения на запрос от ограничителей, учитывая время ожидания в `timing` по уровням.
+
+        Args:
+            method_limiter: Ограничитель метода API
+            adaptive_limiter: Адаптивный ограничитель конечной точки
+            timing: Длительности этапов попытки запроса (опционально)
+        """
+        adaptive_bucket = adaptive_limiter.limiter if adaptive_limiter is not None else None
+        if timing is None:
+            await self._rate_limiter.acquire(method_limiter, adaptive_bucket)
+            return
+
+        metrics = APIManager._request_metrics
+        client_limiter = self._rate_limiter.client_limiter
+
+        def on_wait(bucket: TokenBucket, seconds: float) -> None:
+            if bucket is method_limiter:
+                timing.add_limiter_wait("method", seconds)
+                if metrics is not None and bucket.name is not None:
+                    metrics.observe_limiter_wait(bucket.name, seconds)
+            elif bucket is adaptive_bucket:
+                timing.add_limiter_wait("adaptive", seconds)
+            elif bucket is client_limiter:
+                timing.add_limiter_wait("client", seconds)
+            else:
+                timing.add_limiter_wait("instance", seconds)
+
+        started = time.perf_counter()
+        await self._rate_limiter.acquire(method_limiter, adaptive_bucket, on_wait=on_wait)
+        timing.limiter_wait = time.perf_counter() - started
+
+    def _get_retry_policy(self, endpoint: str, idempotent: Optional[bool] = None) -> RetryPolicy:
+        """Возвращает политику повторов конечной точки, создавая ее при первом запросе.
+
+        Args:
+            endpoint: Конечная точка API без версии
+            idempotent: Явный признак идемпотентности запроса (по умолчанию определяется по конечной точке)
+        """
+        key = (endpoint, idempotent)
+        policy = self._retry_policies.get(key)
+        if policy is None:
+            policy = RetryPolicy(
+                max_retries=self._config.max_retries,
+                min_wait=self._config.retry_min_wait,
+                max_wait=self._config.retry_max_wait,
+                idempotent=is_idempotent(endpoint) if idempotent is None else idempotent,
+            )
+            self._retry_policies[key] = policy
+        return policy
+
+    def _get_batch_loader(self, name: str, load_batch: LoadBatch, max_batch_size: int) -> BatchLoader:
+        """Возвращает загрузчик экземпляра, собирающий отдельные запросы в общие, создавая его при первом запросе.
+
+        Для каждого режима ответа используется свой загрузчик: общие запросы
+        выполняются вне контекста вызовов, поэтому режим передается им явно.
+
+        Args:
+            name: Имя загрузчика, например `product_info_list:sku`; к нему добавляется режим ответа
+            load_batch: Загружает элементы по списку ключей
+            max_batch_size: Максимальное количество ключей в одном запросе
+        """
+        mode = self._get_response_mode()
+        name = f"{name}:{mode.value}"
+        loader = self._batch_loaders.get(name)
+        if loader is None:
+            async def load_in_mode(keys: list) -> Any:
+                with self.response_mode(mode):
+                    return await load_batch(keys)
+
+            loader = BatchLoader(load_in_mode, max_batch_size=max_batch_size, window=self._config.batch_window)
+            self._batch_loaders[name] = loader
+        return loader
+
+    async def get_batch_loader_stats(self) -> dict[str, dict[str, int]]:
+        """Возвращает статистику загрузчиков экземпляра, собирающих отдельные запросы товаров в общие.
+
+        Returns:
+            Статистика в виде `{имя загрузчика: {"loads": ..., "batches": ..., "pending": ...}}`
+        """
+        return {name: loader.get_state() for name, loader in self._batch_loaders.items()}
+
+    @staticmethod
+    def _decode_error_body(body: bytes) -> dict:
+        """Декодирует тело ошибочного ответа, прочитанное в байтах."""
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            return {"message": body.decode(errors="replace")}
+        return data if isinstance(data, dict) else {}
+
     @staticmethod
     def _handle_error_response(response, data: dict, log_context: dict) -> Optional[APIError]:
         """
@@ -283,7 +571,7 @@ class APIManager:
         message = data.get("message", "Unknown error")
         details = data.get("details", [])
 
-        APIManager._class_logger.warning(f"Ошибка API: {message}")
+        APIManager._class_logger.warning("Ошибка API: %s", message)
 
         error_map = {
             400: APIClientError,
@@ -294,9 +582,16 @@ class APIManager:
             500: APIServerError,
         }
 
-        exc_class = error_map.get(response.status, APIError)
-        return exc_class(code, message, details)
+        if response.status >= 500:
+            exc_class = APIServerError
+        else:
+            exc_class = error_map.get(response.status, APIError)
+        error = exc_class(code, message, details)
+        if response.status == 429 or response.status >= 500:
+            error.retry_after = parse_retry_after(getattr(response, "headers", None))
+        return error
 
+    @overload
     async def _request(
             self,
             method: Literal["post", "get", "put", "delete"] = "post",
@@ -304,7 +599,38 @@ class APIManager:
             endpoint: str = "",
             payload: Optional[dict[str, Any]] = None,
             params: Optional[dict[str, Any]] = None,
-    ) -> dict[str, Any]:
+            response_model: None = None,
+            *,
+            idempotent: Optional[bool] = None,
+            coalesce: Optional[bool] = None,
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def _request(
+            self,
+            method: Literal["post", "get", "put", "delete"] = "post",
+            api_version: str = "v1",
+            endpoint: str = "",
+            payload: Optional[dict[str, Any]] = None,
+            params: Optional[dict[str, Any]] = None,
+            *,
+            response_model: type[ResponseModelT],
+            idempotent: Optional[bool] = None,
+            coalesce: Optional[bool] = None,
+    ) -> ResponseModelT: ...
+
+    async def _request(
+            self,
+            method: Literal["post", "get", "put", "delete"] = "post",
+            api_version: str = "v1",
+            endpoint: str = "",
+            payload: Optional[dict[str, Any]] = None,
+            params: Optional[dict[str, Any]] = None,
+            response_model: Optional[type[BaseModel]] = None,
+            *,
+            idempotent: Optional[bool] = None,
+            coalesce: Optional[bool] = None,
+    ) -> Union[dict[str, Any], BaseModel]:
         """
         Выполняет HTTP-запрос к API Ozon с учетом ограничения запросов.
 
@@ -314,9 +640,20 @@ class APIManager:
             endpoint: Конечная точка API
             payload: Данные для отправки в формате JSON
             params: Query parameters
+            response_model: Схема ответа. Если указана, тело ответа валидируется
+                напрямую из байтов через `model_validate_json`, минуя построение словаря
+            idempotent: Безопасен ли повтор запроса после его отправки. По умолчанию
+                определяется по конечной точке: запросы, создающие задачи и операции
+                (`product/import`, `posting/fbs/ship` и т.п.), повторяются только
+                при ответе 429 или если соединение не было установлено
+            coalesce: Объединять ли запрос с одновременными одинаковыми запросами
+                того же client_id. По умолчанию объединяются только запросы на чтение
+                (см. `READ_ENDPOINTS`), если `APIConfig.coalesce_requests` включен
 
         Returns:
-            Ответ от API в формате JSON
+            Ответ от API в формате JSON или экземпляр `response_model`, если схема указана.
+            При указанной схеме форма ответа определяется режимом `ResponseMode`
+            (см. `response_mode()` и `APIConfig.response_mode`)
 
         Raises:
             APIClientError: При ошибках клиента (400)
@@ -324,100 +661,447 @@ class APIManager:
             APINotFoundError: При отсутствии ресурса (404)
             APIConflictError: При конфликте данных (409)
             APITooManyRequestsError: При превышении кол-ва запросов (429)
-            APIServerError: При ошибках сервера (500)
+            APIServerError: При ошибках сервера (5xx)
+            APITimeoutError: При истечении времени ожидания ответа
+            APINetworkError: При сетевых ошибках
             APIError: При прочих ошибках
         """
         if self._closed:
             raise RuntimeError("API-клиент остановлен")
 
-        url = f"{self._config.base_url}/{api_version}/{endpoint}"
+        versioned_endpoint = f"{api_version}/{endpoint}"
+        url = f"{self._config.base_url}/{versioned_endpoint}"
 
-        def get_payload_snippet(p: dict | None) -> str | None:
-            """Возвращает сниппет запроса для отладки."""
-            if p is None:
-                return None
+        mode = self._get_response_mode() if response_model is not None else None
 
-            string = json.dumps(payload)
+        method_limiter = current_method_limiter.get()
+        adaptive_limiter = self._get_adaptive_limiter(versioned_endpoint)
 
-            return string if len(string) < 200 else string[:200] + "..."
+        retry_policy = self._get_retry_policy(endpoint, idempotent)
 
-        log_context: dict[str, Any] = {
-            "method": method,
-            "endpoint": f"{api_version}/{endpoint}",
-            "payload": get_payload_snippet(payload),
-        }
+        # Ответы кешируемых методов (см. cache_response) читаются из постоянного хранилища и сохраняются в него
+        cache_policy = current_cache_policy.get()
+        store = self._response_store if cache_policy is not None and response_model is not None else None
+        store_key = None
+        if store is not None:
+            store_key = StoreKey(
+                self._client_id, versioned_endpoint, payload_digest((method, payload, params)).hex()
+            )
 
-        self.logger.info(f"Отправка запроса к API: {log_context}")
+        async def _send():
+            """Выполнение запроса с повторами."""
+            if store is not None:
+                body = await store.get(store_key)
+                if body is not None:
+                    try:
+                        result = self._decode_response(response_model, body, mode)
+                    except ValueError as e:
+                        self.logger.warning("Сохраненный ответ %s не прошел валидацию: %s", versioned_endpoint, e)
+                    else:
+                        self.logger.info("Ответ получен из постоянного хранилища: %s", versioned_endpoint)
+                        return result
+            ctx = RequestContext(
+                self, method, endpoint, versioned_endpoint, url, payload, params,
+                response_model, mode, retry_policy, method_limiter, adaptive_limiter,
+            )
+            result = await self._run_pipeline(ctx)
+            if store is not None:
+                await store.set(store_key, ctx.body, cache_policy.ttl)
+            return result
+
+        if coalesce is None:
+            coalesce = self._config.coalesce_requests and is_read_only(endpoint)
+        if not coalesce:
+            return await _send()
+
+        # Объединенные вызовы получают общий результат: один и тот же объект ответа
+        key = (
+            self._client_id, versioned_endpoint, method,
+            payload_digest(payload), payload_digest(params), response_model, mode,
+        )
+        return await self._single_flight.do(key, _send, self._client_id, versioned_endpoint)
 
-        instance_limiter = self._rate_limiter.instance_limiter
-        client_limiter = self._rate_limiter.client_limiter
+    async def _run_pipeline(self, ctx: RequestContext) -> Any:
+        """Выполняет попытки запроса через цепочку middleware до результата или окончательной ошибки.
 
-        retry_decorator = self._create_retry_decorator()
-
-        async def _execute_request():
-            """Выполнение запроса."""
-            async with self._session_manager.get_session(
-                    client_id=self._client_id,
-                    api_key=self._api_key,
-                    instance_id=self._instance_id,
-                    token=self._token
-            ) as session:
-                async with instance_limiter, client_limiter:
-                    try:
-                        async with session.request(
-                                method, url, json=payload, params=params
-                        ) as response:
-                            data = await response.json()
-
-                            log_context.update({
-                                "status_code": response.status,
-                                "response_size": len(str(data))
-                            })
-
-                            log_context_remove_keys = [
-                                'method', 'has_payload', 'payload'
-                            ]
-
-                            for key in log_context_remove_keys:
-                                if key in log_context:
-                                    del (log_context[key])
-
-                            if response.status >= 400:
-                                error = self._handle_error_response(response, data, log_context)
-                                if error:
-                                    raise error
-
-                            self.logger.info(f"Получен ответ от API: {log_context}")
-                            return data
-
-                    except asyncio.TimeoutError:
-                        self.logger.error("Таймаут запроса к API")
-                        raise APIError(408, "Request timeout")
-                    except asyncio.CancelledError:
-                        self.logger.warning("Запрос к API отменен")
+        Args:
+            ctx: Контекст вызова
+
+        Returns:
+            Результат вызова, сформированный на этапе `post_receive`
+        """
+        pipeline = self._pipeline
+        metrics = APIManager._request_metrics
+        self._retry_budget.deposit()
+        while True:
+            ctx.reset_response()
+            try:
+                with self._measure_attempt(metrics, ctx.versioned_endpoint, ctx.attempt) as timing:
+                    ctx.timing = timing
+                    for stage in pipeline.pre_send:
+                        await stage(ctx)
+                    return await self._transport(ctx)
+            except Exception as e:
+                if not await self._retry_after_error(ctx, e):
+                    raise
+
+    async def _retry_after_error(self, ctx: RequestContext, error: Exception) -> bool:
+        """Выполняет этапы `on_error` и, если назначен повтор, этапы `on_retry` и ожидание перед повтором.
+
+        Returns:
+            True, если запрос нужно повторить
+        """
+        pipeline = self._pipeline
+        for stage in pipeline.on_error:
+            await stage(ctx, error)
+        if ctx.retry_delay is None:
+            return False
+        ctx.attempt += 1
+        for stage in pipeline.on_retry:
+            await stage(ctx, error)
+        await asyncio.sleep(ctx.retry_delay)
+        return True
+
+    async def _transport(self, ctx: RequestContext) -> Any:
+        """Отправляет запрос, читает тело ответа и выполняет этапы `post_receive`.
+
+        Returns:
+            Результат вызова из `ctx.result`
+
+        Raises:
+            APITimeoutError: При истечении времени ожидания ответа
+            APIConnectError: Если соединение не было установлено
+            APINetworkError: При прочих сетевых ошибках
+        """
+        timing = ctx.timing
+        async with self._session_manager.get_session(
+                client_id=self._client_id,
+                api_key=self._api_key,
+                instance_id=self._instance_id,
+                token=self._token
+        ) as session:
+            try:
+                if timing is not None:
+                    request_started = time.perf_counter()
+                async with session.request(
+                        ctx.method, ctx.url, json=ctx.payload, params=ctx.params, headers=ctx.headers,
+                        trace_request_ctx=timing,
+                ) as response:
+                    ctx.response = response
+                    ctx.status = response.status
+                    if timing is not None:
+                        headers_received = time.perf_counter()
+                        timing.status = response.status
+                        timing.ttfb = headers_received - request_started - timing.connect
+                    ctx.body = await response.read()
+                    if timing is not None:
+                        timing.size = len(ctx.body)
+                        timing.download = time.perf_counter() - headers_received
+                    if ctx.response_model is None and ctx.status < 400:
+                        # Разбор JSON выполняется по уже прочитанному телу
+                        ctx.data = await response.json()
+                        if timing is not None:
+                            timing.decode = time.perf_counter() - headers_received - timing.download
+
+                    for stage in self._pipeline.post_receive:
+                        await stage(ctx)
+                    return ctx.result
+
+            except asyncio.TimeoutError as e:
+                raise APITimeoutError(408, "Request timeout") from e
+            except asyncio.CancelledError:
+                self.logger.warning("Запрос к API отменен")
+                raise
+            except (aiohttp.ClientError, ConnectionError, OSError) as e:
+                if isinstance(e, aiohttp.ClientConnectorError):
+                    raise APIConnectError(0, f"Network error: {str(e)}") from e
+                raise APINetworkError(0, f"Network error: {str(e)}") from e
+
+    def _stream_request(
+            self,
+            method: Literal["post", "get", "put", "delete"] = "post",
+            api_version: str = "v1",
+            endpoint: str = "",
+            payload: Optional[dict[str, Any]] = None,
+            *,
+            item_path: Sequence[str],
+            item_model: type[BaseModel],
+    ) -> StreamedPage:
+        """
+        Выполняет HTTP-запрос к API Ozon и выдает элементы списка по мере получения тела ответа.
+
+        Тело ответа читается из соединения фрагментами, и каждый полученный
+        целиком элемент массива `item_path` сразу формируется по схеме
+        `item_model` в соответствии с режимом ответа. Ответ целиком в памяти
+        не хранится. Повторы выполняются, только пока не выдан первый элемент.
+
+        Args:
+            method: HTTP метод запроса
+            api_version: Версия API
+            endpoint: Конечная точка API
+            payload: Данные для отправки в формате JSON
+            item_path: Путь ключей к массиву элементов в ответе, например `("result", "postings")`
+            item_model: Схема элемента
+
+        Returns:
+            Страница, по которой выполняется асинхронная итерация. Поля ответа вне
+            массива элементов доступны в `data` после выдачи всех элементов
+
+        Raises:
+            APIError: Те же ошибки, что и у `_request()`
+        """
+        if self._closed:
+            raise RuntimeError("API-клиент остановлен")
+
+        versioned_endpoint = f"{api_version}/{endpoint}"
+        url = f"{self._config.base_url}/{versioned_endpoint}"
+        mode = self._get_response_mode()
+        method_limiter = current_method_limiter.get()
+        adaptive_limiter = self._get_adaptive_limiter(versioned_endpoint)
+        retry_policy = self._get_retry_policy(endpoint)
+
+        async def produce(page: StreamedPage) -> AsyncIterator[Any]:
+            ctx = RequestContext(
+                self, method, endpoint, versioned_endpoint, url, payload, None,
+                None, mode, retry_policy, method_limiter, adaptive_limiter, stream=True,
+            )
+            pipeline = self._pipeline
+            metrics = APIManager._request_metrics
+            self._retry_budget.deposit()
+            while True:
+                ctx.reset_response()
+                try:
+                    with self._measure_attempt(metrics, versioned_endpoint, ctx.attempt) as timing:
+                        ctx.timing = timing
+                        for stage in pipeline.pre_send:
+                            await stage(ctx)
+                        async with self._session_manager.get_session(
+                                client_id=self._client_id,
+                                api_key=self._api_key,
+                                instance_id=self._instance_id,
+                                token=self._token
+                        ) as session:
+                            try:
+                                if timing is not None:
+                                    request_started = time.perf_counter()
+                                async with session.request(
+                                        method, url, json=payload, headers=ctx.headers, trace_request_ctx=timing
+                                ) as response:
+                                    ctx.response = response
+                                    ctx.status = response.status
+                                    if timing is not None:
+                                        headers_received = time.perf_counter()
+                                        timing.status = response.status
+                                        timing.ttfb = headers_received - request_started - timing.connect
+                                    if response.status >= 400:
+                                        ctx.body = await response.read()
+                                    for stage in pipeline.post_receive:
+                                        await stage(ctx)
+
+                                    scanner = JSONArrayScanner(item_path)
+                                    response_size = 0
+                                    async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                                        response_size += len(chunk)
+                                        for raw in scanner.feed(chunk):
+                                            # Выданные элементы нельзя отозвать, поэтому после начала выдачи запрос не повторяется
+                                            ctx.started = True
+                                            yield decode_item(item_model, raw, mode)
+                                    page.data = scanner.close()
+                                    if timing is not None:
+                                        # Загрузка потокового ответа включает формирование элементов и их обработку
+                                        timing.size = response_size
+                                        timing.download = time.perf_counter() - headers_received
+                                    return
+                            except asyncio.TimeoutError as e:
+                                raise APITimeoutError(408, "Request timeout") from e
+                            except (aiohttp.ClientError, ConnectionError, OSError) as e:
+                                if isinstance(e, aiohttp.ClientConnectorError):
+                                    raise APIConnectError(0, f"Network error: {str(e)}") from e
+                                raise APINetworkError(0, f"Network error: {str(e)}") from e
+                except Exception as e:
+                    if not await self._retry_after_error(ctx, e):
                         raise
-                    except (aiohttp.ClientError, ConnectionError, OSError) as e:
-                        log_context.update({
-                            "error_type": type(e).__name__,
-                            "error_message": str(e)
-                        })
-                        self.logger.error(
-                            f"Сетевая ошибка при выполнении запроса к API: {str(e)}",
-                            extra=log_context
-                        )
-                        raise APIError(0, f"Network error: {str(e)}")
-
-        _execute_request_retry = retry_decorator(_execute_request)
-        return await _execute_request_retry()
+
+        return StreamedPage(produce)
 
     @classmethod
     async def get_active_client_ids(cls) -> list[str]:
         """Возвращает список client_id с активными экземплярами."""
         return RateLimiterManager.get_active_client_ids()
 
+    @classmethod
+    async def get_session_stats(cls) -> dict[str, dict[str, int]]:
+        """Возвращает статистику по HTTP-сессиям и повторному использованию соединений."""
+        if cls._session_manager:
+            return cls._session_manager.get_stats()
+        return dict()
+
+    @classmethod
+    def set_rate_limit_backend(cls, backend: Optional[RateLimiterBackend]) -> None:
+        """Подключает общее хранилище ограничителей запросов для нескольких процессов или хостов.
+
+        Args:
+            backend: Хранилище ограничителей (`FileLockBackend`, `RedisBackend` и т.п.)
+                или None для ограничения запросов в пределах процесса
+
+        Examples:
+            SellerAPI.set_rate_limit_backend(FileLockBackend("/tmp/ozonapi-rate-limit"))
+        """
+        RateLimiterManager.set_backend(backend)
+
+    @classmethod
+    def set_retry_budget(cls, budget: RetryBudget) -> None:
+        """Заменяет общий для процесса бюджет повторов запросов.
+
+        Args:
+            budget: Бюджет повторов
+
+        Examples:
+            SellerAPI.set_retry_budget(RetryBudget(ratio=0.1, min_per_second=1))
+        """
+        APIManager._retry_budget = budget
+
+    @classmethod
+    async def get_retry_stats(cls) -> dict[str, Any]:
+        """Возвращает состояние общего бюджета повторов запросов.
+
+        Returns:
+            Состояние в виде `{"available": ..., "requests": ..., "retries": ..., "rejected": ...}`
+        """
+        return APIManager._retry_budget.get_state()
+
+    @classmethod
+    async def get_adaptive_rate_stats(cls, client_id: Optional[str] = None) -> dict[str, dict[str, dict[str, Any]]]:
+        """Возвращает состояние адаптивных ограничителей по client_id и конечным точкам.
+
+        Args:
+            client_id: Идентификатор клиента для отбора (опционально)
+
+        Returns:
+            Состояние в виде `{client_id: {endpoint: {"rate": ..., "throttled": ..., ...}}}`
+        """
+        return cls._adaptive_rate_manager.get_state(client_id)
+
+    @classmethod
+    async def get_coalescing_stats(cls, client_id: Optional[str] = None) -> dict[str, dict[str, dict[str, int]]]:
+        """Возвращает статистику объединения одновременных одинаковых запросов.
+
+        Args:
+            client_id: Идентификатор клиента для отбора (опционально)
+
+        Returns:
+            Статистика в виде `{client_id: {endpoint: {"requests": ..., "coalesced": ..., "in_flight": ...}}}`
+        """
+        return cls._single_flight.get_state(client_id)
+
+    @classmethod
+    def set_response_cache(cls, cache: ResponseCache) -> None:
+        """Заменяет общий для процесса кеш ответов API.
+
+        Args:
+            cache: Кеш ответов
+
+        Examples:
+            SellerAPI.set_response_cache(ResponseCache(max_entries=10000))
+        """
+        APIManager._response_cache = cache
+
+    @classmethod
+    def invalidate_response_cache(cls, client_id: Optional[str] = None, method: Optional[str] = None) -> int:
+        """Удаляет закешированные ответы API.
+
+        Args:
+            client_id: Идентификатор клиента (по умолчанию все клиенты)
+            method: Имя метода API, например `warehouse_list` (по умолчанию все методы)
+
+        Returns:
+            Количество удаленных ответов
+
+        Examples:
+            # После добавления склада в личном кабинете
+            SellerAPI.invalidate_response_cache(client_id, "warehouse_list")
+        """
+        return APIManager._response_cache.invalidate(client_id, method)
+
+    @classmethod
+    def set_response_store(cls, store: Optional[ResponseStore]) -> None:
+        """Подключает постоянное хранилище ответов кешируемых методов.
+
+        Хранилище дополняет общий кеш ответов в памяти: при отсутствии ответа
+        в памяти он ищется в хранилище и только затем запрашивается у API.
+        Подключите хранилище до начала запросов.
+
+        Args:
+            store: Хранилище ответов или None для отключения
+
+        Examples:
+            # Несколько процессов на одном хосте и перезапуски
+            SellerAPI.set_response_store(FileResponseStore("/var/cache/ozonapi"))
+        """
+        APIManager._response_store = store
+
+    @classmethod
+    async def get_response_cache_stats(cls) -> dict[str, int]:
+        """Возвращает статистику общего кеша ответов API.
+
+        Returns:
+            Статистика в виде `{"entries": ..., "hits": ..., "stale_hits": ..., "misses": ..., ...}`
+        """
+        return APIManager._response_cache.get_state()
+
+    @classmethod
+    def set_request_metrics(cls, metrics: Optional[RequestMetrics]) -> None:
+        """Подключает сборщик длительности этапов запросов к API.
+
+        Пока сборщик не подключен, этапы запросов не измеряются и запросы
+        выполняются без дополнительных затрат. Сборщик общий для всех
+        экземпляров в процессе.
+
+        Args:
+            metrics: Сборщик метрик или None для отключения
+
+        Examples:
+            metrics = RequestMetrics(hooks=[lambda timing: print(timing.as_dict())])
+            SellerAPI.set_request_metrics(metrics)
+        """
+        APIManager._request_metrics = metrics
+
+    @classmethod
+    async def get_request_stats(cls, client_id: Optional[str] = None) -> dict[str, Any]:
+        """Возвращает метрики запросов по конечным точкам и текущую загрузку ограничителей.
+
+        Args:
+            client_id: Идентификатор клиента для отбора (опционально)
+
+        Returns:
+            Статистика в виде `{"endpoints": {client_id: {endpoint: {"requests": ..., "retries": ...,
+            "throttled": ..., "errors": ..., "bytes": ..., "in_flight": ..., "phases": {этап: сводка},
+            "limiter_waits": {уровень: сводка}}}}, "limiters": {client_id: {"client": {...},
+            "instances": {...}}}}`. Раздел `endpoints` пуст, пока сборщик метрик не подключен
+            (см. `set_request_metrics()`), раздел `limiters` заполняется всегда
+        """
+        metrics = APIManager._request_metrics
+        return {
+            "endpoints": metrics.get_state(client_id) if metrics is not None else {},
+            "limiters": RateLimiterManager.get_limiter_state(client_id),
+        }
+
     @classmethod
     async def get_method_limiter_stats(cls) -> dict[str, dict[str, Any]]:
-        """Возвращает статистику по ограничителям методов."""
+        """Возвращает статистику по ограничителям методов.
+
+        Returns:
+            Статистика в виде `{"client_id:метод": {"limit_requests": ..., "interval_seconds": ...,
+            "available_tokens": ..., "waiters": ..., "wait": ..., ...}}`, где `wait` — сводка
+            времени ожидания токена метода, если подключен сборщик метрик, иначе None
+        """
         if cls._method_rate_limiter_manager:
-            return await cls._method_rate_limiter_manager.get_limiter_stats()
+            stats = await cls._method_rate_limiter_manager.get_limiter_stats()
+            metrics = APIManager._request_metrics
+            for limiter_stats in stats.values():
+                name = limiter_stats.get("name")
+                limiter_stats["wait"] = (
+                    metrics.get_limiter_wait(name) if metrics is not None and name is not None else None
+                )
+            return stats
         return dict()
@@ -4,6 +4,8 @@ class APIError(Exception):
         self.code = code
         self.message = message
         self.details = details or []
+        # Время до повтора из заголовков ответа, если сервер его сообщил
+        self.retry_after: float | None = None
         super().__init__(f"API Error {code}: {message}")
 
 
@@ -34,3 +36,38 @@ class APITooManyRequestsError(APIError):
 class APIServerError(APIError):
     """Ошибка 500: Внутренняя ошибка сервера."""
     pass
+
+
+class APITimeoutError(APIError):
+    """Ошибка 408: Истекло время ожидания ответа."""
+    pass
+
+
+class APINetworkError(APIError):
+    """Сетевая ошибка: соединение разорвано или ответ не получен."""
+    pass
+
+
+class APIConnectError(APINetworkError):
+    """Сетевая ошибка: не удалось установить соединение, запрос не был отправлен."""
+    pass
+
+
+class APIBulkError(APIError):
+    """Ошибка выполнения части запросов пакетного метода.
+
+    Attributes:
+        response: Объединенный ответ успешно выполненных частей или None, если ошибкой завершились все части
+        errors: Ошибки частей по схеме `ChunkError` (номер части, ее элементы и исключение)
+        total: Общее количество частей
+    """
+    def __init__(self, response, errors: list, total: int):
+        self.response = response
+        self.errors = errors
+        self.total = total
+        first = errors[0].error
+        super().__init__(
+            getattr(first, "code", 0),
+            f"Ошибкой завершились {len(errors)} из {total} частей запроса, первая: {first}",
+            errors,
+        )
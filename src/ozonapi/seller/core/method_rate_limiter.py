@@ -1,14 +1,17 @@
 import asyncio
-import hashlib
 import time
+from contextvars import ContextVar
 from functools import wraps
 from typing import Optional, Any
 
-from aiolimiter import AsyncLimiter
 from pydantic import BaseModel, Field
 
+from .token_bucket import TokenBucket
 from ...infrastructure.logging import ozonapi_logger as logger
 
+# Ограничитель метода, токен которого списывается в APIManager._request вместе с токенами инстанса и client_id
+current_method_limiter: ContextVar[Optional[TokenBucket]] = ContextVar("ozonapi_method_limiter", default=None)
+
 
 class MethodRateLimitConfig(BaseModel):
     """Конфигурация ограничений для конкретного метода API."""
@@ -29,11 +32,10 @@ class MethodRateLimiterManager:
             min_instance_ttl: float = 300.0,
             instance_logger=logger
     ) -> None:
-        self._rate_limiters: dict[str, AsyncLimiter] = {}
-        self._limiter_configs: dict[str, MethodRateLimitConfig] = {}
-        self._last_used: dict[str, float] = {}
-        self._last_instance_creation: dict[str, float] = {}
-        self._lock = asyncio.Lock()
+        self._rate_limiters: dict[tuple[str, str], TokenBucket] = {}
+        self._limiter_configs: dict[tuple[str, str], MethodRateLimitConfig] = {}
+        self._last_used: dict[tuple[str, str], float] = {}
+        self._last_instance_creation: dict[tuple[str, str], float] = {}
         self._cleanup_task: Optional[asyncio.Task] = None
         self._shutdown = False
         self._cleanup_interval = cleanup_interval
@@ -60,61 +62,76 @@ class MethodRateLimiterManager:
 
     @staticmethod
     def _generate_limiter_key(client_id: str, method_identifier: str) -> str:
-        """Генерирует уникальный ключ для ограничителя метода."""
-        key_data = f"{client_id}:{method_identifier}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+        """Генерирует читаемый ключ ограничителя метода для статистики."""
+        return f"{client_id}:{method_identifier}"
 
-    async def get_limiter(self, client_id: str, config: MethodRateLimitConfig) -> AsyncLimiter:
+    def get_bucket(self, client_id: str, config: MethodRateLimitConfig) -> TokenBucket:
         """
-        Получает ограничитель для указанного метода и client_id.
+        Получает ограничитель для указанного метода и client_id без блокировок.
 
         Args:
             client_id: Идентификатор клиента
             config: Конфигурация ограничителя метода
 
         Returns:
-            AsyncLimiter: Ограничитель для метода
+            TokenBucket: Ограничитель для метода
         """
-        limiter_key = self._generate_limiter_key(client_id, config.method_identifier)
+        key = (client_id, config.method_identifier)
         current_time = time.monotonic()
+        limiter = self._rate_limiters.get(key)
 
-        async with self._lock:
-            if limiter_key not in self._rate_limiters:
-                limiter = AsyncLimiter(config.limit_requests, config.interval_seconds)
-                self._rate_limiters[limiter_key] = limiter
-                self._limiter_configs[limiter_key] = config
-                self._last_instance_creation[limiter_key] = current_time
-                self._logger.debug(
-                    f"Инициализирован ограничитель запросов для метода {config.method_identifier} "
-                    f"ClientID {client_id}: {config.limit_requests} запросов в {config.interval_seconds} сек"
-                )
+        if limiter is None:
+            limiter = TokenBucket(
+                config.limit_requests,
+                config.interval_seconds,
+                name=f"method:{client_id}:{config.method_identifier}",
+            )
+            self._rate_limiters[key] = limiter
+            self._limiter_configs[key] = config
+            self._last_instance_creation[key] = current_time
+            self._logger.debug(
+                "Инициализирован ограничитель запросов для метода %s ClientID %s: %s запросов в %s сек",
+                config.method_identifier, client_id, config.limit_requests, config.interval_seconds,
+            )
 
-            self._last_used[limiter_key] = current_time
-            return self._rate_limiters[limiter_key]
+        self._last_used[key] = current_time
+        return limiter
+
+    async def get_limiter(self, client_id: str, config: MethodRateLimitConfig) -> TokenBucket:
+        """
+        Получает ограничитель для указанного метода и client_id.
+
+        Args:
+            client_id: Идентификатор клиента
+            config: Конфигурация ограничителя метода
+
+        Returns:
+            TokenBucket: Ограничитель для метода
+        """
+        return self.get_bucket(client_id, config)
 
     async def _cleanup_unused_limiters(self) -> None:
         """Очистка неиспользуемых ограничителей методов с учетом минимального времени жизни."""
-        async with self._lock:
-            current_time = time.monotonic()
-            limiters_to_remove = []
-
-            for limiter_key in list(self._last_used.keys()):
-                last_used = self._last_used[limiter_key]
-                last_creation = self._last_instance_creation.get(limiter_key, last_used)
-                time_since_creation = current_time - last_creation
-                time_since_usage = current_time - last_used
-
-                if (time_since_usage > self._cleanup_interval and
-                        time_since_creation > self._min_instance_ttl):
-                    limiters_to_remove.append(limiter_key)
-
-            for limiter_key in limiters_to_remove:
-                config = self._limiter_configs.pop(limiter_key, None)
-                self._rate_limiters.pop(limiter_key, None)
-                self._last_used.pop(limiter_key, None)
-                self._last_instance_creation.pop(limiter_key, None)
-                if config:
-                    self._logger.debug(f"Очищен ограничитель для метода {config.method_identifier}")
+        current_time = time.monotonic()
+        limiters_to_remove = []
+
+        for limiter_key, last_used in tuple(self._last_used.items()):
+            last_creation = self._last_instance_creation.get(limiter_key, last_used)
+            time_since_creation = current_time - last_creation
+            time_since_usage = current_time - last_used
+
+            if (time_since_usage > self._cleanup_interval and
+                    time_since_creation > self._min_instance_ttl and
+                    not self._rate_limiters[limiter_key].waiters):
+                limiters_to_remove.append(limiter_key)
+
+        for limiter_key in limiters_to_remove:
+            config = self._limiter_configs.pop(limiter_key, None)
+            self._rate_limiters.pop(limiter_key, None)
+            self._last_used.pop(limiter_key, None)
+            self._last_instance_creation.pop(limiter_key, None)
+            if config:
+                self._logger.debug("Очищен ограничитель для метода %s", config.method_identifier)
 
     async def _cleanup_loop(self) -> None:
         """Фоновая задача для очистки неиспользуемых ограничителей."""
@@ -125,28 +142,46 @@ class MethodRateLimiterManager:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self._logger.error(f"Ошибка в cleanup loop методов: {e}")
+                self._logger.error("Ошибка в cleanup loop методов: %s", e)
                 await asyncio.sleep(60)
 
     async def get_limiter_stats(self) -> dict[str, dict[str, Any]]:
-        """Формирует статистику по ограничителям методов."""
+        """Формирует статистику по ограничителям методов.
+
+        Returns:
+            Статистика в виде `{"client_id:метод": {"client_id": ..., "method": ..., "name": ...,
+            "limit_requests": ..., "interval_seconds": ..., "available_tokens": ..., "waiters": ...,
+            "time_since_creation": ..., "time_since_usage": ..., ...}}`, где `name` — имя корзины
+            ограничителя, `waiters` — количество запросов, ожидающих токен метода
+        """
         current_time = time.monotonic()
-        async with self._lock:
-            stats = {}
-            for limiter_key in self._rate_limiters:
-                config = self._limiter_configs.get(limiter_key)
-                last_used = self._last_used.get(limiter_key, current_time)
-                last_creation = self._last_instance_creation.get(limiter_key, current_time)
-
-                if config:
-                    stats[limiter_key] = {
-                        "config": config,
-                        "last_used": last_used,
-                        "last_instance_creation": last_creation,
-                        "time_since_creation": current_time - last_creation,
-                        "time_since_usage": current_time - last_used,
-                    }
-            return stats
+        stats = {}
+        for limiter_key, limiter in tuple(self._rate_limiters.items()):
+            config = self._limiter_configs.get(limiter_key)
+            last_used = self._last_used.get(limiter_key, current_time)
+            last_creation = self._last_instance_creation.get(limiter_key, current_time)
+
+            if config:
+                stats[self._generate_limiter_key(*limiter_key)] = {
+                    "client_id": limiter_key[0],
+                    "method": config.method_identifier,
+                    "name": limiter.name,
+                    "limit_requests": config.limit_requests,
+                    "interval_seconds": config.interval_seconds,
+                    "config": config,
+                    "last_used": last_used,
+                    "last_instance_creation": last_creation,
+                    "time_since_creation": current_time - last_creation,
+                    "time_since_usage": current_time - last_used,
+                    "available_tokens": limiter.tokens,
+                    "waiters": limiter.waiters,
+                }
+        return stats
+
+
+def _get_logger(instance):
+    """Возвращает лог экземпляра или общий лог пакета."""
+    return instance.logger if hasattr(instance, '_logger') else logger
 
 
 def method_rate_limit(limit_requests: int, interval_seconds: float):
@@ -172,33 +207,38 @@ def method_rate_limit(limit_requests: int, interval_seconds: float):
 
         @wraps(method)
         async def wrapper(self, *args, **kwargs):
-            _logger = self.logger if hasattr(self, '_logger') else logger
             # Проверяем, что экземпляр имеет необходимые атрибуты
             if not hasattr(self, '_client_id') or not hasattr(self, '_method_rate_limiter_manager'):
-                _logger.warning(
-                    f"Метод {method_identifier} вызван без инициализации ограничителей. "
-                    "Ограничения не применяются."
+                _get_logger(self).warning(
+                    "Метод %s вызван без инициализации ограничителей. Ограничения не применяются.",
+                    method_identifier,
                 )
                 return await method(self, *args, **kwargs)
 
             # Дополнительная проверка, что менеджер не None
             if self._method_rate_limiter_manager is None:
-                _logger.warning(
-                    f"Менеджер ограничителей методов не инициализирован для {method_identifier}. "
-                    "Ограничения не применяются."
+                _get_logger(self).warning(
+                    "Менеджер ограничителей методов не инициализирован для %s. Ограничения не применяются.",
+                    method_identifier,
                 )
                 return await method(self, *args, **kwargs)
 
             # Получаем ограничитель запросов для этого метода
-            method_limiter = await self._method_rate_limiter_manager.get_limiter(
-                self._client_id, config
-            )
+            method_limiter = self._method_rate_limiter_manager.get_bucket(self._client_id, config)
+
+            if hasattr(self, '_rate_limiter'):
+                # Токен метода списывается в _request атомарно с токенами инстанса и client_id
+                token = current_method_limiter.set(method_limiter)
+                try:
+                    return await method(self, *args, **kwargs)
+                finally:
+                    current_method_limiter.reset(token)
 
             # Применяем ограничитель запросов
             async with method_limiter:
-                _logger.debug(
-                    f"Применен ограничитель метода {method_identifier} для ClientID {self._client_id}: "
-                    f"{limit_requests} запросов в {interval_seconds} сек"
+                _get_logger(self).debug(
+                    "Применен ограничитель метода %s для ClientID %s: %s запросов в %s сек",
+                    method_identifier, self._client_id, limit_requests, interval_seconds,
                 )
                 return await method(self, *args, **kwargs)
 
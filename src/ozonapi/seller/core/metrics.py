@@ -0,0 +1,329 @@
+import bisect
+import math
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from ...infrastructure.logging import ozonapi_logger as logger
+
+# Этапы запроса, длительность которых учитывается в гистограммах:
+# limiter_wait — ожидание токенов всех ограничителей (инстанс, client_id, метод, конечная точка),
+# connect — ожидание свободного соединения в пуле и установка нового соединения,
+# ttfb — от отправки запроса до получения заголовков ответа (без connect),
+# download — чтение тела ответа,
+# decode — разбор JSON в словарь,
+# validate — формирование ответа по схеме (в режиме VALIDATE включает разбор JSON,
+# который pydantic выполняет за один проход),
+# total — попытка целиком, включая ожидание ограничителей
+PHASES = ("limiter_wait", "connect", "ttfb", "download", "decode", "validate", "total")
+
+# Уровни ограничителей, ожидание которых учитывается отдельно
+LIMITER_LEVELS = ("instance", "client", "method", "adaptive")
+
+# Верхние границы корзин гистограмм в секундах, последняя корзина не ограничена
+BUCKET_BOUNDS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+MetricsHook = Callable[["RequestTiming"], None]
+
+
+class Histogram:
+    """Гистограмма длительностей с фиксированными границами корзин `BUCKET_BOUNDS`.
+
+    Учет значения выполняется за O(log n) по числу корзин без хранения самих значений,
+    поэтому память не растет с количеством запросов.
+    """
+
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Учитывает длительность в секундах."""
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Возвращает оценку квантиля сверху: границу корзины, в которую он попадает.
+
+        Args:
+            q: Уровень квантиля от 0 до 1
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(BUCKET_BOUNDS, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def get_state(self) -> dict[str, Any]:
+        """Формирует сводку гистограммы.
+
+        Returns:
+            Сводка в виде `{"count": ..., "sum": ..., "mean": ..., "max": ..., "p50": ..., "p90": ...,
+            "p99": ..., "buckets": {граница: количество}}`, где последняя граница равна `math.inf`
+        """
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip(BUCKET_BOUNDS + (math.inf,), self.counts)),
+        }
+
+
+class RequestTiming:
+    """Длительность этапов одной попытки запроса к API в секундах.
+
+    Передается обработчикам событий `RequestMetrics` после завершения попытки.
+    Этапы, которые попытка не прошла (например, чтение тела после сетевой ошибки), равны 0.
+
+    Attributes:
+        client_id: Идентификатор клиента
+        endpoint: Конечная точка API вместе с версией, например `v3/product/list`
+        attempt: Номер попытки, 0 — первая отправка, 1 и далее — повторы
+        status: Код ответа или None, если ответ не получен
+        size: Размер тела ответа в байтах
+        error: Имя класса ошибки попытки или None
+        limiter_wait: Ожидание токенов всех ограничителей
+        limiter_waits: Ожидание по уровням ограничителей (`instance`, `client`, `method`, `adaptive`)
+        connect: Ожидание свободного соединения и установка нового соединения
+        ttfb: Время до получения заголовков ответа без учета `connect`
+        download: Чтение тела ответа
+        decode: Разбор JSON в словарь
+        validate: Формирование ответа по схеме
+        total: Попытка целиком
+    """
+
+    __slots__ = (
+        "client_id", "endpoint", "attempt", "status", "size", "error", "limiter_wait", "limiter_waits",
+        "connect", "ttfb", "download", "decode", "validate", "total",
+    )
+
+    def __init__(self, client_id: str, endpoint: str, attempt: int = 0) -> None:
+        self.client_id = client_id
+        self.endpoint = endpoint
+        self.attempt = attempt
+        self.status: Optional[int] = None
+        self.size = 0
+        self.error: Optional[str] = None
+        self.limiter_wait = 0.0
+        self.limiter_waits: dict[str, float] = {}
+        self.connect = 0.0
+        self.ttfb = 0.0
+        self.download = 0.0
+        self.decode = 0.0
+        self.validate = 0.0
+        self.total = 0.0
+
+    def add_limiter_wait(self, level: str, seconds: float) -> None:
+        """Учитывает ожидание токена ограничителя указанного уровня."""
+        self.limiter_waits[level] = self.limiter_waits.get(level, 0.0) + seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Возвращает длительности этапов и сведения о попытке в виде словаря."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(endpoint={self.endpoint!r}, status={self.status}, "
+            f"attempt={self.attempt}, total={self.total:.6f})"
+        )
+
+
+class EndpointMetrics:
+    """Счетчики и гистограммы этапов запросов к одной конечной точке одного client_id."""
+
+    __slots__ = ("requests", "retries", "throttled", "errors", "bytes", "in_flight", "phases", "limiter_waits")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.errors = 0
+        self.bytes = 0
+        self.in_flight = 0
+        self.phases = {phase: Histogram() for phase in PHASES}
+        self.limiter_waits: dict[str, Histogram] = {}
+
+    def record(self, timing: RequestTiming) -> None:
+        """Учитывает завершенную попытку запроса."""
+        self.requests += 1
+        if timing.attempt:
+            self.retries += 1
+        if timing.status == 429:
+            self.throttled += 1
+        if timing.error is not None:
+            self.errors += 1
+        self.bytes += timing.size
+        phases = self.phases
+        phases["limiter_wait"].observe(timing.limiter_wait)
+        phases["total"].observe(timing.total)
+        if timing.status is not None:
+            phases["connect"].observe(timing.connect)
+            phases["ttfb"].observe(timing.ttfb)
+            phases["download"].observe(timing.download)
+        if timing.decode:
+            phases["decode"].observe(timing.decode)
+        if timing.validate:
+            phases["validate"].observe(timing.validate)
+        for level, seconds in timing.limiter_waits.items():
+            histogram = self.limiter_waits.get(level)
+            if histogram is None:
+                histogram = self.limiter_waits[level] = Histogram()
+            histogram.observe(seconds)
+
+    def get_state(self) -> dict[str, Any]:
+        """Формирует счетчики и сводки гистограмм конечной точки."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "in_flight": self.in_flight,
+            "phases": {phase: histogram.get_state() for phase, histogram in self.phases.items()},
+            "limiter_waits": {level: histogram.get_state() for level, histogram in self.limiter_waits.items()},
+        }
+
+
+class RequestMetrics:
+    """Сборщик длительности этапов запросов к API по client_id и конечным точкам.
+
+    Подключается через `APIManager.set_request_metrics()`. Пока сборщик не подключен,
+    этапы запросов не измеряются. Каждая попытка запроса (включая повторы) учитывается
+    отдельно: счетчики `requests`, `retries`, `throttled` (ответы 429), `errors`, `bytes`
+    и гистограммы этапов из `PHASES`. Ожидание ограничителей методов дополнительно
+    учитывается по именам их корзин.
+
+    Args:
+        hooks: Обработчики событий, вызываемые с `RequestTiming` после каждой попытки запроса.
+            Обработчики вызываются синхронно в цикле событий и должны быть быстрыми,
+            ошибки обработчиков записываются в лог и на запрос не влияют
+    """
+
+    def __init__(self, hooks: Iterable[MetricsHook] = ()) -> None:
+        self._endpoints: dict[tuple[str, str], EndpointMetrics] = {}
+        self._limiters: dict[str, Histogram] = {}
+        self._hooks: list[MetricsHook] = list(hooks)
+
+    def add_hook(self, hook: MetricsHook) -> None:
+        """Подключает обработчик событий завершения попыток запросов."""
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: MetricsHook) -> None:
+        """Отключает обработчик событий завершения попыток запросов."""
+        try:
+            self._hooks.remove(hook)
+        except ValueError:
+            pass
+
+    def _get_endpoint(self, client_id: str, endpoint: str) -> EndpointMetrics:
+        metrics = self._endpoints.get((client_id, endpoint))
+        if metrics is None:
+            metrics = self._endpoints[(client_id, endpoint)] = EndpointMetrics()
+        return metrics
+
+    def begin(self, client_id: str, endpoint: str, attempt: int = 0) -> RequestTiming:
+        """Начинает учет попытки запроса.
+
+        Args:
+            client_id: Идентификатор клиента
+            endpoint: Конечная точка API вместе с версией
+            attempt: Номер попытки, 0 — первая отправка
+
+        Returns:
+            Длительности этапов попытки, заполняемые по ходу запроса
+        """
+        self._get_endpoint(client_id, endpoint).in_flight += 1
+        return RequestTiming(client_id, endpoint, attempt)
+
+    def finish(self, timing: RequestTiming) -> None:
+        """Завершает учет попытки запроса и передает ее обработчикам событий."""
+        metrics = self._get_endpoint(timing.client_id, timing.endpoint)
+        metrics.in_flight -= 1
+        metrics.record(timing)
+        for hook in tuple(self._hooks):
+            try:
+                hook(timing)
+            except Exception as e:
+                logger.warning(f"Ошибка обработчика метрик запросов {hook!r}: {e}")
+
+    @contextmanager
+    def measure(self, client_id: str, endpoint: str, attempt: int = 0) -> Iterator[RequestTiming]:
+        """Учитывает попытку запроса, выполняемую в блоке `with`.
+
+        Длительность блока записывается в `total`, а имя класса ошибки, с которой
+        завершился блок, — в `error`. Остальные этапы заполняет выполняющий запрос код.
+
+        Args:
+            client_id: Идентификатор клиента
+            endpoint: Конечная точка API вместе с версией
+            attempt: Номер попытки, 0 — первая отправка
+
+        Yields:
+            Длительности этапов попытки
+        """
+        timing = self.begin(client_id, endpoint, attempt)
+        started = time.perf_counter()
+        try:
+            yield timing
+        except Exception as e:
+            timing.error = type(e).__name__
+            raise
+        finally:
+            timing.total = time.perf_counter() - started
+            self.finish(timing)
+
+    def observe_limiter_wait(self, name: str, seconds: float) -> None:
+        """Учитывает ожидание токена именованного ограничителя, например ограничителя метода."""
+        histogram = self._limiters.get(name)
+        if histogram is None:
+            histogram = self._limiters[name] = Histogram()
+        histogram.observe(seconds)
+
+    def get_limiter_wait(self, name: str) -> Optional[dict[str, Any]]:
+        """Возвращает сводку ожидания именованного ограничителя или None, если ожиданий не было."""
+        histogram = self._limiters.get(name)
+        return histogram.get_state() if histogram is not None else None
+
+    def get_state(self, client_id: Optional[str] = None) -> dict[str, dict[str, dict[str, Any]]]:
+        """Формирует счетчики и сводки гистограмм по client_id и конечным точкам.
+
+        Args:
+            client_id: Идентификатор клиента для отбора (опционально)
+
+        Returns:
+            Состояние в виде `{client_id: {endpoint: {"requests": ..., "retries": ..., "throttled": ...,
+            "errors": ..., "bytes": ..., "in_flight": ..., "phases": {этап: сводка},
+            "limiter_waits": {уровень: сводка}}}}`
+        """
+        state: dict[str, dict[str, dict[str, Any]]] = {}
+        for (metrics_client_id, endpoint), metrics in tuple(self._endpoints.items()):
+            if client_id is None or metrics_client_id == client_id:
+                state.setdefault(metrics_client_id, {})[endpoint] = metrics.get_state()
+        return state
+
+    def clear(self) -> None:
+        """Сбрасывает накопленные счетчики и гистограммы. Количество выполняющихся запросов сохраняется."""
+        endpoints: dict[tuple[str, str], EndpointMetrics] = {}
+        for key, metrics in tuple(self._endpoints.items()):
+            if metrics.in_flight:
+                endpoints[key] = EndpointMetrics()
+                endpoints[key].in_flight = metrics.in_flight
+        self._endpoints = endpoints
+        self._limiters.clear()
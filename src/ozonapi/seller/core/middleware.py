@@ -0,0 +1,329 @@
+import json
+import random
+import time
+import typing
+from logging import INFO
+from typing import Any, Optional, Sequence
+
+from pydantic import BaseModel
+
+from .adaptive_rate import AdaptiveRateLimiter
+from .exceptions import APIConnectError, APINetworkError, APITimeoutError, APITooManyRequestsError
+from .metrics import RequestTiming
+from .response import ResponseMode
+from .retry import RetryPolicy
+from .token_bucket import TokenBucket
+
+if typing.TYPE_CHECKING:
+    from .core import APIManager
+
+# Этапы жизненного цикла запроса в порядке выполнения
+STAGES = ("pre_send", "post_receive", "on_error", "on_retry")
+
+
+class RequestContext:
+    """Состояние одного вызова API, передаваемое этапам middleware.
+
+    Контекст создается один раз на вызов и сохраняется между повторами.
+    Поля ответа (`response`, `status`, `body`, `data`, `result`) заполняются
+    заново при каждой попытке.
+
+    Attributes:
+        client: API-клиент, выполняющий запрос
+        method: HTTP метод запроса
+        endpoint: Конечная точка API без версии, например `product/list`
+        versioned_endpoint: Конечная точка API вместе с версией, например `v3/product/list`
+        url: Полный адрес запроса
+        payload: Данные для отправки в формате JSON
+        params: Query parameters
+        headers: Дополнительные заголовки запроса, например для собственной авторизации
+        response_model: Схема ответа или None
+        mode: Режим формирования ответа по схеме
+        retry_policy: Политика повторов конечной точки
+        method_limiter: Ограничитель метода API
+        adaptive_limiter: Адаптивный ограничитель конечной точки
+        stream: Ответ выдается по элементам по мере получения (`_stream_request`)
+        started: Выдача элементов потокового ответа начата, повтор невозможен
+        attempt: Номер попытки, 0 — первая отправка
+        timing: Длительности этапов попытки, если подключен сборщик метрик
+        sent_at: Время отправки попытки по `time.monotonic()`
+        response: Объект ответа aiohttp, доступен на этапе `post_receive`
+        status: Код ответа
+        body: Тело ответа в байтах
+        data: Ответ в виде словаря для успешных запросов без схемы
+        result: Результат вызова, возвращаемый вызывающему коду
+        retry_delay: Задержка перед повтором, назначенная на этапе `on_error`, или None без повтора
+        state: Произвольные данные middleware
+    """
+
+    __slots__ = (
+        "client", "method", "endpoint", "versioned_endpoint", "url", "payload", "params", "headers",
+        "response_model", "mode", "retry_policy", "method_limiter", "adaptive_limiter", "stream", "started",
+        "attempt", "timing", "sent_at", "response", "status", "body", "data", "result", "retry_delay", "state",
+    )
+
+    def __init__(
+            self,
+            client: "APIManager",
+            method: str,
+            endpoint: str,
+            versioned_endpoint: str,
+            url: str,
+            payload: Optional[dict[str, Any]],
+            params: Optional[dict[str, Any]],
+            response_model: Optional[type[BaseModel]],
+            mode: Optional[ResponseMode],
+            retry_policy: RetryPolicy,
+            method_limiter: Optional[TokenBucket],
+            adaptive_limiter: Optional[AdaptiveRateLimiter],
+            stream: bool = False,
+    ) -> None:
+        self.client = client
+        self.method = method
+        self.endpoint = endpoint
+        self.versioned_endpoint = versioned_endpoint
+        self.url = url
+        self.payload = payload
+        self.params = params
+        self.headers: Optional[dict[str, str]] = None
+        self.response_model = response_model
+        self.mode = mode
+        self.retry_policy = retry_policy
+        self.method_limiter = method_limiter
+        self.adaptive_limiter = adaptive_limiter
+        self.stream = stream
+        self.started = False
+        self.attempt = 0
+        self.timing: Optional[RequestTiming] = None
+        self.sent_at = 0.0
+        self.response: Any = None
+        self.status: Optional[int] = None
+        self.body: Optional[bytes] = None
+        self.data: Any = None
+        self.result: Any = None
+        self.retry_delay: Optional[float] = None
+        self.state: dict[str, Any] = {}
+
+    def reset_response(self) -> None:
+        """Очищает поля ответа перед очередной попыткой."""
+        self.response = None
+        self.status = None
+        self.body = None
+        self.data = None
+        self.result = None
+        self.retry_delay = None
+
+
+class Middleware:
+    """Базовый класс middleware запросов к API.
+
+    Middleware переопределяет нужные этапы жизненного цикла запроса,
+    остальные этапы не вызываются и затрат не добавляют:
+
+    • `pre_send` — перед каждой отправкой запроса, в том числе повторной
+    • `post_receive` — после получения ответа и чтения тела, пока соединение открыто
+    • `on_error` — после ошибки попытки; назначает повтор через `ctx.retry_delay`
+    • `on_retry` — перед ожиданием и повторной отправкой запроса
+
+    Этапы выполняются в порядке middleware в цепочке. Исключение на любом этапе,
+    кроме `on_error` и `on_retry`, завершает попытку ошибкой.
+
+    Examples:
+        Базовое применение:
+            class RecordingMiddleware(Middleware):
+                async def post_receive(self, ctx: RequestContext) -> None:
+                    records.append((ctx.versioned_endpoint, ctx.status, ctx.result))
+
+            async with SellerAPI(client_id, api_key, middleware=[RecordingMiddleware()]) as api:
+                ...
+    """
+
+    async def pre_send(self, ctx: RequestContext) -> None:
+        """Выполняется перед отправкой запроса."""
+
+    async def post_receive(self, ctx: RequestContext) -> None:
+        """Выполняется после получения ответа."""
+
+    async def on_error(self, ctx: RequestContext, error: Exception) -> None:
+        """Выполняется после ошибки попытки запроса."""
+
+    async def on_retry(self, ctx: RequestContext, error: Exception) -> None:
+        """Выполняется перед повтором запроса."""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class MiddlewarePipeline:
+    """Цепочка middleware с заранее отобранными обработчиками этапов.
+
+    Отбор выполняется при создании цепочки: в кортеж этапа попадают только
+    методы, переопределенные в классе middleware, поэтому при запросе этапы
+    выполняются простым перебором без проверок.
+
+    Args:
+        middleware: Middleware в порядке выполнения этапов
+    """
+
+    __slots__ = ("middleware",) + STAGES
+
+    def __init__(self, middleware: Sequence[Middleware]) -> None:
+        self.middleware = tuple(middleware)
+        for stage in STAGES:
+            default = getattr(Middleware, stage)
+            setattr(self, stage, tuple(
+                getattr(item, stage) for item in self.middleware
+                if getattr(type(item), stage, default) is not default
+            ))
+
+
+class LimitingMiddleware(Middleware):
+    """Ожидает токены ограничителей запросов и передает ответы адаптивному ограничителю."""
+
+    async def pre_send(self, ctx: RequestContext) -> None:
+        await ctx.client._acquire(ctx.method_limiter, ctx.adaptive_limiter, ctx.timing)
+        ctx.sent_at = time.monotonic()
+
+    async def post_receive(self, ctx: RequestContext) -> None:
+        adaptive_limiter = ctx.adaptive_limiter
+        if adaptive_limiter is not None:
+            if ctx.status == 429:
+                adaptive_limiter.on_throttled(ctx.sent_at, ctx.response.headers)
+            elif ctx.status < 400:
+                adaptive_limiter.on_success(ctx.response.headers)
+
+
+class _PayloadSnippet:
+    """Сниппет тела запроса для лога, формируемый только при записи сообщения."""
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.payload = payload
+
+    def __repr__(self) -> str:
+        string = json.dumps(self.payload)
+        return repr(string if len(string) < 200 else string[:200] + "...")
+
+
+class LoggingMiddleware(Middleware):
+    """Записывает в лог клиента отправку запросов, ответы, ошибки и повторы.
+
+    Пока уровень INFO лога клиента не включен, сообщения об отправке и ответах
+    не формируются. Сниппет тела запроса формируется только при записи сообщения,
+    размер ответа берется по длине тела в байтах.
+
+    Args:
+        sample_rate: Доля вызовов, для которых записываются отправка запроса и ответ.
+            По умолчанию берется из `APIConfig.log_sample_rate`. Ошибки и повторы
+            записываются всегда
+    """
+
+    __slots__ = ("sample_rate",)
+
+    def __init__(self, sample_rate: Optional[float] = None) -> None:
+        self.sample_rate = sample_rate
+
+    def _sampled(self, ctx: RequestContext) -> bool:
+        """Решает один раз на вызов, записывать ли сообщения об отправке и ответе."""
+        sampled = ctx.state.get("log_sampled")
+        if sampled is None:
+            rate = self.sample_rate if self.sample_rate is not None else ctx.client.config.log_sample_rate
+            sampled = ctx.state["log_sampled"] = rate >= 1 or random.random() < rate
+        return sampled
+
+    async def pre_send(self, ctx: RequestContext) -> None:
+        logger = ctx.client.logger
+        if not logger.isEnabledFor(INFO) or not self._sampled(ctx):
+            return
+        log_context: dict[str, Any] = {
+            "method": ctx.method,
+            "endpoint": ctx.versioned_endpoint,
+            "payload": _PayloadSnippet(ctx.payload) if ctx.payload is not None else None,
+        }
+        if ctx.stream:
+            log_context["stream"] = True
+        logger.info("Отправка запроса к API: %s", log_context)
+
+    async def post_receive(self, ctx: RequestContext) -> None:
+        logger = ctx.client.logger
+        if ctx.status >= 400 or not logger.isEnabledFor(INFO) or not self._sampled(ctx):
+            return
+        log_context: dict[str, Any] = {"endpoint": ctx.versioned_endpoint, "status_code": ctx.status}
+        if ctx.stream:
+            log_context["stream"] = True
+        else:
+            log_context["response_size"] = len(ctx.body)
+        logger.info("Получен ответ от API: %s", log_context)
+
+    async def on_error(self, ctx: RequestContext, error: Exception) -> None:
+        if isinstance(error, APITimeoutError):
+            ctx.client.logger.error("Таймаут запроса к API")
+        elif isinstance(error, (APIConnectError, APINetworkError)):
+            cause = error.__cause__ or error
+            ctx.client.logger.error(
+                "Сетевая ошибка при выполнении запроса к API: %s", cause,
+                extra={
+                    "endpoint": ctx.versioned_endpoint,
+                    "error_type": type(cause).__name__,
+                    "error_message": str(cause),
+                },
+            )
+
+    async def on_retry(self, ctx: RequestContext, error: Exception) -> None:
+        ctx.client.logger.debug(
+            "Попытка [%d/%d]. Запрос вернул ошибку: %s", ctx.attempt, ctx.retry_policy.max_retries, error
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(sample_rate={self.sample_rate})"
+
+
+class DecodingMiddleware(Middleware):
+    """Преобразует ошибочные ответы в исключения `APIError` и формирует результат по схеме ответа."""
+
+    async def post_receive(self, ctx: RequestContext) -> None:
+        client = ctx.client
+        if ctx.status >= 400:
+            data = ctx.data if ctx.data is not None else client._decode_error_body(ctx.body)
+            error = client._handle_error_response(
+                ctx.response, data, {"endpoint": ctx.versioned_endpoint, "status_code": ctx.status}
+            )
+            if error:
+                raise error
+        if ctx.stream:
+            return
+        if ctx.response_model is None:
+            ctx.result = ctx.data
+        elif ctx.timing is None:
+            ctx.result = client._decode_response(ctx.response_model, ctx.body, ctx.mode)
+        else:
+            ctx.result = client._decode_response_timed(ctx.response_model, ctx.body, ctx.mode, ctx.timing)
+
+
+class RetryMiddleware(Middleware):
+    """Назначает повтор запроса по политике повторов конечной точки и общему бюджету повторов.
+
+    Повторы после ответа 429 проходят через ограничители запросов и бюджет
+    не расходуют. Потоковый запрос не повторяется после начала выдачи элементов.
+    """
+
+    async def on_error(self, ctx: RequestContext, error: Exception) -> None:
+        policy = ctx.retry_policy
+        if not isinstance(error, policy.retry_on) or ctx.started or ctx.attempt >= policy.max_retries:
+            return
+        if not isinstance(error, APITooManyRequestsError) and not ctx.client._retry_budget.try_withdraw():
+            return
+        ctx.retry_delay = policy.get_delay(ctx.attempt + 1, error)
+
+
+# Встроенные middleware не хранят состояния и общие для всех клиентов
+BUILTIN_MIDDLEWARE: tuple[Middleware, ...] = (
+    LimitingMiddleware(),
+    LoggingMiddleware(),
+    DecodingMiddleware(),
+    RetryMiddleware(),
+)
+
+# Цепочка клиентов без собственных middleware
+DEFAULT_PIPELINE = MiddlewarePipeline(BUILTIN_MIDDLEWARE)
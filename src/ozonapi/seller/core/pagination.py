@@ -0,0 +1,317 @@
+import asyncio
+import datetime
+import json
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Optional, Sequence, TypeVar
+
+from pydantic import BaseModel
+
+from ...infrastructure.logging import ozonapi_logger as logger
+
+RequestT = TypeVar("RequestT", bound=BaseModel)
+
+# Определяет запрос следующей страницы по текущему запросу, странице и ее элементам
+NextRequest = Callable[[RequestT, Any, Sequence[Any]], Optional[RequestT]]
+
+# Делит запрос на запросы за меньшие периоды или возвращает None, если делить нельзя
+SplitRequest = Callable[[RequestT], Optional[Sequence[RequestT]]]
+
+
+def get_field(page: Any, *path: str) -> Any:
+    """Возвращает значение поля страницы по пути независимо от режима ответа.
+
+    Args:
+        page: Страница ответа: схема или словарь
+        *path: Имена полей, например `"result", "items"`
+
+    Returns:
+        Значение поля или None, если поле отсутствует
+    """
+    for name in path:
+        if page is None:
+            return None
+        if isinstance(page, dict):
+            page = page.get(name)
+        else:
+            page = getattr(page, name, None)
+    return page
+
+
+def next_by_token(request: RequestT, field: str, token: Any, items: Sequence[Any]) -> Optional[RequestT]:
+    """Формирует запрос следующей страницы для пагинации по курсору или идентификатору.
+
+    Пагинация завершается, если страница пуста, неполна или сервер не вернул указатель.
+
+    Args:
+        request: Запрос текущей страницы
+        field: Имя поля запроса с указателем (`cursor`, `last_id`, `last_value_id`)
+        token: Указатель на следующую страницу из ответа
+        items: Элементы текущей страницы
+    """
+    limit = getattr(request, "limit", None)
+    if not items or token in (None, "") or (limit and len(items) < limit):
+        return None
+    return request.model_copy(update={field: token})
+
+
+def next_by_offset(request: RequestT, items: Sequence[Any], has_next: bool) -> Optional[RequestT]:
+    """Формирует запрос следующей страницы для пагинации по `offset`.
+
+    Args:
+        request: Запрос текущей страницы
+        items: Элементы текущей страницы
+        has_next: Есть ли следующая страница
+    """
+    if not items or not has_next:
+        return None
+    return request.model_copy(update={"offset": (request.offset or 0) + len(items)})
+
+
+async def paginate(
+        fetch: Callable[[RequestT], Awaitable[Any]],
+        request: RequestT,
+        get_items: Callable[[Any], Optional[Sequence[Any]]],
+        next_request: NextRequest,
+        pages: bool = False,
+        prefetch: bool = True,
+) -> AsyncIterator[Any]:
+    """Последовательно запрашивает страницы и выдает их элементы или сами страницы.
+
+    Пока потребитель обрабатывает текущую страницу, запрос следующей уже
+    выполняется в отдельной задаче. Запросы проходят через ограничители,
+    поэтому предварительная загрузка не превышает ограничение запросов.
+    При досрочном завершении итерации загрузка следующей страницы отменяется.
+
+    Args:
+        fetch: Метод API, возвращающий страницу по запросу
+        request: Запрос первой страницы
+        get_items: Извлекает элементы из страницы
+        next_request: Формирует запрос следующей страницы или возвращает None
+        pages: Выдавать страницы целиком вместо отдельных элементов
+        prefetch: Загружать следующую страницу во время обработки текущей
+
+    Yields:
+        Элементы страниц или страницы. В режиме ответа `ResponseMode.BYTES`
+        страницы выдаются байтами, а элементы — словарями
+    """
+    pending: Optional[asyncio.Future] = None
+    try:
+        page = await fetch(request)
+        while True:
+            view = json.loads(page) if isinstance(page, (bytes, bytearray)) else page
+            items = get_items(view) or ()
+            request = next_request(request, view, items)
+            if request is not None and prefetch:
+                pending = asyncio.ensure_future(fetch(request))
+
+            if pages:
+                yield page
+            else:
+                for item in items:
+                    yield item
+
+            if request is None:
+                return
+            if pending is None:
+                page = await fetch(request)
+            else:
+                page, pending = await pending, None
+    finally:
+        if pending is not None:
+            if pending.done():
+                if not pending.cancelled():
+                    pending.exception()
+            else:
+                pending.cancel()
+
+
+def parse_datetime(value: Any) -> Optional[datetime.datetime]:
+    """Преобразует значение фильтра по дате (datetime или строку ISO 8601) в datetime с часовым поясом."""
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime.datetime) and value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+def split_by_period(
+        request: RequestT,
+        from_field: str,
+        to_field: str,
+        min_period: float = 1.0,
+) -> Optional[list[RequestT]]:
+    """Делит период фильтра запроса пополам.
+
+    Соседние периоды пересекаются в точке деления, поэтому элементы на границе
+    могут попасть в оба ответа и должны отбрасываться по ключу.
+
+    Args:
+        request: Запрос с полем `filter`
+        from_field: Имя поля начала периода в фильтре
+        to_field: Имя поля конца периода в фильтре
+        min_period: Минимальная длительность периода в секундах, который можно делить
+
+    Returns:
+        Запросы за первую и вторую половину периода со сброшенным offset
+        или None, если период не задан или слишком короток
+    """
+    period_filter = request.filter
+    since = parse_datetime(getattr(period_filter, from_field))
+    to = parse_datetime(getattr(period_filter, to_field))
+    if since is None or to is None or (to - since).total_seconds() < 2 * min_period:
+        return None
+
+    middle = since + (to - since) / 2
+    filter_class = type(period_filter)
+    from_key = filter_class.model_fields[from_field].alias or from_field
+    to_key = filter_class.model_fields[to_field].alias or to_field
+    return [
+        request.model_copy(update={
+            "offset": 0,
+            # Повторная валидация приводит даты к формату, который ожидает API
+            "filter": filter_class.model_validate({
+                **period_filter.model_dump(by_alias=True), from_key: start, to_key: end,
+            }),
+        })
+        for start, end in ((since, middle), (middle, to))
+    ]
+
+
+async def fan_out_offsets(
+        fetch: Callable[[RequestT], Awaitable[Any]],
+        request: RequestT,
+        get_items: Callable[[Any], Optional[Sequence[Any]]],
+        get_total: Optional[Callable[[Any], Optional[int]]] = None,
+        concurrency: int = 8,
+        max_offset: Optional[int] = None,
+        split_request: Optional[SplitRequest] = None,
+        get_key: Optional[Callable[[Any], Hashable]] = None,
+        reverse: bool = False,
+) -> AsyncIterator[Any]:
+    """Параллельно запрашивает страницы выборки с пагинацией по `offset` и выдает элементы по порядку.
+
+    После первой страницы остальные запрашиваются одновременно (не более
+    `concurrency` запросов в работе) через ограничители запросов. Если ответ
+    содержит общее количество элементов (`get_total`), запрашиваются только
+    нужные страницы, иначе выборка идет до первой неполной страницы.
+
+    Если задан `max_offset`, вместе с первой страницей запрашивается страница
+    на предельном смещении. Если она заполнена, часть выборки недоступна
+    через `offset`, и период запроса делится через `split_request`. Если
+    `limit` не делит `max_offset`, элементы после последней обычной страницы
+    берутся из страницы на предельном смещении. Если выборка не уместилась
+    до `max_offset`, а период больше не делится, выдается доступная часть
+    выборки и в журнал пишется предупреждение.
+
+    Если `limit` в запросе не задан, используется значение по умолчанию из схемы запроса.
+
+    Args:
+        fetch: Метод API, возвращающий страницу по запросу
+        request: Запрос первой страницы
+        get_items: Извлекает элементы из страницы
+        get_total: Извлекает из страницы общее количество элементов (опционально)
+        concurrency: Максимальное количество одновременных запросов страниц
+        max_offset: Максимально допустимое значение `offset` (опционально)
+        split_request: Делит запрос на запросы за меньшие периоды (опционально)
+        get_key: Ключ элемента для отбрасывания повторов на границах периодов (опционально)
+        reverse: Выдавать периоды от последнего к первому (для сортировки по убыванию)
+
+    Yields:
+        Элементы выборки в порядке страниц
+
+    Raises:
+        ValueError: Если `limit` не задан ни в запросе, ни в схеме запроса
+    """
+    if request.limit is None:
+        default_limit = type(request).model_fields["limit"].default
+        if not isinstance(default_limit, int):
+            raise ValueError("Для параллельной выборки страниц необходимо указать limit")
+        request = request.model_copy(update={"limit": default_limit})
+
+    seen: set[Hashable] = set()
+
+    async def fetch_items(page_request: RequestT) -> tuple[Sequence[Any], Optional[int]]:
+        page = await fetch(page_request)
+        if isinstance(page, (bytes, bytearray)):
+            page = json.loads(page)
+        return get_items(page) or (), get_total(page) if get_total is not None else None
+
+    async def scan(window: RequestT) -> AsyncIterator[Any]:
+        limit = window.limit
+        start = window.offset or 0
+        first = asyncio.ensure_future(fetch_items(window))
+        # Запросы страниц и количество элементов в начале страницы, уже выданных с предыдущей страницей
+        tasks: deque[tuple[asyncio.Future, int]] = deque()
+        ceiling = None
+        try:
+            if max_offset is not None and split_request is not None and max_offset > start:
+                ceiling = asyncio.ensure_future(fetch_items(window.model_copy(update={"offset": max_offset})))
+                if len((await ceiling)[0]) >= limit:
+                    windows = split_request(window)
+                    if windows:
+                        first.cancel()
+                        for part in (reversed(windows) if reverse else windows):
+                            async for item in scan(part):
+                                yield item
+                        return
+
+            items, total = await first
+            for item in items:
+                yield item
+            if len(items) < limit:
+                return
+
+            last_offset = max_offset if max_offset is not None else float("inf")
+            if total is not None:
+                last_offset = min(last_offset, total - 1)
+            next_offset = start + limit
+            ceiling_queued = False
+
+            while True:
+                while next_offset <= last_offset and len(tasks) < concurrency:
+                    if ceiling is not None and next_offset == max_offset:
+                        # Страница на предельном смещении уже получена
+                        tasks.append((ceiling, 0))
+                        ceiling_queued = True
+                    else:
+                        tasks.append((asyncio.ensure_future(
+                            fetch_items(window.model_copy(update={"offset": next_offset}))
+                        ), 0))
+                    next_offset += limit
+                if (
+                        not ceiling_queued and last_offset == max_offset
+                        and next_offset > max_offset > next_offset - limit and len(tasks) < concurrency
+                ):
+                    # Обычные страницы закончились до предельного смещения: конец выборки
+                    # доступен только на странице с offset = max_offset
+                    if ceiling is None:
+                        ceiling = asyncio.ensure_future(fetch_items(window.model_copy(update={"offset": max_offset})))
+                    tasks.append((ceiling, next_offset - max_offset))
+                    ceiling_queued = True
+                if not tasks:
+                    if last_offset == max_offset and (total is None or total - 1 > max_offset):
+                        logger.warning(
+                            f"Выборка не уместилась до offset = {max_offset} и не может быть разделена, "
+                            f"получено только {max_offset + limit - start} элементов"
+                        )
+                    return
+                task, skip = tasks.popleft()
+                items, _ = await task
+                for item in items[skip:]:
+                    yield item
+                if len(items) < limit:
+                    return
+        finally:
+            for task in (first, *(task for task, _ in tasks), *((ceiling,) if ceiling is not None else ())):
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
+
+    async for item in scan(request):
+        if get_key is not None:
+            key = get_key(item)
+            if key in seen:
+                continue
+            seen.add(key)
+        yield item
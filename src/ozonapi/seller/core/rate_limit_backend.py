@@ -0,0 +1,292 @@
+import abc
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+from typing import Any, NamedTuple, Optional, Protocol, Sequence
+
+from .token_bucket import TokenBucket, acquire
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+class BucketSpec(NamedTuple):
+    """Описание общей корзины токенов.
+
+    Attributes:
+        name: Уникальное имя корзины в хранилище (например, client_id или client_id:метод)
+        max_rate: Количество запросов за период
+        time_period: Длительность периода в секундах
+    """
+    name: str
+    max_rate: float
+    time_period: float = 1.0
+
+
+def take_tokens(states: dict[str, list[float]], specs: Sequence[BucketSpec], now: float) -> float:
+    """Атомарно списывает по токену с каждой корзины или вычисляет время ожидания.
+
+    Args:
+        states: Состояния корзин `{имя: [токены, время обновления]}`, изменяются на месте
+        specs: Описания корзин
+        now: Текущее время в секундах
+
+    Returns:
+        0, если токены списаны, иначе время в секундах до появления токена во всех корзинах
+    """
+    wait = 0.0
+    refilled = []
+    for spec in specs:
+        rate = spec.max_rate / spec.time_period
+        capacity = max(float(spec.max_rate), 1.0)
+        tokens, updated_at = states.get(spec.name, (capacity, now))
+        tokens = min(capacity, tokens + max(now - updated_at, 0.0) * rate)
+        refilled.append(tokens)
+        if tokens < 1:
+            wait = max(wait, (1 - tokens) / rate)
+
+    if wait > 0:
+        return wait
+
+    for spec, tokens in zip(specs, refilled):
+        states[spec.name] = [tokens - 1, now]
+    return 0.0
+
+
+class RateLimiterBackend(abc.ABC):
+    """Базовый класс хранилища общих ограничителей запросов.
+
+    Реализация должна определить `try_acquire()`, атомарно списывающий токены
+    со всех переданных корзин, иначе создание экземпляра завершается ошибкой
+    `TypeError`. Ожидание, очередь корутин внутри процесса и
+    сочетание с локальными ограничителями реализованы в `acquire()`.
+
+    Процессы, подключенные к одному хранилищу, делят ограничения client_id
+    и методов API между собой.
+    """
+
+    def __init__(self) -> None:
+        self._gates: dict[tuple[str, ...], asyncio.Lock] = {}
+        self._gates_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @abc.abstractmethod
+    async def try_acquire(self, specs: Sequence[BucketSpec]) -> float:
+        """Пытается атомарно списать по токену с каждой из корзин.
+
+        Args:
+            specs: Описания корзин
+
+        Returns:
+            0, если токены списаны, иначе время в секундах до следующей попытки
+        """
+
+    async def close(self) -> None:
+        """Освобождает ресурсы хранилища."""
+        return None
+
+    def _get_gate(self, specs: Sequence[BucketSpec]) -> asyncio.Lock:
+        """Возвращает очередь корутин процесса для набора общих корзин."""
+        loop = asyncio.get_running_loop()
+        if self._gates_loop is not loop:
+            self._gates.clear()
+            self._gates_loop = loop
+        key = tuple(spec.name for spec in specs)
+        gate = self._gates.get(key)
+        if gate is None:
+            gate = self._gates[key] = asyncio.Lock()
+        return gate
+
+    async def acquire(self, specs: Sequence[BucketSpec], local: Sequence[TokenBucket] = ()) -> None:
+        """Ожидает разрешения на запрос от общих и локальных ограничителей.
+
+        Хранилище опрашивает только одна корутина процесса на набор корзин,
+        остальные ждут в очереди `asyncio.Lock`. Токены локальных ограничителей
+        возвращаются, если общие корзины пусты, и не удерживаются во время ожидания.
+
+        Args:
+            specs: Описания общих корзин
+            local: Локальные ограничители процесса
+        """
+        if not specs:
+            await acquire(local)
+            return
+
+        async with self._get_gate(specs):
+            while True:
+                if local:
+                    await acquire(local)
+                delay = await self.try_acquire(specs)
+                if delay <= 0:
+                    return
+                for bucket in local:
+                    bucket.refund()
+                # Небольшой разброс, чтобы процессы не опрашивали хранилище одновременно
+                await asyncio.sleep(delay * random.uniform(1.0, 1.1))
+
+
+class InProcessBackend(RateLimiterBackend):
+    """Хранилище ограничителей в памяти процесса.
+
+    Подходит для одного процесса и как эталон поведения других хранилищ.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._states: dict[str, list[float]] = {}
+
+    async def try_acquire(self, specs: Sequence[BucketSpec]) -> float:
+        return take_tokens(self._states, specs, time.monotonic())
+
+
+class FileLockBackend(RateLimiterBackend):
+    """Хранилище ограничителей в файле для нескольких процессов одного хоста.
+
+    Состояние корзин хранится в файле `path`, доступ к нему сериализуется
+    блокировкой файла `path + ".lock"` (`fcntl.flock`, на Windows `msvcrt.locking`).
+    Ожидание блокировки и работа с файлом выполняются в отдельном потоке,
+    чтобы процесс, удерживающий блокировку, не останавливал цикл событий.
+
+    Args:
+        path: Путь к файлу состояния, общий для всех процессов
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+        self._lock_path = f"{path}.lock"
+        self._lock_fd: Optional[int] = None
+        # Блокировка файла общая для потоков процесса, поэтому потоки сериализуются отдельно
+        self._thread_lock = threading.Lock()
+
+    def _lock(self) -> int:
+        if self._lock_fd is None:
+            self._lock_fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        else:  # pragma: no cover - Windows
+            os.lseek(self._lock_fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._lock_fd, msvcrt.LK_LOCK, 1)
+        return self._lock_fd
+
+    def _unlock(self, fd: int) -> None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:  # pragma: no cover - Windows
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+    def _read_states(self) -> dict[str, list[float]]:
+        try:
+            with open(self.path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return {}
+        try:
+            return json.loads(data) if data else {}
+        except ValueError:
+            return {}
+
+    def _write_states(self, states: dict[str, list[float]]) -> None:
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(json.dumps(states, separators=(",", ":")).encode())
+        os.replace(tmp_path, self.path)
+
+    def take(self, specs: Sequence[BucketSpec]) -> float:
+        """Синхронно выполняет `try_acquire()` под блокировкой файла."""
+        with self._thread_lock:
+            fd = self._lock()
+            try:
+                states = self._read_states()
+                # Время должно быть общим для всех процессов хоста
+                delay = take_tokens(states, specs, time.time())
+                if delay <= 0:
+                    self._write_states(states)
+                return delay
+            finally:
+                self._unlock(fd)
+
+    async def try_acquire(self, specs: Sequence[BucketSpec]) -> float:
+        return await asyncio.to_thread(self.take, specs)
+
+    def _close(self) -> None:
+        with self._thread_lock:
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close)
+
+
+class RedisLikeClient(Protocol):
+    """Протокол клиента хранилища с атомарным выполнением Lua-скриптов.
+
+    Совместим с `redis.asyncio.Redis` и другими клиентами с тем же методом `eval`.
+    """
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> Any:
+        ...
+
+
+class RedisBackend(RateLimiterBackend):
+    """Хранилище ограничителей в Redis или совместимом хранилище для нескольких хостов.
+
+    Списание токенов выполняется одним Lua-скриптом, время берется из
+    команды `TIME` сервера, поэтому часы хостов не обязаны совпадать.
+
+    Args:
+        client: Клиент хранилища, реализующий `RedisLikeClient`
+        prefix: Префикс ключей корзин
+    """
+
+    SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local wait = 0
+local refilled = {}
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[2 * i - 1])
+    local capacity = tonumber(ARGV[2 * i])
+    local state = redis.call('HMGET', key, 'tokens', 'updated_at')
+    local tokens = tonumber(state[1]) or capacity
+    local updated_at = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(now - updated_at, 0) * rate)
+    refilled[i] = tokens
+    if tokens < 1 then
+        wait = math.max(wait, (1 - tokens) / rate)
+    end
+end
+if wait > 0 then
+    return tostring(wait)
+end
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[2 * i - 1])
+    local capacity = tonumber(ARGV[2 * i])
+    redis.call('HSET', key, 'tokens', tostring(refilled[i] - 1), 'updated_at', tostring(now))
+    redis.call('PEXPIRE', key, math.ceil(capacity / rate * 1000) + 1000)
+end
+return '0'
+"""
+
+    def __init__(self, client: RedisLikeClient, prefix: str = "ozonapi:rate_limit:") -> None:
+        super().__init__()
+        self.client = client
+        self.prefix = prefix
+
+    async def try_acquire(self, specs: Sequence[BucketSpec]) -> float:
+        keys = [f"{self.prefix}{spec.name}" for spec in specs]
+        args: list[Any] = []
+        for spec in specs:
+            args.append(repr(spec.max_rate / spec.time_period))
+            args.append(repr(max(float(spec.max_rate), 1.0)))
+        result = await self.client.eval(self.SCRIPT, len(keys), *keys, *args)
+        if isinstance(result, bytes):
+            result = result.decode()
+        return float(result)
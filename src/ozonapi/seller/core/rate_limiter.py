@@ -1,15 +1,19 @@
 import time
 import typing
 import weakref
-from logging import Logger
-
-from aiolimiter import AsyncLimiter
+from logging import Logger, LoggerAdapter
+from typing import Callable, Optional, Union
 
 from .config import APIConfig
+from .rate_limit_backend import BucketSpec, RateLimiterBackend
+from .token_bucket import TokenBucket, acquire
 
 if typing.TYPE_CHECKING:
     from .core import APIManager
 
+# Минимальный интервал между проверками регистров client_id на истечение ttl в секундах
+REGISTER_CLEANUP_INTERVAL = 1.0
+
 
 class InstanceData:
     def __init__(
@@ -19,7 +23,7 @@ class InstanceData:
         self._client_id: str = instance.client_id
         self._config: APIConfig = instance.config
         self._updated_at: float = time.monotonic()
-        self._limiter: AsyncLimiter = AsyncLimiter(self._config.max_requests_per_second, 1)
+        self._limiter: TokenBucket = TokenBucket(self._config.max_requests_per_second, 1)
 
     def update(self) -> None:
         """Обновляет время последней активности"""
@@ -31,7 +35,7 @@ class InstanceData:
         return self._updated_at
 
     @property
-    def limiter(self) -> AsyncLimiter:
+    def limiter(self) -> TokenBucket:
         """Обеспечивает доступ к ограничителю запросов инстанса."""
         return self._limiter
 
@@ -47,62 +51,98 @@ class InstanceData:
 
 
 class Register:
-    def __init__(self):
-        self._limiter = AsyncLimiter(APIConfig.model_construct().max_requests_per_second, 1)
+    """Регистр инстансов и общий ограничитель запросов одного client_id.
+
+    Инстанс удаляется из регистра сразу после удаления объекта API-клиента,
+    а регистр с общим ограничителем сохраняется до `expires_at` — времени
+    последней активности удаленных инстансов плюс их `min_instance_ttl`.
+
+    Args:
+        max_requests_per_second: Ограничение запросов для client_id.
+            По умолчанию берется значение по умолчанию из `APIConfig`
+        client_id: Идентификатор клиента, задает имя ограничителя в общем хранилище
+    """
+
+    def __init__(self, max_requests_per_second: Optional[int] = None, client_id: Optional[str] = None):
+        if max_requests_per_second is None:
+            max_requests_per_second = APIConfig.model_fields["max_requests_per_second"].default
+        self._limiter = TokenBucket(
+            max_requests_per_second, 1, name=f"client:{client_id}" if client_id is not None else None
+        )
         self.data: dict[weakref.ref, InstanceData] = dict()
+        self.expires_at: float = 0.0
 
     @property
-    def limiter(self) -> AsyncLimiter:
+    def limiter(self) -> TokenBucket:
         return self._limiter
 
+    def release(self, ref: weakref.ref) -> None:
+        """Удаляет инстанс, объект которого удален, и продлевает время жизни регистра."""
+        instance_data = self.data.pop(ref, None)
+        if instance_data is not None:
+            self.expires_at = max(self.expires_at, instance_data.updated_at + instance_data.config.min_instance_ttl)
+
+    def apply_config(self, config: APIConfig) -> None:
+        """Ограничивает запросы client_id самым строгим значением из конфигураций инстансов."""
+        if config.max_requests_per_second < self._limiter.max_rate:
+            self._limiter.set_rate(config.max_requests_per_second)
+
 
 class RateLimiterManager:
     _clients: dict[str, Register] = dict()
+    _backend: Optional[RateLimiterBackend] = None
+    _cleanup_at: float = 0.0
 
-    def __init__(self, instance: "APIManager", logger: Logger):
+    def __init__(self, instance: "APIManager", logger: Union[Logger, LoggerAdapter]):
         self._logger = logger
         self._manager = self.get_or_create_client_register(instance)
         self._instance_data = self.get_or_register_instance(instance)
         self._instance_limiter = self._instance_data.limiter
         self._client_limiter = self._manager.limiter
+        self._limiters = (self._instance_limiter, self._client_limiter)
 
-        self.clear_register_by_ttl()
+        self._clear_expired_registers()
 
         self._logger.debug(
-            f"Установлено ограничение: {self._instance_data.config.max_requests_per_second} rps"
+            "Установлено ограничение: %s rps", self._instance_data.config.max_requests_per_second
         )
 
 
     @classmethod
     def clear_register_by_ttl(cls):
         """Очищает регистры инстансов по ttl."""
-        for client_id in tuple(cls._clients.keys()):
-            for ref in tuple(cls._clients[client_id].data.keys()):
-                # Для уже не существующих инстансов
-                if ref() is None:
-                    instance_last_update = cls._clients[client_id].data[ref].updated_at
-                    instance_config: APIConfig = cls._clients[client_id].data[ref].config
-                    # Если с последней активности инстанса прошло больше времени, чем определено конфигом
-                    if instance_last_update < time.monotonic() - instance_config.min_instance_ttl:
-                        del cls._clients[client_id].data[ref]
-                        if not cls._clients[client_id].data:
-                            del cls._clients[client_id]
-                            break
+        now = time.monotonic()
+        cls._cleanup_at = now + REGISTER_CLEANUP_INTERVAL
+        for client_id, register in tuple(cls._clients.items()):
+            # Инстансы, объекты которых уже удалены
+            for ref in [ref for ref in register.data if ref() is None]:
+                register.release(ref)
+            if not register.data and register.expires_at < now:
+                del cls._clients[client_id]
 
+    @classmethod
+    def _clear_expired_registers(cls) -> None:
+        """Очищает регистры по ttl не чаще раза в `REGISTER_CLEANUP_INTERVAL`."""
+        if time.monotonic() >= cls._cleanup_at:
+            cls.clear_register_by_ttl()
 
     @classmethod
     def get_or_create_client_register(cls, instance: "APIManager") -> Register:
         """Формирует и/или возвращает регистр ограничителей запросов по client_id."""
-        if instance.client_id not in cls._clients.keys():
-            cls._clients[instance.client_id] = Register()
+        register = cls._clients.get(instance.client_id)
+        if register is None:
+            register = Register(instance.config.max_requests_per_second, instance.client_id)
+            cls._clients[instance.client_id] = register
+        else:
+            register.apply_config(instance.config)
 
-        return cls._clients[instance.client_id]
+        return register
 
     @classmethod
     def get_or_register_instance(cls, instance: "APIManager") -> InstanceData:
         """Регистрирует и/или возвращает данные зарегистрированного инстанса API."""
         register = cls.get_or_create_client_register(instance)
-        instance_ref = weakref.ref(instance)
+        instance_ref = weakref.ref(instance, register.release)
         if instance_ref not in register.data.keys():
             register.data[instance_ref] = InstanceData(instance)
         else:
@@ -114,14 +154,66 @@ class RateLimiterManager:
         """Обновляет дату последней активности инстанса в регистре."""
         self._instance_data.update()
 
+    async def acquire(
+            self,
+            *limiters: Optional[TokenBucket],
+            on_wait: Optional[Callable[[TokenBucket, float], None]] = None,
+    ) -> None:
+        """Ожидает разрешения на запрос от всех уровней ограничения.
+
+        Токен атомарно списывается с ограничителей инстанса, client_id и
+        дополнительных уровней (метода, конечной точки). Пока один из уровней
+        исчерпан, токены остальных не удерживаются.
+
+        Args:
+            limiters: Дополнительные ограничители запроса, None пропускаются
+            on_wait: Вызывается с корзиной и длительностью каждого ожидания в очереди
+                (см. `token_bucket.acquire`). С подключенным хранилищем не вызывается
+        """
+        self._instance_data.update()
+        extra = tuple(limiter for limiter in limiters if limiter is not None)
+        buckets = self._limiters + extra if extra else self._limiters
+
+        backend = RateLimiterManager._backend
+        if backend is None:
+            await acquire(buckets, on_wait)
+            return
+
+        # Именованные ограничители (client_id, методы) делятся между процессами через хранилище
+        await backend.acquire(
+            specs=[
+                BucketSpec(bucket.name, bucket.max_rate, bucket.time_period)
+                for bucket in buckets if bucket.name is not None
+            ],
+            local=[bucket for bucket in buckets if bucket.name is None],
+        )
+
+    @classmethod
+    def set_backend(cls, backend: Optional[RateLimiterBackend]) -> None:
+        """Подключает общее хранилище ограничителей запросов.
+
+        Ограничения client_id и методов API будут общими для всех процессов,
+        подключенных к одному хранилищу. Ограничения инстансов и адаптивные
+        ограничения конечных точек остаются локальными.
+
+        Args:
+            backend: Хранилище ограничителей или None для работы в пределах процесса
+        """
+        cls._backend = backend
+
+    @classmethod
+    def get_backend(cls) -> Optional[RateLimiterBackend]:
+        """Возвращает подключенное хранилище ограничителей запросов."""
+        return cls._backend
+
     @property
-    def instance_limiter(self) -> AsyncLimiter:
+    def instance_limiter(self) -> TokenBucket:
         """Обеспечивает доступ к ограничителю запросов инстанса."""
         self.instance_update()
         return self._instance_limiter
 
     @property
-    def client_limiter(self) -> AsyncLimiter:
+    def client_limiter(self) -> TokenBucket:
         """Обеспечивает доступ к ограничителю запросов клиента."""
         return self._client_limiter
 
@@ -133,9 +225,39 @@ class RateLimiterManager:
             if any(ref() is not None for ref in register.data.keys())
         ]
 
+    @classmethod
+    def get_limiter_state(cls, client_id: Optional[str] = None) -> dict[str, dict[str, dict[str, float]]]:
+        """Формирует текущее состояние ограничителей client_id и их инстансов.
+
+        Args:
+            client_id: Идентификатор клиента для отбора (опционально)
+
+        Returns:
+            Состояние в виде `{client_id: {"client": {"max_rate": ..., "available_tokens": ..., "waiters": ...},
+            "instances": {"count": ..., "waiters": ...}}}`, где `instances.waiters` — сумма
+            ожидающих по ограничителям всех зарегистрированных инстансов
+        """
+        state: dict[str, dict[str, dict[str, float]]] = {}
+        for register_client_id, register in tuple(cls._clients.items()):
+            if client_id is not None and register_client_id != client_id:
+                continue
+            instances = tuple(register.data.values())
+            state[register_client_id] = {
+                "client": {
+                    "max_rate": register.limiter.max_rate,
+                    "available_tokens": register.limiter.tokens,
+                    "waiters": register.limiter.waiters,
+                },
+                "instances": {
+                    "count": len(instances),
+                    "waiters": sum(instance.limiter.waiters for instance in instances),
+                },
+            }
+        return state
+
     def shutdown(self) -> None:
         """Обеспечивает корректное завершение работы инстанса."""
-        self.clear_register_by_ttl()
+        self._clear_expired_registers()
 
     def __del__(self) -> None:
         """Очищает регистры от expired-инстансов перед удалением инстанса."""
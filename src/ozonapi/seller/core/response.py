@@ -0,0 +1,153 @@
+import copy
+import types
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Optional, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+
+class ResponseMode(str, Enum):
+    """Режим формирования ответа методов API.
+
+    Attributes:
+        VALIDATE: Полная валидация ответа в схему (по умолчанию)
+        CONSTRUCT: Построение схемы без валидации и приведения типов (аналог `model_construct`)
+        DICT: Ответ в виде словаря без построения схемы
+        BYTES: Тело ответа в байтах без декодирования
+    """
+    VALIDATE = "validate"
+    CONSTRUCT = "construct"
+    DICT = "dict"
+    BYTES = "bytes"
+
+
+_FieldBuilder = Callable[[Any], Any]
+
+_MISSING = object()
+_object_setattr = object.__setattr__
+
+
+def _unwrap_annotation(annotation: Any) -> Any:
+    """Снимает обертку `Annotated` с аннотации поля."""
+    while hasattr(annotation, "__metadata__"):
+        annotation = get_args(annotation)[0]
+    return annotation
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _get_builder(annotation: Any) -> Optional[_FieldBuilder]:
+    """Возвращает функцию построения значения поля или None, если значение не содержит схем."""
+    annotation = _unwrap_annotation(annotation)
+
+    if _is_model(annotation):
+        return lambda value: construct_model(annotation, value) if isinstance(value, dict) else value
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin in (list, tuple, set, frozenset) and args:
+        item_builder = _get_builder(args[0])
+        if item_builder is None:
+            return None
+        return lambda value: [item_builder(item) for item in value] if isinstance(value, list) else value
+
+    if origin is dict and len(args) == 2:
+        value_builder = _get_builder(args[1])
+        if value_builder is None:
+            return None
+        return lambda value: (
+            {key: value_builder(item) for key, item in value.items()} if isinstance(value, dict) else value
+        )
+
+    if origin is Union or origin is getattr(types, "UnionType", Union):
+        builders = [builder for builder in (_get_builder(arg) for arg in args) if builder is not None]
+        if not builders:
+            return None
+        if len(builders) == 1:
+            return builders[0]
+
+        def build_union(value: Any) -> Any:
+            for builder in builders:
+                result = builder(value)
+                if result is not value:
+                    return result
+            return value
+
+        return build_union
+
+    return None
+
+
+def _get_default_getter(field: FieldInfo) -> Optional[Callable[[], Any]]:
+    """Возвращает функцию получения значения поля по умолчанию или None для обязательного поля."""
+    if field.default_factory is not None:
+        if field.default_factory_takes_validated_data:
+            return lambda: field.get_default(call_default_factory=True, validated_data={})
+        return field.default_factory
+    if field.is_required():
+        return None
+    default = field.default
+    if isinstance(default, (list, dict, set)):
+        return lambda: copy.deepcopy(default)
+    return lambda: default
+
+
+@lru_cache(maxsize=None)
+def _get_model_plan(
+        model: type[BaseModel]
+) -> tuple[tuple[str, str, Optional[_FieldBuilder], Optional[Callable[[], Any]]], ...]:
+    """Формирует и кеширует план построения полей схемы."""
+    return tuple(
+        (name, field.alias or name, _get_builder(field.annotation), _get_default_getter(field))
+        for name, field in model.model_fields.items()
+    )
+
+
+def construct_model(model: type[BaseModel], data: dict[str, Any]) -> BaseModel:
+    """Строит экземпляр схемы из словаря без валидации, включая вложенные схемы.
+
+    Результат эквивалентен `model_construct`, но план заполнения полей кешируется
+    для каждой схемы. Значения полей не приводятся к типам аннотаций: даты,
+    перечисления и числа остаются в том виде, в котором пришли от API.
+
+    Args:
+        model: Схема ответа
+        data: Декодированный ответ API
+
+    Returns:
+        Экземпляр схемы, построенный без валидации
+    """
+    if model.__private_attributes__:
+        values = {}
+        for name, key, builder, _ in _get_model_plan(model):
+            value = data[key] if key in data else data.get(name, _MISSING)
+            if value is not _MISSING:
+                values[name] = value if builder is None or value is None else builder(value)
+        return model.model_construct(**values)
+
+    values = {}
+    fields_set = set()
+    for name, key, builder, get_default in _get_model_plan(model):
+        if key in data:
+            value = data[key]
+        elif name in data:
+            value = data[name]
+        else:
+            if get_default is not None:
+                values[name] = get_default()
+            continue
+        values[name] = value if builder is None or value is None else builder(value)
+        fields_set.add(name)
+
+    instance = model.__new__(model)
+    _object_setattr(instance, "__dict__", values)
+    _object_setattr(instance, "__pydantic_fields_set__", fields_set)
+    _object_setattr(instance, "__pydantic_extra__", None)
+    _object_setattr(instance, "__pydantic_private__", None)
+    return instance
@@ -0,0 +1,236 @@
+import asyncio
+import inspect
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
+
+from pydantic import BaseModel
+
+from .single_flight import payload_digest
+from ...infrastructure.logging import ozonapi_logger as logger
+
+
+class CachePolicy(NamedTuple):
+    """Правила кеширования ответов конечной точки.
+
+    Attributes:
+        ttl: Время в секундах, в течение которого ответ считается актуальным
+        stale_ttl: Время в секундах после `ttl`, в течение которого устаревший
+            ответ выдается сразу, а актуальный запрашивается в фоне
+    """
+    ttl: float
+    stale_ttl: float = 0.0
+
+
+# Правила кеширования выполняющегося метода API, задаются декоратором cache_response.
+# По ним APIManager._request сохраняет ответы в постоянное хранилище и читает их оттуда
+current_cache_policy: ContextVar[Optional[CachePolicy]] = ContextVar("ozonapi_cache_policy", default=None)
+
+
+class _Entry:
+    """Закешированный ответ."""
+
+    __slots__ = ("value", "fresh_until", "stale_until")
+
+    def __init__(self, value: Any, policy: CachePolicy) -> None:
+        now = time.monotonic()
+        self.value = value
+        self.fresh_until = now + policy.ttl
+        self.stale_until = self.fresh_until + policy.stale_ttl
+
+
+class ResponseCache:
+    """Общий для процесса кеш ответов API.
+
+    Ключ ответа включает client_id, метод API и хеш запроса, поэтому
+    новые экземпляры клиента с тем же client_id сразу получают закешированные
+    ответы, а кеш не удерживает сами экземпляры. При превышении `max_entries`
+    вытесняются давно не использованные ответы.
+
+    Args:
+        max_entries: Максимальное количество закешированных ответов
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        self._refreshes: dict[tuple, asyncio.Future] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refresh_errors = 0
+
+    async def get(self, key: tuple, fetch: Callable[[], Awaitable[Any]], policy: CachePolicy) -> Any:
+        """Возвращает закешированный ответ или запрашивает его.
+
+        Устаревший в пределах `policy.stale_ttl` ответ выдается сразу, а
+        актуальный запрашивается в фоновой задаче (одной на ключ). Ошибки
+        фонового запроса не передаются вызовам: до истечения `stale_ttl`
+        выдается прежний ответ.
+
+        Args:
+            key: Ключ ответа, первые элементы — client_id и имя метода API
+            fetch: Выполняет запрос
+            policy: Правила кеширования конечной точки
+
+        Returns:
+            Ответ, общий для всех вызовов с тем же ключом
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            now = time.monotonic()
+            if now < entry.fresh_until:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if now < entry.stale_until:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                self._revalidate(key, fetch, policy)
+                return entry.value
+            del self._entries[key]
+
+        self.misses += 1
+        value = await fetch()
+        self._store(key, value, policy)
+        return value
+
+    def peek(self, key: tuple) -> Optional[Any]:
+        """Возвращает актуальный закешированный ответ без запроса.
+
+        Args:
+            key: Ключ ответа
+
+        Returns:
+            Ответ или None, если актуального ответа в кеше нет
+        """
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry.fresh_until:
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def _store(self, key: tuple, value: Any, policy: CachePolicy) -> None:
+        self._entries[key] = _Entry(value, policy)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _revalidate(self, key: tuple, fetch: Callable[[], Awaitable[Any]], policy: CachePolicy) -> None:
+        if key in self._refreshes:
+            return
+        task = asyncio.ensure_future(self._refresh(key, fetch, policy))
+        self._refreshes[key] = task
+        task.add_done_callback(lambda _: self._refreshes.pop(key, None))
+
+    async def _refresh(self, key: tuple, fetch: Callable[[], Awaitable[Any]], policy: CachePolicy) -> None:
+        try:
+            value = await fetch()
+        except Exception as e:
+            self.refresh_errors += 1
+            logger.warning(f"Не удалось обновить закешированный ответ {key[1]}: {e}")
+            return
+        self._store(key, value, policy)
+
+    def invalidate(self, client_id: Optional[str] = None, method: Optional[str] = None) -> int:
+        """Удаляет закешированные ответы.
+
+        Args:
+            client_id: Идентификатор клиента (по умолчанию все клиенты)
+            method: Имя метода API, например `warehouse_list` (по умолчанию все методы)
+
+        Returns:
+            Количество удаленных ответов
+        """
+        keys = [
+            key for key in self._entries
+            if (client_id is None or key[0] == client_id) and (method is None or key[1] == method)
+        ]
+        for key in keys:
+            del self._entries[key]
+            refresh = self._refreshes.pop(key, None)
+            if refresh is not None:
+                refresh.cancel()
+        return len(keys)
+
+    def get_state(self) -> dict[str, int]:
+        """Формирует статистику кеша.
+
+        Returns:
+            Статистика в виде `{"entries": ..., "hits": ..., "stale_hits": ..., "misses": ..., ...}`
+        """
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "refreshing": len(self._refreshes),
+            "refresh_errors": self.refresh_errors,
+        }
+
+
+def _dump(argument: Any) -> Any:
+    """Приводит аргумент метода к виду для вычисления ключа кеша."""
+    return argument.model_dump() if isinstance(argument, BaseModel) else argument
+
+
+def cache_response(ttl: float, stale_ttl: Optional[float] = None):
+    """
+    Декоратор для кеширования ответов метода API в общем кеше `APIManager`.
+
+    Ответы кешируются по client_id, имени метода, запросу и режиму ответа.
+    Одновременные запросы при отсутствии ответа в кеше объединяются в один
+    (см. `APIConfig.coalesce_requests`). Если подключено постоянное хранилище
+    (см. `APIManager.set_response_store()`), ответ сначала ищется в нем.
+    Кеширование отключается параметром `APIConfig.response_cache`, а для
+    отдельных вызовов — блоком `APIManager.bypass_response_cache()`.
+
+    Args:
+        ttl: Время в секундах, в течение которого ответ считается актуальным
+        stale_ttl: Время в секундах после `ttl`, в течение которого выдается
+            устаревший ответ с обновлением в фоне (по умолчанию равно `ttl`)
+
+    Returns:
+        Декоратор метода
+    """
+    policy = CachePolicy(ttl=ttl, stale_ttl=ttl if stale_ttl is None else stale_ttl)
+
+    def decorator(method):
+        name = method.__name__
+        signature = inspect.signature(method)
+
+        def cache_key(self, mode, *args, **kwargs) -> tuple:
+            # Аргументы приводятся к именованным со значениями по умолчанию,
+            # чтобы вызовы f() и f(request) с тем же запросом имели общий ключ
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = {key: _dump(argument) for key, argument in list(bound.arguments.items())[1:]}
+            return self.client_id, name, mode, payload_digest(arguments)
+
+        @wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            if not self._is_response_cache_enabled():
+                return await method(self, *args, **kwargs)
+            key = cache_key(self, self._get_response_mode(), *args, **kwargs)
+
+            async def fetch():
+                token = current_cache_policy.set(policy)
+                try:
+                    return await method(self, *args, **kwargs)
+                finally:
+                    current_cache_policy.reset(token)
+
+            return await self._response_cache.get(key, fetch, policy)
+
+        wrapper._cache_policy = policy
+        wrapper._cache_key = cache_key
+        return wrapper
+
+    return decorator
@@ -0,0 +1,218 @@
+import abc
+import asyncio
+import hashlib
+import os
+import struct
+import tempfile
+import time
+from typing import NamedTuple, Optional
+
+from ...infrastructure.logging import ozonapi_logger as logger
+
+
+class StoreKey(NamedTuple):
+    """Ключ ответа в постоянном хранилище.
+
+    Attributes:
+        client_id: Идентификатор клиента
+        endpoint: Конечная точка API вместе с версией, например `v1/description-category/tree`
+        digest: Хеш HTTP-метода, тела и параметров запроса
+    """
+    client_id: str
+    endpoint: str
+    digest: str
+
+
+class ResponseStore(abc.ABC):
+    """Базовый класс постоянного хранилища ответов API.
+
+    Хранилище содержит исходные тела ответов кешируемых методов (см.
+    `cache_response()`) и позволяет процессам одного хоста и перезапущенным
+    процессам не загружать повторно большие справочники. Тело ответа из
+    хранилища сразу передается в валидацию схемы ответа, поэтому хранимые
+    данные не зависят от версии библиотеки. Ответы разных версий конечной
+    точки (`v1`, `v3` …) хранятся раздельно.
+
+    Реализация должна определить `get()`, `set()` и `invalidate()`, иначе
+    создание экземпляра завершается ошибкой `TypeError`. Ошибки
+    хранилища не должны прерывать запросы: при ошибке чтения ответ
+    запрашивается у API.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+
+    @abc.abstractmethod
+    async def get(self, key: StoreKey) -> Optional[bytes]:
+        """Возвращает актуальное тело ответа или None, если ответа нет или он устарел."""
+
+    @abc.abstractmethod
+    async def set(self, key: StoreKey, body: bytes, ttl: float) -> None:
+        """Сохраняет тело ответа на `ttl` секунд."""
+
+    @abc.abstractmethod
+    async def invalidate(self, client_id: Optional[str] = None, endpoint: Optional[str] = None) -> int:
+        """Удаляет сохраненные ответы.
+
+        Args:
+            client_id: Идентификатор клиента (по умолчанию все клиенты)
+            endpoint: Конечная точка API вместе с версией (по умолчанию все конечные точки)
+
+        Returns:
+            Количество удаленных ответов
+        """
+
+    async def close(self) -> None:
+        """Освобождает ресурсы хранилища."""
+        return None
+
+    def get_state(self) -> dict[str, int]:
+        """Формирует статистику хранилища.
+
+        Returns:
+            Статистика в виде `{"hits": ..., "misses": ..., "writes": ..., "errors": ...}`
+        """
+        return {"hits": self.hits, "misses": self.misses, "writes": self.writes, "errors": self.errors}
+
+
+class FileResponseStore(ResponseStore):
+    """Хранилище ответов в файлах для нескольких процессов одного хоста.
+
+    Каждый ответ хранится в отдельном файле
+    `directory/<версия>/<конечная точка>/<client_id>-<хеш запроса>.bin`
+    вместе со временем устаревания. Файл записывается во временный файл и
+    атомарно заменяется (`os.replace`), поэтому процессы не видят частично
+    записанных ответов. Чтение и запись выполняются в отдельном потоке,
+    чтобы загрузка больших справочников не блокировала цикл событий.
+    Устаревшие файлы удаляются при чтении и при вызове `invalidate()`.
+
+    Args:
+        directory: Каталог хранилища, общий для всех процессов
+    """
+
+    # Версия формата файлов. Файлы другого формата хранятся в другом каталоге и не читаются
+    FORMAT_VERSION = 1
+    _HEADER = struct.Struct("<d")
+
+    def __init__(self, directory: str) -> None:
+        super().__init__()
+        self.directory = os.path.join(directory, f"v{self.FORMAT_VERSION}")
+
+    @staticmethod
+    def _client_prefix(client_id: str) -> str:
+        return hashlib.blake2b(client_id.encode(), digest_size=8).hexdigest()
+
+    def _endpoint_directory(self, endpoint: str) -> str:
+        return os.path.join(self.directory, *endpoint.strip("/").split("/"))
+
+    def _path(self, key: StoreKey) -> str:
+        return os.path.join(
+            self._endpoint_directory(key.endpoint), f"{self._client_prefix(key.client_id)}-{key.digest}.bin"
+        )
+
+    @staticmethod
+    def _unlink_if_same(path: str, stat: os.stat_result) -> None:
+        """Удаляет файл, если он не был заменен другим процессом после чтения."""
+        try:
+            current = os.stat(path)
+            if (current.st_ino, current.st_dev) == (stat.st_ino, stat.st_dev):
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    def read(self, key: StoreKey) -> Optional[bytes]:
+        """Синхронно читает актуальное тело ответа. Устаревший файл удаляется."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                stat = os.fstat(file.fileno())
+                data = file.read()
+        except FileNotFoundError:
+            return None
+        if len(data) < self._HEADER.size:
+            return None
+        (expires_at,) = self._HEADER.unpack_from(data)
+        # Время должно быть общим для всех процессов хоста
+        if expires_at <= time.time():
+            self._unlink_if_same(path, stat)
+            return None
+        return data[self._HEADER.size:]
+
+    def write(self, key: StoreKey, body: bytes, ttl: float) -> None:
+        """Синхронно записывает тело ответа с атомарной заменой файла."""
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(self._HEADER.pack(time.time() + ttl))
+                file.write(body)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _remove_if_expired(self, path: str) -> None:
+        """Удаляет файл ответа, если он устарел или поврежден."""
+        with open(path, "rb") as file:
+            stat = os.fstat(file.fileno())
+            header = file.read(self._HEADER.size)
+        if len(header) < self._HEADER.size or self._HEADER.unpack(header)[0] <= time.time():
+            self._unlink_if_same(path, stat)
+
+    def remove(self, client_id: Optional[str] = None, endpoint: Optional[str] = None) -> int:
+        """Синхронно удаляет сохраненные ответы, попутно удаляя устаревшие ответы остальных ключей.
+
+        Ответы вложенной конечной точки (`.../attribute/values` для `.../attribute`)
+        хранятся в подкаталоге и к конечной точке не относятся.
+        """
+        endpoint_directory = None if endpoint is None else self._endpoint_directory(endpoint)
+        prefix = None if client_id is None else f"{self._client_prefix(client_id)}-"
+        removed = 0
+        for directory, _, files in os.walk(self.directory):
+            selected = endpoint_directory is None or directory == endpoint_directory
+            for name in files:
+                if not name.endswith(".bin"):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    if selected and (prefix is None or name.startswith(prefix)):
+                        os.unlink(path)
+                        removed += 1
+                    else:
+                        self._remove_if_expired(path)
+                except FileNotFoundError:
+                    pass
+        return removed
+
+    async def get(self, key: StoreKey) -> Optional[bytes]:
+        try:
+            body = await asyncio.to_thread(self.read, key)
+        except OSError as e:
+            self.errors += 1
+            logger.warning(f"Не удалось прочитать сохраненный ответ {key.endpoint}: {e}")
+            body = None
+        if body is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return body
+
+    async def set(self, key: StoreKey, body: bytes, ttl: float) -> None:
+        try:
+            await asyncio.to_thread(self.write, key, body, ttl)
+        except OSError as e:
+            self.errors += 1
+            logger.warning(f"Не удалось сохранить ответ {key.endpoint}: {e}")
+            return
+        self.writes += 1
+
+    async def invalidate(self, client_id: Optional[str] = None, endpoint: Optional[str] = None) -> int:
+        return await asyncio.to_thread(self.remove, client_id, endpoint)
@@ -0,0 +1,168 @@
+import math
+import random
+import time
+from typing import Any, Optional
+
+from .exceptions import (
+    APIConnectError,
+    APIError,
+    APINetworkError,
+    APIServerError,
+    APITimeoutError,
+    APITooManyRequestsError,
+)
+
+# Конечные точки (без версии API), повтор которых после отправки запроса может
+# создать дубликат операции: задачи импорта, генерацию, отгрузку, отмену и т.п.
+# Обновления абсолютных значений (цены, остатки, архивирование) безопасны для повтора.
+NON_IDEMPOTENT_ENDPOINTS = frozenset({
+    "barcode/add",
+    "barcode/generate",
+    "posting/fbs/arbitration",
+    "posting/fbs/awaiting-delivery",
+    "posting/fbs/cancel",
+    "posting/fbs/package-label/create",
+    "posting/fbs/product/cancel",
+    "posting/fbs/product/change",
+    "posting/fbs/ship",
+    "posting/fbs/ship/package",
+    "product/import",
+    "product/import-by-sku",
+    "product/pictures/import",
+    "product/attributes/update",
+    "product/update/offer-id",
+})
+
+# Ошибки, после которых повтор безопасен для любых запросов: сервер отклонил
+# запрос до обработки или запрос не был отправлен
+SAFE_RETRY_ERRORS: tuple[type[APIError], ...] = (APITooManyRequestsError, APIConnectError)
+
+# Ошибки, после которых запрос мог быть обработан сервером
+IDEMPOTENT_RETRY_ERRORS: tuple[type[APIError], ...] = SAFE_RETRY_ERRORS + (
+    APIServerError,
+    APITimeoutError,
+    APINetworkError,
+)
+
+
+class RetryPolicy:
+    """Политика повторов запросов к конечной точке.
+
+    Создается один раз для client_id и конечной точки и переиспользуется
+    всеми запросами. Задержка выбирается случайно между `min_wait` и
+    экспоненциально растущей верхней границей (не более `max_wait`),
+    чтобы повторы разных запросов не совпадали по времени.
+
+    Args:
+        max_retries: Максимальное количество повторов
+        min_wait: Минимальная задержка между повторами в секундах
+        max_wait: Максимальная задержка между повторами в секундах
+        idempotent: Безопасен ли повтор запроса после его отправки
+    """
+
+    __slots__ = ("max_retries", "min_wait", "max_wait", "idempotent", "retry_on")
+
+    def __init__(self, max_retries: int, min_wait: float, max_wait: float, idempotent: bool = True) -> None:
+        self.max_retries = max_retries
+        self.min_wait = min_wait
+        self.max_wait = max(max_wait, min_wait)
+        self.idempotent = idempotent
+        self.retry_on = IDEMPOTENT_RETRY_ERRORS if idempotent else SAFE_RETRY_ERRORS
+
+    def get_delay(self, attempt: int, error: Optional[APIError] = None) -> float:
+        """Вычисляет задержку перед повтором.
+
+        Args:
+            attempt: Номер повтора, начиная с 1
+            error: Ошибка предыдущей попытки
+
+        Returns:
+            Задержка в секундах, не меньше времени из `Retry-After`, если сервер его сообщил
+        """
+        upper = min(self.max_wait, self.min_wait * 2 ** min(attempt, 32))
+        delay = random.uniform(self.min_wait, upper)
+        if error is not None and error.retry_after:
+            return max(delay, error.retry_after)
+        return delay
+
+
+class RetryBudget:
+    """Общий для процесса бюджет повторов запросов.
+
+    Каждый исходный запрос пополняет бюджет на `ratio` повтора, каждый повтор
+    после ошибки сервера или сети расходует один. Накопленный запас затухает за время порядка `ttl` секунд,
+    а резерв в `min_per_second` повторов в секунду позволяет повторять
+    редкие запросы. При частичной недоступности API доля повторов не
+    превышает `ratio` от потока запросов, и нагрузка не умножается.
+
+    Args:
+        ratio: Допустимая доля повторов от числа исходных запросов
+        min_per_second: Резерв повторов в секунду независимо от числа запросов
+        ttl: Время жизни накопленного запаса в секундах
+    """
+
+    __slots__ = (
+        "ratio", "min_per_second", "ttl", "_balance", "_reserve", "_updated_at",
+        "requests", "retries", "rejected",
+    )
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 5.0, ttl: float = 10.0) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.ttl = ttl
+        self._balance = 0.0
+        self._reserve = min_per_second
+        self._updated_at = time.monotonic()
+        self.requests = 0
+        self.retries = 0
+        self.rejected = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._balance *= math.exp(-elapsed / self.ttl)
+            self._reserve = min(self.min_per_second, self._reserve + elapsed * self.min_per_second)
+            self._updated_at = now
+
+    def deposit(self) -> None:
+        """Учитывает исходный запрос."""
+        self._refill()
+        self.requests += 1
+        self._balance += self.ratio
+
+    def try_withdraw(self) -> bool:
+        """Расходует бюджет на повтор.
+
+        Returns:
+            True, если повтор разрешен
+        """
+        self._refill()
+        if self._balance >= 1:
+            self._balance -= 1
+        elif self._reserve >= 1:
+            self._reserve -= 1
+        else:
+            self.rejected += 1
+            return False
+        self.retries += 1
+        return True
+
+    def get_state(self) -> dict[str, Any]:
+        """Формирует текущее состояние бюджета."""
+        self._refill()
+        return {
+            "available": math.floor(self._balance) + math.floor(self._reserve),
+            "requests": self.requests,
+            "retries": self.retries,
+            "rejected": self.rejected,
+        }
+
+
+def is_idempotent(endpoint: str) -> bool:
+    """Проверяет, безопасен ли повтор запроса к конечной точке после его отправки.
+
+    Args:
+        endpoint: Конечная точка API без версии, например `product/import`
+    """
+    return endpoint.strip("/") not in NON_IDEMPOTENT_ENDPOINTS
@@ -1,25 +1,42 @@
 import asyncio
+import time
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
-from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from typing import AsyncIterator, Optional
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, TraceConfig
 
 from ...infrastructure.logging import ozonapi_logger as logger
 
 
 class SessionManager:
-    """Менеджер для управления HTTP-сессиями."""
+    """Менеджер для управления HTTP-сессиями.
+
+    В пуловом режиме (`pooled=True`) сессия и ее keep-alive соединения сохраняются
+    между запросами и закрываются при удалении последнего инстанса client_id,
+    при вызове `close_all()` или фоновой задачей по истечении `idle_timeout`.
+    """
 
     def __init__(
             self,
             timeout: float = 30.0,
             connector_limit: int = 100,
-            instance_logger=logger
+            instance_logger=logger,
+            pooled: bool = False,
+            idle_timeout: float = 300.0,
+            keepalive_timeout: float = 15.0,
     ) -> None:
         self._sessions: dict[str, ClientSession] = {}
         self._session_refs: dict[str, set[int]] = {}
+        self._session_loops: dict[str, asyncio.AbstractEventLoop] = {}
+        self._last_used: dict[str, float] = {}
+        self._in_flight: dict[str, int] = {}
+        self._stats: dict[str, dict[str, int]] = {}
         self._lock = asyncio.Lock()
         self._timeout = ClientTimeout(total=timeout)
         self._connector_limit = connector_limit
+        self._pooled = pooled
+        self._idle_timeout = idle_timeout
+        self._keepalive_timeout = keepalive_timeout
+        self._reaper_task: Optional[asyncio.Task] = None
         self._logger = instance_logger
 
     @staticmethod
@@ -35,6 +52,82 @@ class SessionManager:
         else:
             raise ValueError("Недостаточно данных для авторизации")
 
+    def _get_client_stats(self, client_id: str) -> dict[str, int]:
+        """Возвращает счетчики сессий и соединений для client_id."""
+        if client_id not in self._stats:
+            self._stats[client_id] = {
+                "sessions_created": 0,
+                "requests": 0,
+                "connections_created": 0,
+                "connections_reused": 0,
+            }
+        return self._stats[client_id]
+
+    def _create_trace_config(self, client_id: str) -> TraceConfig:
+        """Создает трассировку для подсчета новых и повторно используемых соединений.
+
+        Если запрос передан с `trace_request_ctx` (см. `RequestTiming`), время ожидания
+        свободного соединения в пуле и установки нового соединения добавляется к его `connect`.
+        """
+        stats = self._get_client_stats(client_id)
+
+        async def on_request_start(session, context, params):
+            stats["requests"] += 1
+
+        async def on_connect_start(session, context, params):
+            if context.trace_request_ctx is not None:
+                context.connect_started = time.perf_counter()
+
+        async def on_connect_end(session, context, params):
+            if context.trace_request_ctx is not None:
+                context.trace_request_ctx.connect += time.perf_counter() - context.connect_started
+
+        async def on_connection_create_end(session, context, params):
+            stats["connections_created"] += 1
+            await on_connect_end(session, context, params)
+
+        async def on_connection_reuseconn(session, context, params):
+            stats["connections_reused"] += 1
+
+        trace_config = TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_queued_start.append(on_connect_start)
+        trace_config.on_connection_queued_end.append(on_connect_end)
+        trace_config.on_connection_create_start.append(on_connect_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def _create_session(self, client_id: str, api_key: str, token: str) -> ClientSession:
+        """Создает HTTP-сессию для client_id."""
+        session = ClientSession(
+            headers=self._get_headers(client_id, api_key, token),
+            timeout=self._timeout,
+            connector=TCPConnector(
+                limit=self._connector_limit,
+                keepalive_timeout=self._keepalive_timeout,
+            ),
+            trace_configs=[self._create_trace_config(client_id)],
+        )
+        self._sessions[client_id] = session
+        self._session_loops[client_id] = asyncio.get_running_loop()
+        self._session_refs.setdefault(client_id, set())
+        self._get_client_stats(client_id)["sessions_created"] += 1
+        self._logger.debug("Создана новая сессия")
+        return session
+
+    def _get_alive_session(self, client_id: str) -> Optional[ClientSession]:
+        """Возвращает открытую сессию client_id, привязанную к текущему event loop."""
+        session = self._sessions.get(client_id)
+        if session is None or session.closed:
+            return None
+        if self._session_loops.get(client_id) is not asyncio.get_running_loop():
+            # Event loop, в котором создана сессия, завершен - сессия непригодна к использованию
+            self._sessions.pop(client_id, None)
+            self._session_loops.pop(client_id, None)
+            return None
+        return session
+
     @asynccontextmanager
     async def get_session(self, client_id: str, api_key: str, instance_id: int, token: str = None) -> AsyncIterator[
         ClientSession]:
@@ -50,32 +143,85 @@ class SessionManager:
         Yields:
             ClientSession: HTTP-сессия
         """
-        async with self._lock:
-            if client_id not in self._sessions:
-                self._sessions[client_id] = ClientSession(
-                    headers=self._get_headers(client_id, api_key, token),
-                    timeout=self._timeout,
-                    connector=TCPConnector(limit=self._connector_limit)
-                )
-                self._session_refs[client_id] = set()
-                self._logger.debug(f"Создана новая сессия")
-
-            self._session_refs[client_id].add(instance_id)
+        if self._pooled:
+            session = self._get_alive_session(client_id)
+            if session is None:
+                async with self._lock:
+                    session = self._get_alive_session(client_id)
+                    if session is None:
+                        session = self._create_session(client_id, api_key, token)
+                self._ensure_reaper()
+            self._session_refs.setdefault(client_id, set()).add(instance_id)
+        else:
+            async with self._lock:
+                session = self._get_alive_session(client_id)
+                if session is None:
+                    session = self._create_session(client_id, api_key, token)
+                self._session_refs[client_id].add(instance_id)
 
+        self._in_flight[client_id] = self._in_flight.get(client_id, 0) + 1
         try:
-            yield self._sessions[client_id]
+            yield session
         finally:
-            async with self._lock:
-                if client_id in self._session_refs:
-                    self._session_refs[client_id].discard(instance_id)
+            self._in_flight[client_id] -= 1
+            self._last_used[client_id] = time.monotonic()
+
+            if not self._pooled:
+                async with self._lock:
+                    if client_id in self._session_refs:
+                        self._session_refs[client_id].discard(instance_id)
+
+                        # Если не осталось активных инстансов для этого client_id - закрываем сессию
+                        if not self._session_refs[client_id]:
+                            await self._drop_session(client_id)
+
+    async def _drop_session(self, client_id: str) -> None:
+        """Закрывает сессию client_id и удаляет сведения о ней."""
+        session = self._sessions.pop(client_id, None)
+        self._session_refs.pop(client_id, None)
+        self._session_loops.pop(client_id, None)
+        self._last_used.pop(client_id, None)
+        if session and not session.closed:
+            await session.close()
+            self._logger.debug("Сессия закрыта")
+
+    def _ensure_reaper(self) -> None:
+        """Запускает фоновую задачу закрытия простаивающих сессий."""
+        loop = asyncio.get_running_loop()
+        if (
+                self._reaper_task is None
+                or self._reaper_task.done()
+                or self._reaper_task.get_loop() is not loop
+        ):
+            self._reaper_task = loop.create_task(self._reaper_loop())
+
+    async def _reaper_loop(self) -> None:
+        """Фоновая задача закрытия простаивающих сессий."""
+        interval = max(min(self._idle_timeout / 2, 60.0), 0.01)
+        while True:
+            try:
+                await asyncio.sleep(interval)
+                await self.close_idle_sessions()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self._logger.error("Ошибка при закрытии простаивающих сессий: %s", e)
 
-                    # Если не осталось активных инстансов для этого client_id - закрываем сессию
-                    if not self._session_refs[client_id]:
-                        session = self._sessions.pop(client_id)
-                        self._session_refs.pop(client_id)
-                        if not session.closed:
-                            await session.close()
-                            self._logger.debug(f"Сессия закрыта")
+    async def close_idle_sessions(self) -> None:
+        """Закрывает сессии без активных запросов, простаивающие дольше `idle_timeout`."""
+        async with self._lock:
+            threshold = time.monotonic() - self._idle_timeout
+            for client_id in tuple(self._sessions.keys()):
+                if self._in_flight.get(client_id, 0) > 0:
+                    continue
+                if self._last_used.get(client_id, 0.0) > threshold:
+                    continue
+                session = self._sessions.pop(client_id)
+                self._session_loops.pop(client_id, None)
+                self._last_used.pop(client_id, None)
+                if not session.closed:
+                    await session.close()
+                    self._logger.debug("Сессия для ClientID %s закрыта по простою", client_id)
 
     def get_active_instances_count(self, client_id: str) -> int:
         """Возвращает количество активных инстансов для client_id."""
@@ -87,6 +233,15 @@ class SessionManager:
         """Проверяет, есть ли активные инстансы у любого клиента."""
         return any(len(refs) > 0 for refs in self._session_refs.values())
 
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """Формирует статистику по сессиям и соединениям в разрезе client_id.
+
+        Returns:
+            Словарь вида `{client_id: {"sessions_created": ..., "requests": ...,
+            "connections_created": ..., "connections_reused": ...}}`
+        """
+        return {client_id: dict(stats) for client_id, stats in self._stats.items()}
+
     async def remove_instance(self, client_id: str, instance_id: int) -> None:
         """Удаляет инстанс из отслеживания."""
         async with self._lock:
@@ -94,11 +249,7 @@ class SessionManager:
                 self._session_refs[client_id].discard(instance_id)
 
                 if not self._session_refs[client_id]:
-                    session = self._sessions.pop(client_id, None)
-                    self._session_refs.pop(client_id, None)
-                    if session and not session.closed:
-                        await session.close()
-                        self._logger.debug(f"Сессия закрыта")
+                    await self._drop_session(client_id)
 
     async def close_session(self, client_id: str) -> None:
         """Закрывает сессию для client_id."""
@@ -106,17 +257,30 @@ class SessionManager:
             if client_id in self._sessions:
                 session = self._sessions.pop(client_id)
                 self._session_refs.pop(client_id, None)
+                self._session_loops.pop(client_id, None)
+                self._last_used.pop(client_id, None)
                 if not session.closed:
                     await session.close()
-                    self._logger.debug(f"Сессия для ClientID {client_id} закрыта")
+                    self._logger.debug("Сессия для ClientID %s закрыта", client_id)
 
     async def close_all(self) -> None:
         """Закрывает все сессии."""
+        if self._reaper_task is not None:
+            if not self._reaper_task.done() and self._reaper_task.get_loop() is asyncio.get_running_loop():
+                self._reaper_task.cancel()
+                try:
+                    await self._reaper_task
+                except asyncio.CancelledError:
+                    pass
+            self._reaper_task = None
+
         async with self._lock:
             for client_id, session in list(self._sessions.items()):
                 if not session.closed:
                     await session.close()
-                    self._logger.debug(f"Сессия для ClientID {client_id} закрыта")
+                    self._logger.debug("Сессия для ClientID %s закрыта", client_id)
             self._sessions.clear()
             self._session_refs.clear()
-        self._logger.debug("Все сессии закрыты")
\ No newline at end of file
+            self._session_loops.clear()
+            self._last_used.clear()
+        self._logger.debug("Все сессии закрыты")
@@ -0,0 +1,168 @@
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+# Конечные точки (без версии API), только читающие данные. Одинаковые
+# одновременные запросы к ним объединяются в один. Запросы к остальным
+# конечным точкам (изменение товаров, цен, остатков, статусов отправлений
+# и т.п.) всегда выполняются по отдельности.
+READ_ENDPOINTS = frozenset({
+    "analytics/stocks",
+    "delivery-method/list",
+    "description-category/attribute",
+    "description-category/attribute/values",
+    "description-category/attribute/values/search",
+    "description-category/tree",
+    "fbs/posting/product/exemplar/status",
+    "posting/fbo/cancel-reason/list",
+    "posting/fbo/get",
+    "posting/fbo/list",
+    "posting/fbs/cancel-reason",
+    "posting/fbs/cancel-reason/list",
+    "posting/fbs/get",
+    "posting/fbs/get-by-barcode",
+    "posting/fbs/list",
+    "posting/fbs/package-label",
+    "posting/fbs/package-label/get",
+    "posting/fbs/product/country/list",
+    "posting/fbs/restrictions",
+    "posting/fbs/unfulfilled/list",
+    "product/import/info",
+    "product/info/attributes",
+    "product/info/description",
+    "product/info/limit",
+    "product/info/list",
+    "product/info/prices",
+    "product/info/stocks",
+    "product/info/stocks-by-warehouse/fbs",
+    "product/info/subscription",
+    "product/list",
+    "product/pictures/info",
+    "product/rating-by-sku",
+    "product/related-sku/get",
+    "seller/info",
+    "warehouse/list",
+})
+
+
+def is_read_only(endpoint: str) -> bool:
+    """Проверяет, что запрос к конечной точке только читает данные.
+
+    Args:
+        endpoint: Конечная точка API без версии, например `warehouse/list`
+    """
+    return endpoint.strip("/") in READ_ENDPOINTS
+
+
+def payload_digest(payload: Any) -> bytes:
+    """Вычисляет хеш канонического представления тела запроса.
+
+    Порядок ключей словарей не влияет на результат.
+    """
+    data = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.blake2b(data.encode(), digest_size=16).digest()
+
+
+class _Call:
+    """Выполняющийся запрос и количество ожидающих его вызовов."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Объединяет одновременные одинаковые запросы в один.
+
+    Первый вызов с ключом выполняет запрос в отдельной задаче, вызовы с тем же
+    ключом до его завершения получают тот же результат или ту же ошибку.
+    Отмена одного из вызовов не прерывает запрос для остальных: запрос
+    отменяется, только когда его не ждет ни один вызов. Результат не
+    сохраняется после завершения запроса.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats: dict[tuple[str, str], list[int]] = {}
+
+    async def do(
+            self,
+            key: Hashable,
+            send: Callable[[], Awaitable[Any]],
+            client_id: str,
+            endpoint: str,
+    ) -> Any:
+        """Выполняет запрос или присоединяется к уже выполняющемуся запросу с тем же ключом.
+
+        Args:
+            key: Ключ запроса
+            send: Выполняет запрос
+            client_id: Идентификатор клиента для статистики
+            endpoint: Конечная точка API вместе с версией для статистики
+
+        Returns:
+            Результат запроса, общий для всех объединенных вызовов
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._calls.clear()
+            self._loop = loop
+
+        stats = self._stats.get((client_id, endpoint))
+        if stats is None:
+            stats = self._stats[(client_id, endpoint)] = [0, 0]
+
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = _Call(asyncio.ensure_future(send()))
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            stats[0] += 1
+        else:
+            stats[1] += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if not call.waiters and not call.task.done():
+                call.task.cancel()
+
+    def _forget(self, key: Hashable, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.task.cancelled():
+            # Ошибка уже передана ожидающим вызовам
+            call.task.exception()
+
+    def get_state(self, client_id: Optional[str] = None) -> dict[str, dict[str, dict[str, int]]]:
+        """Формирует статистику объединения запросов.
+
+        Args:
+            client_id: Идентификатор клиента для отбора (опционально)
+
+        Returns:
+            Статистика в виде `{client_id: {endpoint: {"requests": ..., "coalesced": ..., "in_flight": ...}}}`,
+            где `requests` — выполненные запросы, `coalesced` — вызовы, получившие результат чужого запроса
+        """
+        in_flight: dict[tuple[str, str], int] = {}
+        for key in tuple(self._calls):
+            in_flight[key[:2]] = in_flight.get(key[:2], 0) + 1
+
+        state: dict[str, dict[str, dict[str, int]]] = {}
+        for (stats_client_id, endpoint), (requests, coalesced) in tuple(self._stats.items()):
+            if client_id is None or stats_client_id == client_id:
+                state.setdefault(stats_client_id, {})[endpoint] = {
+                    "requests": requests,
+                    "coalesced": coalesced,
+                    "in_flight": in_flight.get((stats_client_id, endpoint), 0),
+                }
+        return state
+
+    def clear(self) -> None:
+        """Сбрасывает статистику. Выполняющиеся запросы не прерываются."""
+        self._stats.clear()
@@ -0,0 +1,228 @@
+import json
+import re
+from typing import Any, AsyncIterator, Callable, Sequence, TypeVar
+
+from pydantic import BaseModel
+
+from .pagination import NextRequest
+from .response import ResponseMode, construct_model
+
+RequestT = TypeVar("RequestT", bound=BaseModel)
+
+# Размер фрагмента тела ответа, читаемого из сокета за один раз
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Строка JSON целиком или структурный символ. Одиночная кавычка означает,
+# что строка еще не получена полностью
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{},"]', re.DOTALL)
+
+
+class JSONArrayScanner:
+    """Выделяет элементы массива JSON по мере получения тела ответа.
+
+    Массив задается путем ключей от корня документа, например
+    `("result", "postings")`. Каждый полученный целиком элемент массива
+    возвращается в виде исходных байтов, поэтому в памяти одновременно
+    находятся только необработанный фрагмент и текущий элемент. Остальная
+    часть документа (`has_next`, `last_id`, `cursor`, `total` …) собирается
+    отдельно с пустым массивом вместо элементов.
+
+    Args:
+        path: Путь ключей к массиву элементов, пустой путь — массив в корне документа
+    """
+
+    def __init__(self, path: Sequence[str]) -> None:
+        self.path = tuple(path)
+        self._buffer = bytearray()
+        self._position = 0
+        self._consumed = 0
+        self._envelope = bytearray()
+        # Открытые контейнеры вне массива элементов: [это объект, текущий ключ, ожидается ключ]
+        self._stack: list[list[Any]] = []
+        self._in_array = False
+        self._found = False
+        self._depth = 0
+        self._item_start = 0
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Принимает очередной фрагмент тела ответа.
+
+        Returns:
+            Байты элементов массива, полученных целиком
+        """
+        buffer = self._buffer
+        buffer += chunk
+        position = self._position
+        items = []
+
+        while True:
+            match = _TOKEN.search(buffer, position)
+            if match is None:
+                position = len(buffer)
+                break
+            index = match.start()
+            if buffer[index] == 0x22:  # "
+                if match.end() - index == 1:
+                    # Строка еще не получена полностью
+                    position = index
+                    break
+                position = match.end()
+                if not self._in_array and self._stack:
+                    frame = self._stack[-1]
+                    if frame[0] and frame[2]:
+                        frame[1] = json.loads(buffer[index:position])
+                        frame[2] = False
+                continue
+
+            position = index + 1
+            char = buffer[index]
+            if self._in_array:
+                if char == 0x5B or char == 0x7B:  # [ {
+                    self._depth += 1
+                elif char == 0x5D or char == 0x7D:  # ] }
+                    if self._depth:
+                        self._depth -= 1
+                        continue
+                    # Конец массива элементов
+                    item = bytes(buffer[self._item_start:index]).strip()
+                    if item:
+                        items.append(item)
+                    self._in_array = False
+                    self._stack.pop()
+                    self._consumed = index
+                elif char == 0x2C and not self._depth:  # ,
+                    items.append(bytes(buffer[self._item_start:index]).strip())
+                    self._item_start = position
+                continue
+
+            if char == 0x7B:  # {
+                self._stack.append([True, None, True])
+            elif char == 0x5B:  # [
+                if not self._found and self._is_target():
+                    self._found = self._in_array = True
+                    self._depth = 0
+                    self._envelope += buffer[self._consumed:position]
+                    self._consumed = self._item_start = position
+                self._stack.append([False, None, False])
+            elif char == 0x7D or char == 0x5D:  # } ]
+                if self._stack:
+                    self._stack.pop()
+            elif char == 0x2C and self._stack and self._stack[-1][0]:  # ,
+                self._stack[-1][2] = True
+
+        # Обработанная часть буфера удаляется: внутри массива остается только текущий элемент
+        if self._in_array:
+            cut = self._item_start
+            self._item_start = 0
+        else:
+            self._envelope += buffer[self._consumed:position]
+            cut = position
+        del buffer[:cut]
+        self._position = position - cut
+        self._consumed = 0
+        return items
+
+    def _is_target(self) -> bool:
+        stack = self._stack
+        if len(stack) != len(self.path):
+            return False
+        return all(frame[0] and frame[1] == key for frame, key in zip(stack, self.path))
+
+    def close(self) -> Any:
+        """Завершает разбор тела ответа.
+
+        Returns:
+            Документ без элементов массива (массив заменен пустым)
+
+        Raises:
+            ValueError: Если тело ответа получено не полностью
+        """
+        if self._in_array or self._stack:
+            raise ValueError("Тело ответа получено не полностью")
+        self._envelope += self._buffer[self._consumed:]
+        self._buffer.clear()
+        envelope = bytes(self._envelope).strip()
+        return json.loads(envelope) if envelope else None
+
+
+def decode_item(item_model: type[BaseModel], raw: bytes, mode: ResponseMode) -> Any:
+    """Формирует элемент из его байтов в соответствии с режимом ответа."""
+    if mode is ResponseMode.VALIDATE:
+        return item_model.model_validate_json(raw)
+    if mode is ResponseMode.BYTES:
+        return raw
+    data = json.loads(raw)
+    if mode is ResponseMode.DICT:
+        return data
+    return construct_model(item_model, data)
+
+
+class StreamedItems(Sequence):
+    """Сведения о выданных элементах страницы для определения следующей страницы.
+
+    Хранит только количество и последний элемент: поддерживаются `len()`
+    и обращение к последнему элементу (`items[-1]`).
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.last: Any = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> Any:
+        if self.count and index in (-1, self.count - 1):
+            return self.last
+        raise IndexError("Доступен только последний элемент страницы")
+
+
+class StreamedPage:
+    """Страница ответа, элементы которой выдаются по мере получения тела ответа.
+
+    Поля страницы вне массива элементов доступны в `data` после выдачи
+    всех элементов.
+
+    Args:
+        produce: Асинхронный генератор элементов, который по завершении
+            записывает в страницу поля вне массива элементов
+    """
+
+    def __init__(self, produce: Callable[["StreamedPage"], AsyncIterator[Any]]) -> None:
+        self._produce = produce
+        self.data: Any = None
+        self.items = StreamedItems()
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        items = self.items
+        async for item in self._produce(self):
+            items.count += 1
+            items.last = item
+            yield item
+
+
+async def paginate_stream(
+        open_page: Callable[[RequestT], StreamedPage],
+        request: RequestT,
+        next_request: NextRequest,
+) -> AsyncIterator[Any]:
+    """Последовательно запрашивает страницы и выдает элементы по мере получения тела каждой страницы.
+
+    В памяти одновременно находится не больше одного элемента страницы, поэтому
+    следующая страница запрашивается после выдачи всех элементов текущей.
+
+    Args:
+        open_page: Создает потоковую страницу по запросу
+        request: Запрос первой страницы
+        next_request: Формирует запрос следующей страницы по запросу, полям
+            страницы вне массива элементов и сведениям о выданных элементах
+            (`len(items)`, `items[-1]`) или возвращает None
+
+    Yields:
+        Элементы страниц
+    """
+    while request is not None:
+        page = open_page(request)
+        async for item in page:
+            yield item
+        request = next_request(request, page.data, page.items)
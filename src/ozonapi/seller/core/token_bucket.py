@@ -0,0 +1,193 @@
+import asyncio
+import time
+from collections import deque
+from types import TracebackType
+from typing import Callable, Optional, Sequence
+
+
+class TokenBucket:
+    """Ограничитель запросов по алгоритму token bucket.
+
+    Корзина вмещает `max_rate` токенов (но не меньше одного) и пополняется
+    со скоростью `max_rate` токенов за `time_period` секунд. Ожидающие токен корутины обслуживаются
+    в порядке очереди, а пробуждение выполняет единственный таймер корзины,
+    поэтому тысячи ожидающих не опрашивают корзину в цикле.
+
+    Корзина может использоваться самостоятельно (`async with bucket`) или как
+    уровень иерархии в `acquire()`, списывающей токены сразу с нескольких корзин.
+
+    Args:
+        max_rate: Количество запросов за период
+        time_period: Длительность периода в секундах
+        name: Имя корзины в общем хранилище ограничителей. Корзины с именем
+            при подключенном `RateLimiterBackend` разделяются между процессами
+    """
+
+    __slots__ = ("max_rate", "time_period", "name", "_rate", "_capacity", "_tokens", "_updated_at", "_waiters", "_timer", "_loop")
+
+    def __init__(self, max_rate: float, time_period: float = 1.0, name: Optional[str] = None) -> None:
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate и time_period должны быть больше 0")
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self.name = name
+        self._rate = max_rate / time_period
+        self._capacity = max(float(max_rate), 1.0)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._waiters: deque[asyncio.Future] = deque()
+        self._timer: Optional[asyncio.Handle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _refill(self, now: float) -> None:
+        """Пополняет корзину токенами, накопленными с момента последнего обновления."""
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+            self._updated_at = now
+
+    def _delay(self, tokens: float = 1.0) -> float:
+        """Возвращает время в секундах до накопления указанного количества токенов."""
+        return max(tokens - self._tokens, 0.0) / self._rate
+
+    def has_capacity(self, now: Optional[float] = None) -> bool:
+        """Проверяет наличие свободного токена."""
+        self._refill(time.monotonic() if now is None else now)
+        return self._tokens >= 1
+
+    def set_rate(self, max_rate: float, time_period: Optional[float] = None) -> None:
+        """Изменяет ограничение корзины без потери ожидающих в очереди."""
+        if max_rate <= 0:
+            raise ValueError("max_rate должен быть больше 0")
+        self._refill(time.monotonic())
+        self.max_rate = max_rate
+        self.time_period = time_period or self.time_period
+        self._rate = max_rate / self.time_period
+        self._capacity = max(float(max_rate), 1.0)
+        self._tokens = min(self._tokens, self._capacity)
+
+    def pause(self, seconds: float) -> None:
+        """Откладывает выдачу следующего токена не менее чем на указанное время."""
+        self._refill(time.monotonic())
+        self._tokens = min(self._tokens, 1.0 - seconds * self._rate)
+
+    def refund(self) -> None:
+        """Возвращает в корзину токен, списанный для запроса, который не был отправлен."""
+        self._tokens = min(self._capacity, self._tokens + 1)
+        self._release_turn()
+
+    @property
+    def tokens(self) -> float:
+        """Количество доступных токенов."""
+        self._refill(time.monotonic())
+        return self._tokens
+
+    @property
+    def waiters(self) -> int:
+        """Количество корутин, ожидающих токен этой корзины."""
+        return len(self._waiters)
+
+    def _enqueue(self, waiter: asyncio.Future, first: bool = False) -> None:
+        """Ставит корутину в очередь и при необходимости планирует пробуждение."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Очередь и таймер, оставшиеся от другого цикла событий, недействительны
+            self._waiters.clear()
+            self._timer = None
+            self._loop = loop
+        if first:
+            self._waiters.appendleft(waiter)
+        else:
+            self._waiters.append(waiter)
+        if self._timer is None:
+            self._timer = loop.call_later(self._delay(), self._wake)
+
+    def _wake(self) -> None:
+        """Будит по одной ожидающей корутине на каждый доступный токен."""
+        self._timer = None
+        self._refill(time.monotonic())
+        available = int(self._tokens)
+        woken = 0
+        while self._waiters and woken < available:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                woken += 1
+        if self._waiters:
+            self._timer = asyncio.get_running_loop().call_later(self._delay(woken + 1), self._wake)
+
+    def _release_turn(self) -> None:
+        """Передает очередь следующей корутине, если разбуженная не списала токен."""
+        if self._waiters:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = asyncio.get_running_loop().call_soon(self._wake)
+
+    async def __aenter__(self) -> None:
+        await acquire((self,))
+
+    async def __aexit__(
+            self,
+            exc_type: Optional[type[BaseException]],
+            exc_val: Optional[BaseException],
+            exc_tb: Optional[TracebackType],
+    ) -> None:
+        return None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(max_rate={self.max_rate}, time_period={self.time_period})"
+
+
+async def acquire(
+        buckets: Sequence[TokenBucket],
+        on_wait: Optional[Callable[[TokenBucket, float], None]] = None,
+) -> None:
+    """Атомарно списывает по одному токену с каждой из корзин.
+
+    Токены списываются только тогда, когда они есть во всех корзинах сразу:
+    пока запрос ждет один уровень иерархии, токены других уровней остаются
+    доступными для прочих запросов. Проверка и списание выполняются без
+    точек переключения, поэтому блокировки не требуются.
+
+    Args:
+        buckets: Корзины уровней иерархии (например, инстанс, client_id, метод)
+        on_wait: Вызывается после каждого ожидания в очереди с корзиной, которой не хватило
+            токена, и длительностью ожидания в секундах. Без ожидания не вызывается
+    """
+    woken_by: Optional[TokenBucket] = None
+    while True:
+        now = time.monotonic()
+        blocking = None
+        for bucket in buckets:
+            bucket._refill(now)
+            # Новые запросы встают в очередь за уже ожидающими,
+            # а однажды разбуженные конкурируют только за токены
+            if bucket._tokens < 1 or (woken_by is None and bucket._waiters):
+                blocking = bucket
+                break
+
+        if blocking is None:
+            for bucket in buckets:
+                bucket._tokens -= 1
+            return
+
+        if woken_by is not None and woken_by is not blocking:
+            woken_by._release_turn()
+
+        waiter = asyncio.get_running_loop().create_future()
+        # Уже ожидавшая корутина не теряет очередь и встает в начало
+        blocking._enqueue(waiter, first=woken_by is not None)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                blocking._release_turn()
+            else:
+                try:
+                    blocking._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+        if on_wait is not None:
+            on_wait(blocking, time.monotonic() - now)
+        woken_by = blocking
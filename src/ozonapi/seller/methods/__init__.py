@@ -1,3 +1,7 @@
+from typing import TYPE_CHECKING
+
+from ..common.lazy import lazy_exports
+
 __all__ = [
     "SellerBarcodeAPI",
     "SellerBetaAPI",
@@ -10,13 +14,25 @@ __all__ = [
     "SellerWarehouseAPI",
 ]
 
-from .attributes_and_characteristics import SellerCategoryAPI
-from .barcodes import SellerBarcodeAPI
-from .beta import SellerBetaAPI
-from .fbo import SellerFBOAPI
-from .fbs import SellerFBSAPI
-from .fbs_assembly_and_labeling import SellerFBSAssemblyLabelingAPI
-from .prices_and_stocks import SellerPricesAndStocksAPI
-from .products import SellerProductAPI
-from .warehouses import SellerWarehouseAPI
+if TYPE_CHECKING:
+    from .attributes_and_characteristics import SellerCategoryAPI
+    from .barcodes import SellerBarcodeAPI
+    from .beta import SellerBetaAPI
+    from .fbo import SellerFBOAPI
+    from .fbs import SellerFBSAPI
+    from .fbs_assembly_and_labeling import SellerFBSAssemblyLabelingAPI
+    from .prices_and_stocks import SellerPricesAndStocksAPI
+    from .products import SellerProductAPI
+    from .warehouses import SellerWarehouseAPI
 
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".attributes_and_characteristics": ("SellerCategoryAPI",),
+    ".barcodes": ("SellerBarcodeAPI",),
+    ".beta": ("SellerBetaAPI",),
+    ".fbo": ("SellerFBOAPI",),
+    ".fbs": ("SellerFBSAPI",),
+    ".fbs_assembly_and_labeling": ("SellerFBSAssemblyLabelingAPI",),
+    ".prices_and_stocks": ("SellerPricesAndStocksAPI",),
+    ".products": ("SellerProductAPI",),
+    ".warehouses": ("SellerWarehouseAPI",),
+})
@@ -1,4 +1,4 @@
-from ...core import APIManager
+from ...core import APIManager, cache_response
 from ...schemas.attributes_and_characteristics import DescriptionCategoryAttributeRequest, \
     DescriptionCategoryAttributeResponse
 
@@ -6,6 +6,7 @@ from ...schemas.attributes_and_characteristics import DescriptionCategoryAttribu
 class DescriptionCategoryAttributeMixin(APIManager):
     """Реализует метод /v1/description-category/attribute"""
 
+    @cache_response(ttl=86400)
     async def description_category_attribute(
         self: "DescriptionCategoryAttributeMixin",
         request: DescriptionCategoryAttributeRequest,
@@ -18,6 +19,7 @@ class DescriptionCategoryAttributeMixin(APIManager):
             • `attribute_id` - Идентификатор характеристики, можно получить с помощью метода `description_category_attribute()`
             • `description_category_id` - Идентификатор категории, можно получить с помощью метода `description_category_tree()`
             • `type_id` - Идентификатор типа товара, можно получить с помощью метода `description_category_tree()`
+            • Ответ кешируется на сутки для каждого client_id и запроса, сбросить кеш можно методом `invalidate_response_cache()`.
 
         References:
             https://docs.ozon.ru/api/seller/#operation/DescriptionCategoryAPI_GetAttributes
@@ -38,10 +40,10 @@ class DescriptionCategoryAttributeMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="description-category/attribute",
             payload=request.model_dump(),
+            response_model=DescriptionCategoryAttributeResponse,
         )
-        return DescriptionCategoryAttributeResponse(**response)
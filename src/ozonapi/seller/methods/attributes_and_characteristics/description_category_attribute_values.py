@@ -1,11 +1,16 @@
-from ...core import APIManager
+from typing import AsyncIterator, Union
+
+from ...core import APIManager, cache_response
+from ...core.pagination import get_field, next_by_token, paginate
 from ...schemas.attributes_and_characteristics import DescriptionCategoryAttributeValuesRequest, \
     DescriptionCategoryAttributeValuesResponse
+from ...schemas.attributes_and_characteristics.base import BaseDescriptionCategoryAttributeValuesItem
 
 
 class DescriptionCategoryAttributeValuesMixin(APIManager):
     """Реализует метод /v1/description-category/attribute/values"""
 
+    @cache_response(ttl=86400)
     async def description_category_attribute_values(
         self: "DescriptionCategoryAttributeValuesMixin",
         request: DescriptionCategoryAttributeValuesRequest,
@@ -18,6 +23,7 @@ class DescriptionCategoryAttributeValuesMixin(APIManager):
             • `description_category_id` - Идентификатор категории, можно получить с помощью метода `description_category_tree()`
             • `type_id` - Идентификатор типа товара, можно получить с помощью метода `description_category_tree()`
             • Для пагинации используйте значение `last_value_id`
+            • Ответ кешируется на сутки для каждого client_id и запроса, сбросить кеш можно методом `invalidate_response_cache()`.
 
         References:
             https://docs.ozon.ru/api/seller/?__rr=2&abt_att=1#operation/DescriptionCategoryAPI_GetAttributeValues
@@ -41,10 +47,55 @@ class DescriptionCategoryAttributeValuesMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="description-category/attribute/values",
             payload=request.model_dump(),
+            response_model=DescriptionCategoryAttributeValuesResponse,
+        )
+
+    def iter_description_category_attribute_values(
+        self: "DescriptionCategoryAttributeValuesMixin",
+        request: DescriptionCategoryAttributeValuesRequest,
+        *,
+        pages: bool = False,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Union[BaseDescriptionCategoryAttributeValuesItem, DescriptionCategoryAttributeValuesResponse]]:
+        """Последовательно выбирает все страницы справочника значений характеристики с автоматической пагинацией по `last_value_id`.
+
+        Notes:
+            • Пока обрабатывается текущая страница, следующая уже запрашивается с учетом ограничений запросов.
+            • Указатель пагинации в переданном запросе задает первую страницу выборки.
+            • При досрочном выходе из цикла загрузка следующей страницы отменяется.
+
+        Args:
+            request: Запрос первой страницы по схеме `DescriptionCategoryAttributeValuesRequest`
+            pages: Выдавать страницы по схеме `DescriptionCategoryAttributeValuesResponse` вместо отдельных элементов
+            prefetch: Запрашивать следующую страницу во время обработки текущей
+
+        Yields:
+            Элементы по схеме `BaseDescriptionCategoryAttributeValuesItem` или страницы по схеме `DescriptionCategoryAttributeValuesResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    async for value in api.iter_description_category_attribute_values(
+                        DescriptionCategoryAttributeValuesRequest(
+                            attribute_id=85,
+                            description_category_id=17054869,
+                            type_id=97311,
+                        )
+                    ):
+                        print(value.id, value.value)
+        """
+        return paginate(
+            self.description_category_attribute_values,
+            request,
+            get_items=lambda page: get_field(page, "result"),
+            next_request=lambda request, page, items: next_by_token(
+                request, "last_value_id", get_field(items[-1], "id") if items and get_field(page, "has_next") else None, items
+            ),
+            pages=pages,
+            prefetch=prefetch,
         )
-        return DescriptionCategoryAttributeValuesResponse(**response)
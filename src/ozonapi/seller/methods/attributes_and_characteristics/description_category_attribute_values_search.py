@@ -40,10 +40,10 @@ class DescriptionCategoryAttributeValuesSearchMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="description-category/attribute/values/search",
             payload=request.model_dump(),
+            response_model=DescriptionCategoryAttributeValuesSearchResponse,
         )
-        return DescriptionCategoryAttributeValuesSearchResponse(**response)
\ No newline at end of file
@@ -1,10 +1,12 @@
-from ...core import APIManager
+from ...catalog import CategoryIndex
+from ...core import APIManager, cache_response, ResponseMode
 from ...schemas.attributes_and_characteristics import DescriptionCategoryTreeRequest, DescriptionCategoryTreeResponse
 
 
 class DescriptionCategoryTreeMixin(APIManager):
     """Реализует метод /v1/description-category/tree"""
 
+    @cache_response(ttl=86400)
     async def description_category_tree(
         self: "DescriptionCategoryTreeMixin",
         request: DescriptionCategoryTreeRequest = DescriptionCategoryTreeRequest.model_construct(),
@@ -14,7 +16,8 @@ class DescriptionCategoryTreeMixin(APIManager):
         Категории не создаются по запросу пользователя.
 
         Notes:
-            Внимательно выбирайте категорию для товара: для разных категорий применяется разный размер комиссии.
+            • Внимательно выбирайте категорию для товара: для разных категорий применяется разный размер комиссии.
+            • Ответ кешируется на сутки для каждого client_id и запроса, сбросить кеш можно методом `invalidate_response_cache()`.
 
         References:
             https://docs.ozon.ru/api/seller/#operation/DescriptionCategoryAPI_GetTree
@@ -29,10 +32,42 @@ class DescriptionCategoryTreeMixin(APIManager):
             async with SellerAPI(client_id, api_key) as api:
                 description_category_tree = await api.description_category_tree()
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="description-category/tree",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=DescriptionCategoryTreeResponse,
         )
-        return DescriptionCategoryTreeResponse(**response)
+
+    async def description_category_index(
+        self: "DescriptionCategoryTreeMixin",
+        request: DescriptionCategoryTreeRequest = DescriptionCategoryTreeRequest.model_construct(),
+    ) -> CategoryIndex:
+        """Возвращает индекс дерева категорий и типов для товаров.
+
+        Notes:
+            • Если ответ `description_category_tree()` на тот же запрос уже есть в кеше (в любом режиме ответа), индекс строится по нему.
+            • Иначе дерево запрашивается без валидации схем и кешируется в режиме DICT, режим ответа клиента не учитывается.
+            • Индекс позволяет без обхода дерева находить категории и типы по идентификаторам, получать путь от корня и доступные для создания товаров типы, искать по названию.
+            • Сохраните индекс методом `to_snapshot()`, чтобы загрузить его через `CategoryIndex.from_snapshot()` без запроса к API.
+
+        Args:
+            request: Запрос к серверу по схеме `DescriptionCategoryTreeRequest`
+
+        Returns:
+            Индекс дерева категорий `CategoryIndex`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    index = await api.description_category_index()
+                    node = index.get_type(93080)
+                    path = " / ".join(item.name for item in index.get_path(node))
+                    found = index.search("чехол смартф")
+        """
+        response = self._get_cached_response("description_category_tree", request)
+        if response is None:
+            with self.response_mode(ResponseMode.DICT):
+                response = await self.description_category_tree(request)
+        return CategoryIndex.from_response(response)
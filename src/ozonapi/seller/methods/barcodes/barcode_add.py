@@ -33,10 +33,10 @@ class BarcodeAddMixin(APIManager):
 
                 result = await api.barcode_add(BarcodeAddRequest(barcodes=barcodes))
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="barcode/add",
             payload=request.model_dump(),
+            response_model=BarcodeAddResponse,
         )
-        return BarcodeAddResponse(**response)
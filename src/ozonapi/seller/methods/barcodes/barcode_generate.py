@@ -33,10 +33,10 @@ class BarcodeGenerateMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="barcode/generate",
             payload=request.model_dump(),
+            response_model=BarcodeGenerateResponse,
         )
-        return BarcodeGenerateResponse(**response)
@@ -1,4 +1,8 @@
+from typing import Optional, Sequence
+
+from ...common.enumerations.products import ItemTag, TurnoverGrade
 from ...core import APIManager
+from ...core.bulk import execute_chunked, max_items, merge_lists
 from ...schemas.beta import AnalyticsStocksRequest, AnalyticsStocksResponse
 
 
@@ -40,10 +44,59 @@ class AnalyticsStocksMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="analytics/stocks",
             payload=request.model_dump(),
+            response_model=AnalyticsStocksResponse,
+        )
+
+    async def analytics_stocks_bulk(
+            self: "AnalyticsStocksMixin",
+            skus: Sequence[int],
+            *,
+            cluster_ids: Optional[list[int]] = None,
+            item_tags: Optional[list[ItemTag]] = None,
+            turnover_grades: Optional[list[TurnoverGrade]] = None,
+            warehouse_ids: Optional[list[int]] = None,
+            concurrency: int = 8,
+    ) -> AnalyticsStocksResponse:
+        """Получает аналитику по остаткам для любого количества SKU.
+
+        Notes:
+            • SKU делятся на части по `100` и запрашиваются одновременно (не более `concurrency` запросов) с учетом ограничений запросов.
+            • Остальные фильтры передаются в каждый запрос без изменений.
+            • Элементы ответов объединяются в один ответ в порядке частей.
+            • Если часть запросов завершилась ошибкой, выбрасывается `APIBulkError` с объединенным ответом остальных частей и ошибками по частям.
+
+        Args:
+            skus: Идентификаторы товаров в системе Ozon — SKU
+            cluster_ids: Фильтр по идентификаторам кластеров (опционально)
+            item_tags: Фильтр по тегам товара (опционально)
+            turnover_grades: Фильтр по статусу ликвидности товаров (опционально)
+            warehouse_ids: Фильтр по идентификаторам складов (опционально)
+            concurrency: Максимальное количество одновременных запросов
+
+        Returns:
+            Аналитика по остаткам товаров по схеме `AnalyticsStocksResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    result = await api.analytics_stocks_bulk(skus, warehouse_ids=[101, 102])
+        """
+        return await execute_chunked(
+            self.analytics_stocks,
+            lambda chunk: AnalyticsStocksRequest(
+                skus=chunk,
+                cluster_ids=cluster_ids,
+                item_tags=item_tags,
+                turnover_grades=turnover_grades,
+                warehouse_ids=warehouse_ids,
+            ),
+            skus,
+            chunk_size=max_items(AnalyticsStocksRequest, "skus"),
+            merge=merge_lists("items"),
+            concurrency=concurrency,
         )
-        return AnalyticsStocksResponse(**response)
\ No newline at end of file
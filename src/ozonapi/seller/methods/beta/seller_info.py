@@ -1,10 +1,11 @@
-from ...core import APIManager
+from ...core import APIManager, cache_response
 from ...schemas.beta import SellerInfoResponse
 
 
 class SellerInfoMixin(APIManager):
     """Реализует метод /v1/seller/info"""
 
+    @cache_response(ttl=3600)
     async def seller_info(
             self: "SellerInfoMixin",
     ) -> SellerInfoResponse:
@@ -17,6 +18,7 @@ class SellerInfoMixin(APIManager):
             • Содержит информацию о подписке продавца, включая тип подписки и статус Premium-доступа.
             • Рейтинги могут иметь различные типы значений: индекс, процент, время, коэффициент, оценка или счёт.
             • Статусы рейтингов могут быть: OK (хороший), WARNING (требует внимания), CRITICAL (критичный).
+            • Ответ кешируется на 1 час для каждого client_id и запроса, сбросить кеш можно методом `invalidate_response_cache()`.
 
         References:
             https://docs.ozon.ru/api/seller/?#operation/SellerAPI_SellerInfo
@@ -45,10 +47,10 @@ class SellerInfoMixin(APIManager):
                 has_premium = result.subscription.is_premium
                 subscription_type = result.subscription.type
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="seller/info",
             payload={},
+            response_model=SellerInfoResponse,
         )
-        return SellerInfoResponse(**response)
\ No newline at end of file
@@ -52,10 +52,10 @@ class PostingFBOGetMixin(APIManager):
                         )
                     )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v2",
             endpoint="posting/fbo/get",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBOGetResponse,
         )
-        return PostingFBOGetResponse(**response)
\ No newline at end of file
@@ -1,5 +1,14 @@
+from typing import AsyncIterator, Union
+
+from ...common.enumerations.requests import SortingDirection
 from ...core import APIManager
+from ...core.pagination import fan_out_offsets, get_field, next_by_offset, paginate, split_by_period
+from ...core.streaming import paginate_stream
 from ...schemas.fbo import PostingFBOListRequest, PostingFBOListResponse
+from ...schemas.fbo.entities import PostingFBOPosting
+
+# Максимальное значение offset, допустимое методом /v2/posting/fbo/list
+POSTING_FBO_LIST_MAX_OFFSET = 20000
 
 
 class PostingFBOListMixin(APIManager):
@@ -49,7 +58,7 @@ class PostingFBOListMixin(APIManager):
                             dir=SortingDirection.ASC,
                             filter=PostingFilter(
                                 since=datetime.datetime.now() - datetime.timedelta(days=30),
-                                to=datetime.datetime.now(),
+                                to_=datetime.datetime.now(),
                                 status=PostingStatus.DELIVERED
                             ),
                             limit=100,
@@ -63,10 +72,120 @@ class PostingFBOListMixin(APIManager):
                         )
                     )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v2",
             endpoint="posting/fbo/list",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBOListResponse,
+        )
+
+    def iter_posting_fbo_list(
+        self: "PostingFBOListMixin",
+        request: PostingFBOListRequest,
+        *,
+        pages: bool = False,
+        prefetch: bool = True,
+        stream: bool = False,
+    ) -> AsyncIterator[Union[PostingFBOPosting, PostingFBOListResponse]]:
+        """Последовательно выбирает все страницы отправлений FBO с автоматической пагинацией по `offset` (до неполной страницы).
+
+        Notes:
+            • Пока обрабатывается текущая страница, следующая уже запрашивается с учетом ограничений запросов.
+            • Указатель пагинации в переданном запросе задает первую страницу выборки.
+            • При досрочном выходе из цикла загрузка следующей страницы отменяется.
+            • С `stream=True` элементы выдаются по мере получения тела каждой страницы, страница целиком в памяти не хранится. Следующая страница запрашивается после выдачи всех элементов текущей.
+
+        Args:
+            request: Запрос первой страницы по схеме `PostingFBOListRequest`
+            pages: Выдавать страницы по схеме `PostingFBOListResponse` вместо отдельных элементов
+            prefetch: Запрашивать следующую страницу во время обработки текущей
+            stream: Выдавать элементы по мере получения тела ответа (несовместимо с `pages`)
+
+        Yields:
+            Элементы по схеме `PostingFBOPosting` или страницы по схеме `PostingFBOListResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    async for posting in api.iter_posting_fbo_list(
+                        PostingFBOListRequest(
+                            filter=PostingFilter(
+                                since=datetime.datetime.now() - datetime.timedelta(days=30),
+                                to_=datetime.datetime.now(),
+                            ),
+                        )
+                    ):
+                        print(posting.posting_number)
+        """
+        def next_request(request, page, items):
+            return next_by_offset(request, items, len(items) >= (request.limit or 0))
+
+        if stream:
+            if pages:
+                raise ValueError("Потоковая выдача возможна только для отдельных элементов")
+            return paginate_stream(
+                lambda page_request: self._stream_request(
+                    api_version="v2",
+                    endpoint="posting/fbo/list",
+                    payload=page_request.model_dump(by_alias=True),
+                    item_path=("result",),
+                    item_model=PostingFBOPosting,
+                ),
+                request,
+                next_request,
+            )
+        return paginate(
+            self.posting_fbo_list,
+            request,
+            get_items=lambda page: get_field(page, "result"),
+            next_request=next_request,
+            pages=pages,
+            prefetch=prefetch,
         )
-        return PostingFBOListResponse(**response)
\ No newline at end of file
+
+    async def posting_fbo_list_all(
+            self: "PostingFBOListMixin",
+            request: PostingFBOListRequest,
+            *,
+            concurrency: int = 8,
+    ) -> list[Union[PostingFBOPosting, dict]]:
+        """Параллельно выбирает все отправления FBO за период и объединяет их по порядку страниц.
+
+        Notes:
+            • После первой страницы остальные запрашиваются одновременно (не более `concurrency`) с учетом ограничений запросов.
+            • API не позволяет задать `offset` больше `20000`. Если за период отправлений больше, период автоматически делится на части.
+            • Отправления на границах частей периода не повторяются.
+            • Выборка начинается со смещения `offset` из запроса.
+
+        Args:
+            request: Запрос на получение информации об отправлениях FBO по схеме `PostingFBOListRequest`
+            concurrency: Максимальное количество одновременных запросов страниц
+
+        Returns:
+            Список отправлений по схеме `PostingFBOPosting` (словари в режимах ответа `dict` и `bytes`)
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    postings = await api.posting_fbo_list_all(
+                        PostingFBOListRequest(
+                            filter=PostingFilter(
+                                since=datetime.datetime.now() - datetime.timedelta(days=365),
+                                to_=datetime.datetime.now(),
+                            ),
+                        )
+                    )
+        """
+        return [
+            posting async for posting in fan_out_offsets(
+                self.posting_fbo_list,
+                request,
+                get_items=lambda page: get_field(page, "result"),
+                concurrency=concurrency,
+                max_offset=POSTING_FBO_LIST_MAX_OFFSET,
+                split_request=lambda window: split_by_period(window, "since", "to_"),
+                get_key=lambda posting: get_field(posting, "posting_number"),
+                reverse=request.dir == SortingDirection.DESC,
+            )
+        ]
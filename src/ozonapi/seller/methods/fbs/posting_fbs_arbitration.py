@@ -33,10 +33,10 @@ class PostingFBSArbitrationMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v2",
             endpoint="posting/fbs/arbitration",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSArbitrationResponse,
         )
-        return PostingFBSArbitrationResponse(**response)
\ No newline at end of file
@@ -1,4 +1,7 @@
+from typing import Sequence
+
 from ...core import APIManager
+from ...core.bulk import execute_chunked, max_items, merge_flags
 from ...schemas.fbs import PostingFBSAwaitingDeliveryRequest, PostingFBSAwaitingDeliveryResponse
 
 
@@ -33,10 +36,44 @@ class PostingFBSAwaitingDeliveryMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v2",
             endpoint="posting/fbs/awaiting-delivery",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSAwaitingDeliveryResponse,
+        )
+
+    async def posting_fbs_awaiting_delivery_bulk(
+            self: "PostingFBSAwaitingDeliveryMixin",
+            posting_number: Sequence[str],
+            *,
+            concurrency: int = 8,
+    ) -> PostingFBSAwaitingDeliveryResponse:
+        """Передает к отгрузке отправления с любым количеством идентификаторов.
+
+        Notes:
+            • Идентификаторы делятся на части по `100` и отправляются одновременно (не более `concurrency` запросов) с учетом ограничений запросов.
+            • Результат истинен, если все части обработаны успешно.
+            • Если часть запросов завершилась ошибкой, выбрасывается `APIBulkError`: по `errors` можно определить, какие отправления не были переданы.
+
+        Args:
+            posting_number: Идентификаторы отправлений
+            concurrency: Максимальное количество одновременных запросов
+
+        Returns:
+            Результат обработки запроса по схеме `PostingFBSAwaitingDeliveryResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    result = await api.posting_fbs_awaiting_delivery_bulk(posting_numbers)
+        """
+        return await execute_chunked(
+            self.posting_fbs_awaiting_delivery,
+            lambda chunk: PostingFBSAwaitingDeliveryRequest(posting_number=chunk),
+            posting_number,
+            chunk_size=max_items(PostingFBSAwaitingDeliveryRequest, "posting_number"),
+            merge=merge_flags(),
+            concurrency=concurrency,
         )
-        return PostingFBSAwaitingDeliveryResponse(**response)
\ No newline at end of file
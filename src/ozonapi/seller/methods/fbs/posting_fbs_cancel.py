@@ -36,10 +36,10 @@ class PostingFBSCancelMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v2",
             endpoint="posting/fbs/cancel",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSCancelResponse,
         )
-        return PostingFBSCancelResponse(**response)
\ No newline at end of file
@@ -33,10 +33,10 @@ class PostingFBSCancelReasonMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="posting/fbs/cancel-reason",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSCancelReasonResponse,
         )
-        return PostingFBSCancelReasonResponse(**response)
\ No newline at end of file
@@ -1,13 +1,11 @@
-from async_lru import alru_cache
-
-from ...core import APIManager
+from ...core import APIManager, cache_response, ResponseMode
 from ...schemas.fbs import PostingFBSCancelReasonListResponse
 
 
 class PostingFBSCancelReasonListMixin(APIManager):
     """Реализует метод v2/posting/fbs/cancel-reason/list"""
 
-    @alru_cache(ttl=86400)
+    @cache_response(ttl=86400)
     async def posting_fbs_cancel_reason_list(
         self: "PostingFBSCancelReasonListMixin",
     ) -> PostingFBSCancelReasonListResponse:
@@ -18,6 +16,7 @@ class PostingFBSCancelReasonListMixin(APIManager):
             • Каждая причина содержит информацию о доступности для отмены и инициаторе отмены.
             • Инициатором отмены может быть как продавец (seller), так и покупатель (buyer).
             • Поле `is_available_for_cancellation` указывает, доступна ли причина для использования при отмене отправления.
+            • Ответ кешируется и возвращается в виде схемы независимо от `ResponseMode`.
 
         References:
             https://docs.ozon.ru/api/seller/?#operation/PostingAPI_GetPostingFbsCancelReasonList
@@ -29,9 +28,10 @@ class PostingFBSCancelReasonListMixin(APIManager):
             async with SellerAPI(client_id, api_key) as api:
                 result = await api.posting_fbs_cancel_reason_list()
         """
-        response = await self._request(
-            method="post",
-            api_version="v2",
-            endpoint="posting/fbs/cancel-reason/list",
-        )
-        return PostingFBSCancelReasonListResponse(**response)
\ No newline at end of file
+        with self.response_mode(ResponseMode.VALIDATE):
+            return await self._request(
+                method="post",
+                api_version="v2",
+                endpoint="posting/fbs/cancel-reason/list",
+                response_model=PostingFBSCancelReasonListResponse,
+            )
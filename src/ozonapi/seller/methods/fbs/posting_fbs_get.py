@@ -52,10 +52,10 @@ class PostingFBSGetMixin(APIManager):
                         )
                     )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v3",
             endpoint="posting/fbs/get",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSGetResponse,
         )
-        return PostingFBSGetResponse(**response)
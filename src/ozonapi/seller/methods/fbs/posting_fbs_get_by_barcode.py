@@ -1,7 +1,14 @@
+from ...common.schema import BaseModel
 from ...core import APIManager
+from ...core.pagination import get_field
 from ...schemas.fbs import PostingFBSGetByBarcodeRequest, PostingFBSGetByBarcodeResponse
 
 
+class _PostingFBSGetByBarcodeResult(BaseModel):
+    """Ответ API, в поле `result` которого находится ответ метода."""
+    result: PostingFBSGetByBarcodeResponse
+
+
 class PostingFBSGetByBarcodeMixin(APIManager):
     """Реализует метод /v2/posting/fbs/get-by-barcode"""
 
@@ -37,6 +44,8 @@ class PostingFBSGetByBarcodeMixin(APIManager):
             method="post",
             api_version="v2",
             endpoint="posting/fbs/get-by-barcode",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=_PostingFBSGetByBarcodeResult,
         )
-        return PostingFBSGetByBarcodeResponse(**response["result"])
+        # В режиме BYTES возвращается тело ответа целиком
+        return response if isinstance(response, bytes) else get_field(response, "result")
@@ -1,5 +1,9 @@
+from typing import AsyncIterator, Union
+
 from ...core import APIManager
-from ...schemas.fbs import PostingFBSListRequest, PostingFBSListResponse
+from ...core.pagination import get_field, next_by_offset, paginate
+from ...core.streaming import paginate_stream
+from ...schemas.fbs import PostingFBSListRequest, PostingFBSListResponse, PostingFBSPosting
 
 
 class PostingFBSListMixin(APIManager):
@@ -76,10 +80,74 @@ class PostingFBSListMixin(APIManager):
                         )
                     )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v3",
             endpoint="posting/fbs/list",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSListResponse,
+        )
+
+    def iter_posting_fbs_list(
+        self: "PostingFBSListMixin",
+        request: PostingFBSListRequest,
+        *,
+        pages: bool = False,
+        prefetch: bool = True,
+        stream: bool = False,
+    ) -> AsyncIterator[Union[PostingFBSPosting, PostingFBSListResponse]]:
+        """Последовательно выбирает все страницы отправлений FBS с автоматической пагинацией по `offset` и `has_next`.
+
+        Notes:
+            • Пока обрабатывается текущая страница, следующая уже запрашивается с учетом ограничений запросов.
+            • Указатель пагинации в переданном запросе задает первую страницу выборки.
+            • При досрочном выходе из цикла загрузка следующей страницы отменяется.
+            • С `stream=True` элементы выдаются по мере получения тела каждой страницы, страница целиком в памяти не хранится. Следующая страница запрашивается после выдачи всех элементов текущей.
+
+        Args:
+            request: Запрос первой страницы по схеме `PostingFBSListRequest`
+            pages: Выдавать страницы по схеме `PostingFBSListResponse` вместо отдельных элементов
+            prefetch: Запрашивать следующую страницу во время обработки текущей
+            stream: Выдавать элементы по мере получения тела ответа (несовместимо с `pages`)
+
+        Yields:
+            Элементы по схеме `PostingFBSPosting` или страницы по схеме `PostingFBSListResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    async for posting in api.iter_posting_fbs_list(
+                        PostingFBSListRequest(
+                            filter=PostingFBSListFilter(
+                                since=datetime.datetime.now() - datetime.timedelta(days=30),
+                                to_=datetime.datetime.now(),
+                            ),
+                        )
+                    ):
+                        print(posting.posting_number)
+        """
+        def next_request(request, page, items):
+            return next_by_offset(request, items, get_field(page, "result", "has_next"))
+
+        if stream:
+            if pages:
+                raise ValueError("Потоковая выдача возможна только для отдельных элементов")
+            return paginate_stream(
+                lambda page_request: self._stream_request(
+                    api_version="v3",
+                    endpoint="posting/fbs/list",
+                    payload=page_request.model_dump(by_alias=True),
+                    item_path=("result", "postings"),
+                    item_model=PostingFBSPosting,
+                ),
+                request,
+                next_request,
+            )
+        return paginate(
+            self.posting_fbs_list,
+            request,
+            get_items=lambda page: get_field(page, "result", "postings"),
+            next_request=next_request,
+            pages=pages,
+            prefetch=prefetch,
         )
-        return PostingFBSListResponse(**response)
@@ -41,10 +41,10 @@ class PostingFBSMultiBoxQtySetMixin(APIManager):
                     else:
                         print("Произошла ошибка при указании количества коробок")
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v3",
             endpoint="posting/multi-box-qty/set",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSMultiBoxQtySetResponse,
         )
-        return PostingFBSMultiBoxQtySetResponse(**response)
@@ -1,4 +1,7 @@
+from typing import Sequence, Union
+
 from ...core import APIManager
+from ...core.bulk import execute_chunked, max_items
 from ...schemas.fbs import PostingFBSPackageLabelRequest, PostingFBSPackageLabelResponse
 
 
@@ -36,10 +39,43 @@ class PostingFBSPackageLabelMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v2",
             endpoint="posting/fbs/package-label",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSPackageLabelResponse,
+        )
+
+    async def posting_fbs_package_label_bulk(
+            self: "PostingFBSPackageLabelMixin",
+            posting_number: Sequence[str],
+            *,
+            concurrency: int = 8,
+    ) -> list[Union[PostingFBSPackageLabelResponse, dict, bytes]]:
+        """Генерирует PDF-файлы с этикетками для любого количества отправлений.
+
+        Notes:
+            • Идентификаторы делятся на части по `20` и запрашиваются одновременно (не более `concurrency` запросов) с учетом ограничений запросов.
+            • PDF-файлы не объединяются: возвращается по файлу на каждую часть в порядке частей.
+            • Если часть запросов завершилась ошибкой, выбрасывается `APIBulkError` с файлами остальных частей в `response` и ошибками по частям.
+
+        Args:
+            posting_number: Идентификаторы отправлений
+            concurrency: Максимальное количество одновременных запросов
+
+        Returns:
+            Список PDF-файлов с этикетками по схеме `PostingFBSPackageLabelResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    labels = await api.posting_fbs_package_label_bulk(posting_numbers)
+        """
+        return await execute_chunked(
+            self.posting_fbs_package_label,
+            lambda chunk: PostingFBSPackageLabelRequest(posting_number=chunk),
+            posting_number,
+            chunk_size=max_items(PostingFBSPackageLabelRequest, "posting_number"),
+            concurrency=concurrency,
         )
-        return PostingFBSPackageLabelResponse(**response)
\ No newline at end of file
@@ -33,10 +33,10 @@ class PostingFBSPackageLabelCreateMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v2",
             endpoint="posting/fbs/package-label/create",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSPackageLabelCreateResponse,
         )
-        return PostingFBSPackageLabelCreateResponse(**response)
\ No newline at end of file
@@ -34,10 +34,10 @@ class PostingFBSPackageLabelGetMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="posting/fbs/package-label/get",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSPackageLabelGetResponse,
         )
-        return PostingFBSPackageLabelGetResponse(**response)
\ No newline at end of file
@@ -42,10 +42,10 @@ class PostingFBSProductCancelMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v2",
             endpoint="posting/fbs/product/cancel",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSProductCancelResponse,
         )
-        return PostingFBSProductCancelResponse(**response)
\ No newline at end of file
@@ -39,10 +39,10 @@ class PostingFBSProductChangeMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v2",
             endpoint="posting/fbs/product/change",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSProductChangeResponse,
         )
-        return PostingFBSProductChangeResponse(**response)
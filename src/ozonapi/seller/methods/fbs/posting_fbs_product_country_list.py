@@ -1,6 +1,4 @@
-from async_lru import alru_cache
-
-from ...core import APIManager
+from ...core import APIManager, cache_response, ResponseMode
 from ...core.exceptions import APINotFoundError
 from ...schemas.fbs import PostingFBSProductCountryListRequest, PostingFBSProductCountryListResponse
 
@@ -8,7 +6,7 @@ from ...schemas.fbs import PostingFBSProductCountryListRequest, PostingFBSProduc
 class PostingFBSProductCountryListMixin(APIManager):
     """Реализует метод v2/posting/fbs/product/country/list"""
 
-    @alru_cache(ttl=86400)
+    @cache_response(ttl=86400)
     async def posting_fbs_product_country_list(
             self: "PostingFBSProductCountryListMixin",
             request: PostingFBSProductCountryListRequest = PostingFBSProductCountryListRequest.model_construct()
@@ -22,6 +20,7 @@ class PostingFBSProductCountryListMixin(APIManager):
             • Поиск осуществляется по частичному совпадению с названием страны на русском языке.
             • Регистр букв в поисковой строке не имеет значения.
             • ISO код страны возвращается в формате двухбуквенного кода (Alpha-2) согласно стандарту ISO 3166-1.
+            • Ответ кешируется и возвращается в виде схемы независимо от `ResponseMode`.
 
         References:
             https://docs.ozon.ru/api/seller/?__rr=1#operation/PostingAPI_ListCountryProductFbsPostingV2
@@ -47,13 +46,14 @@ class PostingFBSProductCountryListMixin(APIManager):
                         )
                     )
         """
-        try:
-            response = await self._request(
-                method="post",
-                api_version="v2",
-                endpoint="posting/fbs/product/country/list",
-                payload=request.model_dump()
-            )
-        except APINotFoundError:
-            return PostingFBSProductCountryListResponse.model_construct()
-        return PostingFBSProductCountryListResponse(**response)
+        with self.response_mode(ResponseMode.VALIDATE):
+            try:
+                return await self._request(
+                    method="post",
+                    api_version="v2",
+                    endpoint="posting/fbs/product/country/list",
+                    payload=request.model_dump(),
+                    response_model=PostingFBSProductCountryListResponse,
+                )
+            except APINotFoundError:
+                return PostingFBSProductCountryListResponse.model_construct()
@@ -38,10 +38,10 @@ class PostingFBSProductCountrySetMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v2",
             endpoint="posting/fbs/product/country/set",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSProductCountrySetResponse,
         )
-        return PostingFBSProductCountrySetResponse(**response)
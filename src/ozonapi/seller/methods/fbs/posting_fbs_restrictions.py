@@ -1,10 +1,18 @@
-from ...core import APIManager
+from ...common.schema import BaseModel
+from ...core import APIManager, cache_response
+from ...core.pagination import get_field
 from ...schemas.fbs import PostingFBSRestrictionsRequest, PostingFBSRestrictionsResponse
 
 
+class _PostingFBSRestrictionsResult(BaseModel):
+    """Ответ API, в поле `result` которого находится ответ метода."""
+    result: PostingFBSRestrictionsResponse
+
+
 class PostingFBSRestrictionsMixin(APIManager):
     """Реализует метод /v1/posting/fbs/restrictions"""
 
+    @cache_response(ttl=3600)
     async def posting_fbs_restrictions(
             self: "PostingFBSRestrictionsMixin",
             request: PostingFBSRestrictionsRequest
@@ -18,6 +26,7 @@ class PostingFBSRestrictionsMixin(APIManager):
             • Вес указывается в граммах, габариты — в сантиметрах, стоимость — в рублях.
             • Если для какого-то параметра ограничение не установлено, значение будет None.
             • Метод помогает определить, соответствует ли отправление требованиям пункта приёма перед передачей.
+            • Ответ кешируется на 1 час для каждого client_id и запроса, сбросить кеш можно методом `invalidate_response_cache()`.
 
         References:
             https://docs.ozon.ru/api/seller/?#operation/PostingAPI_GetRestrictions
@@ -40,6 +49,8 @@ class PostingFBSRestrictionsMixin(APIManager):
             method="post",
             api_version="v1",
             endpoint="posting/fbs/restrictions",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=_PostingFBSRestrictionsResult,
         )
-        return PostingFBSRestrictionsResponse(**response["result"])
\ No newline at end of file
+        # В режиме BYTES возвращается тело ответа целиком
+        return response if isinstance(response, bytes) else get_field(response, "result")
\ No newline at end of file
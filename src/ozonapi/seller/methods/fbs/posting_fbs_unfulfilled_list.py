@@ -1,5 +1,8 @@
+from typing import AsyncIterator, Union
+
 from ...core import APIManager
-from ...schemas.fbs import PostingFBSUnfulfilledListRequest, PostingFBSUnfulfilledListResponse
+from ...core.pagination import fan_out_offsets, get_field, next_by_offset, paginate
+from ...schemas.fbs import PostingFBSUnfulfilledListRequest, PostingFBSUnfulfilledListResponse, PostingFBSPosting
 
 
 class PostingFBSUnfulfilledListMixin(APIManager):
@@ -70,10 +73,97 @@ class PostingFBSUnfulfilledListMixin(APIManager):
                         )
                     )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v3",
             endpoint="posting/fbs/unfulfilled/list",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSUnfulfilledListResponse,
+        )
+
+    def iter_posting_fbs_unfulfilled_list(
+        self: "PostingFBSUnfulfilledListMixin",
+        request: PostingFBSUnfulfilledListRequest,
+        *,
+        pages: bool = False,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Union[PostingFBSPosting, PostingFBSUnfulfilledListResponse]]:
+        """Последовательно выбирает все страницы необработанных отправлений с автоматической пагинацией по `offset` и общему количеству `count`.
+
+        Notes:
+            • Пока обрабатывается текущая страница, следующая уже запрашивается с учетом ограничений запросов.
+            • Указатель пагинации в переданном запросе задает первую страницу выборки.
+            • При досрочном выходе из цикла загрузка следующей страницы отменяется.
+
+        Args:
+            request: Запрос первой страницы по схеме `PostingFBSUnfulfilledListRequest`
+            pages: Выдавать страницы по схеме `PostingFBSUnfulfilledListResponse` вместо отдельных элементов
+            prefetch: Запрашивать следующую страницу во время обработки текущей
+
+        Yields:
+            Элементы по схеме `PostingFBSPosting` или страницы по схеме `PostingFBSUnfulfilledListResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    async for posting in api.iter_posting_fbs_unfulfilled_list(
+                        PostingFBSUnfulfilledListRequest(
+                            filter=PostingFBSUnfulfilledListFilter(
+                                cutoff_from=datetime.datetime.now() - datetime.timedelta(days=5),
+                                cutoff_to=datetime.datetime.now(),
+                            ),
+                        )
+                    ):
+                        print(posting.posting_number)
+        """
+        return paginate(
+            self.posting_fbs_unfulfilled_list,
+            request,
+            get_items=lambda page: get_field(page, "result", "postings"),
+            next_request=lambda request, page, items: next_by_offset(
+                request, items, (request.offset or 0) + len(items) < (get_field(page, "result", "count") or 0)
+            ),
+            pages=pages,
+            prefetch=prefetch,
         )
-        return PostingFBSUnfulfilledListResponse(**response)
+
+    async def posting_fbs_unfulfilled_list_all(
+        self: "PostingFBSUnfulfilledListMixin",
+        request: PostingFBSUnfulfilledListRequest,
+        *,
+        concurrency: int = 8,
+    ) -> list[Union[PostingFBSPosting, dict]]:
+        """Параллельно выбирает все необработанные отправления за период и объединяет их по порядку страниц.
+
+        Notes:
+            • Первая страница возвращает общее количество отправлений `count`, после чего оставшиеся страницы запрашиваются одновременно (не более `concurrency`) с учетом ограничений запросов.
+            • Выборка начинается со смещения `offset` из запроса.
+
+        Args:
+            request: Запрос на получение информации о необработанных отправлениях по схеме `PostingFBSUnfulfilledListRequest`
+            concurrency: Максимальное количество одновременных запросов страниц
+
+        Returns:
+            Список отправлений по схеме `PostingFBSPosting` (словари в режимах ответа `dict` и `bytes`)
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    postings = await api.posting_fbs_unfulfilled_list_all(
+                        PostingFBSUnfulfilledListRequest(
+                            filter=PostingFBSUnfulfilledListFilter(
+                                cutoff_from=datetime.datetime.now() - datetime.timedelta(days=5),
+                                cutoff_to=datetime.datetime.now(),
+                            ),
+                        )
+                    )
+        """
+        return [
+            posting async for posting in fan_out_offsets(
+                self.posting_fbs_unfulfilled_list,
+                request,
+                get_items=lambda page: get_field(page, "result", "postings"),
+                get_total=lambda page: get_field(page, "result", "count"),
+                concurrency=concurrency,
+            )
+        ]
@@ -38,10 +38,10 @@ class FBSPostingProductExemplarCreateOrGetMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v6",
             endpoint="fbs/posting/product/exemplar/create-or-get",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=FBSPostingProductExemplarCreateOrGetResponse,
         )
-        return FBSPostingProductExemplarCreateOrGetResponse(**response)
\ No newline at end of file
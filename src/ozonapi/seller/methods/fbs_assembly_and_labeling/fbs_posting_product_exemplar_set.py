@@ -67,12 +67,11 @@ class FBSPostingProductExemplarSetMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v6",
             endpoint="fbs/posting/product/exemplar/set",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=FBSPostingProductExemplarSetResponse,
         )
 
-        return FBSPostingProductExemplarSetResponse(**response)
-
@@ -38,10 +38,10 @@ class FBSPostingProductExemplarStatusMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v5",
             endpoint="fbs/posting/product/exemplar/status",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=FBSPostingProductExemplarStatusResponse,
         )
-        return FBSPostingProductExemplarStatusResponse(**response)
\ No newline at end of file
@@ -41,10 +41,10 @@ class FBSPostingProductExemplarUpdateMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="fbs/posting/product/exemplar/update",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=FBSPostingProductExemplarUpdateResponse,
         )
-        return FBSPostingProductExemplarUpdateResponse(**response)
\ No newline at end of file
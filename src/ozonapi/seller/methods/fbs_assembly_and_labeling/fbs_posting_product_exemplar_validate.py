@@ -63,10 +63,10 @@ class FBSPostingProductExemplarValidateMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v5",
             endpoint="fbs/posting/product/exemplar/validate",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=FBSPostingProductExemplarValidateResponse,
         )
-        return FBSPostingProductExemplarValidateResponse(**response)
\ No newline at end of file
@@ -81,10 +81,10 @@ class PostingFBSShipMixin(APIManager):
                         )
                     )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v4",
             endpoint="posting/fbs/ship",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSShipResponse,
         )
-        return PostingFBSShipResponse(**response)
\ No newline at end of file
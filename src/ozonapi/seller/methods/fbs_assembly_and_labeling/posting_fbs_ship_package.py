@@ -56,10 +56,10 @@ class PostingFBSShipPackageMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v4",
             endpoint="posting/fbs/ship/package",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSShipPackageResponse,
         )
-        return PostingFBSShipPackageResponse(**response)
\ No newline at end of file
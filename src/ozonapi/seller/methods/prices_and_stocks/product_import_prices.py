@@ -54,10 +54,10 @@ class ProductImportPricesMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="product/import/prices",
             payload=request.model_dump(),
+            response_model=ProductImportPricesResponse,
         )
-        return ProductImportPricesResponse(**response)
@@ -1,5 +1,9 @@
+from typing import Any, AsyncIterator, Hashable, Optional, Union
+
 from ...core import APIManager
-from ...schemas.prices_and_stocks import ProductInfoPricesRequest, ProductInfoPricesResponse
+from ...core.batch_loader import index_items, single_key
+from ...core.pagination import get_field, next_by_token, paginate
+from ...schemas.prices_and_stocks import ProductInfoPricesFilter, ProductInfoPricesRequest, ProductInfoPricesResponse, ProductInfoPricesItem
 
 
 class ProductInfoPricesMixin(APIManager):
@@ -45,10 +49,91 @@ class ProductInfoPricesMixin(APIManager):
                         )
                     )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v5",
             endpoint="product/info/prices",
             payload=request.model_dump(),
+            response_model=ProductInfoPricesResponse,
+        )
+
+    def iter_product_info_prices(
+        self: "ProductInfoPricesMixin",
+        request: ProductInfoPricesRequest = ProductInfoPricesRequest.model_construct(),
+        *,
+        pages: bool = False,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Union[ProductInfoPricesItem, ProductInfoPricesResponse]]:
+        """Последовательно выбирает все страницы информации о ценах и комиссиях товаров с автоматической пагинацией по `cursor`.
+
+        Notes:
+            • Пока обрабатывается текущая страница, следующая уже запрашивается с учетом ограничений запросов.
+            • Указатель пагинации в переданном запросе задает первую страницу выборки.
+            • При досрочном выходе из цикла загрузка следующей страницы отменяется.
+
+        Args:
+            request: Запрос первой страницы по схеме `ProductInfoPricesRequest`
+            pages: Выдавать страницы по схеме `ProductInfoPricesResponse` вместо отдельных элементов
+            prefetch: Запрашивать следующую страницу во время обработки текущей
+
+        Yields:
+            Элементы по схеме `ProductInfoPricesItem` или страницы по схеме `ProductInfoPricesResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    async for item in api.iter_product_info_prices():
+                        print(item.offer_id, item.price.price)
+        """
+        return paginate(
+            self.product_info_prices,
+            request,
+            get_items=lambda page: get_field(page, "items"),
+            next_request=lambda request, page, items: next_by_token(request, "cursor", get_field(page, "cursor"), items),
+            pages=pages,
+            prefetch=prefetch,
+        )
+
+    async def product_info_prices_load(
+        self: "ProductInfoPricesMixin",
+        *,
+        offer_id: Optional[str] = None,
+        product_id: Optional[int] = None,
+    ) -> Optional[Union[ProductInfoPricesItem, dict]]:
+        """Получает информацию о ценах и комиссиях товара в составе общего запроса.
+
+        Notes:
+            • Идентификаторы, запрошенные одновременно в течение `batch_window` секунд (см. `APIConfig`), собираются в один запрос `product_info_prices()` для каждого вида идентификатора (до `1000` в запросе).
+            • Укажите ровно один идентификатор: `offer_id` или `product_id`.
+            • Если товар не найден, возвращается None.
+
+        Args:
+            offer_id: Идентификатор товара в системе продавца — артикул
+            product_id: Идентификатор товара в системе Ozon
+
+        Returns:
+            Информация о ценах и комиссиях товара по схеме `ProductInfoPricesItem` или None, если товар не найден
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    item = await api.product_info_prices_load(offer_id="033")
+        """
+        field, value = single_key(offer_id=offer_id, product_id=product_id)
+        loader = self._get_batch_loader(
+            f"product_info_prices:{field}",
+            lambda keys: self._load_product_info_prices(field, keys),
+            1000,
+        )
+        return await loader.load(value)
+
+    async def _load_product_info_prices(
+        self: "ProductInfoPricesMixin",
+        field: str,
+        keys: list[Hashable],
+    ) -> dict[Hashable, Any]:
+        """Запрашивает товары по идентификаторам одного вида и индексирует их по этим идентификаторам."""
+        response = await self.product_info_prices(
+            ProductInfoPricesRequest(filter=ProductInfoPricesFilter(**{field: keys}), limit=len(keys))
         )
-        return ProductInfoPricesResponse(**response)
+        return index_items(response, lambda item: (get_field(item, field),))
@@ -1,5 +1,10 @@
+from typing import Any, AsyncIterator, Hashable, Optional, Union
+
 from ...core import APIManager
-from ...schemas.prices_and_stocks import ProductInfoStocksRequest, ProductInfoStocksResponse
+from ...core.batch_loader import index_items, single_key
+from ...core.pagination import get_field, next_by_token, paginate
+from ...core.streaming import paginate_stream
+from ...schemas.prices_and_stocks import ProductInfoStocksFilter, ProductInfoStocksRequest, ProductInfoStocksResponse, ProductInfoStocksItem
 
 
 class ProductInfoStocksMixin(APIManager):
@@ -47,10 +52,111 @@ class ProductInfoStocksMixin(APIManager):
                         )
                     )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v4",
             endpoint="product/info/stocks",
             payload=request.model_dump(),
+            response_model=ProductInfoStocksResponse,
+        )
+
+    def iter_product_info_stocks(
+        self: "ProductInfoStocksMixin",
+        request: ProductInfoStocksRequest = ProductInfoStocksRequest.model_construct(),
+        *,
+        pages: bool = False,
+        prefetch: bool = True,
+        stream: bool = False,
+    ) -> AsyncIterator[Union[ProductInfoStocksItem, ProductInfoStocksResponse]]:
+        """Последовательно выбирает все страницы информации об общих остатках FBS и rFBS с автоматической пагинацией по `cursor`.
+
+        Notes:
+            • Пока обрабатывается текущая страница, следующая уже запрашивается с учетом ограничений запросов.
+            • Указатель пагинации в переданном запросе задает первую страницу выборки.
+            • При досрочном выходе из цикла загрузка следующей страницы отменяется.
+            • С `stream=True` элементы выдаются по мере получения тела каждой страницы, страница целиком в памяти не хранится. Следующая страница запрашивается после выдачи всех элементов текущей.
+
+        Args:
+            request: Запрос первой страницы по схеме `ProductInfoStocksRequest`
+            pages: Выдавать страницы по схеме `ProductInfoStocksResponse` вместо отдельных элементов
+            prefetch: Запрашивать следующую страницу во время обработки текущей
+            stream: Выдавать элементы по мере получения тела ответа (несовместимо с `pages`)
+
+        Yields:
+            Элементы по схеме `ProductInfoStocksItem` или страницы по схеме `ProductInfoStocksResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    async for item in api.iter_product_info_stocks():
+                        print(item.offer_id, item.stocks)
+        """
+        def next_request(request, page, items):
+            return next_by_token(request, "cursor", get_field(page, "cursor"), items)
+
+        if stream:
+            if pages:
+                raise ValueError("Потоковая выдача возможна только для отдельных элементов")
+            return paginate_stream(
+                lambda page_request: self._stream_request(
+                    api_version="v4",
+                    endpoint="product/info/stocks",
+                    payload=page_request.model_dump(),
+                    item_path=("items",),
+                    item_model=ProductInfoStocksItem,
+                ),
+                request,
+                next_request,
+            )
+        return paginate(
+            self.product_info_stocks,
+            request,
+            get_items=lambda page: get_field(page, "items"),
+            next_request=next_request,
+            pages=pages,
+            prefetch=prefetch,
+        )
+
+    async def product_info_stocks_load(
+        self: "ProductInfoStocksMixin",
+        *,
+        offer_id: Optional[str] = None,
+        product_id: Optional[int] = None,
+    ) -> Optional[Union[ProductInfoStocksItem, dict]]:
+        """Получает информацию об остатках товара в составе общего запроса.
+
+        Notes:
+            • Идентификаторы, запрошенные одновременно в течение `batch_window` секунд (см. `APIConfig`), собираются в один запрос `product_info_stocks()` для каждого вида идентификатора (до `1000` в запросе).
+            • Укажите ровно один идентификатор: `offer_id` или `product_id`.
+            • Если товар не найден, возвращается None.
+
+        Args:
+            offer_id: Идентификатор товара в системе продавца — артикул
+            product_id: Идентификатор товара в системе Ozon
+
+        Returns:
+            Информация об остатках товара по схеме `ProductInfoStocksItem` или None, если товар не найден
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    item = await api.product_info_stocks_load(offer_id="033")
+        """
+        field, value = single_key(offer_id=offer_id, product_id=product_id)
+        loader = self._get_batch_loader(
+            f"product_info_stocks:{field}",
+            lambda keys: self._load_product_info_stocks(field, keys),
+            1000,
+        )
+        return await loader.load(value)
+
+    async def _load_product_info_stocks(
+        self: "ProductInfoStocksMixin",
+        field: str,
+        keys: list[Hashable],
+    ) -> dict[Hashable, Any]:
+        """Запрашивает товары по идентификаторам одного вида и индексирует их по этим идентификаторам."""
+        response = await self.product_info_stocks(
+            ProductInfoStocksRequest(filter=ProductInfoStocksFilter(**{field: keys}), limit=len(keys))
         )
-        return ProductInfoStocksResponse(**response)
+        return index_items(response, lambda item: (get_field(item, field),))
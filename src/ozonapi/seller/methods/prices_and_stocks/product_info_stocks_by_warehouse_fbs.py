@@ -28,10 +28,10 @@ class ProductInfoStocksByWarehouseFBSMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="product/info/stocks-by-warehouse/fbs",
             payload=request.model_dump(),
+            response_model=ProductInfoStocksByWarehouseFBSResponse,
         )
-        return ProductInfoStocksByWarehouseFBSResponse(**response)
@@ -47,10 +47,10 @@ class ProductsStocksMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v2",
             endpoint="products/stocks",
             payload=request.model_dump(),
+            response_model=ProductsStocksResponse,
         )
-        return ProductsStocksResponse(**response)
\ No newline at end of file
@@ -1,4 +1,7 @@
+from typing import Sequence
+
 from ...core import APIManager
+from ...core.bulk import execute_chunked, max_items, merge_flags
 from ...schemas.products import ProductArchiveRequest, ProductArchiveResponse
 
 
@@ -31,10 +34,44 @@ class ProductArchiveMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="product/archive",
             payload=request.model_dump(),
+            response_model=ProductArchiveResponse,
+        )
+
+    async def product_archive_bulk(
+        self: "ProductArchiveMixin",
+        product_id: Sequence[int],
+        *,
+        concurrency: int = 8,
+    ) -> ProductArchiveResponse:
+        """Перемещает в архив товары с любым количеством идентификаторов.
+
+        Notes:
+            • Идентификаторы делятся на части по `100` и отправляются одновременно (не более `concurrency` запросов) с учетом ограничений запросов.
+            • Результат истинен, если операция выполнена для всех частей.
+            • Если часть запросов завершилась ошибкой, выбрасывается `APIBulkError` с результатом остальных частей и ошибками по частям.
+
+        Args:
+            product_id: Идентификаторы товаров в системе Ozon
+            concurrency: Максимальное количество одновременных запросов
+
+        Returns:
+            Логическое значение выполнения операции по схеме `ProductArchiveResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    result = await api.product_archive_bulk(product_ids)
+        """
+        return await execute_chunked(
+            self.product_archive,
+            lambda chunk: ProductArchiveRequest(product_id=chunk),
+            product_id,
+            chunk_size=max_items(ProductArchiveRequest, "product_id"),
+            merge=merge_flags(),
+            concurrency=concurrency,
         )
-        return ProductArchiveResponse(**response)
@@ -43,10 +43,10 @@ class ProductAttributesUpdateMixin(APIManager):
                     ),
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="product/attributes/update",
             payload=request.model_dump(),
+            response_model=ProductAttributesUpdateResponse,
         )
-        return ProductAttributesUpdateResponse(**response)
@@ -1,5 +1,8 @@
+from typing import Sequence
+
 from ...core import APIManager
-from ...schemas.products import ProductsDeleteRequest, ProductsDeleteResponse
+from ...core.bulk import execute_chunked, max_items, merge_lists
+from ...schemas.products import ProductDeleteRequestItem, ProductsDeleteRequest, ProductsDeleteResponse
 
 
 class ProductDeleteMixin(APIManager):
@@ -34,10 +37,46 @@ class ProductDeleteMixin(APIManager):
                     ),
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v2",
             endpoint="products/delete",
             payload=request.model_dump(),
+            response_model=ProductsDeleteResponse,
+        )
+
+    async def products_delete_bulk(
+        self: "ProductDeleteMixin",
+        offer_id: Sequence[str],
+        *,
+        concurrency: int = 8,
+    ) -> ProductsDeleteResponse:
+        """Удаляет архивные товары без SKU с любым количеством идентификаторов.
+
+        Notes:
+            • Артикулы делятся на части по `500` и отправляются одновременно (не более `concurrency` запросов) с учетом ограничений запросов.
+            • Статусы обработки товаров объединяются в один ответ в порядке частей.
+            • Если часть запросов завершилась ошибкой, выбрасывается `APIBulkError` со статусами остальных частей и ошибками по частям.
+
+        Args:
+            offer_id: Идентификаторы товаров в системе продавца — артикулы
+            concurrency: Максимальное количество одновременных запросов
+
+        Returns:
+            Статус обработки запроса для каждого товара по схеме `ProductsDeleteResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    result = await api.products_delete_bulk(["033", "034"])
+        """
+        return await execute_chunked(
+            self.products_delete,
+            lambda chunk: ProductsDeleteRequest(
+                products=[ProductDeleteRequestItem(offer_id=item) for item in chunk]
+            ),
+            offer_id,
+            chunk_size=max_items(ProductsDeleteRequest, "products"),
+            merge=merge_lists("status"),
+            concurrency=concurrency,
         )
-        return ProductsDeleteResponse(**response)
@@ -122,10 +122,10 @@ class ProductImportMixin(APIManager):
                     ProductImportRequest(items=items)
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v3",
             endpoint="product/import",
             payload=request.model_dump(),
+            response_model=ProductImportResponse,
         )
-        return ProductImportResponse(**response)
@@ -44,10 +44,10 @@ class ProductImportBySkuMixin(APIManager):
                     ),
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="product/import-by-sku",
             payload=request.model_dump(),
+            response_model=ProductImportBySkuResponse,
         )
-        return ProductImportBySkuResponse(**response)
@@ -26,10 +26,10 @@ class ProductImportInfoMixin(APIManager):
                     ProductImportInfoRequest(task_id=1234567),
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="product/import/info",
             payload=request.model_dump(),
+            response_model=ProductImportInfoResponse,
         )
-        return ProductImportInfoResponse(**response)
@@ -1,5 +1,9 @@
+from typing import AsyncIterator, Union
+
 from ...core import APIManager
-from ...schemas.products import ProductInfoAttributesRequest, ProductInfoAttributesResponse
+from ...core.pagination import get_field, next_by_token, paginate
+from ...core.streaming import paginate_stream
+from ...schemas.products import ProductInfoAttributesRequest, ProductInfoAttributesResponse, ProductInfoAttributesItem
 
 
 class ProductInfoAttributesMixin(APIManager):
@@ -46,10 +50,67 @@ class ProductInfoAttributesMixin(APIManager):
                         ),
                     )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v4",
             endpoint="product/info/attributes",
             payload=request.model_dump(),
+            response_model=ProductInfoAttributesResponse,
+        )
+
+    def iter_product_info_attributes(
+        self: "ProductInfoAttributesMixin",
+        request: ProductInfoAttributesRequest = ProductInfoAttributesRequest.model_construct(),
+        *,
+        pages: bool = False,
+        prefetch: bool = True,
+        stream: bool = False,
+    ) -> AsyncIterator[Union[ProductInfoAttributesItem, ProductInfoAttributesResponse]]:
+        """Последовательно выбирает все страницы характеристик товаров с автоматической пагинацией по `last_id`.
+
+        Notes:
+            • Пока обрабатывается текущая страница, следующая уже запрашивается с учетом ограничений запросов.
+            • Указатель пагинации в переданном запросе задает первую страницу выборки.
+            • При досрочном выходе из цикла загрузка следующей страницы отменяется.
+            • С `stream=True` элементы выдаются по мере получения тела каждой страницы, страница целиком в памяти не хранится. Следующая страница запрашивается после выдачи всех элементов текущей.
+
+        Args:
+            request: Запрос первой страницы по схеме `ProductInfoAttributesRequest`
+            pages: Выдавать страницы по схеме `ProductInfoAttributesResponse` вместо отдельных элементов
+            prefetch: Запрашивать следующую страницу во время обработки текущей
+            stream: Выдавать элементы по мере получения тела ответа (несовместимо с `pages`)
+
+        Yields:
+            Элементы по схеме `ProductInfoAttributesItem` или страницы по схеме `ProductInfoAttributesResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    async for item in api.iter_product_info_attributes():
+                        print(item.offer_id, item.attributes)
+        """
+        def next_request(request, page, items):
+            return next_by_token(request, "last_id", get_field(page, "last_id"), items)
+
+        if stream:
+            if pages:
+                raise ValueError("Потоковая выдача возможна только для отдельных элементов")
+            return paginate_stream(
+                lambda page_request: self._stream_request(
+                    api_version="v4",
+                    endpoint="product/info/attributes",
+                    payload=page_request.model_dump(),
+                    item_path=("result",),
+                    item_model=ProductInfoAttributesItem,
+                ),
+                request,
+                next_request,
+            )
+        return paginate(
+            self.product_info_attributes,
+            request,
+            get_items=lambda page: get_field(page, "result"),
+            next_request=next_request,
+            pages=pages,
+            prefetch=prefetch,
         )
-        return ProductInfoAttributesResponse(**response)
@@ -29,10 +29,10 @@ class ProductInfoDescriptionMixin(APIManager):
                     ProductInfoDescriptionRequest(product_id=12345678)
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="product/info/description",
             payload=request.model_dump(),
+            response_model=ProductInfoDescriptionResponse,
         )
-        return ProductInfoDescriptionResponse(**response)
@@ -31,10 +31,10 @@ class ProductInfoLimitMixin(APIManager):
             async with SellerAPI(client_id, api_key) as api:
                 result = await api.product_info_limit()
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v4",
             endpoint="product/info/limit",
             payload={},
+            response_model=ProductInfoLimitResponse,
         )
-        return ProductInfoLimitResponse(**response)
\ No newline at end of file
@@ -1,5 +1,13 @@
+from typing import Any, Hashable, Optional, Sequence, Union
+
 from ...core import APIManager
-from ...schemas.products import ProductInfoListRequest, ProductInfoListResponse
+from ...core.batch_loader import index_items, single_key
+from ...core.bulk import chunked, execute_chunks, merge_lists
+from ...core.pagination import get_field
+from ...schemas.products import ProductInfoListItem, ProductInfoListRequest, ProductInfoListResponse
+
+# Максимальное общее количество идентификаторов в запросе /v3/product/info/list
+PRODUCT_INFO_LIST_MAX_ITEMS = 1000
 
 
 class ProductInfoListMixin(APIManager):
@@ -33,10 +41,105 @@ class ProductInfoListMixin(APIManager):
                     ),
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v3",
             endpoint="product/info/list",
             payload=request.model_dump(),
+            response_model=ProductInfoListResponse,
+        )
+
+    async def product_info_list_bulk(
+        self: "ProductInfoListMixin",
+        *,
+        offer_id: Optional[Sequence[str]] = None,
+        product_id: Optional[Sequence[int]] = None,
+        sku: Optional[Sequence[int]] = None,
+        concurrency: int = 8,
+    ) -> ProductInfoListResponse:
+        """Получает информацию о товарах с любым количеством идентификаторов.
+
+        Notes:
+            • Идентификаторы каждого вида делятся на части по `1000` и запрашиваются одновременно (не более `concurrency` запросов) с учетом ограничений запросов.
+            • Можно передать идентификаторы нескольких видов: каждая часть содержит идентификаторы одного вида.
+            • Товары объединяются в один ответ в порядке частей: сначала по `offer_id`, затем по `product_id` и `sku`.
+            • Если часть запросов завершилась ошибкой, выбрасывается `APIBulkError` с объединенным ответом остальных частей и ошибками по частям.
+
+        Args:
+            offer_id: Идентификаторы товаров в системе продавца — артикулы (опционально)
+            product_id: Идентификаторы товаров в системе Ozon (опционально)
+            sku: Идентификаторы товаров в системе Ozon — SKU (опционально)
+            concurrency: Максимальное количество одновременных запросов
+
+        Returns:
+            Информация о товарах по схеме `ProductInfoListResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    result = await api.product_info_list_bulk(product_id=product_ids)
+        """
+        chunks = [
+            [(field, value) for value in chunk]
+            for field, values in (("offer_id", offer_id), ("product_id", product_id), ("sku", sku))
+            for chunk in chunked(values or (), PRODUCT_INFO_LIST_MAX_ITEMS)
+        ]
+        return await execute_chunks(
+            self.product_info_list,
+            lambda chunk: ProductInfoListRequest(**{chunk[0][0]: [value for _, value in chunk]}),
+            chunks,
+            merge=merge_lists("items"),
+            concurrency=concurrency,
         )
-        return ProductInfoListResponse(**response)
+
+    async def product_info_list_load(
+        self: "ProductInfoListMixin",
+        *,
+        offer_id: Optional[str] = None,
+        product_id: Optional[int] = None,
+        sku: Optional[int] = None,
+    ) -> Optional[Union[ProductInfoListItem, dict]]:
+        """Получает информацию об одном товаре в составе общего запроса.
+
+        Notes:
+            • Идентификаторы, запрошенные одновременно в течение `batch_window` секунд (см. `APIConfig`), собираются в один запрос `product_info_list()` для каждого вида идентификатора (до `1000` в запросе).
+            • Укажите ровно один идентификатор: `offer_id`, `product_id` или `sku`.
+            • Если товар не найден, возвращается None.
+            • Если запрос отклонен из-за ошибочного идентификатора, ошибку получает только вызов с этим идентификатором.
+
+        Args:
+            offer_id: Идентификатор товара в системе продавца — артикул
+            product_id: Идентификатор товара в системе Ozon
+            sku: Идентификатор товара в системе Ozon — SKU
+
+        Returns:
+            Информация о товаре по схеме `ProductInfoListItem` или None, если товар не найден
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    # Один запрос к API для всех отправлений
+                    products = await asyncio.gather(*(
+                        api.product_info_list_load(sku=posting.products[0].sku) for posting in postings
+                    ))
+        """
+        field, value = single_key(offer_id=offer_id, product_id=product_id, sku=sku)
+        loader = self._get_batch_loader(
+            f"product_info_list:{field}",
+            lambda keys: self._load_product_info_list(field, keys),
+            PRODUCT_INFO_LIST_MAX_ITEMS,
+        )
+        return await loader.load(value)
+
+    async def _load_product_info_list(
+        self: "ProductInfoListMixin",
+        field: str,
+        keys: list[Hashable],
+    ) -> dict[Hashable, Any]:
+        """Запрашивает товары по идентификаторам одного вида и индексирует их по этим идентификаторам."""
+        response = await self.product_info_list(ProductInfoListRequest(**{field: keys}))
+        if field == "sku":
+            return index_items(response, lambda item: (
+                get_field(source, "sku") for source in get_field(item, "sources") or ()
+            ))
+        return index_items(response, lambda item: (get_field(item, "id" if field == "product_id" else field),))
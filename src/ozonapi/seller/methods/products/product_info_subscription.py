@@ -32,10 +32,10 @@ class ProductInfoSubscriptionMixin(APIManager):
                     ),
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="product/info/subscription",
             payload=request.model_dump(),
+            response_model=ProductInfoSubscriptionResponse,
         )
-        return ProductInfoSubscriptionResponse(**response)
@@ -1,5 +1,8 @@
+from typing import AsyncIterator, Union
+
 from ...core import APIManager
-from ...schemas.products import ProductListRequest, ProductListResponse
+from ...core.pagination import get_field, next_by_token, paginate
+from ...schemas.products import ProductListRequest, ProductListResponse, ProductListResponseItem
 
 
 class ProductListMixin(APIManager):
@@ -45,10 +48,46 @@ class ProductListMixin(APIManager):
                         ),
                     )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v3",
             endpoint="product/list",
             payload=request.model_dump(),
+            response_model=ProductListResponse,
+        )
+
+    def iter_product_list(
+        self: "ProductListMixin",
+        request: ProductListRequest = ProductListRequest.model_construct(),
+        *,
+        pages: bool = False,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Union[ProductListResponseItem, ProductListResponse]]:
+        """Последовательно выбирает все страницы списка товаров продавца с автоматической пагинацией по `last_id`.
+
+        Notes:
+            • Пока обрабатывается текущая страница, следующая уже запрашивается с учетом ограничений запросов.
+            • Указатель пагинации в переданном запросе задает первую страницу выборки.
+            • При досрочном выходе из цикла загрузка следующей страницы отменяется.
+
+        Args:
+            request: Запрос первой страницы по схеме `ProductListRequest`
+            pages: Выдавать страницы по схеме `ProductListResponse` вместо отдельных элементов
+            prefetch: Запрашивать следующую страницу во время обработки текущей
+
+        Yields:
+            Элементы по схеме `ProductListResponseItem` или страницы по схеме `ProductListResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    product_ids = [item.product_id async for item in api.iter_product_list()]
+        """
+        return paginate(
+            self.product_list,
+            request,
+            get_items=lambda page: get_field(page, "result", "items"),
+            next_request=lambda request, page, items: next_by_token(request, "last_id", get_field(page, "result", "last_id"), items),
+            pages=pages,
+            prefetch=prefetch,
         )
-        return ProductListResponse(**response)
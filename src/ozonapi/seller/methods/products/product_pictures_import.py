@@ -59,10 +59,10 @@ class ProductPicturesImportMixin(APIManager):
                     )
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="product/pictures/import",
             payload=request.model_dump(),
+            response_model=ProductPicturesImportResponse,
         )
-        return ProductPicturesImportResponse(**response)
@@ -1,4 +1,7 @@
+from typing import Sequence
+
 from ...core import APIManager
+from ...core.bulk import execute_chunked, max_items, merge_lists
 from ...schemas.products import ProductPicturesInfoRequest, ProductPicturesInfoResponse
 
 
@@ -32,10 +35,44 @@ class ProductPicturesInfoMixin(APIManager):
                     ),
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v2",
             endpoint="product/pictures/info",
             payload=request.model_dump(),
+            response_model=ProductPicturesInfoResponse,
+        )
+
+    async def product_pictures_info_bulk(
+        self: "ProductPicturesInfoMixin",
+        product_id: Sequence[int],
+        *,
+        concurrency: int = 8,
+    ) -> ProductPicturesInfoResponse:
+        """Получает информацию об изображениях товаров с любым количеством идентификаторов.
+
+        Notes:
+            • Идентификаторы делятся на части по `1000` и запрашиваются одновременно (не более `concurrency` запросов) с учетом ограничений запросов.
+            • Элементы ответов объединяются в один ответ в порядке частей.
+            • Если часть запросов завершилась ошибкой, выбрасывается `APIBulkError` с объединенным ответом остальных частей и ошибками по частям.
+
+        Args:
+            product_id: Идентификаторы товаров в системе Ozon
+            concurrency: Максимальное количество одновременных запросов
+
+        Returns:
+            Информация об изображениях товаров по схеме `ProductPicturesInfoResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    result = await api.product_pictures_info_bulk(product_ids)
+        """
+        return await execute_chunked(
+            self.product_pictures_info,
+            lambda chunk: ProductPicturesInfoRequest(product_id=chunk),
+            product_id,
+            chunk_size=max_items(ProductPicturesInfoRequest, "product_id"),
+            merge=merge_lists("items"),
+            concurrency=concurrency,
         )
-        return ProductPicturesInfoResponse(**response)
@@ -33,10 +33,10 @@ class ProductRatingBySkuMixin(APIManager):
                     ),
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="product/rating-by-sku",
             payload=request.model_dump(),
+            response_model=ProductRatingBySkuResponse,
         )
-        return ProductRatingBySkuResponse(**response)
@@ -33,10 +33,10 @@ class ProductRelatedSkuGetMixin(APIManager):
                     ),
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="product/related-sku/get",
             payload=request.model_dump(),
+            response_model=ProductRelatedSkuGetResponse,
         )
-        return ProductRelatedSkuGetResponse(**response)
@@ -1,4 +1,7 @@
+from typing import Sequence
+
 from ...core import APIManager
+from ...core.bulk import execute_chunked, max_items, merge_flags
 from ...schemas.products import ProductUnarchiveRequest, ProductUnarchiveResponse
 
 
@@ -34,10 +37,44 @@ class ProductUnarchiveMixin(APIManager):
                     ),
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="product/unarchive",
             payload=request.model_dump(),
+            response_model=ProductUnarchiveResponse,
+        )
+
+    async def product_unarchive_bulk(
+        self: "ProductUnarchiveMixin",
+        product_id: Sequence[int],
+        *,
+        concurrency: int = 8,
+    ) -> ProductUnarchiveResponse:
+        """Восстанавливает из архива товары с любым количеством идентификаторов.
+
+        Notes:
+            • Идентификаторы делятся на части по `100` и отправляются одновременно (не более `concurrency` запросов) с учетом ограничений запросов.
+            • Результат истинен, если операция выполнена для всех частей.
+            • Если часть запросов завершилась ошибкой, выбрасывается `APIBulkError` с результатом остальных частей и ошибками по частям.
+
+        Args:
+            product_id: Идентификаторы товаров в системе Ozon
+            concurrency: Максимальное количество одновременных запросов
+
+        Returns:
+            Результат обработки запроса по схеме `ProductUnarchiveResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    result = await api.product_unarchive_bulk(product_ids)
+        """
+        return await execute_chunked(
+            self.product_unarchive,
+            lambda chunk: ProductUnarchiveRequest(product_id=chunk),
+            product_id,
+            chunk_size=max_items(ProductUnarchiveRequest, "product_id"),
+            merge=merge_flags(),
+            concurrency=concurrency,
         )
-        return ProductUnarchiveResponse(**response)
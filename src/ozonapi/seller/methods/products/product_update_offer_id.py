@@ -42,10 +42,10 @@ class ProductUpdateOfferIdMixin(APIManager):
                     ),
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="product/update/offer-id",
             payload=request.model_dump(),
+            response_model=ProductUpdateOfferIdResponse,
         )
-        return ProductUpdateOfferIdResponse(**response)
@@ -1,10 +1,14 @@
-from ...core import APIManager
-from ...schemas.warehouses import DeliveryMethodListRequest, DeliveryMethodListResponse
+from typing import AsyncIterator, Union
+
+from ...core import APIManager, cache_response
+from ...core.pagination import get_field, next_by_offset, paginate
+from ...schemas.warehouses import DeliveryMethodListRequest, DeliveryMethodListResponse, DeliveryMethodListItem
 
 
 class DeliveryMethodListMixin(APIManager):
     """Реализует метод /v1/delivery-method/list"""
 
+    @cache_response(ttl=600)
     async def delivery_method_list(
         self: "DeliveryMethodListMixin",
         request: DeliveryMethodListRequest = DeliveryMethodListRequest.model_construct()
@@ -15,6 +19,7 @@ class DeliveryMethodListMixin(APIManager):
             • Для получения идентификатора склада используйте метод `warehouse_list()`.
             • В ответе может быть только часть методов доставки - используйте параметр `offset` в запросе и `has_next` из ответа для пагинации.
             • Максимальное количество элементов в ответе - `50`.
+            • Ответ кешируется на 10 минут для каждого client_id и запроса, сбросить кеш можно методом `invalidate_response_cache()`.
 
         References:
             https://docs.ozon.ru/api/seller/?__rr=1&abt_att=1#operation/WarehouseAPI_DeliveryMethodList
@@ -39,10 +44,46 @@ class DeliveryMethodListMixin(APIManager):
                     ),
                 )
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="delivery-method/list",
             payload=request.model_dump(),
+            response_model=DeliveryMethodListResponse,
+        )
+
+    def iter_delivery_method_list(
+        self: "DeliveryMethodListMixin",
+        request: DeliveryMethodListRequest = DeliveryMethodListRequest.model_construct(),
+        *,
+        pages: bool = False,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Union[DeliveryMethodListItem, DeliveryMethodListResponse]]:
+        """Последовательно выбирает все страницы методов доставки склада с автоматической пагинацией по `offset` и `has_next`.
+
+        Notes:
+            • Пока обрабатывается текущая страница, следующая уже запрашивается с учетом ограничений запросов.
+            • Указатель пагинации в переданном запросе задает первую страницу выборки.
+            • При досрочном выходе из цикла загрузка следующей страницы отменяется.
+
+        Args:
+            request: Запрос первой страницы по схеме `DeliveryMethodListRequest`
+            pages: Выдавать страницы по схеме `DeliveryMethodListResponse` вместо отдельных элементов
+            prefetch: Запрашивать следующую страницу во время обработки текущей
+
+        Yields:
+            Элементы по схеме `DeliveryMethodListItem` или страницы по схеме `DeliveryMethodListResponse`
+
+        Examples:
+            Базовое применение:
+                async with SellerAPI(client_id, api_key) as api:
+                    methods = [method async for method in api.iter_delivery_method_list()]
+        """
+        return paginate(
+            self.delivery_method_list,
+            request,
+            get_items=lambda page: get_field(page, "result"),
+            next_request=lambda request, page, items: next_by_offset(request, items, get_field(page, "has_next")),
+            pages=pages,
+            prefetch=prefetch,
         )
-        return DeliveryMethodListResponse(**response)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from ...core import APIManager, method_rate_limit
+from ...core import APIManager, cache_response, method_rate_limit
 from ...schemas import WarehouseListRequest
 from ...schemas.warehouses import WarehouseListResponse
 
@@ -6,6 +6,7 @@ from ...schemas.warehouses import WarehouseListResponse
 class WarehouseListMixin(APIManager):
     """Реализует метод /v1/warehouse/list"""
 
+    @cache_response(ttl=600)
     @method_rate_limit(limit_requests=1, interval_seconds=60)
     async def warehouse_list(
         self: "WarehouseListMixin",
@@ -16,6 +17,7 @@ class WarehouseListMixin(APIManager):
         Notes:
             • Чтобы получить список складов FBO, используйте метод `cluster_list()`.
             • Метод можно использовать `1` раз в минуту.
+            • Ответ кешируется на 10 минут для каждого client_id и запроса, сбросить кеш можно методом `invalidate_response_cache()`.
 
         References:
             https://docs.ozon.ru/api/seller/?__rr=1&abt_att=1#operation/WarehouseAPI_WarehouseList
@@ -27,10 +29,10 @@ class WarehouseListMixin(APIManager):
             async with SellerAPI(client_id, api_key) as api:
                 result = await api.warehouse_list()
         """
-        response = await self._request(
+        return await self._request(
             method="post",
             api_version="v1",
             endpoint="warehouse/list",
             payload=request.model_dump(),
+            response_model=WarehouseListResponse,
         )
-        return WarehouseListResponse(**response)
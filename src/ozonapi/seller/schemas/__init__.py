@@ -1,9 +1,38 @@
-from .attributes_and_characteristics import *
-from .barcodes import *
-from .beta import *
-from .fbo import *
-from .fbs import *
-from .fbs_assembly_and_labeling import *
-from .prices_and_stocks import *
-from .products import *
-from .warehouses import *
\ No newline at end of file
+"""Схемы запросов и ответов методов Seller API.
+
+Модули схем импортируются при первом обращении к имени схемы.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+from ..common.lazy import lazy_exports
+
+_PACKAGES = (
+    ".attributes_and_characteristics",
+    ".barcodes",
+    ".beta",
+    ".fbo",
+    ".fbs",
+    ".fbs_assembly_and_labeling",
+    ".prices_and_stocks",
+    ".products",
+    ".warehouses",
+)
+
+if TYPE_CHECKING:
+    from .attributes_and_characteristics import *
+    from .barcodes import *
+    from .beta import *
+    from .fbo import *
+    from .fbs import *
+    from .fbs_assembly_and_labeling import *
+    from .prices_and_stocks import *
+    from .products import *
+    from .warehouses import *
+
+# Пакеты разделов содержат только имена схем, поэтому их импорт не загружает модули схем
+_exports = {package: tuple(importlib.import_module(package, __name__).__all__) for package in _PACKAGES}
+
+__all__ = list(dict.fromkeys(name for names in _exports.values() for name in names))
+
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
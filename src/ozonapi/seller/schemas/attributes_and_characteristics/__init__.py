@@ -1,6 +1,10 @@
 """Описывает модели методов раздела Атрибуты и характеристики Ozon.
 https://docs.ozon.ru/api/seller/?__rr=1#tag/CategoryAPI
 """
+from typing import TYPE_CHECKING
+
+from ...common.lazy import lazy_exports
+
 __all__ = [
     "DescriptionCategoryAttributeItem",
     "DescriptionCategoryAttributeRequest",
@@ -14,11 +18,28 @@ __all__ = [
     "DescriptionCategoryTreeResponse",
 ]
 
-from .v1__description_category_attribute import DescriptionCategoryAttributeItem, \
-    DescriptionCategoryAttributeRequest, DescriptionCategoryAttributeResponse
-from .v1__description_category_attribute_values import DescriptionCategoryAttributeValuesRequest, \
-    DescriptionCategoryAttributeValuesResponse
-from .v1__description_category_attribute_values_search import DescriptionCategoryAttributeValuesSearchRequest, \
-    DescriptionCategoryAttributeValuesSearchResponse
-from .v1__description_category_tree import DescriptionCategoryTreeItem, DescriptionCategoryTreeRequest, \
-    DescriptionCategoryTreeResponse
\ No newline at end of file
+if TYPE_CHECKING:
+    from .v1__description_category_attribute import DescriptionCategoryAttributeItem, \
+        DescriptionCategoryAttributeRequest, DescriptionCategoryAttributeResponse
+    from .v1__description_category_attribute_values import DescriptionCategoryAttributeValuesRequest, \
+        DescriptionCategoryAttributeValuesResponse
+    from .v1__description_category_attribute_values_search import DescriptionCategoryAttributeValuesSearchRequest, \
+        DescriptionCategoryAttributeValuesSearchResponse
+    from .v1__description_category_tree import DescriptionCategoryTreeItem, DescriptionCategoryTreeRequest, \
+        DescriptionCategoryTreeResponse
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".v1__description_category_attribute": (
+        "DescriptionCategoryAttributeItem", "DescriptionCategoryAttributeRequest",
+        "DescriptionCategoryAttributeResponse",
+    ),
+    ".v1__description_category_attribute_values": (
+        "DescriptionCategoryAttributeValuesRequest", "DescriptionCategoryAttributeValuesResponse",
+    ),
+    ".v1__description_category_attribute_values_search": (
+        "DescriptionCategoryAttributeValuesSearchRequest", "DescriptionCategoryAttributeValuesSearchResponse",
+    ),
+    ".v1__description_category_tree": (
+        "DescriptionCategoryTreeItem", "DescriptionCategoryTreeRequest", "DescriptionCategoryTreeResponse",
+    ),
+})
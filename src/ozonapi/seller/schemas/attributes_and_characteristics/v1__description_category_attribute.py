@@ -1,6 +1,7 @@
 """https://docs.ozon.ru/api/seller/#operation/DescriptionCategoryAPI_GetAttributes"""
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ...common.enumerations.localization import Language
 from .base import BaseAttributeRequest, BaseLanguageRequest
 
@@ -1,8 +1,9 @@
 """https://docs.ozon.ru/api/seller/#operation/DescriptionCategoryAPI_GetTree"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ...common.enumerations.localization import Language
 from .base import BaseLanguageRequest
 
@@ -47,9 +48,6 @@ class DescriptionCategoryTreeItem(BaseModel):
     )
 
 
-DescriptionCategoryTreeItem.model_rebuild()
-
-
 class DescriptionCategoryTreeResponse(BaseModel):
     """Описывает схему ответа на запрос о получении дерева категорий и типов для товаров в виде дерева.
 
@@ -1,6 +1,10 @@
 """Описывает модели методов раздела Штрихкоды товаров.
 https://docs.ozon.ru/api/seller/?__rr=1#tag/BarcodeAPI
 """
+from typing import TYPE_CHECKING
+
+from ...common.lazy import lazy_exports
+
 __all__ = [
     "BarcodeAddRequest",
     "BarcodeAddResponse",
@@ -11,5 +15,11 @@ __all__ = [
     "BarcodeGenerateError",
 ]
 
-from .v1__barcode_add import BarcodeAddRequest, BarcodeAddResponse, BarcodeAddItem, BarcodeAddError
-from .v1__barcode_generate import BarcodeGenerateRequest, BarcodeGenerateResponse, BarcodeGenerateError
\ No newline at end of file
+if TYPE_CHECKING:
+    from .v1__barcode_add import BarcodeAddRequest, BarcodeAddResponse, BarcodeAddItem, BarcodeAddError
+    from .v1__barcode_generate import BarcodeGenerateRequest, BarcodeGenerateResponse, BarcodeGenerateError
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".v1__barcode_add": ("BarcodeAddRequest", "BarcodeAddResponse", "BarcodeAddItem", "BarcodeAddError"),
+    ".v1__barcode_generate": ("BarcodeGenerateRequest", "BarcodeGenerateResponse", "BarcodeGenerateError"),
+})
@@ -1,7 +1,9 @@
 """https://docs.ozon.ru/api/seller/#operation/generate-barcode"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from ...common.schema import BaseModel
 
 
 class BarcodeGenerateRequest(BaseModel):
@@ -1,6 +1,9 @@
 """Описывает модели бета-методов.
 https://docs.ozon.com/api/seller/?#tag/BetaMethod
 """
+from typing import TYPE_CHECKING
+
+from ...common.lazy import lazy_exports
 
 __all__ = [
     "AnalyticsStocksRequest",
@@ -9,5 +12,11 @@ __all__ = [
     "SellerInfoResponse",
 ]
 
-from .v1__seller_info import SellerInfoResponse
-from .v1__analytics_stocks import AnalyticsStocksResponse, AnalyticsStocksRequest, AnalyticsStocksItem
\ No newline at end of file
+if TYPE_CHECKING:
+    from .v1__seller_info import SellerInfoResponse
+    from .v1__analytics_stocks import AnalyticsStocksResponse, AnalyticsStocksRequest, AnalyticsStocksItem
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".v1__seller_info": ("SellerInfoResponse",),
+    ".v1__analytics_stocks": ("AnalyticsStocksResponse", "AnalyticsStocksRequest", "AnalyticsStocksItem"),
+})
@@ -1,7 +1,8 @@
 """https://docs.ozon.com/api/seller/#operation/AnalyticsAPI_AnalyticsStocks"""
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ...common.enumerations.products import TurnoverGrade, ItemTag
 
 
@@ -2,8 +2,9 @@
 import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ...common.enumerations.company import TaxSystem, RatingStatus, RatingValueType, SubscriptionType
 from ...common.enumerations.localization import CurrencyCode
 
@@ -1,3 +1,7 @@
+from typing import TYPE_CHECKING
+
+from ....common.lazy import lazy_exports
+
 __all__ = [
     "AdditionalData",
     "ResponseCursor",
@@ -9,6 +13,13 @@ __all__ = [
     "RequestOffset",
 ]
 
-from .requests import RequestLastId, RequestLimit1000, RequestOffset, RequestCursor
-from .responses import ResponseCursor, ResponseHasNext, ResponseLastId
-from .additional_data import AdditionalData
\ No newline at end of file
+if TYPE_CHECKING:
+    from .requests import RequestLastId, RequestLimit1000, RequestOffset, RequestCursor
+    from .responses import ResponseCursor, ResponseHasNext, ResponseLastId
+    from .additional_data import AdditionalData
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".requests": ("RequestLastId", "RequestLimit1000", "RequestOffset", "RequestCursor"),
+    ".responses": ("ResponseCursor", "ResponseHasNext", "ResponseLastId"),
+    ".additional_data": ("AdditionalData",),
+})
@@ -1,6 +1,8 @@
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from ....common.schema import BaseModel
 
 
 class ResponseCursor(BaseModel):
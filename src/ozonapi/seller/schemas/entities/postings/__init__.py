@@ -1,3 +1,7 @@
+from typing import TYPE_CHECKING
+
+from ....common.lazy import lazy_exports
+
 __all__ = [
     "Posting",
     "PostingAddressee",
@@ -15,15 +19,31 @@ __all__ = [
     "PostingRequest"
 ]
 
-from .addressee import PostingAddressee
-from .analytics_data import PostingAnalyticsData
-from .cancel_reason import PostingCancelReason, PostingCancelReasonListItem
-from .delivery_method import PostingDeliveryMethod
-from .filter_with import PostingFilterWith
-from .financial_data import PostingFinancialData
-from .financial_data_product import PostingFinancialDataProduct
-from .legal_info import PostingLegalInfo
-from .posting import Posting
-from .product import PostingProductWithCurrencyCode, PostingProduct
-from .request import PostingRequest
-from .filter import PostingFilter
\ No newline at end of file
+if TYPE_CHECKING:
+    from .addressee import PostingAddressee
+    from .analytics_data import PostingAnalyticsData
+    from .cancel_reason import PostingCancelReason, PostingCancelReasonListItem
+    from .delivery_method import PostingDeliveryMethod
+    from .filter_with import PostingFilterWith
+    from .financial_data import PostingFinancialData
+    from .financial_data_product import PostingFinancialDataProduct
+    from .legal_info import PostingLegalInfo
+    from .posting import Posting
+    from .product import PostingProductWithCurrencyCode, PostingProduct
+    from .request import PostingRequest
+    from .filter import PostingFilter
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".addressee": ("PostingAddressee",),
+    ".analytics_data": ("PostingAnalyticsData",),
+    ".cancel_reason": ("PostingCancelReason", "PostingCancelReasonListItem"),
+    ".delivery_method": ("PostingDeliveryMethod",),
+    ".filter_with": ("PostingFilterWith",),
+    ".financial_data": ("PostingFinancialData",),
+    ".financial_data_product": ("PostingFinancialDataProduct",),
+    ".legal_info": ("PostingLegalInfo",),
+    ".posting": ("Posting",),
+    ".product": ("PostingProductWithCurrencyCode", "PostingProduct"),
+    ".request": ("PostingRequest",),
+    ".filter": ("PostingFilter",),
+})
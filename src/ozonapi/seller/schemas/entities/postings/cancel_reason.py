@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ....common.schema import BaseModel
 from ....common.enumerations.postings import CancellationReasonTypeId
 
 
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from ....common.schema import BaseModel
 
 
 class PostingDeliveryMethod(BaseModel):
@@ -1,8 +1,9 @@
 import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ....common.schema import BaseModel
 from ...mixins import DateTimeSerializationMixin
 from ....common.enumerations.postings import PostingStatus
 
@@ -1,7 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ....common.schema import BaseModel
 from .financial_data_product import PostingFinancialDataProduct
 
 
@@ -1,8 +1,9 @@
 import datetime
 from typing import Optional
 
-from pydantic import Field, BaseModel
+from pydantic import Field
 
+from ....common.schema import BaseModel
 from .product import PostingProduct
 from .analytics_data import PostingAnalyticsData
 from ....common.enumerations.postings import PostingStatus, PostingSubstatus
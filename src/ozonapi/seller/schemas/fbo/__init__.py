@@ -1,6 +1,10 @@
 """Описывает модели методов раздела Доставка FBO.
 https://docs.ozon.com/api/seller/?#tag/FBO
 """
+from typing import TYPE_CHECKING
+
+from ...common.lazy import lazy_exports
+
 __all__ = [
     "PostingFilter",
     "PostingFilterWith",
@@ -11,7 +15,15 @@ __all__ = [
     "PostingFBOListResponse",
 ]
 
-from .v1__posting_fbo_cancel_reason_list import PostingFBOCancelReasonListResponse
-from .v2__posting_fbo_get import PostingFBOGetRequest, PostingFBOGetResponse
-from .v2__posting_fbo_list import PostingFBOListRequest, PostingFBOListResponse
-from ..entities.postings import PostingFilter, PostingFilterWith
+if TYPE_CHECKING:
+    from .v1__posting_fbo_cancel_reason_list import PostingFBOCancelReasonListResponse
+    from .v2__posting_fbo_get import PostingFBOGetRequest, PostingFBOGetResponse
+    from .v2__posting_fbo_list import PostingFBOListRequest, PostingFBOListResponse
+    from ..entities.postings import PostingFilter, PostingFilterWith
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".v1__posting_fbo_cancel_reason_list": ("PostingFBOCancelReasonListResponse",),
+    ".v2__posting_fbo_get": ("PostingFBOGetRequest", "PostingFBOGetResponse"),
+    ".v2__posting_fbo_list": ("PostingFBOListRequest", "PostingFBOListResponse"),
+    "..entities.postings": ("PostingFilter", "PostingFilterWith"),
+})
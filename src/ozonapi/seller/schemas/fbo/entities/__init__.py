@@ -1,9 +1,20 @@
+from typing import TYPE_CHECKING
+
+from ....common.lazy import lazy_exports
+
 __all__ = [
     "PostingFBOAnalyticsData",
     "PostingFBOPosting",
     "PostingFBOProduct"
 ]
 
-from .posting__posting import PostingFBOPosting
-from .posting__product import PostingFBOProduct
-from .posting__analytics_data import PostingFBOAnalyticsData
\ No newline at end of file
+if TYPE_CHECKING:
+    from .posting__posting import PostingFBOPosting
+    from .posting__product import PostingFBOProduct
+    from .posting__analytics_data import PostingFBOAnalyticsData
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".posting__posting": ("PostingFBOPosting",),
+    ".posting__product": ("PostingFBOProduct",),
+    ".posting__analytics_data": ("PostingFBOAnalyticsData",),
+})
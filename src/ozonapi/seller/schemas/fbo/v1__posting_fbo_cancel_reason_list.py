@@ -1,6 +1,7 @@
 """https://docs.ozon.com/api/seller/?#operation/PostingAPI_GetPostingFboCancelReasonList"""
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ..entities.postings import PostingCancelReasonListItem
 
 
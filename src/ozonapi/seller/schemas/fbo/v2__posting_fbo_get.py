@@ -1,8 +1,9 @@
 """https://docs.ozon.com/api/seller/?#operation/PostingAPI_GetFboPosting"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from .entities import PostingFBOPosting
 from ..entities.postings import PostingFilterWith
 
@@ -1,8 +1,9 @@
 """https://docs.ozon.com/api/seller/?#operation/PostingAPI_GetFboPostingList"""
 from typing import Optional
 
-from pydantic import Field, BaseModel
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from .entities.posting__posting import PostingFBOPosting
 from ..entities.postings import PostingRequest
 
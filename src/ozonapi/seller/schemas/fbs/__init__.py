@@ -1,6 +1,10 @@
 """Описывает модели методов раздела Обработка заказов FBS и rFBS.
 https://docs.ozon.ru/api/seller/?__rr=1#tag/FBS
 """
+from typing import TYPE_CHECKING
+
+from ...common.lazy import lazy_exports
+
 __all__ = [
     "PostingFBSAddressee",
     "PostingFBSAnalyticsData",
@@ -60,40 +64,89 @@ __all__ = [
     "PostingFBSUnfulfilledListResult",
 ]
 
-from .entities import PostingFBSAddressee, PostingFBSAnalyticsData, PostingFBSBarcodes, PostingFBSCancellation, \
-    PostingFBSCustomer, PostingFBSCustomerAddress, PostingFBSDeliveryMethod, PostingFBSOptional, PostingFBSPosting, \
-    PostingFBSProductDetailed, \
-    PostingFBSRequirements, PostingFBSTariffication, PostingFBSFilterWith
-from ..entities.postings.legal_info import PostingLegalInfo
-from ..entities.postings.product import PostingProduct
-from ..entities.postings.financial_data import PostingFinancialData
-from ..entities.postings.financial_data_product import PostingFinancialDataProduct
-from .v1__posting_fbs_cancel_reason import PostingFBSCancelReasonResponse, PostingFBSCancelReasonRequest
-from .v1__posting_fbs_package_label_get import PostingFBSPackageLabelGetResponse, PostingFBSPackageLabelGetRequest
-from .v1__posting_fbs_restrictions import PostingFBSRestrictionsResponse, PostingFBSRestrictionsRequest
-from .v2__posting_fbs_arbitration import PostingFBSArbitrationRequest, PostingFBSArbitrationResponse
-from .v2__posting_fbs_awaiting_delivery import PostingFBSAwaitingDeliveryResponse, PostingFBSAwaitingDeliveryRequest
-from .v2__posting_fbs_cancel import PostingFBSCancelRequest, PostingFBSCancelResponse
-from .v2__posting_fbs_cancel_reason_list import PostingFBSCancelReasonListResponse
-from .v2__posting_fbs_get_by_barcode import PostingFBSGetByBarcodeRequest, PostingFBSGetByBarcodeResponse
-from .v2__posting_fbs_package_label import PostingFBSPackageLabelResponse, PostingFBSPackageLabelRequest
-from .v2__posting_fbs_package_label_create import PostingFBSPackageLabelCreateResponse, \
-    PostingFBSPackageLabelCreateRequest
-from .v2__posting_fbs_product_cancel import PostingFBSProductCancelRequest, PostingFBSProductCancelResponse, \
-    PostingFBSProductCancelItem
-from .v2__posting_fbs_product_change import PostingFBSProductChangeRequestItem, PostingFBSProductChangeRequest, \
-    PostingFBSProductChangeResponse
-from .v2__posting_fbs_product_country_list import PostingFBSProductCountryListResponse, \
-    PostingFBSProductCountryListRequest
-from .v2__posting_fbs_product_country_set import PostingFBSProductCountrySetResponse, PostingFBSProductCountrySetRequest
-from .v3__posting_fbs_get import PostingFBSGetRequest, PostingFBSGetResponse
-from .v3__posting_fbs_list import PostingFBSListRequestFilterLastChangedStatusDate, \
-    PostingFBSListFilter, PostingFBSListRequest, PostingFBSListResult, PostingFBSListResponse
-from .v3__posting_multiboxqty_set import PostingFBSMultiBoxQtySetResponse, PostingFBSMultiBoxQtySetRequest
-from .v3__posting_fbs_unfulfilled_list import (
-    PostingFBSUnfulfilledListRequest,
-    PostingFBSUnfulfilledListResponse,
-    PostingFBSUnfulfilledListRequestFilterLastChangedStatusDate,
-    PostingFBSUnfulfilledListFilter,
-    PostingFBSUnfulfilledListResult,
-)
\ No newline at end of file
+if TYPE_CHECKING:
+    from .entities import PostingFBSAddressee, PostingFBSAnalyticsData, PostingFBSBarcodes, PostingFBSCancellation, \
+        PostingFBSCustomer, PostingFBSCustomerAddress, PostingFBSDeliveryMethod, PostingFBSOptional, PostingFBSPosting, \
+        PostingFBSProductDetailed, \
+        PostingFBSRequirements, PostingFBSTariffication, PostingFBSFilterWith
+    from ..entities.postings.legal_info import PostingLegalInfo
+    from ..entities.postings.product import PostingProduct
+    from ..entities.postings.financial_data import PostingFinancialData
+    from ..entities.postings.financial_data_product import PostingFinancialDataProduct
+    from .v1__posting_fbs_cancel_reason import PostingFBSCancelReasonResponse, PostingFBSCancelReasonRequest
+    from .v1__posting_fbs_package_label_get import PostingFBSPackageLabelGetResponse, PostingFBSPackageLabelGetRequest
+    from .v1__posting_fbs_restrictions import PostingFBSRestrictionsResponse, PostingFBSRestrictionsRequest
+    from .v2__posting_fbs_arbitration import PostingFBSArbitrationRequest, PostingFBSArbitrationResponse
+    from .v2__posting_fbs_awaiting_delivery import PostingFBSAwaitingDeliveryResponse, PostingFBSAwaitingDeliveryRequest
+    from .v2__posting_fbs_cancel import PostingFBSCancelRequest, PostingFBSCancelResponse
+    from .v2__posting_fbs_cancel_reason_list import PostingFBSCancelReasonListResponse
+    from .v2__posting_fbs_get_by_barcode import PostingFBSGetByBarcodeRequest, PostingFBSGetByBarcodeResponse
+    from .v2__posting_fbs_package_label import PostingFBSPackageLabelResponse, PostingFBSPackageLabelRequest
+    from .v2__posting_fbs_package_label_create import PostingFBSPackageLabelCreateResponse, \
+        PostingFBSPackageLabelCreateRequest
+    from .v2__posting_fbs_product_cancel import PostingFBSProductCancelRequest, PostingFBSProductCancelResponse, \
+        PostingFBSProductCancelItem
+    from .v2__posting_fbs_product_change import PostingFBSProductChangeRequestItem, PostingFBSProductChangeRequest, \
+        PostingFBSProductChangeResponse
+    from .v2__posting_fbs_product_country_list import PostingFBSProductCountryListResponse, \
+        PostingFBSProductCountryListRequest
+    from .v2__posting_fbs_product_country_set import PostingFBSProductCountrySetResponse, PostingFBSProductCountrySetRequest
+    from .v3__posting_fbs_get import PostingFBSGetRequest, PostingFBSGetResponse
+    from .v3__posting_fbs_list import PostingFBSListRequestFilterLastChangedStatusDate, \
+        PostingFBSListFilter, PostingFBSListRequest, PostingFBSListResult, PostingFBSListResponse
+    from .v3__posting_multiboxqty_set import PostingFBSMultiBoxQtySetResponse, PostingFBSMultiBoxQtySetRequest
+    from .v3__posting_fbs_unfulfilled_list import (
+        PostingFBSUnfulfilledListRequest,
+        PostingFBSUnfulfilledListResponse,
+        PostingFBSUnfulfilledListRequestFilterLastChangedStatusDate,
+        PostingFBSUnfulfilledListFilter,
+        PostingFBSUnfulfilledListResult,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".entities": (
+        "PostingFBSAddressee", "PostingFBSAnalyticsData", "PostingFBSBarcodes", "PostingFBSCancellation",
+        "PostingFBSCustomer", "PostingFBSCustomerAddress", "PostingFBSDeliveryMethod", "PostingFBSOptional",
+        "PostingFBSPosting", "PostingFBSProductDetailed", "PostingFBSRequirements", "PostingFBSTariffication",
+        "PostingFBSFilterWith",
+    ),
+    "..entities.postings.legal_info": ("PostingLegalInfo",),
+    "..entities.postings.product": ("PostingProduct",),
+    "..entities.postings.financial_data": ("PostingFinancialData",),
+    "..entities.postings.financial_data_product": ("PostingFinancialDataProduct",),
+    ".v1__posting_fbs_cancel_reason": ("PostingFBSCancelReasonResponse", "PostingFBSCancelReasonRequest"),
+    ".v1__posting_fbs_package_label_get": ("PostingFBSPackageLabelGetResponse", "PostingFBSPackageLabelGetRequest"),
+    ".v1__posting_fbs_restrictions": ("PostingFBSRestrictionsResponse", "PostingFBSRestrictionsRequest"),
+    ".v2__posting_fbs_arbitration": ("PostingFBSArbitrationRequest", "PostingFBSArbitrationResponse"),
+    ".v2__posting_fbs_awaiting_delivery": ("PostingFBSAwaitingDeliveryResponse", "PostingFBSAwaitingDeliveryRequest"),
+    ".v2__posting_fbs_cancel": ("PostingFBSCancelRequest", "PostingFBSCancelResponse"),
+    ".v2__posting_fbs_cancel_reason_list": ("PostingFBSCancelReasonListResponse",),
+    ".v2__posting_fbs_get_by_barcode": ("PostingFBSGetByBarcodeRequest", "PostingFBSGetByBarcodeResponse"),
+    ".v2__posting_fbs_package_label": ("PostingFBSPackageLabelResponse", "PostingFBSPackageLabelRequest"),
+    ".v2__posting_fbs_package_label_create": (
+        "PostingFBSPackageLabelCreateResponse", "PostingFBSPackageLabelCreateRequest",
+    ),
+    ".v2__posting_fbs_product_cancel": (
+        "PostingFBSProductCancelRequest", "PostingFBSProductCancelResponse", "PostingFBSProductCancelItem",
+    ),
+    ".v2__posting_fbs_product_change": (
+        "PostingFBSProductChangeRequestItem", "PostingFBSProductChangeRequest", "PostingFBSProductChangeResponse",
+    ),
+    ".v2__posting_fbs_product_country_list": (
+        "PostingFBSProductCountryListResponse", "PostingFBSProductCountryListRequest",
+    ),
+    ".v2__posting_fbs_product_country_set": (
+        "PostingFBSProductCountrySetResponse", "PostingFBSProductCountrySetRequest",
+    ),
+    ".v3__posting_fbs_get": ("PostingFBSGetRequest", "PostingFBSGetResponse"),
+    ".v3__posting_fbs_list": (
+        "PostingFBSListRequestFilterLastChangedStatusDate", "PostingFBSListFilter", "PostingFBSListRequest",
+        "PostingFBSListResult", "PostingFBSListResponse",
+    ),
+    ".v3__posting_multiboxqty_set": ("PostingFBSMultiBoxQtySetResponse", "PostingFBSMultiBoxQtySetRequest"),
+    ".v3__posting_fbs_unfulfilled_list": (
+        "PostingFBSUnfulfilledListRequest", "PostingFBSUnfulfilledListResponse",
+        "PostingFBSUnfulfilledListRequestFilterLastChangedStatusDate", "PostingFBSUnfulfilledListFilter",
+        "PostingFBSUnfulfilledListResult",
+    ),
+})
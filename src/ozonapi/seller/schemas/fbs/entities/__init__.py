@@ -1,3 +1,7 @@
+from typing import TYPE_CHECKING
+
+from ....common.lazy import lazy_exports
+
 __all__ = [
     "PostingFBSAddressee",
     "PostingFBSAnalyticsData",
@@ -14,21 +18,43 @@ __all__ = [
     "PostingFBSFilterWith",
 ]
 
-from .posting__analytics_data import PostingFBSAnalyticsData
-from .posting__barcodes import PostingFBSBarcodes
-from ...entities.postings.cancel_reason import PostingCancelReason
-from .posting__cancellation import PostingFBSCancellation
-from .posting__customer import PostingFBSCustomer
-from .posting__customer_address import PostingFBSCustomerAddress
-from .posting__delivery_method import PostingFBSDeliveryMethod
-from .posting__filter_with import PostingFBSFilterWith
-from ...entities.postings.financial_data import PostingFinancialData
-from ...entities.postings.financial_data_product import PostingFinancialDataProduct
-from ...entities.postings.legal_info import PostingLegalInfo
-from .posting__optional import PostingFBSOptional
-from .posting__posting import PostingFBSPosting
-from .posting__product import PostingFBSProductDetailed
-from ...entities.postings.product import PostingProduct, PostingProductWithCurrencyCode
-from .posting__requirements import PostingFBSRequirements
-from .posting__tariffication import PostingFBSTariffication
-from .posting__addressee import PostingFBSAddressee
\ No newline at end of file
+if TYPE_CHECKING:
+    from .posting__analytics_data import PostingFBSAnalyticsData
+    from .posting__barcodes import PostingFBSBarcodes
+    from ...entities.postings.cancel_reason import PostingCancelReason
+    from .posting__cancellation import PostingFBSCancellation
+    from .posting__customer import PostingFBSCustomer
+    from .posting__customer_address import PostingFBSCustomerAddress
+    from .posting__delivery_method import PostingFBSDeliveryMethod
+    from .posting__filter_with import PostingFBSFilterWith
+    from ...entities.postings.financial_data import PostingFinancialData
+    from ...entities.postings.financial_data_product import PostingFinancialDataProduct
+    from ...entities.postings.legal_info import PostingLegalInfo
+    from .posting__optional import PostingFBSOptional
+    from .posting__posting import PostingFBSPosting
+    from .posting__product import PostingFBSProductDetailed
+    from ...entities.postings.product import PostingProduct, PostingProductWithCurrencyCode
+    from .posting__requirements import PostingFBSRequirements
+    from .posting__tariffication import PostingFBSTariffication
+    from .posting__addressee import PostingFBSAddressee
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".posting__analytics_data": ("PostingFBSAnalyticsData",),
+    ".posting__barcodes": ("PostingFBSBarcodes",),
+    "...entities.postings.cancel_reason": ("PostingCancelReason",),
+    ".posting__cancellation": ("PostingFBSCancellation",),
+    ".posting__customer": ("PostingFBSCustomer",),
+    ".posting__customer_address": ("PostingFBSCustomerAddress",),
+    ".posting__delivery_method": ("PostingFBSDeliveryMethod",),
+    ".posting__filter_with": ("PostingFBSFilterWith",),
+    "...entities.postings.financial_data": ("PostingFinancialData",),
+    "...entities.postings.financial_data_product": ("PostingFinancialDataProduct",),
+    "...entities.postings.legal_info": ("PostingLegalInfo",),
+    ".posting__optional": ("PostingFBSOptional",),
+    ".posting__posting": ("PostingFBSPosting",),
+    ".posting__product": ("PostingFBSProductDetailed",),
+    "...entities.postings.product": ("PostingProduct", "PostingProductWithCurrencyCode"),
+    ".posting__requirements": ("PostingFBSRequirements",),
+    ".posting__tariffication": ("PostingFBSTariffication",),
+    ".posting__addressee": ("PostingFBSAddressee",),
+})
@@ -1,4 +1,6 @@
-from pydantic import Field, BaseModel
+from pydantic import Field
+
+from ....common.schema import BaseModel
 
 
 class PostingFBSRequirements(BaseModel):
@@ -1,7 +1,9 @@
 import datetime
 from typing import Optional
 
-from pydantic import Field, BaseModel
+from pydantic import Field
+
+from ....common.schema import BaseModel
 
 
 class PostingFBSTariffication(BaseModel):
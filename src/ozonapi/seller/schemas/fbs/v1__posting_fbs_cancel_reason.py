@@ -1,8 +1,9 @@
 """https://docs.ozon.ru/api/seller/#operation/PostingAPI_GetPostingFbsCancelReasonV1"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ..entities.postings import PostingCancelReason
 
 
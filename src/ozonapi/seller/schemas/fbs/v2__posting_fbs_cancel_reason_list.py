@@ -1,6 +1,7 @@
 """https://docs.ozon.ru/api/seller/?#operation/PostingAPI_GetPostingFbsCancelReasonList"""
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ..entities.postings.cancel_reason import PostingCancelReasonListItem
 
 
@@ -1,7 +1,9 @@
 """https://docs.ozon.ru/api/seller/?__rr=1#operation/PostingAPI_ListCountryProductFbsPostingV2"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from ...common.schema import BaseModel
 
 
 class PostingFBSProductCountryListRequest(BaseModel):
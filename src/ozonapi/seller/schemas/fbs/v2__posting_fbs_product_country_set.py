@@ -1,5 +1,7 @@
 """https://docs.ozon.ru/api/seller/?#operation/PostingAPI_SetCountryProductFbsPostingV2"""
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from ...common.schema import BaseModel
 
 
 class PostingFBSProductCountrySetRequest(BaseModel):
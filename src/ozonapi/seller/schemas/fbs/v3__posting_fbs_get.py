@@ -1,8 +1,9 @@
 """https://docs.ozon.ru/api/seller/#operation/PostingAPI_GetFbsPostingV3"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from . import PostingFBSPosting
 from .entities import PostingFBSFilterWith
 from ...common.enumerations.localization import CurrencyCode
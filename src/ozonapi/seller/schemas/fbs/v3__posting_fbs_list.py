@@ -2,8 +2,9 @@
 import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from .entities import PostingFBSFilterWith
 from .entities.posting__posting import PostingFBSPosting
 from ..entities.postings import PostingFilter, PostingRequest
@@ -2,8 +2,9 @@
 import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import Field, model_validator
 
+from ...common.schema import BaseModel
 from .entities import PostingFBSFilterWith
 from .entities.posting__posting import PostingFBSPosting
 from ..mixins import DateTimeSerializationMixin
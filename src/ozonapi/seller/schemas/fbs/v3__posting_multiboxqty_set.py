@@ -1,5 +1,7 @@
 """https://docs.ozon.com/api/seller/?__rr=1#operation/PostingAPI_PostingMultiBoxQtySetV3"""
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from ...common.schema import BaseModel
 
 
 class PostingFBSMultiBoxQtySetRequest(BaseModel):
@@ -1,6 +1,10 @@
 """Описывает модели методов раздела Управление кодами маркировки и сборкой заказов для FBS/rFBS и rFBS.
 https://docs.ozon.com/api/seller/?__rr=1#tag/FBSandrFBSMarks
 """
+from typing import TYPE_CHECKING
+
+from ...common.lazy import lazy_exports
+
 __all__ = [
     "FBSPostingProductExemplarSetExemplar",
     "FBSPostingProductExemplarSetProduct",
@@ -29,19 +33,48 @@ __all__ = [
     "ProductExemplarMark",
 ]
 
-from .entities import ProductExemplar, ProductExemplarMark, PostingProduct, ProductExemplarBase
-from .v1__fbs_posting_product_exemplar_update import FBSPostingProductExemplarUpdateResponse, \
-    FBSPostingProductExemplarUpdateRequest
-from .v4__posting_fbs_ship import PostingFBSShipResponse, PostingFBSShipRequest, PostingFBSShipRequestWith, \
-    PostingFBSShipProducts, PostingFBSShipProduct
-from .v4__posting_fbs_ship_package import PostingFBSShipPackageProduct, PostingFBSShipPackageRequest, \
-    PostingFBSShipPackageResponse
-from .v5__fbs_posting_product_exemplar_status import FBSPostingProductExemplarStatusResponse, \
-    FBSPostingProductExemplarStatusRequest
-from .v5__fbs_posting_product_exemplar_validate import FBSPostingProductExemplarValidateResponse, \
-    FBSPostingProductExemplarValidateRequest, FBSPostingProductExemplarValidateProduct
-from .v6__fbs_posting_product_exemplar_create_or_get import FBSPostingProductExemplarCreateOrGetResponse, \
-    FBSPostingProductExemplarCreateOrGetRequest
-from .v6__fbs_posting_product_exemplar_set import \
-    FBSPostingProductExemplarSetExemplar, FBSPostingProductExemplarSetProduct, \
-    FBSPostingProductExemplarSetRequest, FBSPostingProductExemplarSetResponse
+if TYPE_CHECKING:
+    from .entities import ProductExemplar, ProductExemplarMark, PostingProduct, ProductExemplarBase
+    from .v1__fbs_posting_product_exemplar_update import FBSPostingProductExemplarUpdateResponse, \
+        FBSPostingProductExemplarUpdateRequest
+    from .v4__posting_fbs_ship import PostingFBSShipResponse, PostingFBSShipRequest, PostingFBSShipRequestWith, \
+        PostingFBSShipProducts, PostingFBSShipProduct
+    from .v4__posting_fbs_ship_package import PostingFBSShipPackageProduct, PostingFBSShipPackageRequest, \
+        PostingFBSShipPackageResponse
+    from .v5__fbs_posting_product_exemplar_status import FBSPostingProductExemplarStatusResponse, \
+        FBSPostingProductExemplarStatusRequest
+    from .v5__fbs_posting_product_exemplar_validate import FBSPostingProductExemplarValidateResponse, \
+        FBSPostingProductExemplarValidateRequest, FBSPostingProductExemplarValidateProduct
+    from .v6__fbs_posting_product_exemplar_create_or_get import FBSPostingProductExemplarCreateOrGetResponse, \
+        FBSPostingProductExemplarCreateOrGetRequest
+    from .v6__fbs_posting_product_exemplar_set import \
+        FBSPostingProductExemplarSetExemplar, FBSPostingProductExemplarSetProduct, \
+        FBSPostingProductExemplarSetRequest, FBSPostingProductExemplarSetResponse
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".entities": ("ProductExemplar", "ProductExemplarMark", "PostingProduct", "ProductExemplarBase"),
+    ".v1__fbs_posting_product_exemplar_update": (
+        "FBSPostingProductExemplarUpdateResponse", "FBSPostingProductExemplarUpdateRequest",
+    ),
+    ".v4__posting_fbs_ship": (
+        "PostingFBSShipResponse", "PostingFBSShipRequest", "PostingFBSShipRequestWith", "PostingFBSShipProducts",
+        "PostingFBSShipProduct",
+    ),
+    ".v4__posting_fbs_ship_package": (
+        "PostingFBSShipPackageProduct", "PostingFBSShipPackageRequest", "PostingFBSShipPackageResponse",
+    ),
+    ".v5__fbs_posting_product_exemplar_status": (
+        "FBSPostingProductExemplarStatusResponse", "FBSPostingProductExemplarStatusRequest",
+    ),
+    ".v5__fbs_posting_product_exemplar_validate": (
+        "FBSPostingProductExemplarValidateResponse", "FBSPostingProductExemplarValidateRequest",
+        "FBSPostingProductExemplarValidateProduct",
+    ),
+    ".v6__fbs_posting_product_exemplar_create_or_get": (
+        "FBSPostingProductExemplarCreateOrGetResponse", "FBSPostingProductExemplarCreateOrGetRequest",
+    ),
+    ".v6__fbs_posting_product_exemplar_set": (
+        "FBSPostingProductExemplarSetExemplar", "FBSPostingProductExemplarSetProduct",
+        "FBSPostingProductExemplarSetRequest", "FBSPostingProductExemplarSetResponse",
+    ),
+})
@@ -1,3 +1,7 @@
+from typing import TYPE_CHECKING
+
+from ....common.lazy import lazy_exports
+
 __all__ = [
     "ProductExemplar",
     "ProductExemplarBase",
@@ -7,7 +11,13 @@ __all__ = [
     "PostingProduct"
 ]
 
-from .posting__mark import ProductExemplarMark, ProductExemplarMarkChecked
+if TYPE_CHECKING:
+    from .posting__mark import ProductExemplarMark, ProductExemplarMarkChecked
+    from .posting__product import PostingProduct
+    from .posting__exemplar import ProductExemplar, ProductExemplarChecked, ProductExemplarBase
 
-from .posting__product import PostingProduct
-from .posting__exemplar import ProductExemplar, ProductExemplarChecked, ProductExemplarBase
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".posting__mark": ("ProductExemplarMark", "ProductExemplarMarkChecked"),
+    ".posting__product": ("PostingProduct",),
+    ".posting__exemplar": ("ProductExemplar", "ProductExemplarChecked", "ProductExemplarBase"),
+})
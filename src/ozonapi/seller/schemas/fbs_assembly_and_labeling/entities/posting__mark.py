@@ -1,7 +1,8 @@
 from typing import Optional
 
-from pydantic import Field, BaseModel
+from pydantic import Field
 
+from ....common.schema import BaseModel
 from ....common.enumerations.postings import MarkType
 
 
@@ -1,5 +1,7 @@
 """https://docs.ozon.com/api/seller/?#operation/PostingAPI_FbsPostingProductExemplarUpdate"""
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from ...common.schema import BaseModel
 
 
 class FBSPostingProductExemplarUpdateRequest(BaseModel):
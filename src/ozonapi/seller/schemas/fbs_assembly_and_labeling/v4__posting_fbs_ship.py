@@ -1,8 +1,9 @@
 """https://docs.ozon.com/api/seller/?#operation/PostingAPI_ShipFbsPostingV4"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ..entities.postings.product import PostingProductWithCurrencyCode
 
 
@@ -1,7 +1,9 @@
 """https://docs.ozon.com/api/seller/?#operation/PostingAPI_ShipFbsPostingPackage"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from ...common.schema import BaseModel
 
 
 class PostingFBSShipPackageProduct(BaseModel):
@@ -1,8 +1,9 @@
 """https://docs.ozon.com/api/seller/?__rr=1#operation/PostingAPI_FbsPostingProductExemplarStatusV5"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ...common.enumerations.postings import PostingShipmentStatus
 from .entities import ProductExemplarChecked
 
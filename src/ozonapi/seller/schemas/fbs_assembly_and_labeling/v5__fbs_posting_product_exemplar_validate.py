@@ -1,8 +1,9 @@
 """https://docs.ozon.ru/api/seller/#operation/PostingAPI_FbsPostingProductExemplarValidateV5"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from .entities import ProductExemplarBase, ProductExemplarMark
 
 
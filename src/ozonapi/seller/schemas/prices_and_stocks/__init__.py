@@ -1,6 +1,10 @@
 """Описывает модели методов раздела Цены и остатки товаров.
 https://docs.ozon.ru/api/seller/#tag/PricesandStocksAPI
 """
+from typing import TYPE_CHECKING
+
+from ...common.lazy import lazy_exports
+
 __all__ = [
     "ProductImportPricesRequest",
     "ProductImportPricesResponse",
@@ -33,42 +37,68 @@ __all__ = [
     "ProductsStocksResultItem",
 ]
 
-from .v1__product_import_prices import (
-    ProductImportPricesRequest,
-    ProductImportPricesResponse,
-    ProductImportPricesItem,
-    ProductImportPricesError,
-    ProductImportPricesResultItem,
-)
-from .v1__product_info_stocks_by_warehouse_fbs import (
-    ProductInfoStocksByWarehouseFBSRequest,
-    ProductInfoStocksByWarehouseFBSResponse,
-    ProductInfoStocksByWarehouseFBSItem,
-)
-from .v2__products_stocks import (
-    ProductsStocksRequest,
-    ProductsStocksResponse,
-    ProductsStocksItem,
-    ProductsStocksError,
-    ProductsStocksResultItem,
-)
-from .v4__product_info_stocks import (
-    ProductInfoStocksRequest,
-    ProductInfoStocksResponse,
-    ProductInfoPricesRequestFilterWithQuant,
-    ProductInfoStocksFilter,
-    ProductInfoStocksStock,
-    ProductInfoStocksItem,
-)
-from .v5__product_info_prices import (
-    ProductInfoPricesRequest,
-    ProductInfoPricesResponse,
-    ProductInfoPricesFilter,
-    ProductInfoPricesCommissions,
-    ProductInfoPricesAction,
-    ProductInfoPricesMarketingActions,
-    ProductInfoPricesPrice,
-    ProductInfoPricesIndexData,
-    ProductInfoPricesPriceIndexes,
-    ProductInfoPricesItem,
-)
\ No newline at end of file
+if TYPE_CHECKING:
+    from .v1__product_import_prices import (
+        ProductImportPricesRequest,
+        ProductImportPricesResponse,
+        ProductImportPricesItem,
+        ProductImportPricesError,
+        ProductImportPricesResultItem,
+    )
+    from .v1__product_info_stocks_by_warehouse_fbs import (
+        ProductInfoStocksByWarehouseFBSRequest,
+        ProductInfoStocksByWarehouseFBSResponse,
+        ProductInfoStocksByWarehouseFBSItem,
+    )
+    from .v2__products_stocks import (
+        ProductsStocksRequest,
+        ProductsStocksResponse,
+        ProductsStocksItem,
+        ProductsStocksError,
+        ProductsStocksResultItem,
+    )
+    from .v4__product_info_stocks import (
+        ProductInfoStocksRequest,
+        ProductInfoStocksResponse,
+        ProductInfoPricesRequestFilterWithQuant,
+        ProductInfoStocksFilter,
+        ProductInfoStocksStock,
+        ProductInfoStocksItem,
+    )
+    from .v5__product_info_prices import (
+        ProductInfoPricesRequest,
+        ProductInfoPricesResponse,
+        ProductInfoPricesFilter,
+        ProductInfoPricesCommissions,
+        ProductInfoPricesAction,
+        ProductInfoPricesMarketingActions,
+        ProductInfoPricesPrice,
+        ProductInfoPricesIndexData,
+        ProductInfoPricesPriceIndexes,
+        ProductInfoPricesItem,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".v1__product_import_prices": (
+        "ProductImportPricesRequest", "ProductImportPricesResponse", "ProductImportPricesItem",
+        "ProductImportPricesError", "ProductImportPricesResultItem",
+    ),
+    ".v1__product_info_stocks_by_warehouse_fbs": (
+        "ProductInfoStocksByWarehouseFBSRequest", "ProductInfoStocksByWarehouseFBSResponse",
+        "ProductInfoStocksByWarehouseFBSItem",
+    ),
+    ".v2__products_stocks": (
+        "ProductsStocksRequest", "ProductsStocksResponse", "ProductsStocksItem", "ProductsStocksError",
+        "ProductsStocksResultItem",
+    ),
+    ".v4__product_info_stocks": (
+        "ProductInfoStocksRequest", "ProductInfoStocksResponse", "ProductInfoPricesRequestFilterWithQuant",
+        "ProductInfoStocksFilter", "ProductInfoStocksStock", "ProductInfoStocksItem",
+    ),
+    ".v5__product_info_prices": (
+        "ProductInfoPricesRequest", "ProductInfoPricesResponse", "ProductInfoPricesFilter",
+        "ProductInfoPricesCommissions", "ProductInfoPricesAction", "ProductInfoPricesMarketingActions",
+        "ProductInfoPricesPrice", "ProductInfoPricesIndexData", "ProductInfoPricesPriceIndexes",
+        "ProductInfoPricesItem",
+    ),
+})
@@ -1,7 +1,8 @@
 """https://docs.ozon.com/api/seller/#operation/ProductAPI_ImportProductsPrices"""
 from typing import Optional
-from pydantic import BaseModel, Field, model_validator
+from pydantic import Field, model_validator
 
+from ...common.schema import BaseModel
 from ...common.enumerations.localization import CurrencyCode
 from ...common.enumerations.prices import PricingStrategy, VAT
 
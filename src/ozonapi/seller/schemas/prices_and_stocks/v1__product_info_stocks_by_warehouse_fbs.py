@@ -1,5 +1,7 @@
 """https://docs.ozon.ru/api/seller/#operation/ProductAPI_ProductStocksByWarehouseFbs"""
-from pydantic import Field, BaseModel
+from pydantic import Field
+
+from ...common.schema import BaseModel
 
 
 class ProductInfoStocksByWarehouseFBSRequest(BaseModel):
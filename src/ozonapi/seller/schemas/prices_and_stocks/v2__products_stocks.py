@@ -1,6 +1,8 @@
 """https://docs.ozon.com/api/seller/#operation/ProductAPI_ProductsStocksV2"""
 from typing import Optional
-from pydantic import BaseModel, Field, model_validator
+from pydantic import Field, model_validator
+
+from ...common.schema import BaseModel
 
 
 class ProductsStocksItem(BaseModel):
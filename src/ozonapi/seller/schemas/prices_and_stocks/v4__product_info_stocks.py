@@ -1,8 +1,9 @@
 """https://docs.ozon.ru/api/seller/#operation/ProductAPI_GetProductInfoStocks"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ...common.enumerations.products import Visibility, ShipmentType
 from .base import BaseRequestFilterSpec, BaseRequestCursorSpec
 from ..entities.common import ResponseCursor
@@ -1,6 +1,10 @@
 """Описывает модели методов раздела Загрузка и обновление товаров.
 https://docs.ozon.ru/api/seller/?__rr=1#tag/ProductAPI
 """
+from typing import TYPE_CHECKING
+
+from ...common.lazy import lazy_exports
+
 __all__ = [
     "ProductArchiveRequest",
     "ProductArchiveResponse",
@@ -84,105 +88,167 @@ __all__ = [
     "ProductUpdateOfferIdError",
 ]
 
-from .v1__product_archive import ProductArchiveRequest, ProductArchiveResponse
-from .v1__product_attributes_update import (
-    ProductAttributesUpdateResponse, 
-    ProductAttributesUpdateRequest,
-    ProductAttributesUpdateItem,
-    ProductAttributesUpdateItemAttribute,
-    ProductAttributesUpdateItemAttributeValue,
-)
-from .v1__product_import_by_sku import (
-    ProductImportBySkuResponse, 
-    ProductImportBySkuRequest,
-    ProductImportBySkuRequestItem,
-)
-from .v1__product_import_info import (
-    ProductImportInfoResponse, 
-    ProductImportInfoRequest,
-    ProductImportInfoResult,
-    ProductImportInfoItem,
-    ProductImportInfoItemError,
-)
-from .v1__product_info_description import ProductInfoDescriptionResponse, ProductInfoDescriptionRequest
-from .v1__product_info_subscription import (
-    ProductInfoSubscriptionResponse, 
-    ProductInfoSubscriptionRequest,
-    ProductInfoSubscriptionItem,
-)
-from .v1__product_pictures_import import ProductPicturesImportResponse, ProductPicturesImportRequest
-from .v1__product_rating_by_sku import (
-    ProductRatingBySkuResponse, 
-    ProductRatingBySkuRequest,
-    ProductRatingBySkuItem,
-    ProductRatingBySkuItemGroup,
-    ProductRatingBySkuItemGroupCondition,
-    ProductRatingBySkuItemGroupImproveAttribute,
-)
-from .v1__product_related_sku_get import (
-    ProductRelatedSkuGetResponse, 
-    ProductRelatedSkuGetRequest,
-    ProductRelatedSkuGetItem,
-    ProductRelatedSkuGetError,
-)
-from .v1__product_unarchive import ProductUnarchiveRequest, ProductUnarchiveResponse
-from .v1__product_update_offer_id import (
-    ProductUpdateOfferIdResponse, 
-    ProductUpdateOfferIdRequest,
-    ProductUpdateOfferIdRequestItem,
-    ProductUpdateOfferIdError,
-)
-from .v2__product_pictures_info import (
-    ProductPicturesInfoResponse, 
-    ProductPicturesInfoRequest,
-    ProductPicturesInfoItem,
-    ProductPicturesInfoError,
-)
-from .v2__products_delete import (
-    ProductsDeleteResponse, 
-    ProductsDeleteRequest,
-    ProductDeleteRequestItem,
-    ProductsDeleteStatusItem,
-)
-from .v3__product_import import (
-    ProductImportResponse, 
-    ProductImportRequest,
-    ProductImportItem,
-    ProductImportResponseResult,
-    ProductImportRequestItemPDFListItem,
-    ProductImportRequestItemPromotion,
-)
-from .v3__product_info_list import (
-    ProductInfoListResponse, 
-    ProductInfoListRequest,
-    ProductInfoListItem,
-    ProductInfoListError,
-    ProductInfoListErrorTexts,
-    ProductInfoListErrorTextsParams,
-    ProductInfoListCommission,
-    ProductInfoListPriceIndexData,
-    ProductInfoListPriceIndexes,
-    ProductInfoListModelInfo,
-    ProductInfoListSource,
-    ProductInfoListStockStatus,
-    ProductInfoListStatuses,
-    ProductInfoListStocks,
-    ProductInfoListVisibilityDetails,
-)
-from .v3__product_list import (
-    ProductListResponse, 
-    ProductListRequest,
-    ProductListFilter,
-    ProductListResponseItem,
-    ProductListResponseResult,
-    ProductListQuants,
-)
-from .v4__product_info_limit import ProductInfoLimitResponse
-from .v4__product_info_attributes import (
-    ProductInfoAttributesResponse, 
-    ProductInfoAttributesRequest,
-    ProductInfoAttributesItem,
-    ProductInfoAttributesFilter,
-    ProductInfoAttributesPdfFile,
-    ProductInfoAttributesModelInfo,
-)
\ No newline at end of file
+if TYPE_CHECKING:
+    from .v1__product_archive import ProductArchiveRequest, ProductArchiveResponse
+    from .v1__product_attributes_update import (
+        ProductAttributesUpdateResponse, 
+        ProductAttributesUpdateRequest,
+        ProductAttributesUpdateItem,
+        ProductAttributesUpdateItemAttribute,
+        ProductAttributesUpdateItemAttributeValue,
+    )
+    from .v1__product_import_by_sku import (
+        ProductImportBySkuResponse, 
+        ProductImportBySkuRequest,
+        ProductImportBySkuRequestItem,
+    )
+    from .v1__product_import_info import (
+        ProductImportInfoResponse, 
+        ProductImportInfoRequest,
+        ProductImportInfoResult,
+        ProductImportInfoItem,
+        ProductImportInfoItemError,
+    )
+    from .v1__product_info_description import ProductInfoDescriptionResponse, ProductInfoDescriptionRequest
+    from .v1__product_info_subscription import (
+        ProductInfoSubscriptionResponse, 
+        ProductInfoSubscriptionRequest,
+        ProductInfoSubscriptionItem,
+    )
+    from .v1__product_pictures_import import ProductPicturesImportResponse, ProductPicturesImportRequest
+    from .v1__product_rating_by_sku import (
+        ProductRatingBySkuResponse, 
+        ProductRatingBySkuRequest,
+        ProductRatingBySkuItem,
+        ProductRatingBySkuItemGroup,
+        ProductRatingBySkuItemGroupCondition,
+        ProductRatingBySkuItemGroupImproveAttribute,
+    )
+    from .v1__product_related_sku_get import (
+        ProductRelatedSkuGetResponse, 
+        ProductRelatedSkuGetRequest,
+        ProductRelatedSkuGetItem,
+        ProductRelatedSkuGetError,
+    )
+    from .v1__product_unarchive import ProductUnarchiveRequest, ProductUnarchiveResponse
+    from .v1__product_update_offer_id import (
+        ProductUpdateOfferIdResponse, 
+        ProductUpdateOfferIdRequest,
+        ProductUpdateOfferIdRequestItem,
+        ProductUpdateOfferIdError,
+    )
+    from .v2__product_pictures_info import (
+        ProductPicturesInfoResponse, 
+        ProductPicturesInfoRequest,
+        ProductPicturesInfoItem,
+        ProductPicturesInfoError,
+    )
+    from .v2__products_delete import (
+        ProductsDeleteResponse, 
+        ProductsDeleteRequest,
+        ProductDeleteRequestItem,
+        ProductsDeleteStatusItem,
+    )
+    from .v3__product_import import (
+        ProductImportResponse, 
+        ProductImportRequest,
+        ProductImportItem,
+        ProductImportResponseResult,
+        ProductImportRequestItemPDFListItem,
+        ProductImportRequestItemPromotion,
+    )
+    from .v3__product_info_list import (
+        ProductInfoListResponse, 
+        ProductInfoListRequest,
+        ProductInfoListItem,
+        ProductInfoListError,
+        ProductInfoListErrorTexts,
+        ProductInfoListErrorTextsParams,
+        ProductInfoListCommission,
+        ProductInfoListPriceIndexData,
+        ProductInfoListPriceIndexes,
+        ProductInfoListModelInfo,
+        ProductInfoListSource,
+        ProductInfoListStockStatus,
+        ProductInfoListStatuses,
+        ProductInfoListStocks,
+        ProductInfoListVisibilityDetails,
+    )
+    from .v3__product_list import (
+        ProductListResponse, 
+        ProductListRequest,
+        ProductListFilter,
+        ProductListResponseItem,
+        ProductListResponseResult,
+        ProductListQuants,
+    )
+    from .v4__product_info_limit import ProductInfoLimitResponse
+    from .v4__product_info_attributes import (
+        ProductInfoAttributesResponse, 
+        ProductInfoAttributesRequest,
+        ProductInfoAttributesItem,
+        ProductInfoAttributesFilter,
+        ProductInfoAttributesPdfFile,
+        ProductInfoAttributesModelInfo,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".v1__product_archive": ("ProductArchiveRequest", "ProductArchiveResponse"),
+    ".v1__product_attributes_update": (
+        "ProductAttributesUpdateResponse", "ProductAttributesUpdateRequest", "ProductAttributesUpdateItem",
+        "ProductAttributesUpdateItemAttribute", "ProductAttributesUpdateItemAttributeValue",
+    ),
+    ".v1__product_import_by_sku": (
+        "ProductImportBySkuResponse", "ProductImportBySkuRequest", "ProductImportBySkuRequestItem",
+    ),
+    ".v1__product_import_info": (
+        "ProductImportInfoResponse", "ProductImportInfoRequest", "ProductImportInfoResult", "ProductImportInfoItem",
+        "ProductImportInfoItemError",
+    ),
+    ".v1__product_info_description": ("ProductInfoDescriptionResponse", "ProductInfoDescriptionRequest"),
+    ".v1__product_info_subscription": (
+        "ProductInfoSubscriptionResponse", "ProductInfoSubscriptionRequest", "ProductInfoSubscriptionItem",
+    ),
+    ".v1__product_pictures_import": ("ProductPicturesImportResponse", "ProductPicturesImportRequest"),
+    ".v1__product_rating_by_sku": (
+        "ProductRatingBySkuResponse", "ProductRatingBySkuRequest", "ProductRatingBySkuItem",
+        "ProductRatingBySkuItemGroup", "ProductRatingBySkuItemGroupCondition",
+        "ProductRatingBySkuItemGroupImproveAttribute",
+    ),
+    ".v1__product_related_sku_get": (
+        "ProductRelatedSkuGetResponse", "ProductRelatedSkuGetRequest", "ProductRelatedSkuGetItem",
+        "ProductRelatedSkuGetError",
+    ),
+    ".v1__product_unarchive": ("ProductUnarchiveRequest", "ProductUnarchiveResponse"),
+    ".v1__product_update_offer_id": (
+        "ProductUpdateOfferIdResponse", "ProductUpdateOfferIdRequest", "ProductUpdateOfferIdRequestItem",
+        "ProductUpdateOfferIdError",
+    ),
+    ".v2__product_pictures_info": (
+        "ProductPicturesInfoResponse", "ProductPicturesInfoRequest", "ProductPicturesInfoItem",
+        "ProductPicturesInfoError",
+    ),
+    ".v2__products_delete": (
+        "ProductsDeleteResponse", "ProductsDeleteRequest", "ProductDeleteRequestItem", "ProductsDeleteStatusItem",
+    ),
+    ".v3__product_import": (
+        "ProductImportResponse", "ProductImportRequest", "ProductImportItem", "ProductImportResponseResult",
+        "ProductImportRequestItemPDFListItem", "ProductImportRequestItemPromotion",
+    ),
+    ".v3__product_info_list": (
+        "ProductInfoListResponse", "ProductInfoListRequest", "ProductInfoListItem", "ProductInfoListError",
+        "ProductInfoListErrorTexts", "ProductInfoListErrorTextsParams", "ProductInfoListCommission",
+        "ProductInfoListPriceIndexData", "ProductInfoListPriceIndexes", "ProductInfoListModelInfo",
+        "ProductInfoListSource", "ProductInfoListStockStatus", "ProductInfoListStatuses", "ProductInfoListStocks",
+        "ProductInfoListVisibilityDetails",
+    ),
+    ".v3__product_list": (
+        "ProductListResponse", "ProductListRequest", "ProductListFilter", "ProductListResponseItem",
+        "ProductListResponseResult", "ProductListQuants",
+    ),
+    ".v4__product_info_limit": ("ProductInfoLimitResponse",),
+    ".v4__product_info_attributes": (
+        "ProductInfoAttributesResponse", "ProductInfoAttributesRequest", "ProductInfoAttributesItem",
+        "ProductInfoAttributesFilter", "ProductInfoAttributesPdfFile", "ProductInfoAttributesModelInfo",
+    ),
+})
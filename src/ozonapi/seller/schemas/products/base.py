@@ -1,7 +1,8 @@
 from typing import Optional, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ...common.enumerations.products import Visibility, DimensionUnit, WeightUnit
 
 
@@ -1,8 +1,9 @@
 """https://docs.ozon.ru/api/seller/#operation/ProductAPI_ImportProductsBySKU"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ...common.enumerations.localization import CurrencyCode
 from ...common.enumerations.prices import VAT
 
@@ -1,6 +1,7 @@
 """https://docs.ozon.ru/api/seller/#operation/ProductAPI_GetImportProductsInfo"""
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ...common.enumerations.products import ProductHandlingStatus
 
 
@@ -1,7 +1,9 @@
 """https://docs.ozon.ru/api/seller/?#operation/ProductAPI_GetProductInfoDescription"""
 from typing import Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import Field, model_validator
+
+from ...common.schema import BaseModel
 
 
 class ProductInfoDescriptionRequest(BaseModel):
@@ -1,5 +1,7 @@
 """https://docs.ozon.ru/api/seller/#operation/ProductAPI_GetProductInfoSubscription"""
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from ...common.schema import BaseModel
 
 
 class ProductInfoSubscriptionRequest(BaseModel):
@@ -1,7 +1,9 @@
 """https://docs.ozon.ru/api/seller/#operation/ProductAPI_ProductInfoPicturesV2"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from ...common.schema import BaseModel
 
 
 class ProductPicturesInfoRequest(BaseModel):
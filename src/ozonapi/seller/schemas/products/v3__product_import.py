@@ -1,8 +1,9 @@
 """https://docs.ozon.ru/api/seller/#operation/ProductAPI_ImportProductsV3"""
 from typing import Optional, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from .base import BaseProductInfo
 from ...common.enumerations.localization import CurrencyCode
 from ...common.enumerations.products import ServiceType
@@ -2,8 +2,9 @@
 import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import Field, model_validator
 
+from ...common.schema import BaseModel
 from .base import BaseProductInfoListRequest
 from ...common.enumerations.localization import CurrencyCode
 from ...common.enumerations.products import ErrorLevel, ShipmentType
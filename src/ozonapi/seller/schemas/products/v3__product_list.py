@@ -1,8 +1,9 @@
 """https://docs.ozon.ru/api/seller/#operation/ProductAPI_GetProductList"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from .base import BaseProductListFilter
 from ..entities.common import ResponseLastId
 from ..entities.common import RequestLastId, RequestLimit1000
@@ -1,8 +1,9 @@
 """https://docs.ozon.ru/api/seller/#operation/ProductAPI_GetProductAttributesV4"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ...common.enumerations.requests import SortingDirection, ProductsSortingBy
 from ..entities.common import ResponseLastId
 from ..entities.common import RequestLastId
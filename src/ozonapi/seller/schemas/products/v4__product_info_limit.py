@@ -1,7 +1,9 @@
 """https://docs.ozon.ru/api/seller/?__rr=1#operation/ProductAPI_GetUploadQuota"""
 import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from ...common.schema import BaseModel
 
 
 class ProductInfoLimitDailyCreate(BaseModel):
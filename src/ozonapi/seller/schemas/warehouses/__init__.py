@@ -1,6 +1,10 @@
 """Описывает модели методов раздела Склады.
 https://docs.ozon.ru/api/seller/#tag/WarehouseAPI
 """
+from typing import TYPE_CHECKING
+
+from ...common.lazy import lazy_exports
+
 __all__ = [
     "WarehouseListRequest",
     "WarehouseListResponse",
@@ -12,14 +16,24 @@ __all__ = [
     "WarehouseListItem",
 ]
 
-from .v1__delivery_method_list import (
-    DeliveryMethodListRequest,
-    DeliveryMethodListResponse,
-    DeliveryMethodListFilter,
-    DeliveryMethodListItem,
-)
-from .v1__warehouse_list import (
-    WarehouseListResponse,
-    WarehouseListFirstMileType,
-    WarehouseListItem, WarehouseListRequest,
-)
+if TYPE_CHECKING:
+    from .v1__delivery_method_list import (
+        DeliveryMethodListRequest,
+        DeliveryMethodListResponse,
+        DeliveryMethodListFilter,
+        DeliveryMethodListItem,
+    )
+    from .v1__warehouse_list import (
+        WarehouseListResponse,
+        WarehouseListFirstMileType,
+        WarehouseListItem, WarehouseListRequest,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".v1__delivery_method_list": (
+        "DeliveryMethodListRequest", "DeliveryMethodListResponse", "DeliveryMethodListFilter", "DeliveryMethodListItem",
+    ),
+    ".v1__warehouse_list": (
+        "WarehouseListResponse", "WarehouseListFirstMileType", "WarehouseListItem", "WarehouseListRequest",
+    ),
+})
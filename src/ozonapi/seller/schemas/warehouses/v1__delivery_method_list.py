@@ -2,8 +2,9 @@
 import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ...common.enumerations.delivery import DeliveryMethodStatus
 from ..entities.postings import PostingDeliveryMethod
 from ..entities.common import ResponseHasNext
@@ -1,8 +1,9 @@
 """https://docs.ozon.ru/api/seller/#operation/WarehouseAPI_WarehouseList"""
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ...common.schema import BaseModel
 from ...common.enumerations.warehouses import FirstMileType, WarehouseStatus, WarehouseWorkingDays
 
 class WarehouseListRequest(BaseModel):
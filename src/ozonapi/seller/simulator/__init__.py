@@ -0,0 +1,15 @@
+"""Симулятор Seller API Ozon для нагрузочного и длительного тестирования без обращения к рабочему API."""
+__all__ = [
+    "OzonSimulator",
+    "SimulatorProfile",
+    "RateLimit",
+    "LatencyProfile",
+    "FaultProfile",
+    "PROFILES",
+    "Endpoint",
+    "ENDPOINTS",
+]
+
+from .endpoints import ENDPOINTS, Endpoint
+from .profiles import PROFILES, FaultProfile, LatencyProfile, RateLimit, SimulatorProfile
+from .server import OzonSimulator
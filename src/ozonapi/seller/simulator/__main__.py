@@ -0,0 +1,39 @@
+"""Запуск симулятора Seller API из командной строки.
+
+Examples:
+    Базовое применение:
+        python -m ozonapi.seller.simulator --profile production --port 8080
+"""
+import argparse
+
+from aiohttp import web
+
+from .profiles import PROFILES, SimulatorProfile
+from .server import OzonSimulator
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Симулятор Seller API Ozon")
+    parser.add_argument("--host", default="127.0.0.1", help="адрес, на котором принимаются соединения")
+    parser.add_argument("--port", type=int, default=8080, help="порт")
+    parser.add_argument(
+        "--profile", default="production", help=f"имя профиля ({', '.join(PROFILES)}) или путь к JSON-файлу профиля",
+    )
+    parser.add_argument("--seed", type=int, help="начальное значение генератора случайных чисел")
+    parser.add_argument("--catalog-size", type=int, help="количество товаров в синтетическом каталоге")
+    parser.add_argument("--postings-count", type=int, help="количество отправлений в синтетическом наборе")
+    args = parser.parse_args(argv)
+
+    overrides = {
+        key: value for key, value in (
+            ("seed", args.seed), ("catalog_size", args.catalog_size), ("postings_count", args.postings_count),
+        ) if value is not None
+    }
+    profile = SimulatorProfile.load(args.profile)
+    profile = SimulatorProfile.model_validate({**profile.model_dump(), **overrides})
+    simulator = OzonSimulator(profile)
+    web.run_app(simulator.create_app(), host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
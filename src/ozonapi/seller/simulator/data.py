@@ -0,0 +1,142 @@
+"""Синтетические данные симулятора, построенные по схемам ответов."""
+import datetime
+import enum
+import types
+import typing
+from functools import lru_cache
+from typing import Any, Callable, Union
+
+import pydantic
+
+PRODUCT_ID_BASE = 100_000_000
+SKU_BASE = 200_000_000
+ORDER_ID_BASE = 300_000_000
+POSTING_NUMBER_BASE = 10_000_000
+
+SAMPLE_DATETIME = "2024-01-15T10:00:00Z"
+
+# Поля, значения которых зависят от номера элемента, чтобы элементы каталога
+# различались и идентификаторы можно было сопоставить с номером элемента
+INDEXED_INT_FIELDS: dict[str, Callable[[int], int]] = {
+    "product_id": lambda index: PRODUCT_ID_BASE + index,
+    "sku": lambda index: SKU_BASE + index,
+    "order_id": lambda index: ORDER_ID_BASE + index,
+    "id": lambda index: index + 1,
+}
+INDEXED_STR_FIELDS: dict[str, Callable[[int], str]] = {
+    "offer_id": lambda index: f"OFFER-{index}",
+    "posting_number": lambda index: f"{POSTING_NUMBER_BASE + index}-0001-1",
+    "order_number": lambda index: f"{POSTING_NUMBER_BASE + index}-0001",
+    "name": lambda index: f"Товар {index}",
+    "value": lambda index: f"Значение {index}",
+}
+
+Factory = Callable[[int], Any]
+
+
+def product_index(product_id: int | None = None, offer_id: str | None = None, sku: int | None = None) -> int | None:
+    """Возвращает номер товара синтетического каталога по одному из его идентификаторов."""
+    if product_id is not None:
+        return int(product_id) - PRODUCT_ID_BASE
+    if sku is not None:
+        return int(sku) - SKU_BASE
+    if offer_id is not None and str(offer_id).startswith("OFFER-") and str(offer_id)[6:].isdigit():
+        return int(str(offer_id)[6:])
+    return None
+
+
+def _constant(value: Any) -> Factory:
+    return lambda index: value
+
+
+def _field_factory(annotation: Any, name: str | None, parents: tuple[type, ...]) -> Factory:
+    origin = typing.get_origin(annotation)
+
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return _field_factory(args[0], name, parents) if args else _constant(None)
+    if origin is typing.Literal:
+        return _constant(typing.get_args(annotation)[0])
+    if origin is typing.Annotated:
+        return _field_factory(typing.get_args(annotation)[0], name, parents)
+    if origin in (list, tuple, set, typing.Sequence):
+        args = typing.get_args(annotation)
+        # Рекурсивные схемы (например, дерево категорий) заканчиваются пустым списком
+        if not args or args[0] in parents:
+            return _constant([])
+        item = _field_factory(args[0], name, parents)
+        return lambda index: [item(index)]
+    if origin is dict:
+        return lambda index: {}
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, pydantic.BaseModel):
+            return model_factory(annotation, parents + (annotation,)) if annotation not in parents else _constant(None)
+        if issubclass(annotation, enum.Enum):
+            member = next(iter(annotation))
+            return _constant(member.value)
+        if annotation is bool:
+            return _constant(False)
+        if issubclass(annotation, int):
+            if name in INDEXED_INT_FIELDS:
+                return INDEXED_INT_FIELDS[name]
+            return _constant(1)
+        if issubclass(annotation, float):
+            return _constant(100.0)
+        if issubclass(annotation, datetime.datetime):
+            return _constant(SAMPLE_DATETIME)
+        if issubclass(annotation, datetime.date):
+            return _constant(SAMPLE_DATETIME[:10])
+        if issubclass(annotation, str):
+            if name in INDEXED_STR_FIELDS:
+                return INDEXED_STR_FIELDS[name]
+            return _constant("sample")
+    return _constant(None)
+
+
+def model_factory(model: type[pydantic.BaseModel], parents: tuple[type, ...] = ()) -> Factory:
+    """Формирует функцию, строящую словарь по схеме для элемента с заданным номером.
+
+    Заполняются все поля схемы, включая необязательные. Ключи словаря совпадают
+    с именами полей в JSON (с учетом псевдонимов), идентификаторы зависят от
+    номера элемента.
+
+    Args:
+        model: Схема pydantic
+        parents: Схемы, в которые вложена `model`
+
+    Returns:
+        Функция, принимающая номер элемента и возвращающая словарь
+    """
+    if not parents:
+        return _cached_model_factory(model)
+    fields = [
+        (field.alias or name, _field_factory(field.annotation, name, parents))
+        for name, field in model.model_fields.items()
+    ]
+    return lambda index: {key: build(index) for key, build in fields}
+
+
+@lru_cache(maxsize=None)
+def _cached_model_factory(model: type[pydantic.BaseModel]) -> Factory:
+    return model_factory(model, parents=(model,))
+
+
+def field_model(model: type[pydantic.BaseModel], path: tuple[str, ...]) -> type[pydantic.BaseModel]:
+    """Возвращает схему элементов списка, расположенного по пути `path` в схеме `model`."""
+    annotation: Any = model
+    for key in path:
+        annotation = _unwrap(annotation)
+        annotation = next(
+            field.annotation for name, field in annotation.model_fields.items() if (field.alias or name) == key
+        )
+    return _unwrap(annotation)
+
+
+def _unwrap(annotation: Any) -> Any:
+    while not (isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel)):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if not args:
+            raise TypeError(f"Ожидалась схема pydantic, получено {annotation!r}")
+        annotation = args[0]
+    return annotation
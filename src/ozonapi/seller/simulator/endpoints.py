@@ -0,0 +1,99 @@
+"""Конечные точки Seller API, которые обслуживает симулятор."""
+from typing import NamedTuple, Optional
+
+
+class Endpoint(NamedTuple):
+    """Описание конечной точки симулятора.
+
+    Attributes:
+        schema: Имя схемы ответа в `ozonapi.seller.schemas`
+        pagination: Способ выборки элементов из синтетического набора (`cursor`, `last_id`, `offset`,
+            `last_value_id`, `lookup`) или `None` для ответа-образца
+        items: Путь к списку элементов в ответе
+        source: Синтетический набор, из которого выбираются элементы
+            (`products`, `postings`, `values`, `delivery_methods`)
+        wrap: Ответ вложен в поле `result`, а схема описывает его содержимое
+    """
+    schema: str
+    pagination: Optional[str] = None
+    items: tuple[str, ...] = ()
+    source: str = "products"
+    wrap: bool = False
+
+
+ENDPOINTS: dict[str, Endpoint] = {
+    # Атрибуты и характеристики
+    "/v1/description-category/attribute": Endpoint("DescriptionCategoryAttributeResponse"),
+    "/v1/description-category/attribute/values": Endpoint(
+        "DescriptionCategoryAttributeValuesResponse", "last_value_id", ("result",), "values",
+    ),
+    "/v1/description-category/attribute/values/search": Endpoint("DescriptionCategoryAttributeValuesSearchResponse"),
+    "/v1/description-category/tree": Endpoint("DescriptionCategoryTreeResponse"),
+    # Бета-методы
+    "/v1/analytics/stocks": Endpoint("AnalyticsStocksResponse"),
+    "/v1/seller/info": Endpoint("SellerInfoResponse"),
+    # Штрихкоды
+    "/v1/barcode/add": Endpoint("BarcodeAddResponse"),
+    "/v1/barcode/generate": Endpoint("BarcodeGenerateResponse"),
+    # FBO
+    "/v1/posting/fbo/cancel-reason/list": Endpoint("PostingFBOCancelReasonListResponse"),
+    "/v2/posting/fbo/get": Endpoint("PostingFBOGetResponse"),
+    "/v2/posting/fbo/list": Endpoint("PostingFBOListResponse", "offset", ("result",), "postings"),
+    # FBS
+    "/v1/posting/fbs/cancel-reason": Endpoint("PostingFBSCancelReasonResponse"),
+    "/v1/posting/fbs/package-label/get": Endpoint("PostingFBSPackageLabelGetResponse"),
+    "/v1/posting/fbs/restrictions": Endpoint("PostingFBSRestrictionsResponse", wrap=True),
+    "/v2/posting/fbs/arbitration": Endpoint("PostingFBSArbitrationResponse"),
+    "/v2/posting/fbs/awaiting-delivery": Endpoint("PostingFBSAwaitingDeliveryResponse"),
+    "/v2/posting/fbs/cancel": Endpoint("PostingFBSCancelResponse"),
+    "/v2/posting/fbs/cancel-reason/list": Endpoint("PostingFBSCancelReasonListResponse"),
+    "/v2/posting/fbs/get-by-barcode": Endpoint("PostingFBSGetByBarcodeResponse", wrap=True),
+    "/v2/posting/fbs/package-label": Endpoint("PostingFBSPackageLabelResponse"),
+    "/v2/posting/fbs/package-label/create": Endpoint("PostingFBSPackageLabelCreateResponse"),
+    "/v2/posting/fbs/product/cancel": Endpoint("PostingFBSProductCancelResponse"),
+    "/v2/posting/fbs/product/change": Endpoint("PostingFBSProductChangeResponse"),
+    "/v2/posting/fbs/product/country/list": Endpoint("PostingFBSProductCountryListResponse"),
+    "/v2/posting/fbs/product/country/set": Endpoint("PostingFBSProductCountrySetResponse"),
+    "/v3/posting/fbs/get": Endpoint("PostingFBSGetResponse"),
+    "/v3/posting/fbs/list": Endpoint("PostingFBSListResponse", "offset", ("result", "postings"), "postings"),
+    "/v3/posting/fbs/unfulfilled/list": Endpoint(
+        "PostingFBSUnfulfilledListResponse", "offset", ("result", "postings"), "postings",
+    ),
+    "/v3/posting/multi-box-qty/set": Endpoint("PostingFBSMultiBoxQtySetResponse"),
+    # Сборка и маркировка FBS
+    "/v1/fbs/posting/product/exemplar/update": Endpoint("FBSPostingProductExemplarUpdateResponse"),
+    "/v4/posting/fbs/ship": Endpoint("PostingFBSShipResponse"),
+    "/v4/posting/fbs/ship/package": Endpoint("PostingFBSShipPackageResponse"),
+    "/v5/fbs/posting/product/exemplar/status": Endpoint("FBSPostingProductExemplarStatusResponse"),
+    "/v5/fbs/posting/product/exemplar/validate": Endpoint("FBSPostingProductExemplarValidateResponse"),
+    "/v6/fbs/posting/product/exemplar/create-or-get": Endpoint("FBSPostingProductExemplarCreateOrGetResponse"),
+    "/v6/fbs/posting/product/exemplar/set": Endpoint("FBSPostingProductExemplarSetResponse"),
+    # Цены и остатки
+    "/v1/product/import/prices": Endpoint("ProductImportPricesResponse"),
+    "/v1/product/info/stocks-by-warehouse/fbs": Endpoint("ProductInfoStocksByWarehouseFBSResponse"),
+    "/v2/products/stocks": Endpoint("ProductsStocksResponse"),
+    "/v4/product/info/stocks": Endpoint("ProductInfoStocksResponse", "cursor", ("items",)),
+    "/v5/product/info/prices": Endpoint("ProductInfoPricesResponse", "cursor", ("items",)),
+    # Товары
+    "/v1/product/archive": Endpoint("ProductArchiveResponse"),
+    "/v1/product/attributes/update": Endpoint("ProductAttributesUpdateResponse"),
+    "/v1/product/import-by-sku": Endpoint("ProductImportBySkuResponse"),
+    "/v1/product/import/info": Endpoint("ProductImportInfoResponse"),
+    "/v1/product/info/description": Endpoint("ProductInfoDescriptionResponse"),
+    "/v1/product/info/subscription": Endpoint("ProductInfoSubscriptionResponse"),
+    "/v1/product/pictures/import": Endpoint("ProductPicturesImportResponse"),
+    "/v1/product/rating-by-sku": Endpoint("ProductRatingBySkuResponse"),
+    "/v1/product/related-sku/get": Endpoint("ProductRelatedSkuGetResponse"),
+    "/v1/product/unarchive": Endpoint("ProductUnarchiveResponse"),
+    "/v1/product/update/offer-id": Endpoint("ProductUpdateOfferIdResponse"),
+    "/v2/product/pictures/info": Endpoint("ProductPicturesInfoResponse"),
+    "/v2/products/delete": Endpoint("ProductsDeleteResponse"),
+    "/v3/product/import": Endpoint("ProductImportResponse"),
+    "/v3/product/info/list": Endpoint("ProductInfoListResponse", "lookup", ("items",)),
+    "/v3/product/list": Endpoint("ProductListResponse", "last_id", ("result", "items")),
+    "/v4/product/info/attributes": Endpoint("ProductInfoAttributesResponse", "last_id", ("result",)),
+    "/v4/product/info/limit": Endpoint("ProductInfoLimitResponse"),
+    # Склады
+    "/v1/delivery-method/list": Endpoint("DeliveryMethodListResponse", "offset", ("result",), "delivery_methods"),
+    "/v1/warehouse/list": Endpoint("WarehouseListResponse"),
+}
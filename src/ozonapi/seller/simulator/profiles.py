@@ -0,0 +1,216 @@
+"""Профили лимитов, задержек и сбоев симулятора Seller API."""
+import json
+import math
+import pathlib
+import random
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+from .endpoints import ENDPOINTS
+
+
+class RateLimit(BaseModel):
+    """Ограничение количества запросов в скользящем окне.
+
+    Attributes:
+        requests: Допустимое количество запросов в окне
+        period: Длительность окна в секундах
+    """
+    requests: int = Field(
+        ..., ge=1, description="Допустимое количество запросов в окне."
+    )
+    period: float = Field(
+        1.0, gt=0, description="Длительность окна в секундах."
+    )
+
+
+class LatencyProfile(BaseModel):
+    """Распределение задержки ответа сервера.
+
+    Attributes:
+        distribution: Вид распределения (`fixed`, `uniform`, `normal`, `lognormal`, `exponential`)
+        mean: Среднее значение задержки в секундах
+        stddev: Стандартное отклонение задержки в секундах (для `uniform` — полуширина интервала)
+        minimum: Нижняя граница задержки в секундах
+        maximum: Верхняя граница задержки в секундах
+    """
+    distribution: Literal["fixed", "uniform", "normal", "lognormal", "exponential"] = Field(
+        "fixed", description="Вид распределения."
+    )
+    mean: float = Field(
+        0.0, ge=0, description="Среднее значение задержки в секундах."
+    )
+    stddev: float = Field(
+        0.0, ge=0, description="Стандартное отклонение задержки в секундах."
+    )
+    minimum: float = Field(
+        0.0, ge=0, description="Нижняя граница задержки в секундах."
+    )
+    maximum: float = Field(
+        30.0, ge=0, description="Верхняя граница задержки в секундах."
+    )
+
+    def sample(self, rng: random.Random) -> float:
+        """Возвращает случайную задержку в секундах."""
+        if self.mean <= 0:
+            return self.minimum
+        if self.distribution == "uniform":
+            value = rng.uniform(self.mean - self.stddev, self.mean + self.stddev)
+        elif self.distribution == "normal":
+            value = rng.gauss(self.mean, self.stddev)
+        elif self.distribution == "lognormal":
+            # Параметры нормального распределения логарифма по среднему и отклонению задержки
+            sigma2 = math.log(1 + (self.stddev / self.mean) ** 2)
+            value = rng.lognormvariate(math.log(self.mean) - sigma2 / 2, sigma2 ** 0.5)
+        elif self.distribution == "exponential":
+            value = rng.expovariate(1 / self.mean)
+        else:
+            value = self.mean
+        return min(max(value, self.minimum), self.maximum)
+
+
+class FaultProfile(BaseModel):
+    """Сбои сервера с ответами 5xx.
+
+    Notes:
+        • Одиночные сбои возникают независимо с вероятностью `error_rate`.
+        • Серия сбоев начинается с вероятностью `burst_rate` на запрос и длится `burst_duration` секунд: все запросы за это время получают ответ 5xx.
+
+    Attributes:
+        error_rate: Вероятность одиночного сбоя запроса
+        burst_rate: Вероятность начала серии сбоев при очередном запросе
+        burst_duration: Длительность серии сбоев в секундах
+        statuses: Коды ответов при сбоях
+    """
+    error_rate: float = Field(
+        0.0, ge=0, le=1, description="Вероятность одиночного сбоя запроса."
+    )
+    burst_rate: float = Field(
+        0.0, ge=0, le=1, description="Вероятность начала серии сбоев при очередном запросе."
+    )
+    burst_duration: float = Field(
+        1.0, ge=0, description="Длительность серии сбоев в секундах."
+    )
+    statuses: list[int] = Field(
+        default_factory=lambda: [500, 502, 503], min_length=1, description="Коды ответов при сбоях."
+    )
+
+
+class SimulatorProfile(BaseModel):
+    """Профиль поведения симулятора Seller API.
+
+    Notes:
+        • Клиент определяется по заголовку `Client-Id` или по OAuth-токену из `Authorization`.
+        • Ограничения `client_limit` и `endpoint_limits` действуют для каждого клиента отдельно, при превышении возвращается ответ 429.
+        • Синтетические наборы данных строятся по номеру элемента и не хранятся в памяти, поэтому размер каталога не ограничен памятью.
+        • При одинаковом `seed` задержки и сбои воспроизводятся для одной и той же последовательности запросов.
+
+    Attributes:
+        client_limit: Ограничение запросов клиента ко всем конечным точкам (`None` — без ограничения)
+        endpoint_limits: Ограничения запросов клиента к отдельным конечным точкам по путям
+        retry_after: Значение заголовка `Retry-After` в ответах 429 в секундах (`None` — без заголовка)
+        latency: Задержка ответов по умолчанию
+        endpoint_latency: Задержка ответов отдельных конечных точек по путям
+        faults: Сбои сервера с ответами 5xx
+        catalog_size: Количество товаров в синтетическом каталоге
+        postings_count: Количество отправлений в синтетическом наборе
+        attribute_values_count: Количество значений в справочнике характеристики
+        delivery_methods_count: Количество методов доставки
+        task_duration: Время выполнения асинхронных заданий (загрузка товаров, формирование этикеток) в секундах
+        task_retention: Время хранения выполненных заданий в секундах, после которого задание не найдено
+        seed: Начальное значение генератора случайных чисел (`None` — случайное)
+    """
+    client_limit: Optional[RateLimit] = Field(
+        default_factory=lambda: RateLimit(requests=50), description="Ограничение запросов клиента."
+    )
+    endpoint_limits: dict[str, RateLimit] = Field(
+        default_factory=dict, description="Ограничения запросов клиента к отдельным конечным точкам."
+    )
+    retry_after: Optional[float] = Field(
+        None, ge=0, description="Значение заголовка Retry-After в ответах 429 в секундах."
+    )
+    latency: LatencyProfile = Field(
+        default_factory=LatencyProfile, description="Задержка ответов по умолчанию."
+    )
+    endpoint_latency: dict[str, LatencyProfile] = Field(
+        default_factory=dict, description="Задержка ответов отдельных конечных точек."
+    )
+    faults: FaultProfile = Field(
+        default_factory=FaultProfile, description="Сбои сервера с ответами 5xx."
+    )
+    catalog_size: int = Field(
+        10000, ge=0, description="Количество товаров в синтетическом каталоге."
+    )
+    postings_count: int = Field(
+        10000, ge=0, description="Количество отправлений в синтетическом наборе."
+    )
+    attribute_values_count: int = Field(
+        5000, ge=0, description="Количество значений в справочнике характеристики."
+    )
+    delivery_methods_count: int = Field(
+        100, ge=0, description="Количество методов доставки."
+    )
+    task_duration: float = Field(
+        1.0, ge=0, description="Время выполнения асинхронных заданий в секундах."
+    )
+    task_retention: float = Field(
+        600.0, ge=0, description="Время хранения выполненных асинхронных заданий в секундах."
+    )
+    seed: Optional[int] = Field(
+        None, description="Начальное значение генератора случайных чисел."
+    )
+
+    @model_validator(mode="after")
+    def validate_endpoints(self):
+        """Проверяет, что ограничения и задержки заданы для путей, которые обслуживает симулятор."""
+        unknown = (set(self.endpoint_limits) | set(self.endpoint_latency)) - set(ENDPOINTS)
+        if unknown:
+            raise ValueError(f"Неизвестные конечные точки: {', '.join(sorted(unknown))}")
+        return self
+
+    @classmethod
+    def load(cls, source: str) -> "SimulatorProfile":
+        """Возвращает профиль по имени из `PROFILES` или из JSON-файла.
+
+        Args:
+            source: Имя готового профиля или путь к JSON-файлу профиля
+
+        Returns:
+            Профиль симулятора
+        """
+        if source in PROFILES:
+            return PROFILES[source].model_copy(deep=True)
+        return cls.model_validate(json.loads(pathlib.Path(source).read_text(encoding="utf-8")))
+
+
+PROFILES: dict[str, SimulatorProfile] = {
+    # Без ограничений, задержек и сбоев: проверка логики конвейеров
+    "ideal": SimulatorProfile(client_limit=None),
+    # Близко к рабочему API: 50 запросов в секунду на клиента, отдельные медленные методы, редкие сбои
+    "production": SimulatorProfile(
+        client_limit=RateLimit(requests=50),
+        endpoint_limits={
+            "/v1/product/import/info": RateLimit(requests=10),
+            "/v2/posting/fbs/package-label": RateLimit(requests=10),
+            "/v1/description-category/tree": RateLimit(requests=1),
+        },
+        latency=LatencyProfile(distribution="lognormal", mean=0.12, stddev=0.06, maximum=5.0),
+        endpoint_latency={
+            "/v3/posting/fbs/list": LatencyProfile(distribution="lognormal", mean=0.4, stddev=0.2, maximum=10.0),
+            "/v4/product/info/attributes": LatencyProfile(distribution="lognormal", mean=0.3, stddev=0.15, maximum=10.0),
+        },
+        faults=FaultProfile(error_rate=0.001, burst_rate=0.0002, burst_duration=2.0),
+        catalog_size=100_000,
+        postings_count=50_000,
+    ),
+    # Деградация API: жесткие ограничения, большие задержки и частые серии сбоев
+    "degraded": SimulatorProfile(
+        client_limit=RateLimit(requests=20),
+        retry_after=1.0,
+        latency=LatencyProfile(distribution="lognormal", mean=0.6, stddev=0.5, maximum=15.0),
+        faults=FaultProfile(error_rate=0.02, burst_rate=0.005, burst_duration=3.0),
+        catalog_size=100_000,
+        postings_count=50_000,
+    ),
+}
@@ -0,0 +1,409 @@
+"""Локальный HTTP-сервер, имитирующий Seller API Ozon."""
+import asyncio
+import itertools
+import json
+import random
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
+
+from aiohttp import web
+
+from .data import PRODUCT_ID_BASE, field_model, model_factory, product_index
+from .endpoints import ENDPOINTS, Endpoint
+from .profiles import SimulatorProfile
+
+# Размер страницы, если в запросе не указан `limit`
+DEFAULT_LIMIT = 100
+
+LABEL_FILE = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n1 0 obj<</Type/Catalog>>endobj\ntrailer<</Root 1 0 R>>\n%%EOF\n"
+
+
+class SimulatorTask(NamedTuple):
+    """Асинхронное задание симулятора (загрузка товаров или формирование этикеток).
+
+    Attributes:
+        kind: Вид задания (`product_import`, `package_label`)
+        created: Время создания задания по `time.monotonic()`
+        items: Артикулы и идентификаторы загружаемых товаров или номера отправлений
+    """
+    kind: str
+    created: float
+    items: tuple
+
+
+def _error(status: int, code: int, message: str, headers: Optional[dict] = None) -> web.Response:
+    body = json.dumps({"code": code, "message": message, "details": []}).encode()
+    return web.Response(body=body, status=status, content_type="application/json", headers=headers)
+
+
+def _json(data: Any) -> web.Response:
+    return web.Response(body=json.dumps(data, ensure_ascii=False).encode(), content_type="application/json")
+
+
+@lru_cache(maxsize=None)
+def _schema(name: str) -> Any:
+    from .. import schemas
+    return getattr(schemas, name)
+
+
+class OzonSimulator:
+    """Симулятор Seller API Ozon для нагрузочного и длительного тестирования.
+
+    Обслуживает все конечные точки, которые вызывает `SellerAPI`, и отвечает по
+    их схемам. Постраничные методы выбирают элементы из синтетических наборов
+    (`cursor`, `last_id`, `offset`, `last_value_id`), задания загрузки товаров и
+    формирования этикеток выполняются в течение `task_duration` и хранятся еще
+    `task_retention` секунд. Лимиты запросов, задержки и сбои задаются профилем.
+
+    Notes:
+        • Ответы 429 возвращаются при превышении лимитов клиента, ответы 5xx — при сбоях профиля.
+        • Запросы без заголовков авторизации получают ответ 401.
+        • Счетчики запросов по конечным точкам доступны через `get_stats()` и `GET /simulator/stats`.
+
+    Args:
+        profile: Профиль симулятора, имя готового профиля из `PROFILES` или путь к JSON-файлу профиля
+
+    Examples:
+        Базовое применение:
+            async with OzonSimulator("production") as simulator:
+                config = SellerAPIConfig(client_id="1", api_key="key", base_url=simulator.url)
+                async with SellerAPI(config=config) as api:
+                    async for item in api.iter_product_info_stocks(ProductInfoStocksRequest(limit=1000)):
+                        ...
+                print(simulator.get_stats())
+    """
+
+    def __init__(self, profile: SimulatorProfile | str | None = None) -> None:
+        if isinstance(profile, str):
+            profile = SimulatorProfile.load(profile)
+        self.profile: SimulatorProfile = profile or SimulatorProfile()
+        self.url: Optional[str] = None
+        self._rng = random.Random(self.profile.seed)
+        self._windows: dict[tuple, deque] = {}
+        self._burst_until = 0.0
+        self._tasks: OrderedDict[int, SimulatorTask] = OrderedDict()
+        self._task_ids = itertools.count(1)
+        self._new_products = itertools.count(self.profile.catalog_size)
+        self._stats: dict[str, dict[str, int]] = {}
+        self._runner: Optional[web.AppRunner] = None
+        self._flows = {
+            "/v3/product/import": self._product_import,
+            "/v1/product/import/info": self._product_import_info,
+            "/v2/posting/fbs/package-label/create": self._package_label_create,
+            "/v1/posting/fbs/package-label/get": self._package_label_get,
+        }
+
+    async def __aenter__(self) -> "OzonSimulator":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    def create_app(self) -> web.Application:
+        """Создает приложение aiohttp симулятора."""
+        app = web.Application(middlewares=[self._middleware])
+        for path in ENDPOINTS:
+            app.router.add_post(path, self._handle)
+        app.router.add_get("/simulator/stats", self._handle_stats)
+        app.router.add_get("/simulator/labels/{task_id}.pdf", self._handle_label_file)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Запускает симулятор.
+
+        Args:
+            host: Адрес, на котором принимаются соединения
+            port: Порт (`0` — свободный порт)
+
+        Returns:
+            Базовый URL симулятора для `SellerAPIConfig.base_url`
+        """
+        self._runner = web.AppRunner(self.create_app(), access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        bound_host, bound_port = self._runner.addresses[0][:2]
+        self.url = f"http://{bound_host}:{bound_port}"
+        return self.url
+
+    async def close(self) -> None:
+        """Останавливает симулятор."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Возвращает счетчики запросов.
+
+        Returns:
+            Словарь с суммарными счетчиками (`requests`, `ok`, `throttled`, `errors`, `unauthorized`)
+            и счетчиками по конечным точкам в `endpoints`
+        """
+        total = dict.fromkeys(("requests", "ok", "throttled", "errors", "unauthorized"), 0)
+        for counters in self._stats.values():
+            for key, value in counters.items():
+                total[key] += value
+        return {**total, "endpoints": {path: dict(counters) for path, counters in self._stats.items()}}
+
+    def reset_stats(self) -> None:
+        """Сбрасывает счетчики запросов."""
+        self._stats.clear()
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        path = request.path
+        if path not in ENDPOINTS:
+            return await handler(request)
+
+        counters = self._stats.get(path)
+        if counters is None:
+            counters = self._stats[path] = dict.fromkeys(("requests", "ok", "throttled", "errors", "unauthorized"), 0)
+        counters["requests"] += 1
+
+        client = self._client(request)
+        if client is None:
+            counters["unauthorized"] += 1
+            return _error(401, 16, "Client-Id and Api-Key headers are required")
+
+        if self._throttled(client, path, time.monotonic()):
+            counters["throttled"] += 1
+            headers = {"Retry-After": f"{self.profile.retry_after:g}"} if self.profile.retry_after is not None else None
+            return _error(429, 8, "You have reached request rate limit per second", headers)
+
+        latency = self.profile.endpoint_latency.get(path, self.profile.latency).sample(self._rng)
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        status = self._fault(time.monotonic())
+        if status is not None:
+            counters["errors"] += 1
+            return _error(status, 13, "Internal error")
+
+        response = await handler(request)
+        counters["ok" if response.status < 400 else "errors"] += 1
+        return response
+
+    @staticmethod
+    def _client(request: web.Request) -> Optional[str]:
+        headers = request.headers
+        if "Client-Id" in headers and "Api-Key" in headers:
+            return headers["Client-Id"]
+        authorization = headers.get("Authorization", "")
+        if authorization.startswith("Bearer ") and len(authorization) > 7:
+            return authorization[7:]
+        return None
+
+    def _throttled(self, client: str, path: str, now: float) -> bool:
+        """Проверяет лимиты клиента в скользящих окнах и учитывает принятый запрос."""
+        limits = []
+        if self.profile.client_limit is not None:
+            limits.append(((client,), self.profile.client_limit))
+        if path in self.profile.endpoint_limits:
+            limits.append(((client, path), self.profile.endpoint_limits[path]))
+
+        windows = []
+        for key, limit in limits:
+            window = self._windows.get(key)
+            if window is None:
+                window = self._windows[key] = deque(maxlen=limit.requests)
+            if len(window) == limit.requests and now - window[0] < limit.period:
+                return True
+            windows.append(window)
+        for window in windows:
+            window.append(now)
+        return False
+
+    def _fault(self, now: float) -> Optional[int]:
+        """Возвращает код ответа 5xx, если запрос попадает в сбой профиля."""
+        faults = self.profile.faults
+        if now < self._burst_until:
+            return self._rng.choice(faults.statuses)
+        if faults.burst_rate and self._rng.random() < faults.burst_rate:
+            self._burst_until = now + faults.burst_duration
+            return self._rng.choice(faults.statuses)
+        if faults.error_rate and self._rng.random() < faults.error_rate:
+            return self._rng.choice(faults.statuses)
+        return None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        path = request.path
+        try:
+            payload = await request.json() if request.body_exists else {}
+        except ValueError:
+            return _error(400, 3, "Invalid JSON")
+        if not isinstance(payload, dict):
+            return _error(400, 3, "Request body must be an object")
+
+        if path in self._flows:
+            return self._flows[path](request, payload)
+        endpoint = ENDPOINTS[path]
+        if endpoint.pagination is not None:
+            return _json(self._page(endpoint, payload))
+        return web.Response(body=self._sample(endpoint), content_type="application/json")
+
+    async def _handle_stats(self, request: web.Request) -> web.Response:
+        return _json(self.get_stats())
+
+    async def _handle_label_file(self, request: web.Request) -> web.Response:
+        return web.Response(body=LABEL_FILE, content_type="application/pdf")
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _sample(endpoint: Endpoint) -> bytes:
+        """Возвращает ответ-образец конечной точки без постраничной выборки."""
+        body = model_factory(_schema(endpoint.schema))(0)
+        return json.dumps({"result": body} if endpoint.wrap else body, ensure_ascii=False).encode()
+
+    def _source_size(self, source: str) -> int:
+        return {
+            "products": self.profile.catalog_size,
+            "postings": self.profile.postings_count,
+            "values": self.profile.attribute_values_count,
+            "delivery_methods": self.profile.delivery_methods_count,
+        }[source]
+
+    def _select_products(self, payload: dict) -> Optional[list[int]]:
+        """Возвращает номера товаров каталога из фильтра запроса или `None`, если фильтр по товарам не задан."""
+        source = payload.get("filter") or payload
+        if not isinstance(source, dict) or not any(source.get(field) for field in ("product_id", "offer_id", "sku")):
+            return None
+        selected = []
+        for field in ("product_id", "offer_id", "sku"):
+            for value in source.get(field) or ():
+                try:
+                    index = product_index(**{field: value})
+                except (TypeError, ValueError):
+                    continue
+                if index is not None and 0 <= index < self.profile.catalog_size:
+                    selected.append(index)
+        return list(dict.fromkeys(selected))
+
+    def _page(self, endpoint: Endpoint, payload: dict) -> dict:
+        """Формирует страницу элементов синтетического набора."""
+        schema = _schema(endpoint.schema)
+        selected = self._select_products(payload) if endpoint.source == "products" else None
+        total = len(selected) if selected is not None else self._source_size(endpoint.source)
+        limit = max(int(payload.get("limit") or DEFAULT_LIMIT), 1)
+
+        if endpoint.pagination == "lookup":
+            start, limit = 0, total
+        elif endpoint.pagination in ("cursor", "last_id"):
+            token = payload.get(endpoint.pagination)
+            start = int(token) if token and str(token).isdigit() else 0
+        elif endpoint.pagination == "offset":
+            start = int(payload.get("offset") or 0)
+        else:
+            # Идентификатор значения справочника на единицу больше его номера
+            start = int(payload.get("last_value_id") or 0)
+        end = min(start + limit, total)
+        indexes = selected[start:end] if selected is not None else range(start, end)
+        has_more = end < total
+
+        item = model_factory(field_model(schema, endpoint.items))
+        items = [item(index) for index in indexes]
+        if endpoint.source == "products":
+            for index, data in zip(indexes, items):
+                if "id" in data:
+                    data["id"] = PRODUCT_ID_BASE + index
+
+        body = model_factory(schema)(0)
+        container = body
+        for key in endpoint.items[:-1]:
+            container = container[key]
+        container[endpoint.items[-1]] = items
+        for key, value in (
+                ("cursor", str(end) if has_more else ""),
+                ("last_id", str(end) if has_more else ""),
+                ("total", total),
+                ("count", total),
+                ("has_next", has_more),
+        ):
+            if key in container:
+                container[key] = value
+        return body
+
+    def _create_task(self, kind: str, items: tuple) -> int:
+        now = time.monotonic()
+        self._evict_tasks(now)
+        task_id = next(self._task_ids)
+        self._tasks[task_id] = SimulatorTask(kind, now, items)
+        return task_id
+
+    def _task_expired(self, task: SimulatorTask, now: float) -> bool:
+        return now - task.created >= self.profile.task_duration + self.profile.task_retention
+
+    def _evict_tasks(self, now: float) -> None:
+        """Удаляет задания, время хранения которых истекло."""
+        # Задания добавляются в порядке создания, поэтому устаревшие находятся в начале
+        while self._tasks and self._task_expired(next(iter(self._tasks.values())), now):
+            self._tasks.popitem(last=False)
+
+    def _get_task(self, payload: dict, kind: str) -> Optional[tuple[SimulatorTask, float]]:
+        """Возвращает задание и долю его выполнения от 0 до 1."""
+        task = self._tasks.get(payload.get("task_id"))
+        now = time.monotonic()
+        if task is None or task.kind != kind or self._task_expired(task, now):
+            return None
+        duration = self.profile.task_duration
+        elapsed = now - task.created
+        return task, min(elapsed / duration, 1.0) if duration else 1.0
+
+    def _product_import(self, request: web.Request, payload: dict) -> web.Response:
+        items = payload.get("items") or []
+        if not items:
+            return _error(400, 3, "items is required")
+        products = []
+        for item in items:
+            offer_id = str(item.get("offer_id", ""))
+            index = product_index(offer_id=offer_id)
+            if index is None or not 0 <= index < self.profile.catalog_size:
+                index = next(self._new_products)
+            products.append((offer_id, PRODUCT_ID_BASE + index))
+        return _json({"result": {"task_id": self._create_task("product_import", tuple(products))}})
+
+    def _product_import_info(self, request: web.Request, payload: dict) -> web.Response:
+        found = self._get_task(payload, "product_import")
+        if found is None:
+            return _error(404, 5, "Task not found")
+        task, progress = found
+        done = progress >= 1.0
+        items = [
+            {
+                "offer_id": offer_id,
+                "product_id": product_id if done else 0,
+                "status": "imported" if done else "pending",
+                "errors": [],
+            }
+            for offer_id, product_id in task.items
+        ]
+        return _json({"result": {"items": items, "total": len(items)}})
+
+    def _package_label_create(self, request: web.Request, payload: dict) -> web.Response:
+        postings = tuple(payload.get("posting_number") or ())
+        if not postings:
+            return _error(400, 3, "posting_number is required")
+        tasks = [
+            {"task_id": self._create_task("package_label", postings), "task_type": task_type}
+            for task_type in ("big_label", "small_label")
+        ]
+        return _json({"result": {"tasks": tasks}})
+
+    def _package_label_get(self, request: web.Request, payload: dict) -> web.Response:
+        found = self._get_task(payload, "package_label")
+        if found is None:
+            return _error(404, 5, "Task not found")
+        task, progress = found
+        if progress >= 1.0:
+            result = {
+                "error": "",
+                "file_url": str(request.url.with_path(f"/simulator/labels/{payload['task_id']}.pdf")),
+                "printed_postings_count": len(task.items),
+                "status": "completed",
+                "unprinted_postings": [],
+                "unprinted_postings_count": 0,
+            }
+        else:
+            result = {"status": "pending" if progress < 0.5 else "in_progress"}
+        return _json({"result": result})
@@ -0,0 +1,180 @@
+"""Тесты локальных справочников значений характеристик."""
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+
+from src.ozonapi.seller import SellerAPI
+from src.ozonapi.seller.catalog import AttributeDictionary, AttributeValue, AttributeValueStore, DictionaryKey
+from src.ozonapi.seller.common.enumerations.localization import Language
+from src.ozonapi.seller.core import APIManager, ResponseCache, ResponseMode
+
+KEY = DictionaryKey.create(17054869, 97311, 85, Language.RU)
+
+BRANDS = [
+    AttributeValue(1, "Samsung"),
+    AttributeValue(2, "Samsung Galaxy"),
+    AttributeValue(3, "Apple", info="США"),
+    AttributeValue(4, "Ёлкин дом"),
+]
+
+
+class FakeAPI:
+    """Клиент API, выдающий страницы справочника с идентификатором больше last_value_id."""
+
+    def __init__(self, values, page_size=2):
+        self.values = values
+        self.page_size = page_size
+        self.requests = []
+        self.modes = []
+
+    @contextmanager
+    def response_mode(self, mode):
+        self.modes.append(mode)
+        yield self
+
+    @contextmanager
+    def bypass_response_cache(self):
+        yield self
+
+    async def iter_description_category_attribute_values(self, request, *, pages=False):
+        self.requests.append(request)
+        rest = [value for value in self.values if value.id > (request.last_value_id or 0)]
+        for start in range(0, len(rest), self.page_size):
+            page = rest[start:start + self.page_size]
+            yield {
+                "result": [value._asdict() for value in page],
+                "has_next": start + self.page_size < len(rest),
+            }
+
+
+class TestAttributeDictionary:
+    """Тесты AttributeDictionary."""
+
+    def test_lookups(self):
+        """Тест поиска по идентификатору и точному значению."""
+        dictionary = AttributeDictionary(KEY, BRANDS)
+
+        assert dictionary.get(3).info == "США"
+        assert dictionary.find("samsung") == [BRANDS[0]]
+        assert dictionary.find("елкин дом") == [BRANDS[3]]
+        assert dictionary.last_value_id == 4
+        assert len(dictionary) == 4
+
+    def test_search(self):
+        """Тест поиска по началу слов."""
+        dictionary = AttributeDictionary(KEY, BRANDS)
+
+        assert [value.id for value in dictionary.search("sams")] == [1, 2]
+        assert [value.id for value in dictionary.search("sam gal")] == [2]
+        assert [value.id for value in dictionary.search("samsung galaxy")] == [2]
+        assert dictionary.search("nokia") == []
+        assert [value.id for value in dictionary.search("sams", limit=1)] == [1]
+        assert [value.id for value in dictionary.search("sams", limit=None)] == [1, 2]
+
+    def test_fuzzy_search(self):
+        """Тест нечеткого поиска с опечатками."""
+        dictionary = AttributeDictionary(KEY, BRANDS)
+
+        assert dictionary.fuzzy_search("Samsnug")[0].id == 1
+        assert dictionary.resolve("Aple").id == 3
+        assert dictionary.resolve("Xiaomi") is None
+
+    def test_replace_value(self):
+        """Тест обновления индексов при замене значения."""
+        dictionary = AttributeDictionary(KEY, BRANDS)
+        dictionary.fuzzy_search("apple")
+
+        assert dictionary.add([AttributeValue(3, "Apple Inc.")]) == 0
+        assert dictionary.find("apple") == []
+        assert dictionary.search("inc")[0].id == 3
+        assert dictionary.resolve("Apple Inc").id == 3
+
+
+class TestAttributeValueStore:
+    """Тесты AttributeValueStore."""
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync(self):
+        """Тест загрузки только новых значений справочника."""
+        api, store = FakeAPI(BRANDS[:3]), AttributeValueStore()
+
+        dictionary = await store.sync(api, KEY)
+        assert len(dictionary) == 3
+        assert api.modes == [ResponseMode.DICT]
+        assert api.requests[0].last_value_id is None
+        assert api.requests[0].language == "RU"
+
+        api.values = BRANDS
+        dictionary = await store.sync(api, KEY)
+        assert len(dictionary) == 4
+        assert api.requests[1].last_value_id == 3
+
+    @pytest.mark.asyncio
+    async def test_sync_bypasses_response_cache(self):
+        """Тест загрузки новых значений через кешируемый метод API без ответов из кеша."""
+        values = BRANDS[:3]
+        payloads = []
+
+        async def request(self, *args, payload=None, **kwargs):
+            payloads.append(payload)
+            rest = [value._asdict() for value in values if value.id > (payload["last_value_id"] or 0)]
+            return {"result": rest, "has_next": False}
+
+        original_cache = APIManager._response_cache
+        APIManager._response_cache = ResponseCache()
+        try:
+            with patch.object(APIManager, "_request", request):
+                api, store = SellerAPI(client_id="test_client", api_key="test_api_key"), AttributeValueStore()
+                await store.sync(api, KEY)
+                await store.sync(api, KEY)
+                values = BRANDS
+                dictionary = await store.sync(api, KEY)
+            cache_state = APIManager._response_cache.get_state()
+        finally:
+            APIManager._response_cache = original_cache
+
+        assert len(payloads) == 3
+        assert list(dictionary) == BRANDS
+        assert cache_state["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_persistence(self, tmp_path):
+        """Тест загрузки сохраненного справочника без запросов к API."""
+        await AttributeValueStore(str(tmp_path)).sync(FakeAPI(BRANDS), KEY)
+        store = AttributeValueStore(str(tmp_path))
+
+        dictionary = await store.get(KEY)
+        assert list(dictionary) == BRANDS
+        assert [value.id for value in await store.search(KEY, "galaxy")] == [2]
+        assert await store.get(KEY._replace(attribute_id=31)) is None
+
+        api = FakeAPI(BRANDS)
+        await store.sync(api, KEY)
+        assert api.requests[0].last_value_id == 4
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("content", [
+        None,
+        b'{"key": [17054869, 97311, 85, "RU"], "last_value_id": 4, "synced_at": 0, "values": [[1]]}',
+        b"[1, 2, 3]",
+    ], ids=["truncated", "wrong_arity", "not_object"])
+    async def test_corrupted_file_reloaded(self, tmp_path, content):
+        """Тест повторной загрузки справочника из API вместо поврежденного файла."""
+        store = AttributeValueStore(str(tmp_path))
+        await store.sync(FakeAPI(BRANDS), KEY)
+        with open(store._path(KEY), "r+b") as file:
+            if content is None:
+                file.truncate(20)
+            else:
+                file.write(content)
+                file.truncate()
+
+        store = AttributeValueStore(str(tmp_path))
+        assert await store.get(KEY) is None
+
+        api = FakeAPI(BRANDS)
+        dictionary = await store.sync(api, KEY)
+        assert api.requests[0].last_value_id is None
+        assert list(dictionary) == BRANDS
+        assert list(await AttributeValueStore(str(tmp_path)).get(KEY)) == BRANDS
@@ -0,0 +1,114 @@
+"""Тесты индекса дерева категорий."""
+import json
+
+import pytest
+
+from src.ozonapi.seller.catalog import CategoryIndex
+from src.ozonapi.seller.schemas.attributes_and_characteristics import DescriptionCategoryTreeResponse
+
+TREE = {
+    "result": [
+        {
+            "description_category_id": 1,
+            "category_name": "Электроника",
+            "disabled": False,
+            "children": [
+                {
+                    "description_category_id": 11,
+                    "category_name": "Аксессуары для смартфонов",
+                    "disabled": False,
+                    "children": [
+                        {"type_id": 101, "type_name": "Чехол для смартфона", "disabled": False, "children": []},
+                        {"type_id": 102, "type_name": "Защитное стекло", "disabled": True, "children": []},
+                    ],
+                },
+                {
+                    "description_category_id": 12,
+                    "category_name": "Смартфоны",
+                    "disabled": False,
+                    "children": [
+                        {"type_id": 103, "type_name": "Смартфон", "disabled": False, "children": []},
+                    ],
+                },
+            ],
+        },
+        {
+            "description_category_id": 2,
+            "category_name": "Ёлочные украшения",
+            "disabled": False,
+            "children": [
+                {"type_id": 201, "type_name": "Ёлочная игрушка", "disabled": False, "children": []},
+            ],
+        },
+    ]
+}
+
+
+@pytest.fixture
+def index():
+    """Индекс тестового дерева категорий."""
+    return CategoryIndex.from_response(DescriptionCategoryTreeResponse.model_validate(TREE))
+
+
+class TestCategoryIndex:
+    """Тесты CategoryIndex."""
+
+    def test_lookups(self, index):
+        """Тест поиска категорий и типов по идентификаторам."""
+        assert index.get_category(11).name == "Аксессуары для смартфонов"
+        assert index.get_category(999) is None
+
+        node = index.get_type(103)
+        assert (node.name, node.description_category_id, node.parent_id) == ("Смартфон", 12, 12)
+        assert node.is_type
+        assert index.get_type(103, description_category_id=11) is None
+        assert len(index) == 8
+
+    def test_structure(self, index):
+        """Тест получения пути, родителя и потомков."""
+        node = index.get_type(101)
+
+        assert [item.name for item in index.get_path(node)] == [
+            "Электроника", "Аксессуары для смартфонов", "Чехол для смартфона",
+        ]
+        assert index.get_parent(node) == index.get_category(11)
+        assert index.get_parent(index.get_category(1)) is None
+        assert [item.description_category_id for item in index.get_children(index.get_category(1))] == [11, 12]
+
+    def test_leaves(self, index):
+        """Тест получения доступных для создания товаров типов."""
+        assert [node.type_id for node in index.get_leaves()] == [101, 103, 201]
+        assert [node.type_id for node in index.get_leaves(index.get_category(1))] == [101, 103]
+        assert index.get_leaves(index.get_type(102)) == []
+
+    def test_search(self, index):
+        """Тест поиска по началу слов названия."""
+        assert [node.type_id for node in index.search("чех смартф")] == [101]
+        assert [node.name for node in index.search("смартф")] == [
+            "Аксессуары для смартфонов", "Чехол для смартфона", "Смартфоны", "Смартфон",
+        ]
+        assert [node.type_id for node in index.search("елочн игр")] == [201]
+        assert len(index.search("смартф", limit=2)) == 2
+        assert index.search("телевизор") == []
+        assert index.search("") == []
+
+    def test_response_modes(self, index):
+        """Тест построения индекса по словарю и байтам."""
+        for response in (TREE, json.dumps(TREE).encode()):
+            assert list(CategoryIndex.from_response(response)) == list(index)
+
+    def test_snapshot(self, index):
+        """Тест сохранения и загрузки снимка индекса."""
+        restored = CategoryIndex.from_snapshot(index.to_snapshot())
+
+        assert list(restored) == list(index)
+        assert restored.get_path(restored.get_type(201)) == index.get_path(index.get_type(201))
+        assert restored.search("стекло") == index.search("стекло")
+
+    def test_snapshot_version(self, index):
+        """Тест отказа в загрузке снимка другой версии формата."""
+        snapshot = json.loads(index.to_snapshot())
+        snapshot["version"] = 0
+
+        with pytest.raises(ValueError):
+            CategoryIndex.from_snapshot(json.dumps(snapshot))
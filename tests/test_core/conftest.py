@@ -3,6 +3,9 @@ import pytest
 from unittest.mock import Mock
 import asyncio
 
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
 
 @pytest.fixture
 def mock_logger():
@@ -32,4 +35,31 @@ def event_loop():
     """Создает event loop для тестов."""
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
-    loop.close()
\ No newline at end of file
+    loop.close()
+
+
+@pytest.fixture
+async def local_api_server():
+    """Запускает локальный HTTP-сервер, имитирующий API Ozon."""
+    async def ok_handler(request):
+        return web.json_response({"result": "ok"})
+
+    async def bad_request_handler(request):
+        return web.json_response(
+            {"code": 3, "message": "invalid request", "details": []}, status=400
+        )
+
+    async def nested_handler(request):
+        return web.json_response({
+            "items": [{"offer_id": "A-1", "stocks": [{"present": 5, "updated_at": "2024-01-01T00:00:00Z"}]}],
+            "total": 1,
+        })
+
+    app = web.Application()
+    app.router.add_post("/v1/test", ok_handler)
+    app.router.add_post("/v1/nested", nested_handler)
+    app.router.add_post("/v1/bad-request", bad_request_handler)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
@@ -0,0 +1,125 @@
+"""Тесты сбора отдельных запросов элементов в общие запросы."""
+import asyncio
+
+import pytest
+
+from src.ozonapi.seller.core.batch_loader import BatchLoader, index_items, single_key
+from src.ozonapi.seller.core.exceptions import APIClientError, APIServerError
+
+
+class RecordingLoader:
+    """Загрузчик элементов, запоминающий запрошенные наборы ключей."""
+
+    def __init__(self, missing=(), invalid=(), error=None):
+        self.batches = []
+        self.missing = set(missing)
+        self.invalid = set(invalid)
+        self.error = error
+
+    async def __call__(self, keys):
+        self.batches.append(list(keys))
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        if self.invalid & set(keys):
+            raise APIClientError(400, "invalid id")
+        return {key: {"id": key} for key in keys if key not in self.missing}
+
+
+class TestBatchLoader:
+    """Тесты BatchLoader."""
+
+    @pytest.mark.asyncio
+    async def test_collects_keys_into_one_batch(self):
+        """Тест загрузки одновременно запрошенных ключей одним запросом."""
+        load_batch = RecordingLoader(missing={3})
+        loader = BatchLoader(load_batch, window=0.01)
+
+        results = await asyncio.gather(*(loader.load(key) for key in (1, 2, 3, 1)))
+
+        assert results == [{"id": 1}, {"id": 2}, None, {"id": 1}]
+        assert load_batch.batches == [[1, 2, 3]]
+        assert loader.get_state() == {"loads": 4, "batches": 1, "pending": 0}
+
+    @pytest.mark.asyncio
+    async def test_full_batch_dispatched_immediately(self):
+        """Тест отправки запроса без ожидания при наборе max_batch_size ключей."""
+        load_batch = RecordingLoader()
+        loader = BatchLoader(load_batch, max_batch_size=2, window=10)
+
+        results = await asyncio.wait_for(loader.load_many([1, 2, 3, 4]), timeout=1)
+
+        assert [result["id"] for result in results] == [1, 2, 3, 4]
+        assert load_batch.batches == [[1, 2], [3, 4]]
+
+    @pytest.mark.asyncio
+    async def test_invalid_key_error_isolated(self):
+        """Тест передачи ошибки только вызову с ошибочным ключом."""
+        load_batch = RecordingLoader(invalid={3})
+        loader = BatchLoader(load_batch, window=0.01)
+
+        results = await asyncio.gather(*(loader.load(key) for key in range(1, 5)), return_exceptions=True)
+
+        assert isinstance(results[2], APIClientError)
+        assert [result["id"] for i, result in enumerate(results) if i != 2] == [1, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_request_wide_client_error_not_bisected(self):
+        """Тест передачи общей ошибки 400 всем вызовам без деления до отдельных ключей."""
+        load_batch = RecordingLoader(error=APIClientError(400, "invalid filter"))
+        loader = BatchLoader(load_batch, window=0.01)
+
+        results = await asyncio.gather(*(loader.load(key) for key in range(64)), return_exceptions=True)
+
+        assert all(isinstance(result, APIClientError) for result in results)
+        # Весь запрос и три уровня деления: 1 + 2 + 4 + 8 вместо 2 * 64 - 1
+        assert len(load_batch.batches) == 15
+        assert loader.get_state()["batches"] == 15
+
+    @pytest.mark.asyncio
+    async def test_same_error_in_both_halves_isolated(self):
+        """Тест передачи одинаковой ошибки ошибочных ключей из обеих половин только их вызовам."""
+        load_batch = RecordingLoader(invalid={"bad1", "bad2"})
+        loader = BatchLoader(load_batch, window=0.01)
+        keys = ["bad1", "a", "b", "c", "bad2", "d", "e", "f"]
+
+        results = await asyncio.gather(*(loader.load(key) for key in keys), return_exceptions=True)
+
+        assert [key for key, result in zip(keys, results) if isinstance(result, APIClientError)] == ["bad1", "bad2"]
+        assert [result["id"] for result in results if isinstance(result, dict)] == ["a", "b", "c", "d", "e", "f"]
+
+    @pytest.mark.asyncio
+    async def test_batch_error_shared(self):
+        """Тест передачи ошибки сервера всем вызовам без повторных запросов."""
+        load_batch = RecordingLoader(error=APIServerError(500, "internal"))
+        loader = BatchLoader(load_batch, window=0.01)
+
+        results = await asyncio.gather(*(loader.load(key) for key in (1, 2)), return_exceptions=True)
+
+        assert all(isinstance(result, APIServerError) for result in results)
+        assert len(load_batch.batches) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Тест загрузки ключа для остальных вызовов при отмене одного из них."""
+        loader = BatchLoader(RecordingLoader(), window=0.01)
+        first = asyncio.create_task(loader.load(1))
+        second = asyncio.create_task(loader.load(1))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == {"id": 1}
+
+
+class TestHelpers:
+    """Тесты вспомогательных функций."""
+
+    def test_single_key(self):
+        """Тест выбора единственного заданного идентификатора."""
+        assert single_key(offer_id=None, sku=5) == ("sku", 5)
+        with pytest.raises(ValueError):
+            single_key(offer_id="a", sku=5)
+
+    def test_index_items_bytes(self):
+        """Тест индексации элементов ответа в байтах."""
+        assert index_items(b'{"items": [{"id": 1}]}', lambda item: (item["id"],)) == {1: {"id": 1}}
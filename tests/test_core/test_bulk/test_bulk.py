@@ -0,0 +1,115 @@
+"""Тесты пакетного выполнения запросов с делением на части."""
+import asyncio
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from src.ozonapi.seller.core.bulk import (
+    chunked,
+    execute_chunked,
+    max_items,
+    merge_flags,
+    merge_lists,
+)
+from src.ozonapi.seller.core.exceptions import APIBulkError, APIServerError
+from src.ozonapi.seller.schemas.fbs import PostingFBSPackageLabelRequest
+
+
+class FakeRequest(BaseModel):
+    ids: list[int]
+
+
+class FakeResponse(BaseModel):
+    items: list[int]
+    total: int
+
+
+class TestHelpers:
+    """Тесты вспомогательных функций."""
+
+    def test_chunked(self):
+        """Тест деления на максимальные части с сохранением порядка."""
+        assert chunked(list(range(5)), 2) == [[0, 1], [2, 3], [4]]
+
+    def test_max_items_from_schema(self):
+        """Тест чтения ограничения количества элементов из схемы запроса."""
+        assert max_items(PostingFBSPackageLabelRequest, "posting_number") == 20
+        assert max_items(FakeRequest, "ids") is None
+
+    def test_merge_lists_and_flags(self):
+        """Тест объединения ответов схемами и словарями."""
+        merged = merge_lists("items")([FakeResponse(items=[1], total=2), FakeResponse(items=[2], total=2)])
+        assert merged.items == [1, 2]
+        assert merged.total == 2
+        assert merge_flags()([{"result": True}, {"result": False}]) == {"result": False}
+
+
+class TestExecuteChunked:
+    """Тесты параллельного выполнения частей."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_run_concurrently(self):
+        """Тест одновременного выполнения частей с ограничением concurrency."""
+        running, peak, requests = 0, 0, []
+
+        async def fetch(request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            requests.append(request.ids)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return FakeResponse(items=request.ids, total=0)
+
+        result = await execute_chunked(
+            fetch, lambda chunk: FakeRequest(ids=chunk), list(range(10)), 3,
+            merge=merge_lists("items"), concurrency=2,
+        )
+
+        assert result.items == list(range(10))
+        assert sorted(map(len, requests)) == [1, 3, 3, 3]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_chunk_errors_reported(self):
+        """Тест передачи ошибок частей вместе с ответом успешных частей."""
+        async def fetch(request):
+            if 2 in request.ids:
+                raise APIServerError(500, "internal")
+            return {"items": request.ids, "total": 0}
+
+        with pytest.raises(APIBulkError) as error:
+            await execute_chunked(
+                fetch, lambda chunk: FakeRequest(ids=chunk), [0, 1, 2, 3, 4], 2, merge=merge_lists("items"),
+            )
+
+        assert error.value.code == 500
+        assert error.value.total == 3
+        assert error.value.response["items"] == [0, 1, 4]
+        assert [(e.index, e.items) for e in error.value.errors] == [(1, [2, 3])]
+        assert isinstance(error.value.errors[0].error, APIServerError)
+
+    @pytest.mark.asyncio
+    async def test_bytes_responses_merged_as_dicts(self):
+        """Тест объединения ответов в режиме bytes."""
+        async def fetch(request):
+            return json.dumps({"items": request.ids}).encode()
+
+        result = await execute_chunked(fetch, lambda chunk: FakeRequest(ids=chunk), [1, 2, 3], 2, merge=merge_lists("items"))
+
+        assert result == {"items": [1, 2, 3]}
+
+    @pytest.mark.asyncio
+    async def test_without_merge_returns_responses(self):
+        """Тест возврата ответов частей по порядку без объединения."""
+        async def fetch(request):
+            return request.ids
+
+        assert await execute_chunked(fetch, lambda chunk: FakeRequest(ids=chunk), [1, 2, 3], 2) == [[1, 2], [3]]
+
+    @pytest.mark.asyncio
+    async def test_empty_items(self):
+        """Тест ошибки при пустом списке элементов."""
+        with pytest.raises(ValueError):
+            await execute_chunked(lambda request: None, lambda chunk: FakeRequest(ids=chunk), [], 2)
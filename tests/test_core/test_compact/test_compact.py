@@ -0,0 +1,118 @@
+"""Тесты компактных записей схем ответа."""
+import gc
+import pickle
+import tracemalloc
+
+import pytest
+
+from src.ozonapi.seller.core.compact import CompactRecord, compact_type, from_compact, to_compact
+from src.ozonapi.seller.schemas.entities.postings import Posting, PostingCancelReason
+from src.ozonapi.seller.schemas.prices_and_stocks import ProductInfoStocksItem
+
+
+def stock_item(i: int) -> dict:
+    return {
+        "offer_id": f"OFFER-{i}",
+        "product_id": 1000 + i,
+        "stocks": [
+            {
+                "present": i % 10, "reserved": 1, "shipment_type": "SHIPMENT_TYPE_GENERAL",
+                "sku": 5000 + i, "type": "fbo", "warehouse_ids": [1, 2],
+            },
+        ],
+    }
+
+
+POSTING = {
+    "posting_number": "05708065-0029-1",
+    "order_id": 680420041,
+    "order_number": "05708065-0029",
+    "status": "awaiting_packaging",
+    "in_process_at": "2024-01-15T10:00:00Z",
+    "products": [
+        {"name": "Товар", "offer_id": "OFFER-1", "price": "100.00", "quantity": 1, "sku": 100},
+    ],
+}
+
+
+class TestCompact:
+    """Тесты преобразования схем в компактные записи."""
+
+    def test_fields_and_nested(self):
+        """Тест доступа к полям записи по именам полей схемы, включая вложенные схемы."""
+        item = ProductInfoStocksItem.model_validate(stock_item(1))
+        record = to_compact(item)
+
+        assert isinstance(record, CompactRecord)
+        assert type(record) is compact_type(ProductInfoStocksItem)
+        assert type(record).__name__ == "CompactProductInfoStocksItem"
+        assert record.offer_id == "OFFER-1"
+        assert record.product_id == 1001
+        assert isinstance(record.stocks, tuple)
+        assert record.stocks[0].present == item.stocks[0].present
+        assert record.stocks[0].type is item.stocks[0].type
+        assert record.stocks[0].warehouse_ids == (1, 2)
+        assert not hasattr(record, "__dict__")
+
+    def test_read_only(self):
+        """Тест запрета изменения и удаления полей записи."""
+        record = to_compact(ProductInfoStocksItem.model_validate(stock_item(1)))
+
+        with pytest.raises(AttributeError):
+            record.offer_id = "OTHER"
+        with pytest.raises(AttributeError):
+            del record.offer_id
+        with pytest.raises(AttributeError):
+            record.unknown = 1
+
+    def test_round_trip(self):
+        """Тест обратного преобразования записи в схему."""
+        posting = Posting.model_validate(POSTING)
+        record = to_compact(posting)
+
+        restored = from_compact(record)
+        assert isinstance(restored, Posting)
+        assert restored == posting
+        assert restored.products == posting.products
+        assert record.to_model() == posting
+        assert record == to_compact(restored)
+
+    def test_alias_fields(self):
+        """Тест полей схемы с псевдонимами."""
+        reason = PostingCancelReason.model_validate({"id": 1, "title": "Отмена", "type_id": "buyer"})
+        record = to_compact(reason)
+
+        assert record.id_ == 1
+        assert from_compact(record) == reason
+
+    def test_pickle(self):
+        """Тест сериализации записи через pickle."""
+        record = to_compact(Posting.model_validate(POSTING))
+
+        restored = pickle.loads(pickle.dumps(record))
+        assert restored == record
+        assert restored.products[0].offer_id == "OFFER-1"
+
+    def test_memory(self):
+        """Тест уменьшения памяти, занимаемой элементами ответа."""
+        items = [stock_item(i) for i in range(2000)]
+
+        def retained(build):
+            gc.collect()
+            tracemalloc.start()
+            try:
+                result = build()
+                gc.collect()
+                current, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            return result, current
+
+        models, models_size = retained(lambda: [ProductInfoStocksItem.model_validate(item) for item in items])
+        del models
+        records, records_size = retained(
+            lambda: [to_compact(ProductInfoStocksItem.model_validate(item)) for item in items]
+        )
+
+        assert len(records) == 2000
+        assert records_size * 2 < models_size
@@ -69,10 +69,6 @@ async def api_manager():
 
     yield manager
 
-    # Очищаем ресурсы
-    if hasattr(manager, '_logging_manager') and manager._logging_manager:
-        manager._logging_manager.shutdown()
-
     # Восстанавливаем оригинальные менеджеры
     APIManager._session_manager = original_session_manager
     APIManager._method_rate_limiter_manager = original_method_limiter_manager
@@ -109,16 +105,22 @@ async def api_manager_with_token():
 
     yield manager
 
-    # Очищаем ресурсы
-    if hasattr(manager, '_logging_manager') and manager._logging_manager:
-        manager._logging_manager.shutdown()
-
     # Восстанавливаем оригинальные менеджеры
     APIManager._session_manager = original_session_manager
     APIManager._method_rate_limiter_manager = original_method_limiter_manager
     APIManager._initialized = original_initialized
 
 
+@pytest.fixture
+async def local_api_manager(api_manager, local_api_server):
+    """Направляет запросы APIManager на локальный сервер."""
+    api_manager._config = api_manager._config.model_copy(
+        update={"base_url": str(local_api_server.make_url("")).rstrip("/"), "max_retries": 0}
+    )
+    yield api_manager
+    await APIManager._session_manager.close_all()
+
+
 # Остальные фикстуры для моков
 @pytest.fixture
 def mock_session_manager():
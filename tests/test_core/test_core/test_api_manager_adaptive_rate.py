@@ -0,0 +1,119 @@
+"""Тесты адаптивного ограничения запросов APIManager на локальном сервере со скрытым лимитом."""
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.ozonapi.seller.core import APIManager
+from src.ozonapi.seller.core.exceptions import APITooManyRequestsError
+
+HIDDEN_LIMIT = 10
+RETRY_AFTER_CALLS = web.AppKey("retry_after_calls", list)
+
+
+@pytest.fixture
+async def throttling_api_server():
+    """Запускает локальный сервер, пропускающий не более HIDDEN_LIMIT запросов в секунду."""
+    window = {"started": time.monotonic(), "accepted": 0}
+
+    async def limited_handler(request):
+        now = time.monotonic()
+        if now - window["started"] >= 1:
+            window["started"], window["accepted"] = now, 0
+        if window["accepted"] >= HIDDEN_LIMIT:
+            return web.json_response({"code": 8, "message": "too many requests", "details": []}, status=429)
+        window["accepted"] += 1
+        return web.json_response({"result": "ok"})
+
+    async def retry_after_handler(request):
+        app[RETRY_AFTER_CALLS].append(time.monotonic())
+        if len(app[RETRY_AFTER_CALLS]) == 1:
+            return web.json_response(
+                {"code": 8, "message": "too many requests", "details": []},
+                status=429,
+                headers={"Retry-After": "0.5"},
+            )
+        return web.json_response({"result": "ok"})
+
+    app = web.Application()
+    app[RETRY_AFTER_CALLS] = []
+    app.router.add_post("/v1/limited", limited_handler)
+    app.router.add_post("/v1/retry-after", retry_after_handler)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def throttled_api_manager(api_manager, throttling_api_server):
+    """Направляет запросы APIManager на сервер со скрытым лимитом."""
+    APIManager._adaptive_rate_manager.clear()
+    api_manager._config = api_manager._config.model_copy(
+        update={
+            "base_url": str(throttling_api_server.make_url("")).rstrip("/"),
+            "max_retries": 0,
+        }
+    )
+    yield api_manager
+    APIManager._adaptive_rate_manager.clear()
+    await APIManager._session_manager.close_all()
+
+
+class TestAPIManagerAdaptiveRate:
+    """Тесты адаптивного ограничения запросов APIManager."""
+
+    @pytest.mark.asyncio
+    async def test_converges_to_hidden_limit(self, throttled_api_manager):
+        """Тест снижения доли ответов 429 и сходимости к скрытому лимиту сервера."""
+        results: list[tuple[float, bool]] = []
+        started = time.monotonic()
+
+        async def worker():
+            while True:
+                try:
+                    await throttled_api_manager._request(endpoint="limited")
+                    results.append((time.monotonic() - started, True))
+                except APITooManyRequestsError:
+                    results.append((time.monotonic() - started, False))
+
+        tasks = [asyncio.create_task(worker()) for _ in range(100)]
+        await asyncio.sleep(3)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        first_second = [ok for at, ok in results if at < 1]
+        last_second = [ok for at, ok in results if 2 <= at < 3]
+        state = (await APIManager.get_adaptive_rate_stats("test_client"))["test_client"]["v1/limited"]
+
+        # Без адаптации 27 запросов в сек. дают 17 ответов 429 в секунду
+        assert last_second.count(False) < first_second.count(False)
+        assert last_second.count(False) <= 6
+        assert last_second.count(True) >= HIDDEN_LIMIT * 0.6
+        assert state["throttled"] > 0
+        assert state["rate"] < throttled_api_manager.config.max_requests_per_second
+
+    @pytest.mark.asyncio
+    async def test_retry_after_delays_next_request(self, throttled_api_manager, throttling_api_server):
+        """Тест соблюдения Retry-After перед следующим запросом к конечной точке."""
+        with pytest.raises(APITooManyRequestsError):
+            await throttled_api_manager._request(endpoint="retry-after")
+
+        await throttled_api_manager._request(endpoint="retry-after")
+
+        calls = throttling_api_server.app[RETRY_AFTER_CALLS]
+        assert calls[1] - calls[0] >= 0.45
+
+    @pytest.mark.asyncio
+    async def test_adaptive_rate_can_be_disabled(self, throttled_api_manager):
+        """Тест отключения адаптивного ограничения в конфигурации."""
+        throttled_api_manager._config = throttled_api_manager._config.model_copy(
+            update={"adaptive_rate_limit": False}
+        )
+
+        await throttled_api_manager._request(endpoint="limited")
+
+        assert await APIManager.get_adaptive_rate_stats() == {}
@@ -0,0 +1,90 @@
+"""Тесты логеров экземпляров APIManager на общем конвейере логирования."""
+import gc
+import logging
+import threading
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from src.ozonapi.seller.core.config import APIConfig
+from src.ozonapi.seller.core.core import APIManager
+from src.ozonapi.seller.core.rate_limiter import RateLimiterManager
+
+
+@pytest.fixture
+def clean_config():
+    """Подменяет загрузку конфигурации без чтения .env и переменных окружения."""
+    original_session_manager = APIManager._session_manager
+    original_method_limiter_manager = APIManager._method_rate_limiter_manager
+    APIManager._session_manager = None
+    APIManager._method_rate_limiter_manager = None
+
+    config = APIConfig.model_construct(client_id=None, api_key=None, token=None, base_url="https://api-seller.ozon.ru")
+    with patch.object(APIManager, "load_config", classmethod(lambda cls, user_config=None: config)):
+        yield config
+
+    APIManager._session_manager = original_session_manager
+    APIManager._method_rate_limiter_manager = original_method_limiter_manager
+
+
+class TestAPIManagerLogging:
+    """Тесты логирования экземпляров APIManager."""
+
+    @pytest.mark.asyncio
+    async def test_instances_share_logger(self, clean_config):
+        """Тест общего логера для экземпляров с одинаковыми настройками логирования."""
+        first = APIManager(client_id="first", api_key="key")
+        second = APIManager(client_id="second", api_key="key")
+
+        assert first.logger.logger is second.logger.logger
+        assert first.logger.extra["client_id"] == "first"
+        assert second.logger.extra["instance"] > first.logger.extra["instance"]
+
+        await first.close()
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_record_name_identifies_instance(self, clean_config):
+        """Тест вывода ClientID и номера экземпляра в имени записи."""
+        api = APIManager(client_id="named", api_key="key")
+        records = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+
+        handler = ListHandler()
+        api.logger.logger.addHandler(handler)
+        try:
+            api.logger.error("Ошибка", extra={"endpoint": "v1/test"})
+        finally:
+            api.logger.logger.removeHandler(handler)
+            await api.close()
+
+        assert records[0].name == f"ozonapi.seller.client[named]-[{api.logger.extra['instance']}]"
+        assert records[0].endpoint == "v1/test"
+
+    @pytest.mark.asyncio
+    async def test_create_and_close_10k_clients(self, clean_config):
+        """Тест отсутствия роста потоков, логеров и памяти при создании и закрытии 10 000 клиентов."""
+        for _ in range(100):
+            await APIManager(client_id="short_lived", api_key="key").close()
+        gc.collect()
+
+        threads = threading.active_count()
+        loggers = len(logging.Logger.manager.loggerDict)
+        tracemalloc.start()
+        try:
+            memory = tracemalloc.get_traced_memory()[0]
+            for _ in range(10000):
+                await APIManager(client_id="short_lived", api_key="key").close()
+            gc.collect()
+            memory_growth = tracemalloc.get_traced_memory()[0] - memory
+        finally:
+            tracemalloc.stop()
+
+        assert threading.active_count() == threads
+        assert len(logging.Logger.manager.loggerDict) == loggers
+        assert memory_growth < 256 * 1024
+        assert RateLimiterManager.get_limiter_state("short_lived")["short_lived"]["instances"]["count"] == 0
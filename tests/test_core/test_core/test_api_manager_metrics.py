@@ -0,0 +1,224 @@
+"""Тесты измерения этапов запросов APIManager и метрик по конечным точкам."""
+import asyncio
+import math
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from pydantic import BaseModel
+
+from src.ozonapi.seller.core import APIManager, RequestMetrics, ResponseMode, TokenBucket
+from src.ozonapi.seller.core.core import _NO_TIMING
+from src.ozonapi.seller.core.exceptions import APIClientError
+from src.ozonapi.seller.core.method_rate_limiter import MethodRateLimitConfig, current_method_limiter
+from src.ozonapi.seller.core.metrics import Histogram, PHASES
+from src.ozonapi.seller.core.token_bucket import acquire
+
+CALLS = web.AppKey("calls", list)
+
+
+class OkResponse(BaseModel):
+    result: str
+
+
+@pytest.fixture
+async def metrics_api_server():
+    """Запускает локальный сервер с обычным, ошибочным и однократно ограничивающим обработчиками."""
+    async def ok_handler(request):
+        return web.json_response({"result": "ok"})
+
+    async def bad_request_handler(request):
+        return web.json_response({"code": 3, "message": "invalid request", "details": []}, status=400)
+
+    async def throttled_once_handler(request):
+        request.app[CALLS].append(request.path)
+        if len(request.app[CALLS]) == 1:
+            return web.json_response({"code": 8, "message": "too many requests", "details": []}, status=429)
+        return web.json_response({"result": "ok"})
+
+    app = web.Application()
+    app[CALLS] = []
+    app.router.add_post("/v1/test", ok_handler)
+    app.router.add_post("/v1/bad-request", bad_request_handler)
+    app.router.add_post("/v1/throttled-once", throttled_once_handler)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def metrics(api_manager, metrics_api_server):
+    """Подключает сборщик метрик и направляет запросы APIManager на локальный сервер."""
+    api_manager._config = api_manager._config.model_copy(
+        update={
+            "base_url": str(metrics_api_server.make_url("")).rstrip("/"),
+            "max_retries": 1,
+            "retry_min_wait": 0.01,
+            "retry_max_wait": 0.01,
+            "adaptive_rate_limit": False,
+            "coalesce_requests": False,
+        }
+    )
+    request_metrics = RequestMetrics()
+    APIManager.set_request_metrics(request_metrics)
+    yield request_metrics
+    APIManager.set_request_metrics(None)
+    await APIManager._session_manager.close_all()
+
+
+class TestHistogram:
+    """Тесты гистограммы длительностей."""
+
+    def test_observe_and_quantiles(self):
+        """Тест учета значений и оценки квантилей по границам корзин."""
+        histogram = Histogram()
+        for value in (0.002,) * 9 + (0.3,):
+            histogram.observe(value)
+
+        state = histogram.get_state()
+        assert state["count"] == 10
+        assert state["max"] == 0.3
+        assert state["mean"] == pytest.approx(0.0318)
+        assert state["p50"] == 0.0025
+        assert state["p99"] == 0.3
+        assert state["buckets"][0.0025] == 9
+        assert state["buckets"][0.5] == 1
+        assert state["buckets"][math.inf] == 0
+
+    def test_empty_histogram(self):
+        """Тест сводки пустой гистограммы."""
+        state = Histogram().get_state()
+        assert state["count"] == 0
+        assert state["mean"] == 0.0
+        assert state["p90"] == 0.0
+
+
+class TestTokenBucketWaits:
+    """Тесты учета ожидания токенов в иерархии корзин."""
+
+    @pytest.mark.asyncio
+    async def test_on_wait_reports_blocking_bucket(self):
+        """Тест передачи корзины, которой не хватило токена, и длительности ожидания."""
+        outer, inner = TokenBucket(100, 1), TokenBucket(1, 0.1)
+        waits = []
+
+        await acquire((outer, inner), lambda bucket, seconds: waits.append((bucket, seconds)))
+        assert waits == []
+
+        await acquire((outer, inner), lambda bucket, seconds: waits.append((bucket, seconds)))
+        assert len(waits) == 1
+        assert waits[0][0] is inner
+        assert waits[0][1] == pytest.approx(0.1, abs=0.05)
+
+
+class TestAPIManagerMetrics:
+    """Тесты метрик запросов APIManager."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, api_manager):
+        """Тест отсутствия измерений без подключенного сборщика."""
+        assert APIManager._request_metrics is None
+        assert api_manager._measure_attempt(None, "v1/test", 0) is _NO_TIMING
+        stats = await APIManager.get_request_stats()
+        assert stats["endpoints"] == {}
+        assert "test_client" in stats["limiters"]
+
+    @pytest.mark.asyncio
+    async def test_records_phases_and_counters(self, api_manager, metrics):
+        """Тест учета этапов, счетчиков и размера ответа по конечной точке."""
+        timings = []
+        metrics.add_hook(timings.append)
+
+        assert await api_manager._request(endpoint="test") == {"result": "ok"}
+        with api_manager.response_mode(ResponseMode.VALIDATE):
+            assert (await api_manager._request(endpoint="test", response_model=OkResponse)).result == "ok"
+        with api_manager.response_mode(ResponseMode.CONSTRUCT):
+            await api_manager._request(endpoint="test", response_model=OkResponse)
+
+        assert [timing.status for timing in timings] == [200, 200, 200]
+        first, validated, constructed = timings
+        assert first.connect > 0
+        assert first.ttfb > 0
+        assert first.decode > 0 and first.validate == 0
+        assert validated.validate > 0 and validated.decode == 0
+        assert constructed.decode > 0 and constructed.validate > 0
+        assert first.size == len(b'{"result": "ok"}')
+        assert first.total >= first.limiter_wait + first.connect + first.ttfb + first.download
+
+        state = (await APIManager.get_request_stats("test_client"))["endpoints"]["test_client"]["v1/test"]
+        assert state["requests"] == 3
+        assert state["retries"] == 0
+        assert state["bytes"] == 3 * first.size
+        assert state["in_flight"] == 0
+        assert set(state["phases"]) == set(PHASES)
+        assert state["phases"]["total"]["count"] == 3
+        assert state["phases"]["validate"]["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_counts_errors_retries_and_throttling(self, api_manager, metrics):
+        """Тест счетчиков ошибок, повторов и ответов 429."""
+        with pytest.raises(APIClientError):
+            await api_manager._request(endpoint="bad-request")
+        assert await api_manager._request(endpoint="throttled-once") == {"result": "ok"}
+
+        state = metrics.get_state("test_client")["test_client"]
+        assert state["v1/bad-request"]["errors"] == 1
+        throttled = state["v1/throttled-once"]
+        assert throttled["requests"] == 2
+        assert throttled["retries"] == 1
+        assert throttled["throttled"] == 1
+        assert throttled["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_method_limiter_wait(self, api_manager, metrics):
+        """Тест учета ожидания ограничителя метода по уровню и по имени корзины."""
+        config = MethodRateLimitConfig(limit_requests=1, interval_seconds=0.2, method_identifier="tests.metrics")
+        bucket = APIManager._method_rate_limiter_manager.get_bucket("test_client", config)
+        timings = []
+        metrics.add_hook(timings.append)
+
+        token = current_method_limiter.set(bucket)
+        try:
+            await asyncio.gather(*(api_manager._request(endpoint="test") for _ in range(2)))
+        finally:
+            current_method_limiter.reset(token)
+
+        waited = max(timings, key=lambda timing: timing.limiter_wait)
+        assert waited.limiter_waits["method"] == pytest.approx(0.2, abs=0.1)
+        assert waited.limiter_wait >= waited.limiter_waits["method"]
+
+        state = metrics.get_state()["test_client"]["v1/test"]
+        assert state["limiter_waits"]["method"]["count"] == 1
+
+        stats = (await APIManager.get_method_limiter_stats())["test_client:tests.metrics"]
+        assert stats["limit_requests"] == 1
+        assert stats["interval_seconds"] == 0.2
+        assert stats["waiters"] == 0
+        assert stats["wait"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hook_errors_do_not_break_requests(self, api_manager, metrics):
+        """Тест выполнения запроса при ошибке обработчика событий."""
+        def failing_hook(timing):
+            raise RuntimeError("hook failed")
+
+        metrics.add_hook(failing_hook)
+        assert await api_manager._request(endpoint="test") == {"result": "ok"}
+        metrics.remove_hook(failing_hook)
+        assert metrics.get_state()["test_client"]["v1/test"]["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queued_waiters_gauge(self, api_manager):
+        """Тест отображения ожидающих токен клиента в состоянии ограничителей."""
+        client_limiter = api_manager._rate_limiter.client_limiter
+        while client_limiter.tokens >= 1:
+            client_limiter._tokens -= 1
+        waiter = asyncio.ensure_future(acquire((client_limiter,)))
+        await asyncio.sleep(0)
+
+        state = (await APIManager.get_request_stats("test_client"))["limiters"]["test_client"]
+        assert state["client"]["waiters"] == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
@@ -0,0 +1,289 @@
+"""Тесты цепочки middleware запросов APIManager."""
+import logging
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from pydantic import BaseModel
+
+from src.ozonapi.seller.core import (
+    APIManager,
+    DecodingMiddleware,
+    LoggingMiddleware,
+    Middleware,
+    RequestContext,
+    ResponseMode,
+)
+from src.ozonapi.seller.core.exceptions import APIServerError
+from src.ozonapi.seller.core.middleware import DEFAULT_PIPELINE, MiddlewarePipeline, _PayloadSnippet
+from src.ozonapi.seller.core.retry import RetryBudget
+
+CALLS = web.AppKey("calls", dict)
+
+
+class OkResponse(BaseModel):
+    result: str
+
+
+class ItemResponse(BaseModel):
+    id: int
+
+
+class RecordingMiddleware(Middleware):
+    """Запоминает вызванные этапы."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple] = []
+
+    async def pre_send(self, ctx: RequestContext) -> None:
+        self.events.append(("pre_send", ctx.versioned_endpoint, ctx.attempt))
+
+    async def post_receive(self, ctx: RequestContext) -> None:
+        self.events.append(("post_receive", ctx.status, ctx.body, ctx.result))
+
+    async def on_error(self, ctx: RequestContext, error: Exception) -> None:
+        self.events.append(("on_error", type(error).__name__, ctx.retry_delay is not None))
+
+    async def on_retry(self, ctx: RequestContext, error: Exception) -> None:
+        self.events.append(("on_retry", ctx.attempt))
+
+
+@pytest.fixture
+async def middleware_api_server():
+    """Запускает локальный сервер, возвращающий заголовок авторизации и сбоящий на первый запрос."""
+    async def echo_handler(request):
+        return web.json_response({"result": request.headers.get("X-Auth", "none")})
+
+    async def unavailable_handler(request):
+        calls = request.app[CALLS]
+        calls[request.path] = calls.get(request.path, 0) + 1
+        if calls[request.path] == 1:
+            return web.json_response({"code": 14, "message": "unavailable"}, status=503)
+        return web.json_response({"result": "ok"})
+
+    async def items_handler(request):
+        return web.json_response({"items": [{"id": 1}, {"id": 2}], "total": 2})
+
+    app = web.Application()
+    app[CALLS] = {}
+    app.router.add_post("/v1/echo", echo_handler)
+    app.router.add_post("/v1/unavailable", unavailable_handler)
+    app.router.add_post("/v1/items", items_handler)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def middleware_api_manager(api_manager, middleware_api_server):
+    """Направляет запросы APIManager на локальный сервер с короткими задержками повторов."""
+    original_budget = APIManager._retry_budget
+    APIManager._retry_budget = RetryBudget()
+    api_manager._config = api_manager._config.model_copy(
+        update={
+            "base_url": str(middleware_api_server.make_url("")).rstrip("/"),
+            "max_retries": 1,
+            "retry_min_wait": 0.01,
+            "retry_max_wait": 0.01,
+            "adaptive_rate_limit": False,
+            "coalesce_requests": False,
+        }
+    )
+    yield api_manager
+    APIManager._retry_budget = original_budget
+    await APIManager._session_manager.close_all()
+
+
+class TestMiddlewarePipeline:
+    """Тесты отбора обработчиков этапов."""
+
+    def test_only_overridden_stages_are_resolved(self):
+        """Тест отбора только переопределенных этапов."""
+        class PreSendOnly(Middleware):
+            async def pre_send(self, ctx):
+                pass
+
+        middleware = PreSendOnly()
+        pipeline = MiddlewarePipeline([middleware, Middleware()])
+        assert pipeline.pre_send == (middleware.pre_send,)
+        assert pipeline.post_receive == ()
+        assert pipeline.on_error == ()
+        assert pipeline.on_retry == ()
+
+    def test_default_pipeline_is_shared(self, api_manager):
+        """Тест общей цепочки для клиентов без собственных middleware."""
+        assert api_manager._pipeline is DEFAULT_PIPELINE
+        assert len(DEFAULT_PIPELINE.pre_send) == 2
+        assert len(DEFAULT_PIPELINE.post_receive) == 3
+
+    def test_add_and_remove_middleware(self, api_manager):
+        """Тест добавления middleware в начало и конец цепочки и удаления встроенного middleware."""
+        first, last = RecordingMiddleware(), RecordingMiddleware()
+        api_manager.add_middleware(last)
+        api_manager.add_middleware(first, before=DecodingMiddleware)
+
+        chain = api_manager.middleware
+        assert chain[-1] is last
+        assert chain.index(first) == [type(item) for item in chain].index(DecodingMiddleware) - 1
+        assert api_manager._pipeline is not DEFAULT_PIPELINE
+
+        logging_middleware = next(item for item in chain if isinstance(item, LoggingMiddleware))
+        api_manager.remove_middleware(logging_middleware)
+        assert not any(isinstance(item, LoggingMiddleware) for item in api_manager.middleware)
+
+    def test_add_before_missing_middleware(self, api_manager):
+        """Тест ошибки при добавлении перед отсутствующим в цепочке middleware."""
+        class Missing(Middleware):
+            pass
+
+        with pytest.raises(ValueError):
+            api_manager.add_middleware(RecordingMiddleware(), before=Missing)
+
+
+class TestAPIManagerMiddleware:
+    """Тесты выполнения этапов middleware при запросах."""
+
+    @pytest.mark.asyncio
+    async def test_pre_send_sets_headers(self, middleware_api_manager):
+        """Тест собственной авторизации через заголовки на этапе pre_send."""
+        class AuthMiddleware(Middleware):
+            async def pre_send(self, ctx):
+                ctx.headers = {"X-Auth": "secret"}
+
+        middleware_api_manager.add_middleware(AuthMiddleware())
+        assert await middleware_api_manager._request(endpoint="echo") == {"result": "secret"}
+
+    @pytest.mark.asyncio
+    async def test_post_receive_order(self, middleware_api_manager):
+        """Тест доступа к телу ответа до формирования результата и к результату после него."""
+        before, after = RecordingMiddleware(), RecordingMiddleware()
+        middleware_api_manager.add_middleware(before, before=DecodingMiddleware)
+        middleware_api_manager.add_middleware(after)
+
+        with middleware_api_manager.response_mode(ResponseMode.VALIDATE):
+            result = await middleware_api_manager._request(endpoint="echo", response_model=OkResponse)
+
+        assert before.events[1] == ("post_receive", 200, b'{"result": "none"}', None)
+        assert after.events[1] == ("post_receive", 200, b'{"result": "none"}', result)
+
+    @pytest.mark.asyncio
+    async def test_post_receive_replaces_result(self, middleware_api_manager):
+        """Тест замены результата вызова на этапе post_receive."""
+        class Wrapping(Middleware):
+            async def post_receive(self, ctx):
+                ctx.result = {"wrapped": ctx.result}
+
+        middleware_api_manager.add_middleware(Wrapping())
+        assert await middleware_api_manager._request(endpoint="echo") == {"wrapped": {"result": "none"}}
+
+    @pytest.mark.asyncio
+    async def test_error_and_retry_stages(self, middleware_api_manager):
+        """Тест этапов on_error и on_retry при повторе после ответа 503."""
+        recorder = RecordingMiddleware()
+        middleware_api_manager.add_middleware(recorder)
+
+        assert await middleware_api_manager._request(endpoint="unavailable") == {"result": "ok"}
+        assert recorder.events == [
+            ("pre_send", "v1/unavailable", 0),
+            ("on_error", "APIServerError", True),
+            ("on_retry", 1),
+            ("pre_send", "v1/unavailable", 1),
+            ("post_receive", 200, b'{"result": "ok"}', {"result": "ok"}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_on_error_cancels_retry(self, middleware_api_manager):
+        """Тест отмены повтора, назначенного встроенной политикой."""
+        class NoRetry(Middleware):
+            async def on_error(self, ctx, error):
+                ctx.retry_delay = None
+
+        middleware_api_manager.add_middleware(NoRetry())
+        with pytest.raises(APIServerError):
+            await middleware_api_manager._request(endpoint="unavailable")
+
+    @pytest.mark.asyncio
+    async def test_stream_request_runs_stages(self, middleware_api_manager):
+        """Тест выполнения этапов при потоковом запросе."""
+        recorder = RecordingMiddleware()
+        middleware_api_manager.add_middleware(recorder)
+
+        page = middleware_api_manager._stream_request(
+            endpoint="items", item_path=("items",), item_model=ItemResponse,
+        )
+        items = [item async for item in page]
+
+        assert [item.id for item in items] == [1, 2]
+        assert page.data["total"] == 2
+        assert [event[0] for event in recorder.events] == ["pre_send", "post_receive"]
+
+
+class TestLoggingMiddleware:
+    """Тесты логирования запросов."""
+
+    @pytest.fixture
+    def captured(self, middleware_api_manager):
+        """Перехватывает сообщения лога клиента."""
+        records = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+
+        handler = ListHandler()
+        logger = middleware_api_manager.logger.logger
+        original_level, original_propagate = logger.level, logger.propagate
+        logger.addHandler(handler)
+        logger.propagate = False
+        yield records
+        logger.removeHandler(handler)
+        logger.setLevel(original_level)
+        logger.propagate = original_propagate
+
+    def test_payload_snippet_is_lazy(self):
+        """Тест формирования сниппета тела запроса только при выводе."""
+        class Unserializable:
+            pass
+
+        _PayloadSnippet({"value": Unserializable()})
+        assert repr(_PayloadSnippet({"a": "x" * 300})).endswith("...'")
+
+    @pytest.mark.asyncio
+    async def test_no_records_when_level_disabled(self, middleware_api_manager, captured, monkeypatch):
+        """Тест отсутствия сообщений и сниппета тела запроса при выключенном уровне INFO."""
+        def failing_repr(self):
+            raise AssertionError("snippet formatted")
+
+        monkeypatch.setattr(_PayloadSnippet, "__repr__", failing_repr)
+        middleware_api_manager.logger.setLevel(logging.ERROR)
+        await middleware_api_manager._request(endpoint="echo", payload={"value": 1})
+        assert captured == []
+
+    @pytest.mark.asyncio
+    async def test_records_size_from_body(self, middleware_api_manager, captured):
+        """Тест размера ответа по длине тела в байтах."""
+        middleware_api_manager.logger.setLevel(logging.INFO)
+        await middleware_api_manager._request(endpoint="echo", payload={"value": 1})
+
+        messages = [record.getMessage() for record in captured]
+        assert messages[0].startswith("Отправка запроса к API")
+        assert "'{\"value\": 1}'" in messages[0]
+        assert "'response_size': 18" in messages[1]
+
+    @pytest.mark.asyncio
+    async def test_sampling(self, middleware_api_manager, captured):
+        """Тест выборочного логирования с записью повторов для всех вызовов."""
+        middleware_api_manager.logger.setLevel(logging.DEBUG)
+        middleware_api_manager.remove_middleware(
+            next(item for item in middleware_api_manager.middleware if isinstance(item, LoggingMiddleware))
+        )
+        middleware_api_manager.add_middleware(LoggingMiddleware(sample_rate=1e-9), before=DecodingMiddleware)
+
+        for _ in range(20):
+            await middleware_api_manager._request(endpoint="echo")
+        await middleware_api_manager._request(endpoint="unavailable")
+
+        messages = [record.getMessage() for record in captured]
+        assert not any(message.startswith(("Отправка", "Получен")) for message in messages)
+        assert any(message.startswith("Попытка [1/1]") for message in messages)
@@ -0,0 +1,43 @@
+"""Тесты ограничения запросов APIManager по иерархии инстанс → client_id → метод."""
+import asyncio
+
+import pytest
+
+from src.ozonapi.seller.core import method_rate_limit
+
+
+@method_rate_limit(limit_requests=1, interval_seconds=60)
+async def limited_request(self):
+    """Запрос с ограничением метода 1 запрос в минуту."""
+    return await self._request(endpoint="test")
+
+
+class TestAPIManagerRateLimit:
+    """Тесты ограничения запросов APIManager."""
+
+    @pytest.mark.asyncio
+    async def test_method_limit_applied_in_request(self, local_api_manager):
+        """Тест списания токена метода в _request вместе с токенами инстанса и client_id."""
+        client_limiter = local_api_manager._rate_limiter.client_limiter
+        tokens_before = client_limiter.tokens
+
+        assert await limited_request(local_api_manager) == {"result": "ok"}
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limited_request(local_api_manager), timeout=0.1)
+
+        # Второй запрос ждал только токен метода и не списал токен client_id
+        assert tokens_before - client_limiter.tokens < 1.5
+
+    @pytest.mark.asyncio
+    async def test_unlimited_request_not_blocked_by_method_limit(self, local_api_manager):
+        """Тест выполнения запросов других методов, пока исчерпан лимит метода."""
+        await limited_request(local_api_manager)
+        waiting = asyncio.create_task(limited_request(local_api_manager))
+        await asyncio.sleep(0.01)
+
+        response = await asyncio.wait_for(local_api_manager._request(endpoint="test"), timeout=1)
+
+        assert response == {"result": "ok"}
+        assert not waiting.done()
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
@@ -0,0 +1,116 @@
+"""Тесты режимов формирования ответа APIManager."""
+import asyncio
+import datetime
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from src.ozonapi.seller.core import ResponseMode
+from src.ozonapi.seller.core.response import construct_model
+
+
+class NestedStock(BaseModel):
+    """Вложенная схема остатка."""
+    present: int
+    updated_at: datetime.datetime
+
+
+class NestedItem(BaseModel):
+    """Вложенная схема товара."""
+    offer_id: str
+    stocks: list[NestedStock]
+
+
+class NestedResponse(BaseModel):
+    """Схема ответа со вложенными схемами."""
+    items: list[NestedItem]
+    total: int
+    cursor: Optional[str] = None
+
+
+class TestAPIManagerResponseMode:
+    """Тесты режимов формирования ответа APIManager."""
+
+    @pytest.mark.asyncio
+    async def test_default_mode_validates(self, local_api_manager):
+        """Тест валидации ответа в режиме по умолчанию."""
+        response = await local_api_manager._request(endpoint="nested", response_model=NestedResponse)
+
+        assert isinstance(response.items[0].stocks[0].updated_at, datetime.datetime)
+
+    @pytest.mark.asyncio
+    async def test_construct_mode_skips_validation(self, local_api_manager):
+        """Тест построения вложенных схем без валидации."""
+        with local_api_manager.response_mode(ResponseMode.CONSTRUCT):
+            response = await local_api_manager._request(endpoint="nested", response_model=NestedResponse)
+
+        assert isinstance(response, NestedResponse)
+        assert isinstance(response.items[0], NestedItem)
+        assert isinstance(response.items[0].stocks[0], NestedStock)
+        assert response.items[0].stocks[0].updated_at == "2024-01-01T00:00:00Z"
+        assert response.cursor is None
+
+    @pytest.mark.asyncio
+    async def test_dict_and_bytes_modes(self, local_api_manager):
+        """Тест получения ответа в виде словаря и байтов."""
+        with local_api_manager.response_mode("dict"):
+            as_dict = await local_api_manager._request(endpoint="nested", response_model=NestedResponse)
+        with local_api_manager.response_mode(ResponseMode.BYTES):
+            as_bytes = await local_api_manager._request(endpoint="nested", response_model=NestedResponse)
+
+        assert as_dict["total"] == 1
+        assert isinstance(as_bytes, bytes)
+        assert b'"offer_id"' in as_bytes
+
+    @pytest.mark.asyncio
+    async def test_config_mode_and_call_override(self, local_api_manager):
+        """Тест режима из конфигурации клиента и его переопределения для вызова."""
+        local_api_manager._config = local_api_manager._config.model_copy(
+            update={"response_mode": ResponseMode.DICT}
+        )
+
+        assert isinstance(
+            await local_api_manager._request(endpoint="nested", response_model=NestedResponse), dict
+        )
+        with local_api_manager.response_mode(ResponseMode.VALIDATE):
+            assert isinstance(
+                await local_api_manager._request(endpoint="nested", response_model=NestedResponse), NestedResponse
+            )
+
+    @pytest.mark.asyncio
+    async def test_call_mode_is_task_local(self, local_api_manager):
+        """Тест изоляции режима ответа в пределах задачи asyncio."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def raw_call():
+            with local_api_manager.response_mode(ResponseMode.DICT):
+                started.set()
+                await release.wait()
+                return await local_api_manager._request(endpoint="nested", response_model=NestedResponse)
+
+        task = asyncio.create_task(raw_call())
+        await started.wait()
+        strict = await local_api_manager._request(endpoint="nested", response_model=NestedResponse)
+        release.set()
+
+        assert isinstance(strict, NestedResponse)
+        assert isinstance(await task, dict)
+
+
+class TestConstructModel:
+    """Тесты построения схем без валидации."""
+
+    def test_construct_model_uses_aliases(self):
+        """Тест заполнения полей схемы по псевдонимам."""
+        from src.ozonapi.seller.schemas.fbs import PostingFBSListResponse
+
+        response = construct_model(
+            PostingFBSListResponse,
+            {"result": {"has_next": True, "postings": [{"posting_number": "1-1", "products": [{"sku": 1}]}]}},
+        )
+
+        assert response.result.has_next is True
+        assert response.result.postings[0].posting_number == "1-1"
+        assert response.result.postings[0].products[0].sku == 1
@@ -0,0 +1,49 @@
+"""Тесты разбора ответа APIManager напрямую в схему ответа."""
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from src.ozonapi.seller.core.exceptions import APIClientError
+
+
+class OkResponse(BaseModel):
+    """Схема ответа локального сервера."""
+    result: str
+
+
+class StrictResponse(BaseModel):
+    """Схема, которой ответ локального сервера не соответствует."""
+    result: int
+
+
+class TestAPIManagerResponseModel:
+    """Тесты разбора ответа APIManager напрямую в схему ответа."""
+
+    @pytest.mark.asyncio
+    async def test_request_returns_dict_without_response_model(self, local_api_manager):
+        """Тест сохранения прежнего поведения без указания схемы."""
+        response = await local_api_manager._request(endpoint="test")
+
+        assert response == {"result": "ok"}
+
+    @pytest.mark.asyncio
+    async def test_request_validates_response_model(self, local_api_manager):
+        """Тест валидации тела ответа в указанную схему."""
+        response = await local_api_manager._request(endpoint="test", response_model=OkResponse)
+
+        assert isinstance(response, OkResponse)
+        assert response.result == "ok"
+
+    @pytest.mark.asyncio
+    async def test_request_raises_validation_error(self, local_api_manager):
+        """Тест ошибки валидации при несоответствии ответа схеме."""
+        with pytest.raises(ValidationError):
+            await local_api_manager._request(endpoint="test", response_model=StrictResponse)
+
+    @pytest.mark.asyncio
+    async def test_request_error_response_with_response_model(self, local_api_manager):
+        """Тест обработки ошибочного ответа при указании схемы."""
+        with pytest.raises(APIClientError) as exc_info:
+            await local_api_manager._request(endpoint="bad-request", response_model=OkResponse)
+
+        assert exc_info.value.code == 3
+        assert exc_info.value.message == "invalid request"
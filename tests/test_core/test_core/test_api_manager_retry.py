@@ -0,0 +1,163 @@
+"""Тесты повторов запросов APIManager на локальном сервере со сбоями."""
+import asyncio
+import socket
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.ozonapi.seller.core import APIManager, SessionManager
+from src.ozonapi.seller.core.exceptions import (
+    APIConnectError,
+    APIServerError,
+    APITimeoutError,
+)
+from src.ozonapi.seller.core.retry import RetryBudget
+
+CALLS = web.AppKey("calls", dict)
+
+
+@pytest.fixture
+async def faulty_api_server():
+    """Запускает локальный сервер, отвечающий ошибкой на первый запрос к каждой конечной точке."""
+    def first_call(request) -> bool:
+        calls = request.app[CALLS]
+        calls[request.path] = calls.get(request.path, 0) + 1
+        return calls[request.path] == 1
+
+    async def unavailable_handler(request):
+        if first_call(request):
+            return web.json_response({"code": 14, "message": "unavailable"}, status=503)
+        return web.json_response({"result": "ok"})
+
+    async def throttled_handler(request):
+        if first_call(request):
+            return web.json_response({"code": 8, "message": "too many requests"}, status=429)
+        return web.json_response({"result": "ok"})
+
+    async def slow_handler(request):
+        if first_call(request):
+            await asyncio.sleep(1)
+        return web.json_response({"result": "ok"})
+
+    async def reset_handler(request):
+        if first_call(request):
+            request.transport.close()
+            await asyncio.sleep(0.1)
+        return web.json_response({"result": "ok"})
+
+    app = web.Application()
+    app[CALLS] = {}
+    app.router.add_post("/v1/unavailable", unavailable_handler)
+    app.router.add_post("/v1/throttled", throttled_handler)
+    app.router.add_post("/v1/slow", slow_handler)
+    app.router.add_post("/v1/reset", reset_handler)
+    app.router.add_post("/v3/product/import", unavailable_handler)
+    app.router.add_post("/v4/posting/fbs/ship", throttled_handler)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def retrying_api_manager(api_manager, faulty_api_server):
+    """Направляет запросы APIManager на сервер со сбоями с короткими задержками повторов."""
+    original_budget = APIManager._retry_budget
+    APIManager._retry_budget = RetryBudget()
+    APIManager._session_manager = SessionManager(timeout=0.3, pooled=True)
+    api_manager._config = api_manager._config.model_copy(
+        update={
+            "base_url": str(faulty_api_server.make_url("")).rstrip("/"),
+            "max_retries": 2,
+            "retry_min_wait": 0.01,
+            "retry_max_wait": 0.02,
+            "adaptive_rate_limit": False,
+        }
+    )
+    yield api_manager
+    APIManager._retry_budget = original_budget
+    await APIManager._session_manager.close_all()
+
+
+class TestAPIManagerRetry:
+    """Тесты повторов запросов APIManager."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("endpoint", ["unavailable", "throttled", "slow", "reset"])
+    async def test_read_retried_after_transient_failure(self, retrying_api_manager, faulty_api_server, endpoint):
+        """Тест повтора чтения после 5xx, 429, таймаута и разрыва соединения."""
+        response = await retrying_api_manager._request(endpoint=endpoint)
+
+        assert response == {"result": "ok"}
+        assert faulty_api_server.app[CALLS][f"/v1/{endpoint}"] == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_classified(self, retrying_api_manager):
+        """Тест класса ошибки таймаута без повторов."""
+        retrying_api_manager._config = retrying_api_manager._config.model_copy(update={"max_retries": 0})
+
+        with pytest.raises(APITimeoutError) as exc_info:
+            await retrying_api_manager._request(endpoint="slow")
+        assert exc_info.value.code == 408
+
+    @pytest.mark.asyncio
+    async def test_write_not_retried_after_server_error(self, retrying_api_manager, faulty_api_server):
+        """Тест отсутствия повтора создающего запроса после ответа 5xx."""
+        with pytest.raises(APIServerError):
+            await retrying_api_manager._request(api_version="v3", endpoint="product/import", payload={"items": []})
+
+        assert faulty_api_server.app[CALLS]["/v3/product/import"] == 1
+
+    @pytest.mark.asyncio
+    async def test_write_retried_after_throttling(self, retrying_api_manager, faulty_api_server):
+        """Тест повтора создающего запроса после ответа 429."""
+        await retrying_api_manager._request(api_version="v4", endpoint="posting/fbs/ship", payload={})
+
+        assert faulty_api_server.app[CALLS]["/v4/posting/fbs/ship"] == 2
+
+    @pytest.mark.asyncio
+    async def test_explicit_idempotent_overrides_endpoint(self, retrying_api_manager, faulty_api_server):
+        """Тест явного признака идемпотентности запроса."""
+        await retrying_api_manager._request(
+            api_version="v3", endpoint="product/import", payload={}, idempotent=True
+        )
+
+        assert faulty_api_server.app[CALLS]["/v3/product/import"] == 2
+
+    @pytest.mark.asyncio
+    async def test_connect_error_retried_for_write(self, retrying_api_manager):
+        """Тест повтора создающего запроса, если соединение не было установлено."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        retrying_api_manager._config = retrying_api_manager._config.model_copy(
+            update={"base_url": f"http://127.0.0.1:{port}"}
+        )
+
+        with pytest.raises(APIConnectError):
+            await retrying_api_manager._request(api_version="v3", endpoint="product/import", payload={})
+
+        assert (await APIManager.get_retry_stats())["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_budget_limits_retries(self, retrying_api_manager, faulty_api_server):
+        """Тест отказа от повтора при исчерпанном бюджете."""
+        APIManager.set_retry_budget(RetryBudget(ratio=0.1, min_per_second=0))
+
+        with pytest.raises(APIServerError):
+            await retrying_api_manager._request(endpoint="unavailable")
+
+        state = await APIManager.get_retry_stats()
+        assert faulty_api_server.app[CALLS]["/v1/unavailable"] == 1
+        assert state["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_policy_built_once_per_endpoint(self, retrying_api_manager):
+        """Тест переиспользования политики повторов конечной точки."""
+        await retrying_api_manager._request(endpoint="unavailable")
+        policy = retrying_api_manager._get_retry_policy("unavailable")
+
+        await retrying_api_manager._request(endpoint="unavailable")
+
+        assert retrying_api_manager._get_retry_policy("unavailable") is policy
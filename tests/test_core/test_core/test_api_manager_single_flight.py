@@ -0,0 +1,140 @@
+"""Тесты объединения одновременных одинаковых запросов APIManager."""
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.ozonapi.seller.core import APIManager
+from src.ozonapi.seller.core.exceptions import APIServerError
+from src.ozonapi.seller.core.single_flight import is_read_only, payload_digest
+from src.ozonapi.seller.schemas.warehouses import WarehouseListResponse
+
+CALLS = web.AppKey("calls", list)
+
+
+@pytest.fixture
+async def slow_api_server():
+    """Запускает локальный сервер, отвечающий с задержкой и запоминающий запросы."""
+    async def handler(request):
+        request.app[CALLS].append((request.path, await request.json()))
+        await asyncio.sleep(0.1)
+        if request.path == "/v1/posting/fbs/get-by-barcode":
+            return web.json_response({"code": 13, "message": "internal"}, status=500)
+        return web.json_response({"result": []})
+
+    app = web.Application()
+    app[CALLS] = []
+    for path in ("/v1/warehouse/list", "/v2/products/stocks", "/v1/posting/fbs/get-by-barcode"):
+        app.router.add_post(path, handler)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def coalescing_api_manager(api_manager, slow_api_server):
+    """Направляет запросы APIManager на медленный сервер."""
+    APIManager._single_flight.clear()
+    api_manager._config = api_manager._config.model_copy(
+        update={
+            "base_url": str(slow_api_server.make_url("")).rstrip("/"),
+            "max_retries": 0,
+            "adaptive_rate_limit": False,
+        }
+    )
+    yield api_manager
+    APIManager._single_flight.clear()
+    await APIManager._session_manager.close_all()
+
+
+class TestSingleFlightHelpers:
+    """Тесты вспомогательных функций объединения запросов."""
+
+    def test_payload_digest_is_canonical(self):
+        """Тест независимости хеша тела запроса от порядка ключей."""
+        assert payload_digest({"a": 1, "b": [1, 2]}) == payload_digest({"b": [1, 2], "a": 1})
+        assert payload_digest({"a": 1}) != payload_digest({"a": 2})
+
+    def test_writes_are_not_read_only(self):
+        """Тест исключения запросов на изменение данных."""
+        assert is_read_only("warehouse/list")
+        assert not is_read_only("products/stocks")
+        assert not is_read_only("posting/fbs/ship")
+
+
+class TestAPIManagerSingleFlight:
+    """Тесты объединения запросов APIManager."""
+
+    @pytest.mark.asyncio
+    async def test_identical_reads_share_one_call(self, coalescing_api_manager, slow_api_server):
+        """Тест выполнения одного запроса и общего результата для одинаковых запросов на чтение."""
+        results = await asyncio.gather(*(
+            coalescing_api_manager._request(
+                endpoint="warehouse/list", payload={"b": 1, "a": 2} if i % 2 else {"a": 2, "b": 1},
+                response_model=WarehouseListResponse,
+            )
+            for i in range(20)
+        ))
+
+        assert len(slow_api_server.app[CALLS]) == 1
+        assert all(result is results[0] for result in results)
+        stats = await APIManager.get_coalescing_stats("test_client")
+        assert stats["test_client"]["v1/warehouse/list"] == {"requests": 1, "coalesced": 19, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_different_payloads_not_coalesced(self, coalescing_api_manager, slow_api_server):
+        """Тест раздельного выполнения запросов с разным телом."""
+        await asyncio.gather(*(
+            coalescing_api_manager._request(endpoint="warehouse/list", payload={"page": i}) for i in range(3)
+        ))
+
+        assert len(slow_api_server.app[CALLS]) == 3
+
+    @pytest.mark.asyncio
+    async def test_writes_not_coalesced(self, coalescing_api_manager, slow_api_server):
+        """Тест раздельного выполнения одинаковых запросов на изменение данных."""
+        await asyncio.gather(*(
+            coalescing_api_manager._request(api_version="v2", endpoint="products/stocks", payload={"stocks": []})
+            for _ in range(5)
+        ))
+
+        assert len(slow_api_server.app[CALLS]) == 5
+        assert await APIManager.get_coalescing_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_error_shared(self, coalescing_api_manager, slow_api_server):
+        """Тест передачи ошибки запроса всем объединенным вызовам."""
+        results = await asyncio.gather(*(
+            coalescing_api_manager._request(endpoint="posting/fbs/get-by-barcode", payload={"barcode": "1"})
+            for _ in range(3)
+        ), return_exceptions=True)
+
+        assert len(slow_api_server.app[CALLS]) == 1
+        assert all(isinstance(result, APIServerError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancel_one_waiter(self, coalescing_api_manager, slow_api_server):
+        """Тест продолжения запроса для остальных вызовов при отмене одного из них."""
+        first = asyncio.create_task(coalescing_api_manager._request(endpoint="warehouse/list", payload={}))
+        second = asyncio.create_task(coalescing_api_manager._request(endpoint="warehouse/list", payload={}))
+        await asyncio.sleep(0.02)
+        first.cancel()
+
+        assert await second == {"result": []}
+        assert first.cancelled()
+        assert len(slow_api_server.app[CALLS]) == 1
+
+    @pytest.mark.asyncio
+    async def test_can_be_disabled(self, coalescing_api_manager, slow_api_server):
+        """Тест отключения объединения запросов в конфигурации."""
+        coalescing_api_manager._config = coalescing_api_manager._config.model_copy(
+            update={"coalesce_requests": False}
+        )
+
+        await asyncio.gather(*(
+            coalescing_api_manager._request(endpoint="warehouse/list", payload={}) for _ in range(3)
+        ))
+
+        assert len(slow_api_server.app[CALLS]) == 3
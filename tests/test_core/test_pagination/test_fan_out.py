@@ -0,0 +1,223 @@
+"""Тесты параллельной выборки страниц по offset."""
+import asyncio
+import datetime
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from src.ozonapi.seller.core.pagination import fan_out_offsets, split_by_period
+
+START = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class PeriodFilter(BaseModel):
+    since: datetime.datetime
+    to_: datetime.datetime
+
+
+class OffsetRequest(BaseModel):
+    filter: Optional[PeriodFilter] = None
+    offset: Optional[int] = None
+    limit: int = 10
+
+
+class FakeAPI:
+    """Возвращает страницы синтетической выборки с учетом периода и offset."""
+
+    def __init__(self, size: int, max_offset: Optional[int] = None, latency: float = 0.02):
+        # Одно отправление в минуту, начиная с START
+        self.postings = [
+            {"posting_number": str(i), "created_at": START + datetime.timedelta(minutes=i)} for i in range(size)
+        ]
+        self.max_offset = max_offset
+        self.latency = latency
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch(self, request: OffsetRequest) -> dict:
+        offset = request.offset or 0
+        self.calls.append(offset)
+        if self.max_offset is not None and offset > self.max_offset:
+            raise AssertionError("offset ceiling exceeded")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        postings = self.postings
+        if request.filter is not None:
+            postings = [p for p in postings if request.filter.since <= p["created_at"] <= request.filter.to_]
+        return {"result": postings[offset:offset + request.limit], "count": len(postings)}
+
+
+def numbers(items) -> list[int]:
+    return [int(item["posting_number"]) for item in items]
+
+
+class TestFanOutOffsets:
+    """Тесты параллельной выборки страниц."""
+
+    @pytest.mark.asyncio
+    async def test_total_known_fetches_in_parallel(self):
+        """Тест параллельных запросов после первой страницы с известным общим количеством."""
+        api = FakeAPI(size=95)
+
+        items = [item async for item in fan_out_offsets(
+            api.fetch, OffsetRequest(), lambda page: page["result"], get_total=lambda page: page["count"],
+        )]
+
+        assert numbers(items) == list(range(95))
+        assert sorted(api.calls) == list(range(0, 100, 10))
+        assert api.max_in_flight == 8
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bound(self):
+        """Тест ограничения количества одновременных запросов."""
+        api = FakeAPI(size=95)
+
+        items = [item async for item in fan_out_offsets(
+            api.fetch, OffsetRequest(), lambda page: page["result"],
+            get_total=lambda page: page["count"], concurrency=3,
+        )]
+
+        assert len(items) == 95
+        assert api.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_without_total_stops_on_partial_page(self):
+        """Тест выборки без общего количества до первой неполной страницы."""
+        api = FakeAPI(size=45)
+
+        items = [item async for item in fan_out_offsets(
+            api.fetch, OffsetRequest(), lambda page: page["result"], concurrency=4,
+        )]
+
+        assert numbers(items) == list(range(45))
+        # Не больше concurrency лишних запросов после последней страницы
+        assert len(api.calls) <= 5 + 4
+
+    @pytest.mark.asyncio
+    async def test_offset_ceiling_splits_period(self):
+        """Тест деления периода, если выборка не помещается в предельный offset."""
+        api = FakeAPI(size=100, max_offset=20)
+        request = OffsetRequest(
+            filter=PeriodFilter(since=START, to_=START + datetime.timedelta(minutes=99)),
+        )
+
+        items = [item async for item in fan_out_offsets(
+            api.fetch, request, lambda page: page["result"],
+            max_offset=20,
+            split_request=lambda window: split_by_period(window, "since", "to_", min_period=60),
+            get_key=lambda item: item["posting_number"],
+        )]
+
+        assert numbers(items) == list(range(100))
+        assert max(api.calls) <= 20
+
+    @pytest.mark.asyncio
+    async def test_offset_ceiling_without_split_warns(self):
+        """Тест предупреждения о неполной выборке, если период больше не делится."""
+        api = FakeAPI(size=100, max_offset=20, latency=0)
+
+        with patch("src.ozonapi.seller.core.pagination.logger") as logger:
+            items = [item async for item in fan_out_offsets(
+                api.fetch, OffsetRequest(), lambda page: page["result"],
+                get_total=lambda page: page["count"], max_offset=20, split_request=lambda window: [],
+            )]
+
+        assert numbers(items) == list(range(30))
+        logger.warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [30, 40])
+    async def test_offset_ceiling_with_non_dividing_limit(self, limit):
+        """Тест выдачи конца выборки со страницы на предельном смещении, если limit не делит max_offset."""
+        api = FakeAPI(size=215, max_offset=200, latency=0)
+        request = OffsetRequest(
+            filter=PeriodFilter(since=START, to_=START + datetime.timedelta(minutes=214)), limit=limit,
+        )
+
+        items = [item async for item in fan_out_offsets(
+            api.fetch, request, lambda page: page["result"],
+            max_offset=200,
+            split_request=lambda window: split_by_period(window, "since", "to_", min_period=60),
+            get_key=lambda item: item["posting_number"],
+        )]
+
+        assert numbers(items) == list(range(215))
+        assert max(api.calls) == 200
+
+    @pytest.mark.asyncio
+    async def test_default_limit(self):
+        """Тест значения limit по умолчанию из схемы запроса."""
+        class OptionalLimitRequest(OffsetRequest):
+            limit: Optional[int] = 10
+
+        class NoLimitRequest(OffsetRequest):
+            limit: Optional[int] = None
+
+        api = FakeAPI(size=25, latency=0)
+        items = [item async for item in fan_out_offsets(
+            api.fetch, OptionalLimitRequest(limit=None), lambda page: page["result"],
+        )]
+        assert numbers(items) == list(range(25))
+
+        with pytest.raises(ValueError):
+            async for _ in fan_out_offsets(api.fetch, NoLimitRequest(), lambda page: page["result"]):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_offset_ceiling_reverse_order(self):
+        """Тест порядка частей периода при сортировке по убыванию."""
+        api = FakeAPI(size=60, max_offset=20)
+        request = OffsetRequest(
+            filter=PeriodFilter(since=START, to_=START + datetime.timedelta(minutes=59)),
+        )
+
+        items = [item async for item in fan_out_offsets(
+            api.fetch, request, lambda page: page["result"],
+            max_offset=20,
+            split_request=lambda window: split_by_period(window, "since", "to_", min_period=60),
+            get_key=lambda item: item["posting_number"],
+            reverse=True,
+        )]
+
+        assert sorted(numbers(items)) == list(range(60))
+        assert numbers(items)[0] >= 30
+
+    @pytest.mark.asyncio
+    async def test_error_cancels_pending_pages(self):
+        """Тест отмены запросов страниц при ошибке."""
+        api = FakeAPI(size=200)
+
+        async def failing_fetch(request):
+            if request.offset == 20:
+                raise RuntimeError("page failed")
+            return await api.fetch(request)
+
+        with pytest.raises(RuntimeError, match="page failed"):
+            async for _ in fan_out_offsets(
+                    failing_fetch, OffsetRequest(), lambda page: page["result"], get_total=lambda page: page["count"],
+            ):
+                pass
+        await asyncio.sleep(0.05)
+
+        assert api.in_flight == 0
+
+    def test_split_by_period(self):
+        """Тест деления периода пополам с пересечением на границе."""
+        request = OffsetRequest(
+            filter=PeriodFilter(since=START, to_=START + datetime.timedelta(hours=2)), offset=40,
+        )
+
+        first, second = split_by_period(request, "since", "to_")
+
+        assert first.filter.to_ == second.filter.since == START + datetime.timedelta(hours=1)
+        assert first.offset == second.offset == 0
+        assert split_by_period(
+            OffsetRequest(filter=PeriodFilter(since=START, to_=START)), "since", "to_"
+        ) is None
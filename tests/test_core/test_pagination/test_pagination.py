@@ -0,0 +1,154 @@
+"""Тесты автоматической пагинации с предварительной загрузкой страниц."""
+import asyncio
+import json
+import time
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from src.ozonapi.seller.core.pagination import get_field, next_by_offset, next_by_token, paginate
+
+
+class CursorRequest(BaseModel):
+    cursor: str = ""
+    limit: int = 2
+
+
+class OffsetRequest(BaseModel):
+    offset: Optional[int] = None
+    limit: int = 2
+
+
+CATALOG = list(range(7))
+
+
+async def fetch_cursor(request: CursorRequest) -> dict:
+    """Возвращает страницу каталога по курсору."""
+    start = int(request.cursor or 0)
+    items = CATALOG[start:start + request.limit]
+    return {"items": items, "cursor": str(start + len(items)), "total": len(CATALOG)}
+
+
+def cursor_next(request, page, items):
+    return next_by_token(request, "cursor", get_field(page, "cursor"), items)
+
+
+class TestPaginationHelpers:
+    """Тесты вспомогательных функций пагинации."""
+
+    def test_get_field_model_and_dict(self):
+        """Тест чтения полей из схемы и словаря."""
+        assert get_field({"result": {"items": [1]}}, "result", "items") == [1]
+        assert get_field(CursorRequest(cursor="x"), "cursor") == "x"
+        assert get_field({"result": None}, "result", "items") is None
+
+    def test_next_by_token_stops_on_partial_page(self):
+        """Тест завершения пагинации по неполной странице и пустому указателю."""
+        request = CursorRequest(limit=2)
+
+        assert next_by_token(request, "cursor", "2", [0, 1]).cursor == "2"
+        assert next_by_token(request, "cursor", "3", [0]) is None
+        assert next_by_token(request, "cursor", "", [0, 1]) is None
+
+    def test_next_by_offset(self):
+        """Тест сдвига offset на количество полученных элементов."""
+        request = OffsetRequest(limit=2)
+
+        assert next_by_offset(request, [0, 1], True).offset == 2
+        assert next_by_offset(request, [0, 1], False) is None
+
+
+class TestPaginate:
+    """Тесты итератора страниц."""
+
+    @pytest.mark.asyncio
+    async def test_yields_all_items(self):
+        """Тест выдачи всех элементов каталога."""
+        items = [item async for item in paginate(fetch_cursor, CursorRequest(), lambda page: page["items"], cursor_next)]
+
+        assert items == CATALOG
+
+    @pytest.mark.asyncio
+    async def test_yields_pages(self):
+        """Тест выдачи страниц целиком."""
+        pages = [page async for page in paginate(
+            fetch_cursor, CursorRequest(), lambda page: page["items"], cursor_next, pages=True
+        )]
+
+        assert [page["items"] for page in pages] == [[0, 1], [2, 3], [4, 5], [6]]
+
+    @pytest.mark.asyncio
+    async def test_bytes_pages_navigated(self):
+        """Тест пагинации при ответах в байтах."""
+        async def fetch_bytes(request):
+            return json.dumps(await fetch_cursor(request)).encode()
+
+        pages = [page async for page in paginate(
+            fetch_bytes, CursorRequest(), lambda page: page["items"], cursor_next, pages=True
+        )]
+        items = [item async for item in paginate(fetch_bytes, CursorRequest(), lambda page: page["items"], cursor_next)]
+
+        assert all(isinstance(page, bytes) for page in pages)
+        assert items == CATALOG
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("prefetch", [True, False])
+    async def test_prefetch_hides_round_trip(self, prefetch):
+        """Тест загрузки следующей страницы во время обработки текущей."""
+        async def slow_fetch(request):
+            await asyncio.sleep(0.05)
+            return await fetch_cursor(request)
+
+        started = time.monotonic()
+        async for _ in paginate(
+                slow_fetch, CursorRequest(), lambda page: page["items"], cursor_next, pages=True, prefetch=prefetch
+        ):
+            await asyncio.sleep(0.05)
+        elapsed = time.monotonic() - started
+
+        # 4 страницы: с загрузкой заранее ~0.25 сек., без нее ~0.4 сек.
+        if prefetch:
+            assert elapsed < 0.33
+        else:
+            assert elapsed >= 0.38
+
+    @pytest.mark.asyncio
+    async def test_break_cancels_prefetch(self):
+        """Тест отмены загрузки следующей страницы при досрочном выходе."""
+        requested = []
+        cancelled = []
+
+        async def tracked_fetch(request):
+            requested.append(request.cursor)
+            try:
+                await asyncio.sleep(0.05)
+            except asyncio.CancelledError:
+                cancelled.append(request.cursor)
+                raise
+            return await fetch_cursor(request)
+
+        pages = paginate(tracked_fetch, CursorRequest(), lambda page: page["items"], cursor_next, pages=True)
+        async for _ in pages:
+            await asyncio.sleep(0.01)
+            break
+        await pages.aclose()
+        await asyncio.sleep(0)
+
+        assert requested == ["", "2"]
+        assert cancelled == ["2"]
+
+    @pytest.mark.asyncio
+    async def test_error_propagates(self):
+        """Тест передачи ошибки загрузки страницы потребителю."""
+        async def failing_fetch(request):
+            if request.cursor:
+                raise RuntimeError("page failed")
+            return await fetch_cursor(request)
+
+        received = []
+        with pytest.raises(RuntimeError, match="page failed"):
+            async for item in paginate(failing_fetch, CursorRequest(), lambda page: page["items"], cursor_next):
+                received.append(item)
+
+        assert received == [0, 1]
@@ -0,0 +1,144 @@
+"""Тесты адаптивного ограничителя запросов."""
+import time
+from email.utils import formatdate
+
+import pytest
+
+from src.ozonapi.seller.core.adaptive_rate import (
+    AdaptiveRateLimiter,
+    AdaptiveRateManager,
+    parse_retry_after,
+)
+
+
+class TestParseRetryAfter:
+    """Тесты разбора заголовков ограничения запросов."""
+
+    def test_seconds(self):
+        """Тест значения в секундах."""
+        assert parse_retry_after({"Retry-After": "2.5"}) == 2.5
+
+    def test_http_date(self):
+        """Тест значения в формате HTTP-даты."""
+        delay = parse_retry_after({"Retry-After": formatdate(time.time() + 10, usegmt=True)})
+
+        assert 8 <= delay <= 10
+
+    def test_rate_limit_reset(self):
+        """Тест заголовка X-RateLimit-Reset."""
+        assert parse_retry_after({"X-RateLimit-Reset": "3"}) == 3.0
+
+    def test_rate_limit_reset_epoch(self):
+        """Тест заголовка X-RateLimit-Reset с моментом сброса в Unix-времени."""
+        delay = parse_retry_after({"X-RateLimit-Reset": str(int(time.time()) + 5)})
+
+        assert 3 <= delay <= 5
+        assert parse_retry_after({"RateLimit-Reset": "1500000000"}) == 0.0
+
+    def test_missing_or_invalid(self):
+        """Тест отсутствующего и некорректного заголовка."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after({}) is None
+        assert parse_retry_after({"Retry-After": "soon"}) is None
+
+
+class TestAdaptiveRateLimiter:
+    """Тесты AIMD-ограничителя."""
+
+    def test_multiplicative_decrease_once_per_generation(self):
+        """Тест однократного снижения на ответы запросов, отправленных до снижения."""
+        limiter = AdaptiveRateLimiter(max_rate=40, min_rate=1, decrease=0.5, cooldown=0)
+        sent_at = time.monotonic()
+
+        for _ in range(10):
+            limiter.on_throttled(sent_at)
+
+        assert limiter.rate == 20
+        assert limiter.throttled == 10
+
+        limiter.on_throttled(time.monotonic())
+        assert limiter.rate == 10
+
+    def test_decrease_cooldown(self):
+        """Тест интервала между снижениями ограничения."""
+        limiter = AdaptiveRateLimiter(max_rate=40, decrease=0.5, cooldown=60)
+
+        limiter.on_throttled(time.monotonic())
+        limiter.on_throttled(time.monotonic())
+
+        assert limiter.rate == 20
+
+    def test_min_rate_bound(self):
+        """Тест нижней границы ограничения."""
+        limiter = AdaptiveRateLimiter(max_rate=8, min_rate=2, decrease=0.5, cooldown=0)
+
+        for _ in range(5):
+            limiter.on_throttled(time.monotonic())
+
+        assert limiter.rate == 2
+
+    def test_additive_increase_up_to_max_rate(self):
+        """Тест линейного роста ограничения при успешных ответах."""
+        limiter = AdaptiveRateLimiter(max_rate=10, min_rate=1, increase=1.0, decrease=0.5)
+        limiter.on_throttled(time.monotonic())
+        assert limiter.rate == 5
+
+        # Около одной секунды работы на скорости 5 запросов в секунду
+        for _ in range(5):
+            limiter.on_success()
+        assert limiter.rate == pytest.approx(6, abs=0.2)
+
+        for _ in range(1000):
+            limiter.on_success()
+        assert limiter.rate == 10
+        assert limiter.limiter.max_rate == 10
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_limiter(self):
+        """Тест приостановки выдачи токенов на время из Retry-After."""
+        limiter = AdaptiveRateLimiter(max_rate=50)
+
+        limiter.on_throttled(time.monotonic(), {"Retry-After": "0.3"})
+
+        started = time.monotonic()
+        async with limiter.limiter:
+            pass
+        assert time.monotonic() - started >= 0.25
+        assert limiter.get_state()["paused_for"] == 0
+
+    def test_exhausted_remaining_pauses_without_increase(self):
+        """Тест паузы по заголовкам исчерпанного лимита в успешном ответе."""
+        limiter = AdaptiveRateLimiter(max_rate=50)
+
+        limiter.on_success({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1"})
+
+        assert limiter.get_state()["paused_for"] > 0.5
+
+    def test_pause_bounded_by_max_pause(self):
+        """Тест ограничения паузы по заголовкам ответа значением max_pause."""
+        limiter = AdaptiveRateLimiter(max_rate=50, max_pause=2)
+
+        limiter.on_success({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1760000000000"})
+        limiter.on_throttled(time.monotonic(), {"Retry-After": "86400"})
+
+        assert 1 < limiter.get_state()["paused_for"] <= 2
+
+
+class TestAdaptiveRateManager:
+    """Тесты менеджера адаптивных ограничителей."""
+
+    def test_limiters_per_client_and_endpoint(self):
+        """Тест раздельных ограничителей по client_id и конечной точке."""
+        manager = AdaptiveRateManager()
+
+        first = manager.get_limiter("client_1", "v3/product/list", max_rate=20)
+        assert manager.get_limiter("client_1", "v3/product/list", max_rate=20) is first
+        assert manager.get_limiter("client_1", "v4/product/info/stocks", max_rate=20) is not first
+        assert manager.get_limiter("client_2", "v3/product/list", max_rate=20) is not first
+
+        first.on_throttled(time.monotonic())
+        state = manager.get_state()
+
+        assert state["client_1"]["v3/product/list"]["rate"] == 10
+        assert state["client_1"]["v4/product/info/stocks"]["rate"] == 20
+        assert set(manager.get_state("client_2")) == {"client_2"}
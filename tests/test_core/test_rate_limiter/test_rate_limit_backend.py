@@ -0,0 +1,216 @@
+"""Тесты общих хранилищ ограничителей запросов."""
+import asyncio
+import multiprocessing
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.ozonapi.seller.core.rate_limit_backend import (
+    BucketSpec,
+    FileLockBackend,
+    InProcessBackend,
+    RateLimiterBackend,
+    RedisBackend,
+    take_tokens,
+)
+from src.ozonapi.seller.core.rate_limiter import RateLimiterManager
+
+PROCESSES = 4
+SHARED_RATE = 20
+RUN_SECONDS = 1.5
+
+
+def run_worker(backend_path, start_at: float, shared: bool) -> list[float]:
+    """Выполняет запросы к общей корзине в отдельном процессе до истечения RUN_SECONDS."""
+    backend = FileLockBackend(backend_path) if shared else InProcessBackend()
+    spec = BucketSpec("client:shared", SHARED_RATE, 1)
+    timestamps = []
+
+    async def worker():
+        while True:
+            await backend.acquire([spec])
+            timestamps.append(time.time())
+
+    async def main():
+        await asyncio.sleep(max(start_at - time.time(), 0))
+        tasks = [asyncio.create_task(worker()) for _ in range(50)]
+        await asyncio.sleep(RUN_SECONDS)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await backend.close()
+
+    asyncio.run(main())
+    return timestamps
+
+
+def warm_up() -> None:
+    """Завершает импорт модулей в процессе пула до начала замеров."""
+
+
+def run_processes(pool, path: str, shared: bool) -> list[float]:
+    """Запускает запросы в PROCESSES процессах одновременно и собирает отметки времени."""
+    start_at = time.time() + 0.3
+    results = pool.starmap(run_worker, [(path, start_at, shared)] * PROCESSES)
+    return sorted(timestamp for result in results for timestamp in result)
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    """Создает пул процессов с уже импортированными модулями."""
+    with multiprocessing.get_context("spawn").Pool(PROCESSES) as pool:
+        pool.starmap(warm_up, [()] * PROCESSES)
+        yield pool
+
+
+class FakeRedis:
+    """Хранилище с методом eval, выполняющее скрипт RedisBackend средствами Python."""
+
+    def __init__(self):
+        self.states = {}
+        self.calls = []
+
+    async def eval(self, script, numkeys, *keys_and_args):
+        self.calls.append((numkeys, keys_and_args))
+        keys = keys_and_args[:numkeys]
+        args = [float(arg) for arg in keys_and_args[numkeys:]]
+        specs = [BucketSpec(key, args[2 * i], 1) for i, key in enumerate(keys)]
+        return str(take_tokens(self.states, specs, time.monotonic())).encode()
+
+
+class TestTakeTokens:
+    """Тесты атомарного списания токенов из общего состояния."""
+
+    def test_all_or_nothing(self):
+        """Тест списания токенов только при наличии во всех корзинах."""
+        states = {}
+        client = BucketSpec("client", 10, 1)
+        method = BucketSpec("method", 1, 60)
+
+        assert take_tokens(states, [client, method], 100.0) == 0
+        delay = take_tokens(states, [client, method], 100.0)
+
+        assert delay == pytest.approx(60)
+        assert states["client"][0] == 9
+
+
+class TestBackends:
+    """Тесты хранилищ ограничителей в одном процессе."""
+
+    @pytest.mark.asyncio
+    async def test_in_process_backend_rate(self):
+        """Тест соблюдения ограничения хранилищем в памяти."""
+        backend = InProcessBackend()
+        spec = BucketSpec("client:test", 20, 1)
+        count = 0
+
+        async def worker():
+            nonlocal count
+            while True:
+                await backend.acquire([spec])
+                count += 1
+
+        tasks = [asyncio.create_task(worker()) for _ in range(200)]
+        await asyncio.sleep(0.5)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert 25 <= count <= 31
+
+    @pytest.mark.asyncio
+    async def test_file_backends_share_state(self, tmp_path):
+        """Тест общего состояния двух подключений к одному файлу."""
+        path = str(tmp_path / "limits")
+        first, second = FileLockBackend(path), FileLockBackend(path)
+        spec = BucketSpec("client:file", 2, 60)
+
+        assert await first.try_acquire([spec]) == 0
+        assert await second.try_acquire([spec]) == 0
+        assert await first.try_acquire([spec]) > 0
+
+        await first.close()
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_file_backend_off_event_loop(self, tmp_path):
+        """Тест работы с блокировкой файла вне потока цикла событий."""
+        backend = FileLockBackend(str(tmp_path / "limits"))
+        threads = []
+        take = backend.take
+
+        def recording_take(specs):
+            threads.append(threading.current_thread())
+            return take(specs)
+
+        backend.take = recording_take
+        delays = await asyncio.gather(*(backend.try_acquire([BucketSpec(f"client:{i}", 1, 60)]) for i in range(20)))
+        await backend.close()
+
+        assert delays == [0.0] * 20
+        assert threading.main_thread() not in threads
+
+    def test_incomplete_backend(self):
+        """Тест ошибки создания хранилища без реализации try_acquire()."""
+        class IncompleteBackend(RateLimiterBackend):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteBackend()
+
+    @pytest.mark.asyncio
+    async def test_redis_backend_script_arguments(self):
+        """Тест передачи ключей и ограничений в скрипт Redis."""
+        client = FakeRedis()
+        backend = RedisBackend(client, prefix="test:")
+        spec = BucketSpec("client:redis", 1, 60)
+
+        assert await backend.try_acquire([spec]) == 0
+        assert await backend.try_acquire([spec]) > 0
+        numkeys, keys_and_args = client.calls[0]
+        assert numkeys == 1
+        assert keys_and_args[0] == "test:client:redis"
+        assert float(keys_and_args[1]) == pytest.approx(1 / 60)
+
+    @pytest.mark.asyncio
+    async def test_local_tokens_refunded_while_waiting_shared(self, mock_logger):
+        """Тест возврата локальных токенов, пока общая корзина пуста."""
+        RateLimiterManager._clients.clear()
+        instance = Mock()
+        instance.client_id = "backend_client"
+        instance.config = Mock()
+        instance.config.max_requests_per_second = 50
+        instance.config.min_instance_ttl = 300.0
+        manager = RateLimiterManager(instance=instance, logger=mock_logger)
+        backend = InProcessBackend()
+        # Общая корзина client_id исчерпана другим процессом
+        backend._states["client:backend_client"] = [0.0, time.monotonic() + 60]
+
+        RateLimiterManager.set_backend(backend)
+        try:
+            blocked = asyncio.create_task(manager.acquire())
+            await asyncio.sleep(0.05)
+
+            assert not blocked.done()
+            assert manager.instance_limiter.tokens >= 49
+        finally:
+            RateLimiterManager.set_backend(None)
+            blocked.cancel()
+            await asyncio.gather(blocked, return_exceptions=True)
+
+
+class TestMultiProcessRateLimit:
+    """Тесты суммарной скорости запросов нескольких процессов."""
+
+    def test_file_backend_limits_aggregate_rate(self, process_pool, tmp_path):
+        """Тест соблюдения общего ограничения несколькими процессами."""
+        shared = run_processes(process_pool, str(tmp_path / "limits"), shared=True)
+        separate = run_processes(process_pool, str(tmp_path / "unused"), shared=False)
+
+        # Емкость корзины плюс пополнение за время работы
+        allowed = SHARED_RATE + SHARED_RATE * RUN_SECONDS
+        assert allowed * 0.8 <= len(shared) <= allowed + PROCESSES
+        # Без общего хранилища каждый процесс расходует ограничение целиком
+        assert len(separate) >= allowed * PROCESSES * 0.8
@@ -0,0 +1,100 @@
+"""Тесты иерархии ограничителей инстанс → client_id → метод."""
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.ozonapi.seller.core.method_rate_limiter import MethodRateLimiterManager, MethodRateLimitConfig
+from src.ozonapi.seller.core.rate_limiter import RateLimiterManager
+
+
+def make_instance(client_id: str, max_requests_per_second: int) -> Mock:
+    """Создает мок инстанса API с указанным ограничением."""
+    instance = Mock()
+    instance.client_id = client_id
+    instance.config = Mock()
+    instance.config.max_requests_per_second = max_requests_per_second
+    instance.config.min_instance_ttl = 300.0
+    return instance
+
+
+class TestRateLimiterHierarchy:
+    """Тесты иерархии ограничителей инстанс → client_id → метод."""
+
+    def test_client_limit_taken_from_instance_config(self, mock_logger):
+        """Тест ограничения client_id по конфигурации инстанса, а не по умолчанию."""
+        RateLimiterManager._clients.clear()
+        instance = make_instance("hierarchy_client_1", 50)
+
+        manager = RateLimiterManager(instance=instance, logger=mock_logger)
+
+        assert manager.client_limiter.max_rate == 50
+        assert manager.instance_limiter.max_rate == 50
+
+    def test_client_limit_uses_strictest_config(self, mock_logger):
+        """Тест применения самого строгого ограничения среди инстансов client_id."""
+        RateLimiterManager._clients.clear()
+        fast = make_instance("hierarchy_client_2", 50)
+        slow = make_instance("hierarchy_client_2", 5)
+
+        fast_manager = RateLimiterManager(instance=fast, logger=mock_logger)
+        slow_manager = RateLimiterManager(instance=slow, logger=mock_logger)
+
+        assert fast_manager.client_limiter is slow_manager.client_limiter
+        assert fast_manager.client_limiter.max_rate == 5
+        assert fast_manager.instance_limiter.max_rate == 50
+
+    @pytest.mark.asyncio
+    async def test_instances_share_client_limit(self, mock_logger):
+        """Тест ограничения суммарного потока инстансов одного client_id при 50 rps."""
+        RateLimiterManager._clients.clear()
+        instances = [make_instance("hierarchy_client_3", 50) for _ in range(3)]
+        managers = [RateLimiterManager(instance=instance, logger=mock_logger) for instance in instances]
+        timestamps = []
+
+        async def worker(manager):
+            await manager.acquire()
+            timestamps.append(time.monotonic())
+
+        tasks = [
+            asyncio.create_task(worker(managers[number % len(managers)]))
+            for number in range(3000)
+        ]
+        await asyncio.sleep(1.0)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # 50 токенов емкости и около 50 пополнения за секунду на весь client_id
+        assert 90 <= len(timestamps) <= 101
+
+    @pytest.mark.asyncio
+    async def test_method_tier_applied_with_instance_and_client(self, mock_logger):
+        """Тест списания токена метода вместе с токенами инстанса и client_id."""
+        RateLimiterManager._clients.clear()
+        manager = RateLimiterManager(instance=make_instance("hierarchy_client_4", 50), logger=mock_logger)
+        method_manager = MethodRateLimiterManager()
+        method_limiter = method_manager.get_bucket(
+            "hierarchy_client_4",
+            MethodRateLimitConfig(limit_requests=1, interval_seconds=60, method_identifier="slow_method")
+        )
+
+        await manager.acquire(method_limiter)
+        blocked = asyncio.create_task(manager.acquire(method_limiter))
+        await asyncio.sleep(0.05)
+
+        assert not blocked.done()
+        assert manager.client_limiter.tokens >= 49
+
+        blocked.cancel()
+        await asyncio.gather(blocked, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_get_bucket_is_reused(self):
+        """Тест повторного использования ограничителя метода без блокировок."""
+        method_manager = MethodRateLimiterManager()
+        config = MethodRateLimitConfig(limit_requests=5, interval_seconds=1, method_identifier="method")
+
+        assert method_manager.get_bucket("client", config) is method_manager.get_bucket("client", config)
+        assert "client:method" in await method_manager.get_limiter_stats()
@@ -0,0 +1,189 @@
+"""Тесты TokenBucket и иерархического списания токенов."""
+import asyncio
+import time
+
+import pytest
+
+from src.ozonapi.seller.core.token_bucket import TokenBucket, acquire
+
+
+def assert_rate_respected(timestamps: list[float], max_rate: float, capacity: float) -> None:
+    """Проверяет, что за любой интервал выдано не больше токенов, чем допускает корзина."""
+    timestamps = sorted(timestamps)
+    for start_index, start in enumerate(timestamps):
+        for end_index in range(start_index, len(timestamps)):
+            allowed = capacity + (timestamps[end_index] - start) * max_rate + 1
+            assert end_index - start_index + 1 <= allowed
+
+
+class TestTokenBucket:
+    """Тесты TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_rate(self):
+        """Тест мгновенной выдачи емкости корзины и ожидания следующего токена."""
+        bucket = TokenBucket(5, 0.5)
+
+        started = time.monotonic()
+        for _ in range(5):
+            async with bucket:
+                pass
+        burst_time = time.monotonic() - started
+
+        started = time.monotonic()
+        async with bucket:
+            pass
+        wait_time = time.monotonic() - started
+
+        assert burst_time < 0.05
+        assert wait_time == pytest.approx(0.1, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_in_order(self):
+        """Тест обслуживания ожидающих в порядке очереди."""
+        bucket = TokenBucket(1, 0.02)
+        order = []
+
+        async def worker(number):
+            await acquire((bucket,))
+            order.append(number)
+
+        tasks = []
+        for number in range(10):
+            tasks.append(asyncio.create_task(worker(number)))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+        assert order == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_thousands_of_coroutines_at_50_rps(self):
+        """Тест соблюдения 50 rps при тысячах конкурирующих корутин."""
+        bucket = TokenBucket(50, 1)
+        timestamps = []
+
+        async def worker():
+            await acquire((bucket,))
+            timestamps.append(time.monotonic())
+
+        tasks = [asyncio.create_task(worker()) for _ in range(3000)]
+        await asyncio.sleep(1.0)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert 90 <= len(timestamps) <= 101
+        assert_rate_respected(timestamps, 50, 50)
+        # Отмененные корутины не остаются в очереди
+        assert bucket.waiters == 0
+
+    @pytest.mark.asyncio
+    async def test_set_rate(self):
+        """Тест изменения ограничения корзины."""
+        bucket = TokenBucket(50, 1)
+
+        bucket.set_rate(10)
+
+        assert bucket.max_rate == 10
+        assert bucket.tokens <= 10
+
+    def test_invalid_rate(self):
+        """Тест ошибки при недопустимом ограничении."""
+        with pytest.raises(ValueError):
+            TokenBucket(0, 1)
+
+
+class TestHierarchicalAcquire:
+    """Тесты атомарного списания токенов с нескольких уровней."""
+
+    @pytest.mark.asyncio
+    async def test_tokens_taken_from_all_tiers(self):
+        """Тест списания токена со всех уровней одновременно."""
+        instance = TokenBucket(50, 1)
+        client = TokenBucket(50, 1)
+        method = TokenBucket(2, 1)
+
+        await acquire((instance, client, method))
+
+        assert instance.tokens == pytest.approx(49, abs=0.1)
+        assert client.tokens == pytest.approx(49, abs=0.1)
+        assert method.tokens == pytest.approx(1, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_tokens_not_held_while_waiting_other_tier(self):
+        """Тест отсутствия удержания токенов, пока запрос ждет другой уровень."""
+        instance = TokenBucket(50, 1)
+        client = TokenBucket(50, 1)
+        method = TokenBucket(1, 60)
+
+        await acquire((instance, client, method))
+        blocked = [asyncio.create_task(acquire((instance, client, method))) for _ in range(100)]
+        await asyncio.sleep(0.05)
+
+        # Ожидающие метод запросы не списали токены инстанса и client_id
+        assert method.waiters == 100
+        assert instance.tokens >= 49
+        assert client.tokens >= 49
+
+        # Запросы других методов проходят без ожидания
+        started = time.monotonic()
+        for _ in range(40):
+            await acquire((instance, client))
+        assert time.monotonic() - started < 0.05
+
+        for task in blocked:
+            task.cancel()
+        await asyncio.gather(*blocked, return_exceptions=True)
+        assert method.waiters == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_client_tier_limits_instances(self):
+        """Тест ограничения суммарного потока инстансов общим уровнем client_id."""
+        client = TokenBucket(50, 1)
+        instances = [TokenBucket(50, 1) for _ in range(4)]
+        timestamps = []
+
+        async def worker(instance):
+            await acquire((instance, client))
+            timestamps.append(time.monotonic())
+
+        tasks = [
+            asyncio.create_task(worker(instances[number % len(instances)]))
+            for number in range(2000)
+        ]
+        await asyncio.sleep(1.0)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert 90 <= len(timestamps) <= 101
+        assert_rate_respected(timestamps, 50, 50)
+        assert client.waiters == 0
+        assert all(instance.waiters == 0 for instance in instances)
+
+    @pytest.mark.asyncio
+    async def test_method_tier_throughput_under_contention(self):
+        """Тест пропускной способности уровня метода при конкуренции за общий уровень."""
+        client = TokenBucket(50, 1)
+        method = TokenBucket(10, 0.5)
+        method_calls = []
+
+        async def other_worker():
+            await acquire((client,))
+
+        async def method_worker():
+            await acquire((client, method))
+            method_calls.append(time.monotonic())
+
+        tasks = []
+        for _ in range(1000):
+            tasks.append(asyncio.create_task(other_worker()))
+            tasks.append(asyncio.create_task(method_worker()))
+        await asyncio.sleep(1.0)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Метод не голодает, но и не превышает собственное ограничение
+        assert 10 <= len(method_calls) <= 31
+        assert_rate_respected(method_calls, 20, 10)
@@ -0,0 +1,120 @@
+"""Тесты общего кеша ответов API."""
+import asyncio
+
+import pytest
+
+from src.ozonapi.seller.core.exceptions import APIServerError
+from src.ozonapi.seller.core.response_cache import CachePolicy, ResponseCache
+
+
+class Counter:
+    """Источник ответов, возвращающий номер запроса."""
+
+    def __init__(self):
+        self.calls = 0
+        self.error = None
+
+    async def __call__(self):
+        await asyncio.sleep(0)
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.calls
+
+
+class TestResponseCache:
+    """Тесты ResponseCache."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_hit(self):
+        """Тест выдачи актуального ответа без запроса."""
+        cache, fetch = ResponseCache(), Counter()
+        policy = CachePolicy(ttl=60)
+
+        assert await cache.get(("client", "method"), fetch, policy) == 1
+        assert await cache.get(("client", "method"), fetch, policy) == 1
+        assert fetch.calls == 1
+        assert cache.get_state()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_peek(self):
+        """Тест чтения актуального ответа без запроса."""
+        cache, fetch = ResponseCache(), Counter()
+
+        assert cache.peek(("client", "method")) is None
+        await cache.get(("client", "method"), fetch, CachePolicy(ttl=60))
+        await cache.get(("client", "stale"), fetch, CachePolicy(ttl=0, stale_ttl=60))
+
+        assert cache.peek(("client", "method")) == 1
+        assert cache.peek(("client", "stale")) is None
+        assert fetch.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self):
+        """Тест выдачи устаревшего ответа с обновлением в фоне."""
+        cache, fetch = ResponseCache(), Counter()
+        policy = CachePolicy(ttl=0.05, stale_ttl=60)
+        await cache.get(("client", "method"), fetch, policy)
+        await asyncio.sleep(0.06)
+
+        assert await cache.get(("client", "method"), fetch, policy) == 1
+        assert await cache.get(("client", "method"), fetch, policy) == 1
+        await asyncio.sleep(0.01)
+
+        assert fetch.calls == 2
+        assert await cache.get(("client", "method"), fetch, policy) == 2
+        assert cache.get_state()["stale_hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_error_keeps_stale(self):
+        """Тест сохранения устаревшего ответа при ошибке фонового обновления."""
+        cache, fetch = ResponseCache(), Counter()
+        policy = CachePolicy(ttl=0.01, stale_ttl=60)
+        await cache.get(("client", "method"), fetch, policy)
+        await asyncio.sleep(0.02)
+        fetch.error = APIServerError(500, "internal")
+
+        assert await cache.get(("client", "method"), fetch, policy) == 1
+        await asyncio.sleep(0.01)
+
+        assert await cache.get(("client", "method"), fetch, policy) == 1
+        assert cache.get_state()["refresh_errors"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_fetched_again(self):
+        """Тест повторного запроса после истечения времени выдачи устаревшего ответа."""
+        cache, fetch = ResponseCache(), Counter()
+        policy = CachePolicy(ttl=0.01)
+        await cache.get(("client", "method"), fetch, policy)
+        await asyncio.sleep(0.02)
+
+        assert await cache.get(("client", "method"), fetch, policy) == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """Тест вытеснения давно не использованных ответов."""
+        cache, policy = ResponseCache(max_entries=2), CachePolicy(ttl=60)
+        fetches = {name: Counter() for name in "abc"}
+        await cache.get(("client", "a"), fetches["a"], policy)
+        await cache.get(("client", "b"), fetches["b"], policy)
+        await cache.get(("client", "a"), fetches["a"], policy)
+        await cache.get(("client", "c"), fetches["c"], policy)
+
+        await cache.get(("client", "a"), fetches["a"], policy)
+        await cache.get(("client", "b"), fetches["b"], policy)
+
+        assert fetches["a"].calls == 1
+        assert fetches["b"].calls == 2
+        assert cache.get_state()["evictions"] == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        """Тест удаления ответов по client_id и методу."""
+        cache, policy = ResponseCache(), CachePolicy(ttl=60)
+        for key in (("first", "warehouse_list"), ("first", "seller_info"), ("second", "warehouse_list")):
+            await cache.get(key, Counter(), policy)
+
+        assert cache.invalidate("first", "warehouse_list") == 1
+        assert cache.invalidate(method="warehouse_list") == 1
+        assert cache.invalidate() == 1
+        assert cache.get_state()["entries"] == 0
@@ -0,0 +1,198 @@
+"""Тесты постоянного хранилища ответов API."""
+import os
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.ozonapi.seller import SellerAPI
+from src.ozonapi.seller.core import APIManager, FileResponseStore, ResponseCache
+from src.ozonapi.seller.core.response_store import ResponseStore, StoreKey
+from src.ozonapi.seller.schemas.warehouses import DeliveryMethodListResponse
+
+CALLS = web.AppKey("calls", list)
+
+KEY = StoreKey("123456", "v1/description-category/tree", "abc")
+
+
+@pytest.fixture
+async def delivery_server():
+    """Запускает локальный сервер списка методов доставки, запоминающий запросы."""
+    async def handler(request):
+        request.app[CALLS].append(request.path)
+        return web.json_response({"result": [], "has_next": False})
+
+    app = web.Application()
+    app[CALLS] = []
+    app.router.add_post("/v1/delivery-method/list", handler)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def make_api(delivery_server):
+    """Создает клиентов, направляющих запросы на локальный сервер, с пустым кешем в памяти."""
+    original_cache = APIManager._response_cache
+    original_session_manager = APIManager._session_manager
+    original_initialized = APIManager._initialized
+    APIManager._session_manager = None
+    APIManager._initialized = False
+
+    def create(config_update=None):
+        APIManager._response_cache = ResponseCache()
+        api = SellerAPI(client_id="123456", api_key="test_api_key")
+        api._config = api._config.model_copy(update={
+            "base_url": str(delivery_server.make_url("")).rstrip("/"),
+            "max_retries": 0,
+            "adaptive_rate_limit": False,
+            **(config_update or {}),
+        })
+        return api
+
+    yield create
+    await APIManager._session_manager.close_all()
+    APIManager._response_cache = original_cache
+    APIManager._session_manager = original_session_manager
+    APIManager._initialized = original_initialized
+    APIManager.set_response_store(None)
+
+
+class TestFileResponseStore:
+    """Тесты FileResponseStore."""
+
+    @pytest.mark.asyncio
+    async def test_roundtrip_between_instances(self, tmp_path):
+        """Тест чтения ответа, сохраненного другим экземпляром хранилища (другим процессом)."""
+        await FileResponseStore(str(tmp_path)).set(KEY, b'{"result": []}', ttl=60)
+        store = FileResponseStore(str(tmp_path))
+
+        assert await store.get(KEY) == b'{"result": []}'
+        assert await store.get(KEY._replace(client_id="654321")) is None
+        assert await store.get(KEY._replace(endpoint="v2/description-category/tree")) is None
+        assert store.get_state() == {"hits": 1, "misses": 2, "writes": 0, "errors": 0}
+
+    @pytest.mark.asyncio
+    async def test_expired_response(self, tmp_path):
+        """Тест игнорирования устаревшего ответа."""
+        store = FileResponseStore(str(tmp_path))
+        await store.set(KEY, b"{}", ttl=0.01)
+        time.sleep(0.02)
+
+        assert await store.get(KEY) is None
+        assert not os.path.exists(store._path(KEY))
+
+    @pytest.mark.asyncio
+    async def test_atomic_replace(self, tmp_path):
+        """Тест замены ответа без временных файлов в каталоге."""
+        store = FileResponseStore(str(tmp_path))
+        await store.set(KEY, b"old", ttl=60)
+        await store.set(KEY, b"new", ttl=60)
+
+        assert await store.get(KEY) == b"new"
+        files = [name for _, _, names in os.walk(tmp_path) for name in names]
+        assert len(files) == 1 and files[0].endswith(".bin")
+
+    @pytest.mark.asyncio
+    async def test_corrupted_file(self, tmp_path):
+        """Тест игнорирования поврежденного файла."""
+        store = FileResponseStore(str(tmp_path))
+        await store.set(KEY, b"{}", ttl=60)
+        with open(store._path(KEY), "wb") as file:
+            file.write(b"\x00")
+
+        assert await store.get(KEY) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self, tmp_path):
+        """Тест удаления ответов по client_id и конечной точке."""
+        store = FileResponseStore(str(tmp_path))
+        await store.set(KEY, b"{}", ttl=60)
+        await store.set(KEY._replace(client_id="654321"), b"{}", ttl=60)
+        await store.set(KEY._replace(endpoint="v1/warehouse/list"), b"{}", ttl=60)
+
+        assert await store.invalidate(client_id="654321") == 1
+        assert await store.invalidate(endpoint="v1/warehouse/list") == 1
+        assert await store.invalidate() == 1
+        assert await store.get(KEY) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_keeps_nested_endpoint(self, tmp_path):
+        """Тест сохранения ответов вложенной конечной точки при удалении ответов родительской."""
+        store = FileResponseStore(str(tmp_path))
+        attribute = KEY._replace(endpoint="v1/description-category/attribute")
+        values = KEY._replace(endpoint="v1/description-category/attribute/values")
+        await store.set(attribute, b"{}", ttl=60)
+        await store.set(values, b"{}", ttl=60)
+
+        assert await store.invalidate(endpoint="v1/description-category/attribute") == 1
+        assert await store.get(attribute) is None
+        assert await store.get(values) == b"{}"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_removes_expired(self, tmp_path):
+        """Тест удаления устаревших ответов других клиентов и конечных точек при invalidate()."""
+        store = FileResponseStore(str(tmp_path))
+        expired = KEY._replace(endpoint="v1/warehouse/list")
+        await store.set(KEY, b"{}", ttl=60)
+        await store.set(expired, b"{}", ttl=0.01)
+        time.sleep(0.02)
+
+        assert await store.invalidate(client_id="654321", endpoint=KEY.endpoint) == 0
+        assert not os.path.exists(store._path(expired))
+        assert await store.get(KEY) == b"{}"
+
+
+class TestResponseStore:
+    """Тесты базового класса хранилища ответов."""
+
+    def test_incomplete_store(self):
+        """Тест ошибки создания хранилища без реализации всех методов."""
+        class IncompleteStore(ResponseStore):
+            async def get(self, key):
+                return None
+
+        with pytest.raises(TypeError):
+            IncompleteStore()
+
+
+class TestAPIManagerResponseStore:
+    """Тесты постоянного хранилища ответов в APIManager."""
+
+    @pytest.mark.asyncio
+    async def test_restart_uses_stored_response(self, tmp_path, make_api, delivery_server):
+        """Тест получения ответа из хранилища после перезапуска без запроса к API."""
+        APIManager.set_response_store(FileResponseStore(str(tmp_path)))
+        first = await make_api().delivery_method_list()
+
+        # Перезапуск процесса: пустой кеш в памяти, то же хранилище на диске
+        APIManager.set_response_store(FileResponseStore(str(tmp_path)))
+        second = await make_api().delivery_method_list()
+
+        assert delivery_server.app[CALLS] == ["/v1/delivery-method/list"]
+        assert isinstance(second, DeliveryMethodListResponse)
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_invalid_stored_response_is_refetched(self, tmp_path, make_api, delivery_server):
+        """Тест повторного запроса, если сохраненный ответ не проходит валидацию."""
+        APIManager.set_response_store(FileResponseStore(str(tmp_path)))
+        await make_api().delivery_method_list()
+        path = next(os.path.join(d, n) for d, _, names in os.walk(tmp_path) for n in names)
+        with open(path, "r+b") as file:
+            file.seek(8)
+            file.write(b"[")
+
+        await make_api().delivery_method_list()
+
+        assert len(delivery_server.app[CALLS]) == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_skips_store(self, tmp_path, make_api, delivery_server):
+        """Тест отключения постоянного хранилища вместе с кешем ответов."""
+        APIManager.set_response_store(FileResponseStore(str(tmp_path)))
+        await make_api({"response_cache": False}).delivery_method_list()
+
+        assert not [name for _, _, names in os.walk(tmp_path) for name in names]
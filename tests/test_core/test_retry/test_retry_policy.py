@@ -0,0 +1,109 @@
+"""Тесты политики и бюджета повторов запросов."""
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.ozonapi.seller.core.exceptions import (
+    APIClientError,
+    APIConnectError,
+    APINetworkError,
+    APIServerError,
+    APITimeoutError,
+    APITooManyRequestsError,
+)
+from src.ozonapi.seller.core.retry import RetryBudget, RetryPolicy, is_idempotent
+
+
+class TestRetryPolicy:
+    """Тесты политики повторов."""
+
+    def test_idempotent_policy_errors(self):
+        """Тест повторяемых ошибок для идемпотентных запросов."""
+        policy = RetryPolicy(max_retries=3, min_wait=1, max_wait=10)
+
+        for error_class in (APIServerError, APITimeoutError, APINetworkError, APIConnectError, APITooManyRequestsError):
+            assert issubclass(error_class, policy.retry_on)
+        assert not issubclass(APIClientError, policy.retry_on)
+
+    def test_non_idempotent_policy_errors(self):
+        """Тест повторов записи только после отказа до обработки запроса."""
+        policy = RetryPolicy(max_retries=3, min_wait=1, max_wait=10, idempotent=False)
+
+        assert issubclass(APITooManyRequestsError, policy.retry_on)
+        assert issubclass(APIConnectError, policy.retry_on)
+        assert not issubclass(APIServerError, policy.retry_on)
+        assert not issubclass(APITimeoutError, policy.retry_on)
+        assert not issubclass(APINetworkError, policy.retry_on)
+
+    def test_delay_bounds_and_jitter(self):
+        """Тест границ задержки и разброса между попытками."""
+        policy = RetryPolicy(max_retries=5, min_wait=1, max_wait=10)
+
+        first = [policy.get_delay(1) for _ in range(200)]
+        later = [policy.get_delay(6) for _ in range(200)]
+
+        assert all(1 <= delay <= 2 for delay in first)
+        assert all(1 <= delay <= 10 for delay in later)
+        assert len(set(later)) > 100
+        assert max(later) > 5
+
+    def test_delay_respects_retry_after(self):
+        """Тест задержки не меньше времени из Retry-After."""
+        policy = RetryPolicy(max_retries=5, min_wait=0.1, max_wait=0.2)
+        error = APITooManyRequestsError(429, "too many requests")
+        error.retry_after = 3.0
+
+        assert policy.get_delay(1, error) == 3.0
+
+    def test_is_idempotent(self):
+        """Тест определения идемпотентности по конечной точке."""
+        assert is_idempotent("product/list")
+        assert is_idempotent("product/import/prices")
+        assert not is_idempotent("product/import")
+        assert not is_idempotent("posting/fbs/ship")
+
+
+class TestRetryBudget:
+    """Тесты бюджета повторов."""
+
+    def test_retries_limited_by_ratio(self):
+        """Тест ограничения доли повторов от числа запросов."""
+        budget = RetryBudget(ratio=0.1, min_per_second=0, ttl=60)
+
+        for _ in range(100):
+            budget.deposit()
+        allowed = sum(budget.try_withdraw() for _ in range(100))
+
+        assert 9 <= allowed <= 10
+        assert budget.get_state()["rejected"] == 100 - allowed
+
+    def test_reserve_allows_rare_retries(self):
+        """Тест резерва повторов при малом числе запросов."""
+        budget = RetryBudget(ratio=0.1, min_per_second=2, ttl=60)
+
+        budget.deposit()
+        assert budget.try_withdraw()
+        assert budget.try_withdraw()
+        assert not budget.try_withdraw()
+
+    def test_balance_decays(self):
+        """Тест затухания накопленного запаса."""
+        budget = RetryBudget(ratio=1, min_per_second=0, ttl=1)
+        for _ in range(10):
+            budget.deposit()
+
+        with patch("src.ozonapi.seller.core.retry.time.monotonic", return_value=time.monotonic() + 10):
+            assert not budget.try_withdraw()
+
+    @pytest.mark.parametrize("ratio", [0.2, 0.5])
+    def test_state_counters(self, ratio):
+        """Тест счетчиков состояния бюджета."""
+        budget = RetryBudget(ratio=ratio, min_per_second=0)
+        for _ in range(10):
+            budget.deposit()
+        budget.try_withdraw()
+
+        state = budget.get_state()
+        assert state["requests"] == 10
+        assert state["retries"] == 1
@@ -0,0 +1,122 @@
+"""Тесты пулового режима SessionManager."""
+import asyncio
+
+import pytest
+
+from src.ozonapi.seller.core.sessions import SessionManager
+
+
+@pytest.fixture
+async def pooled_session_manager(mock_logger):
+    """Создает SessionManager в пуловом режиме."""
+    manager = SessionManager(instance_logger=mock_logger, pooled=True, idle_timeout=300.0)
+    yield manager
+    await manager.close_all()
+
+
+class TestSessionPooling:
+    """Тесты пулового режима SessionManager."""
+
+    @pytest.mark.asyncio
+    async def test_session_kept_after_context_exit(self, pooled_session_manager, mock_client_data):
+        """Тест сохранения сессии после завершения запроса."""
+        client_data = mock_client_data("pool1", "key1")
+
+        async with pooled_session_manager.get_session(
+            client_id=client_data["client_id"],
+            api_key=client_data["api_key"],
+            instance_id=1
+        ) as session1:
+            pass
+
+        async with pooled_session_manager.get_session(
+            client_id=client_data["client_id"],
+            api_key=client_data["api_key"],
+            instance_id=1
+        ) as session2:
+            pass
+
+        assert session1 is session2
+        assert not session1.closed
+        assert pooled_session_manager._session_refs[client_data["client_id"]] == {1}
+        assert pooled_session_manager.get_stats()[client_data["client_id"]]["sessions_created"] == 1
+
+    @pytest.mark.asyncio
+    async def test_session_closed_on_last_instance_removal(self, pooled_session_manager, mock_client_data):
+        """Тест закрытия пуловой сессии при удалении последнего инстанса."""
+        client_data = mock_client_data("pool2", "key2")
+
+        for instance_id in (1, 2):
+            async with pooled_session_manager.get_session(
+                client_id=client_data["client_id"],
+                api_key=client_data["api_key"],
+                instance_id=instance_id
+            ) as session:
+                pass
+
+        await pooled_session_manager.remove_instance(client_data["client_id"], 1)
+        assert not session.closed
+
+        await pooled_session_manager.remove_instance(client_data["client_id"], 2)
+        assert session.closed
+        assert client_data["client_id"] not in pooled_session_manager._sessions
+
+    @pytest.mark.asyncio
+    async def test_idle_session_reaped(self, mock_logger, mock_client_data):
+        """Тест закрытия простаивающей сессии фоновой задачей."""
+        manager = SessionManager(instance_logger=mock_logger, pooled=True, idle_timeout=0.05)
+        client_data = mock_client_data("pool3", "key3")
+
+        async with manager.get_session(
+            client_id=client_data["client_id"],
+            api_key=client_data["api_key"],
+            instance_id=1
+        ) as session:
+            await asyncio.sleep(0.15)
+            # Сессия с активным запросом не закрывается
+            assert not session.closed
+
+        await asyncio.sleep(0.15)
+
+        assert session.closed
+        assert client_data["client_id"] not in manager._sessions
+        await manager.close_all()
+        assert manager._reaper_task is None
+
+    @pytest.mark.asyncio
+    async def test_connections_reused_between_requests(self, pooled_session_manager, local_api_server, mock_client_data):
+        """Тест повторного использования keep-alive соединения последовательными запросами."""
+        client_data = mock_client_data("pool4", "key4")
+
+        for _ in range(5):
+            async with pooled_session_manager.get_session(
+                client_id=client_data["client_id"],
+                api_key=client_data["api_key"],
+                instance_id=1
+            ) as session:
+                async with session.post(local_api_server.make_url("/v1/test")) as response:
+                    assert (await response.json()) == {"result": "ok"}
+
+        stats = pooled_session_manager.get_stats()[client_data["client_id"]]
+        assert stats["requests"] == 5
+        assert stats["connections_created"] == 1
+        assert stats["connections_reused"] == 4
+
+    @pytest.mark.asyncio
+    async def test_non_pooled_mode_creates_connection_per_request(self, session_manager, local_api_server, mock_client_data):
+        """Тест создания нового соединения на каждый запрос без пулового режима."""
+        client_data = mock_client_data("pool5", "key5")
+
+        for _ in range(3):
+            async with session_manager.get_session(
+                client_id=client_data["client_id"],
+                api_key=client_data["api_key"],
+                instance_id=1
+            ) as session:
+                async with session.post(local_api_server.make_url("/v1/test")) as response:
+                    await response.read()
+
+        stats = session_manager.get_stats()[client_data["client_id"]]
+        assert stats["sessions_created"] == 3
+        assert stats["connections_created"] == 3
+        assert stats["connections_reused"] == 0
@@ -0,0 +1,221 @@
+"""Тесты потокового разбора ответов API."""
+import json
+import random
+import tracemalloc
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.ozonapi.seller import SellerAPI
+from src.ozonapi.seller.core import APIManager, ResponseMode
+from src.ozonapi.seller.core.exceptions import APIClientError
+from src.ozonapi.seller.core.streaming import JSONArrayScanner, StreamedItems
+from src.ozonapi.seller.schemas.prices_and_stocks import ProductInfoStocksItem, ProductInfoStocksRequest
+
+REQUESTS = web.AppKey("requests", list)
+FAILURES = web.AppKey("failures", list)
+
+DOCUMENT = {
+    "result": {
+        "postings": [
+            {"posting_number": f"{i}-\"]}},{{", "products": [{"sku": i, "tags": ["[", "\\", "ё"]}]}
+            for i in range(30)
+        ],
+        "has_next": True,
+    },
+    "total": 30,
+}
+
+
+def stock_item(number: int) -> dict:
+    """Возвращает элемент остатков товара."""
+    return {
+        "offer_id": f"ART-{number}",
+        "product_id": number,
+        "stocks": [{
+            "present": number, "reserved": 0, "shipment_type": "SHIPMENT_TYPE_GENERAL",
+            "sku": number, "type": "fbs", "warehouse_ids": [1, 2, 3],
+        }],
+    }
+
+
+@pytest.fixture
+async def stocks_server():
+    """Запускает локальный сервер остатков с пагинацией по cursor, отдающий тело ответа по частям."""
+    pages = {
+        "": ({"items": [stock_item(i) for i in range(1000)], "cursor": "page-2", "total": 1500}),
+        "page-2": ({"items": [stock_item(i) for i in range(1000, 1500)], "cursor": "", "total": 1500}),
+        "large": ({"items": [stock_item(i) for i in range(10000)], "cursor": "", "total": 10000}),
+    }
+    bodies = {cursor: json.dumps(page).encode() for cursor, page in pages.items()}
+
+    async def handler(request):
+        payload = await request.json()
+        request.app[REQUESTS].append(payload)
+        if request.app[FAILURES]:
+            status = request.app[FAILURES].pop(0)
+            return web.json_response({"code": status, "message": "error"}, status=status)
+        response = web.StreamResponse()
+        response.content_type = "application/json"
+        await response.prepare(request)
+        body = bodies[payload.get("cursor") or ""]
+        for start in range(0, len(body), 4096):
+            await response.write(body[start:start + 4096])
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app[REQUESTS] = []
+    app[FAILURES] = []
+    app.router.add_post("/v4/product/info/stocks", handler)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def stream_api(stocks_server):
+    """Клиент, направляющий запросы на локальный сервер остатков."""
+    original_session_manager = APIManager._session_manager
+    original_initialized = APIManager._initialized
+    APIManager._session_manager = None
+    APIManager._initialized = False
+    api = SellerAPI(client_id="123456", api_key="test_api_key")
+    api._config = api._config.model_copy(update={
+        "base_url": str(stocks_server.make_url("")).rstrip("/"),
+        "max_retries": 1,
+        "retry_min_wait": 0,
+        "retry_max_wait": 0,
+        "adaptive_rate_limit": False,
+    })
+    yield api
+    await APIManager._session_manager.close_all()
+    APIManager._session_manager = original_session_manager
+    APIManager._initialized = original_initialized
+
+
+class TestJSONArrayScanner:
+    """Тесты JSONArrayScanner."""
+
+    def test_random_chunks(self):
+        """Тест выделения элементов при произвольном делении тела ответа на фрагменты."""
+        body = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+        for _ in range(50):
+            scanner, items, position = JSONArrayScanner(("result", "postings")), [], 0
+            while position < len(body):
+                size = random.randint(1, 64)
+                items += scanner.feed(body[position:position + size])
+                position += size
+
+            assert [json.loads(item) for item in items] == DOCUMENT["result"]["postings"]
+            assert scanner.close() == {"result": {"postings": [], "has_next": True}, "total": 30}
+
+    def test_path_is_exact(self):
+        """Тест выбора массива только по полному пути от корня документа."""
+        scanner = JSONArrayScanner(("items",))
+
+        assert scanner.feed(b'{"nested": {"items": [1]}, "items": [2, 3], "cursor": "c"}') == [b"2", b"3"]
+        assert scanner.close() == {"nested": {"items": [1]}, "items": [], "cursor": "c"}
+
+    def test_root_array_and_empty_array(self):
+        """Тест массива в корне документа и пустого массива."""
+        scanner = JSONArrayScanner(())
+        assert scanner.feed(b' [ {"a": [1]} , 2 ]') == [b'{"a": [1]}', b"2"]
+        assert scanner.close() == []
+
+        scanner = JSONArrayScanner(("result",))
+        assert scanner.feed(b'{"result": []}') == []
+        assert scanner.close() == {"result": []}
+
+    def test_incomplete_body(self):
+        """Тест ошибки при неполном теле ответа."""
+        scanner = JSONArrayScanner(("result",))
+        scanner.feed(b'{"result": [1, 2')
+
+        with pytest.raises(ValueError):
+            scanner.close()
+
+    def test_streamed_items(self):
+        """Тест сведений о выданных элементах для определения следующей страницы."""
+        items = StreamedItems()
+        assert not items
+        items.count, items.last = 3, "last"
+
+        assert len(items) == 3 and items[-1] == "last"
+        with pytest.raises(IndexError):
+            items[0]
+
+
+class TestStreamingIterators:
+    """Тесты потоковой выдачи элементов итераторами."""
+
+    @pytest.mark.asyncio
+    async def test_iterator_streams_all_pages(self, stream_api, stocks_server):
+        """Тест потоковой выдачи элементов всех страниц с пагинацией по cursor."""
+        items = [item async for item in stream_api.iter_product_info_stocks(
+            ProductInfoStocksRequest(limit=1000), stream=True,
+        )]
+
+        assert len(items) == 1500
+        assert isinstance(items[0], ProductInfoStocksItem)
+        assert [item.product_id for item in items] == list(range(1500))
+        assert [payload.get("cursor") for payload in stocks_server.app[REQUESTS]] == ["", "page-2"]
+
+    @pytest.mark.asyncio
+    async def test_response_mode(self, stream_api):
+        """Тест формирования элементов в соответствии с режимом ответа."""
+        with stream_api.response_mode(ResponseMode.DICT):
+            page = stream_api._stream_request(
+                api_version="v4", endpoint="product/info/stocks", payload={"limit": 1000},
+                item_path=("items",), item_model=ProductInfoStocksItem,
+            )
+        items = [item async for item in page]
+
+        assert items[0] == stock_item(0)
+        assert page.data == {"items": [], "cursor": "page-2", "total": 1500}
+        assert len(page.items) == 1000
+
+    @pytest.mark.asyncio
+    async def test_bounded_memory(self, stream_api):
+        """Тест ограниченного потребления памяти при выдаче элементов страницы."""
+        def open_page():
+            return stream_api._stream_request(
+                api_version="v4", endpoint="product/info/stocks", payload={"cursor": "large"},
+                item_path=("items",), item_model=ProductInfoStocksItem,
+            )
+
+        # Первый запрос создает сессию и соединение
+        [item async for item in open_page()]
+        tracemalloc.start()
+        try:
+            count = 0
+            async for _ in open_page():
+                count += 1
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Страница целиком вместе с провалидированными элементами заняла бы в разы больше тела ответа
+        assert count == 10000
+        assert peak < len(json.dumps([stock_item(i) for i in range(10000)])) / 2
+
+    @pytest.mark.asyncio
+    async def test_retry_before_first_item(self, stream_api, stocks_server):
+        """Тест повтора запроса при ошибке сервера до выдачи элементов и ошибки клиента без повтора."""
+        stocks_server.app[FAILURES].append(500)
+        items = [item async for item in stream_api.iter_product_info_stocks(
+            ProductInfoStocksRequest(limit=1000), stream=True,
+        )]
+        assert len(items) == 1500
+
+        stocks_server.app[FAILURES].append(400)
+        with pytest.raises(APIClientError):
+            async for _ in stream_api.iter_product_info_stocks(ProductInfoStocksRequest(limit=1000), stream=True):
+                pass
+
+    def test_stream_pages_not_supported(self, stream_api):
+        """Тест отказа в потоковой выдаче страниц целиком."""
+        with pytest.raises(ValueError):
+            stream_api.iter_product_info_stocks(ProductInfoStocksRequest(), pages=True, stream=True)
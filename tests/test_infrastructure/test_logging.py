@@ -3,13 +3,19 @@
 import json
 import logging
 import os
+import threading
 from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
 from typing import Generator
 
 import pytest
 
-from src.ozonapi.infrastructure.logging import LoggerManager, LoggingSettings
+from src.ozonapi.infrastructure.logging import (
+    ContextLoggerAdapter,
+    LoggerManager,
+    LoggingSettings,
+    SharedLoggingPipeline,
+)
 
 
 class TestLogging:
@@ -349,4 +355,75 @@ class TestLogging:
         default_manager.shutdown()
         assert len(logger.handlers) == 0
         assert not default_manager._is_configured
-        assert len(default_manager._managed_loggers) == 0
\ No newline at end of file
+        assert len(default_manager._managed_loggers) == 0
+
+
+class TestSharedLoggingPipeline:
+    """Test suite for the process-wide shared logging pipeline."""
+
+    @pytest.fixture
+    def temp_log_dir(self, tmp_path: Path) -> Path:
+        """Fixture providing temporary directory for log files."""
+        return tmp_path / "logs"
+
+    @pytest.fixture
+    def pipeline(self) -> Generator[SharedLoggingPipeline, None, None]:
+        """Fixture providing shared pipeline stopped after the test."""
+        pipeline = SharedLoggingPipeline("shared_test")
+        yield pipeline
+        pipeline.shutdown()
+
+    def test_same_settings_share_logger(self, pipeline: SharedLoggingPipeline) -> None:
+        """Test that equal settings return the same logger without new handlers."""
+        settings = LoggingSettings(LEVEL="DEBUG", USE_ASYNC=False)
+        logger = pipeline.get_logger(settings)
+        handlers = list(logger.handlers)
+
+        assert pipeline.get_logger(LoggingSettings(LEVEL="DEBUG", USE_ASYNC=False)) is logger
+        assert logger.handlers == handlers
+        assert logger.name == "shared_test"
+        assert pipeline.get_logger(LoggingSettings(LEVEL="INFO", USE_ASYNC=False)).name == "shared_test.1"
+
+    def test_single_listener_thread(self, pipeline: SharedLoggingPipeline, temp_log_dir: Path) -> None:
+        """Test that async loggers with different outputs share one listener thread."""
+        temp_log_dir.mkdir(parents=True, exist_ok=True)
+        threads_before = threading.active_count()
+
+        first = pipeline.get_logger(LoggingSettings(DIR=str(temp_log_dir), FILE="first.log", FORMAT="%(message)s"))
+        second = pipeline.get_logger(LoggingSettings(DIR=str(temp_log_dir), FILE="second.log", FORMAT="%(message)s"))
+        assert threading.active_count() == threads_before + 1
+
+        first.info("to first")
+        second.info("to second")
+        pipeline.shutdown()
+
+        assert (temp_log_dir / "first.log").read_text().strip() == "to first"
+        assert (temp_log_dir / "second.log").read_text().strip() == "to second"
+        assert threading.active_count() == threads_before
+
+    def test_adapter_context(self, pipeline: SharedLoggingPipeline, temp_log_dir: Path) -> None:
+        """Test that adapter context is rendered into record name and merged with extra fields."""
+        temp_log_dir.mkdir(parents=True, exist_ok=True)
+        logger = pipeline.get_logger(
+            LoggingSettings(DIR=str(temp_log_dir), FILE="context.log", JSON=True, USE_ASYNC=False)
+        )
+        adapter = ContextLoggerAdapter(logger, {"client_id": "123", "instance": 7})
+
+        adapter.warning("first")
+        adapter.warning("second", extra={"endpoint": "v1/test"})
+        pipeline.shutdown()
+
+        records = [json.loads(line) for line in (temp_log_dir / "context.log").read_text().splitlines()]
+        assert [record["logger"] for record in records] == ["shared_test[123]-[7]"] * 2
+        assert records[1]["context"] == {"client_id": "123", "instance": 7}
+
+    def test_shutdown_restores_loggers(self, pipeline: SharedLoggingPipeline) -> None:
+        """Test that shutdown removes handlers, filters and the listener."""
+        logger = pipeline.get_logger(LoggingSettings())
+        assert pipeline.listener is not None
+
+        pipeline.shutdown()
+        assert pipeline.listener is None
+        assert logger.handlers == []
+        assert logger.filters == []
+        assert logger.propagate
@@ -1,9 +1,9 @@
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, Mock
 
 import pytest
 
 from src.ozonapi.seller import SellerAPI
-from src.ozonapi.seller.core import APIManager, MethodRateLimiterManager
+from src.ozonapi.seller.core import APIManager, MethodRateLimiterManager, ResponseCache
 
 
 @pytest.fixture
@@ -14,17 +14,35 @@ def api():
 
 @pytest.fixture
 def mock_api_request():
-    """Фикстура для мока метода _request APIManager."""
+    """Фикстура для мока метода _request APIManager.
+
+    Если при вызове передан `response_model`, данные из `return_value` валидируются
+    в указанную схему так же, как это делает `APIManager._request`.
+    """
     with patch.object(APIManager, '_request', new_callable=AsyncMock) as mock_request:
+        async def decode_response(*args, response_model=None, **kwargs):
+            data = mock_request.return_value
+            return data if response_model is None else response_model.model_validate(data)
+
+        mock_request.side_effect = decode_response
         yield mock_request
 
 
 @pytest.fixture(autouse=True)
 def mock_method_rate_limiter():
-    """Фикстура для мока MethodRateLimiterManager.get_limiter (применяется автоматически ко всем тестам)."""
-    with patch.object(MethodRateLimiterManager, 'get_limiter', new_callable=AsyncMock) as mock_get_limiter:
+    """Фикстура для мока MethodRateLimiterManager.get_bucket (применяется автоматически ко всем тестам)."""
+    with patch.object(MethodRateLimiterManager, 'get_bucket', new_callable=Mock) as mock_get_bucket:
         mock_limiter = AsyncMock()
         mock_limiter.__aenter__ = AsyncMock(return_value=None)
         mock_limiter.__aexit__ = AsyncMock(return_value=None)
-        mock_get_limiter.return_value = mock_limiter
-        yield mock_get_limiter
\ No newline at end of file
+        mock_get_bucket.return_value = mock_limiter
+        yield mock_get_bucket
+
+
+@pytest.fixture(autouse=True)
+def fresh_response_cache():
+    """Фикстура для изоляции общего кеша ответов между тестами (применяется автоматически ко всем тестам)."""
+    original_cache = APIManager._response_cache
+    APIManager._response_cache = ResponseCache()
+    yield APIManager._response_cache
+    APIManager._response_cache = original_cache
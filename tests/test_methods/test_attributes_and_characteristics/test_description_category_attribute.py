@@ -45,7 +45,8 @@ class TestDescriptionCategoryAttribute:
             method="post",
             api_version="v1",
             endpoint="description-category/attribute",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=DescriptionCategoryAttributeResponse,
         )
         assert isinstance(response, DescriptionCategoryAttributeResponse)
         assert len(response.result) == 1
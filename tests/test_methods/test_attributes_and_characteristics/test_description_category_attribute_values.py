@@ -45,7 +45,8 @@ class TestDescriptionCategoryAttributeValues:
             method="post",
             api_version="v1",
             endpoint="description-category/attribute/values",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=DescriptionCategoryAttributeValuesResponse,
         )
         assert isinstance(response, DescriptionCategoryAttributeValuesResponse)
         assert len(response.result) == 2
@@ -42,7 +42,8 @@ class TestDescriptionCategoryAttributeValuesSearch:
             method="post",
             api_version="v1",
             endpoint="description-category/attribute/values/search",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=DescriptionCategoryAttributeValuesSearchResponse,
         )
         assert isinstance(response, DescriptionCategoryAttributeValuesSearchResponse)
         assert len(response.result) == 2
@@ -1,5 +1,6 @@
 import pytest
 
+from src.ozonapi.seller.catalog import CategoryIndex
 from src.ozonapi.seller.common.enumerations.localization import Language
 from src.ozonapi.seller.schemas.attributes_and_characteristics import DescriptionCategoryTreeRequest, \
     DescriptionCategoryTreeResponse
@@ -42,10 +43,55 @@ class TestDescriptionCategoryTree:
             method="post",
             api_version="v1",
             endpoint="description-category/tree",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=DescriptionCategoryTreeResponse,
         )
         assert isinstance(response, DescriptionCategoryTreeResponse)
         assert len(response.result) == 1
         assert response.result[0].description_category_id == 200000933
         assert response.result[0].category_name == "Электроника"
-        assert response.result[0].children[0].category_name == "Аксессуары для смартфонов"
\ No newline at end of file
+        assert response.result[0].children[0].category_name == "Аксессуары для смартфонов"
+
+    @pytest.mark.asyncio
+    async def test_description_category_index(self, api, mock_api_request):
+        """Тестирует метод description_category_index."""
+        mock_api_request.return_value = {
+            "result": [
+                {
+                    "description_category_id": 200000933,
+                    "category_name": "Электроника",
+                    "disabled": False,
+                    "children": [
+                        {"type_id": 93080, "type_name": "Смартфоны", "disabled": False, "children": []},
+                    ],
+                }
+            ]
+        }
+
+        index = await api.description_category_index()
+
+        assert isinstance(index, CategoryIndex)
+        assert index.get_type(93080).description_category_id == 200000933
+        assert mock_api_request.call_args.kwargs["endpoint"] == "description-category/tree"
+
+    @pytest.mark.asyncio
+    async def test_description_category_index_reuses_cached_tree(self, api, mock_api_request):
+        """Индекс строится по дереву, закешированному в другом режиме ответа."""
+        mock_api_request.return_value = {
+            "result": [
+                {
+                    "description_category_id": 200000933,
+                    "category_name": "Электроника",
+                    "disabled": False,
+                    "children": [
+                        {"type_id": 93080, "type_name": "Смартфоны", "disabled": False, "children": []},
+                    ],
+                }
+            ]
+        }
+
+        await api.description_category_tree()
+        index = await api.description_category_index()
+
+        assert mock_api_request.call_count == 1
+        assert index.get_type(93080).description_category_id == 200000933
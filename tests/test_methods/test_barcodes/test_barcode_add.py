@@ -31,7 +31,8 @@ class TestBarcodeAdd:
             method="post",
             api_version="v1",
             endpoint="barcode/add",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=BarcodeAddResponse,
         )
         assert isinstance(response, BarcodeAddResponse)
         assert response.errors == []
\ No newline at end of file
@@ -27,7 +27,8 @@ class TestBarcodeGenerate:
             method="post",
             api_version="v1",
             endpoint="barcode/generate",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=BarcodeGenerateResponse,
         )
         assert isinstance(response, BarcodeGenerateResponse)
         assert response.errors == []
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""Тесты методов *_load со сбором отдельных запросов товаров в общие запросы."""
+import asyncio
+
+import pytest
+
+from src.ozonapi.seller.core import ResponseMode
+from src.ozonapi.seller.core.exceptions import APIClientError
+from src.ozonapi.seller.core.response_cache import current_cache_policy
+
+
+def product(product_id, sku):
+    """Формирует товар ответа product_info_list."""
+    return {"id": product_id, "offer_id": f"offer-{product_id}", "sources": [{"sku": sku, "source": "sds"}]}
+
+
+class TestBatchLoading:
+    """Тесты методов *_load."""
+
+    @pytest.mark.asyncio
+    async def test_product_info_list_load(self, api, mock_api_request):
+        """Тест одного запроса на каждый вид идентификатора и выдачи каждому вызову своего товара."""
+        requests = []
+
+        async def respond(*args, payload=None, response_model=None, **kwargs):
+            requests.append({key: value for key, value in payload.items() if value})
+            ids = payload["sku"] or [value - 100 for value in payload["product_id"] or ()]
+            return {"items": [product(value % 100, value % 100 + 100) for value in ids if value % 100 != 9]}
+
+        mock_api_request.side_effect = respond
+
+        results = await asyncio.gather(
+            *(api.product_info_list_load(sku=sku) for sku in (101, 102, 109)),
+            api.product_info_list_load(product_id=3),
+        )
+
+        assert sorted(requests, key=str) == [{"product_id": [3]}, {"sku": [101, 102, 109]}]
+        assert [result["id"] if result else None for result in results] == [1, 2, None, 3]
+
+    @pytest.mark.asyncio
+    async def test_product_info_prices_load_errors_per_caller(self, api, mock_api_request):
+        """Тест передачи ошибки только вызову с ошибочным идентификатором."""
+        async def respond(*args, payload=None, response_model=None, **kwargs):
+            if "bad" in payload["filter"]["offer_id"]:
+                raise APIClientError(400, "invalid offer_id")
+            return {"items": [{"offer_id": offer_id} for offer_id in payload["filter"]["offer_id"]]}
+
+        mock_api_request.side_effect = respond
+
+        results = await asyncio.gather(
+            *(api.product_info_prices_load(offer_id=offer_id) for offer_id in ("a", "bad", "b")),
+            return_exceptions=True,
+        )
+
+        assert results[0] == {"offer_id": "a"} and results[2] == {"offer_id": "b"}
+        assert isinstance(results[1], APIClientError)
+
+    @pytest.mark.asyncio
+    async def test_product_info_stocks_load(self, api, mock_api_request):
+        """Тест сбора запросов остатков по product_id."""
+        mock_api_request.side_effect = None
+        mock_api_request.return_value = {"items": [{"offer_id": "1", "product_id": 1, "stocks": []}]}
+
+        results = await asyncio.gather(api.product_info_stocks_load(product_id=1), api.product_info_stocks_load(product_id=2))
+
+        assert results == [{"offer_id": "1", "product_id": 1, "stocks": []}, None]
+        assert mock_api_request.call_count == 1
+        assert (await api.get_batch_loader_stats())["product_info_stocks:product_id:validate"]["batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_load_per_response_mode_in_clean_context(self, api, mock_api_request):
+        """Тест отдельных общих запросов для каждого режима ответа вне контекста вызовов."""
+        modes, policies = {}, []
+
+        async def respond(*args, payload=None, response_model=None, **kwargs):
+            modes[payload["sku"][0]] = api._get_response_mode()
+            policies.append(current_cache_policy.get())
+            return {"items": [product(value - 100, value) for value in payload["sku"]]}
+
+        mock_api_request.side_effect = respond
+
+        async def load_as_dict():
+            with api.response_mode(ResponseMode.DICT):
+                return await api.product_info_list_load(sku=102)
+
+        async def load_with_leaked_policy():
+            current_cache_policy.set("leaked")
+            return await api.product_info_list_load(sku=101)
+
+        first, second = await asyncio.gather(load_with_leaked_policy(), load_as_dict())
+
+        assert first["id"] == 1 and second["id"] == 2
+        assert modes == {101: ResponseMode.VALIDATE, 102: ResponseMode.DICT}
+        assert "leaked" not in policies
@@ -64,7 +64,8 @@ class TestSellerBetaAPI:
             method="post",
             api_version="v1",
             endpoint="analytics/stocks",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=AnalyticsStocksResponse,
         )
         assert isinstance(response, AnalyticsStocksResponse)
         assert len(response.items) == 1
@@ -64,7 +64,8 @@ class TestSellerInfo:
             method="post",
             api_version="v1",
             endpoint="seller/info",
-            payload={}
+            payload={},
+            response_model=SellerInfoResponse,
         )
         assert isinstance(response, SellerInfoResponse)
         assert response.company.name == "Test Company на Ozon"
@@ -0,0 +1,93 @@
+"""Тесты пакетных методов *_bulk с делением идентификаторов на части."""
+import pytest
+
+from src.ozonapi.seller.core.exceptions import APIBulkError, APIClientError
+
+
+def echo_items(field, item):
+    """Отвечает на запрос элементами по каждому идентификатору из поля `field`."""
+    async def respond(*args, payload=None, response_model=None, **kwargs):
+        return response_model.model_validate({"items": [item(value) for value in payload[field]]})
+    return respond
+
+
+class TestBulkMethods:
+    """Тесты методов *_bulk."""
+
+    @pytest.mark.asyncio
+    async def test_product_info_list_bulk(self, api, mock_api_request):
+        """Тест деления идентификаторов разных видов на части по 1000 и объединения ответа."""
+        requests = []
+
+        async def respond(*args, payload=None, response_model=None, **kwargs):
+            requests.append({key: len(value) for key, value in payload.items() if value})
+            return response_model.model_validate({"items": []})
+
+        mock_api_request.side_effect = respond
+
+        result = await api.product_info_list_bulk(offer_id=[str(i) for i in range(1500)], sku=[1, 2])
+
+        assert sorted(requests, key=str) == sorted(
+            [{"offer_id": 1000}, {"offer_id": 500}, {"sku": 2}], key=str
+        )
+        assert result.items == []
+
+    @pytest.mark.asyncio
+    async def test_product_pictures_info_bulk(self, api, mock_api_request):
+        """Тест объединения элементов ответов в порядке частей."""
+        mock_api_request.side_effect = echo_items(
+            "product_id", lambda product_id: {"product_id": product_id, "primary_photo": [], "photo": [],
+                                              "color_photo": [], "photo_360": []},
+        )
+
+        result = await api.product_pictures_info_bulk(list(range(2500)))
+
+        assert mock_api_request.call_count == 3
+        assert [item.product_id for item in result.items] == list(range(2500))
+
+    @pytest.mark.asyncio
+    async def test_product_archive_bulk_errors(self, api, mock_api_request):
+        """Тест передачи ошибок частей и результата остальных частей."""
+        async def respond(*args, payload=None, response_model=None, **kwargs):
+            if payload["product_id"][0] == 100:
+                raise APIClientError(400, "invalid")
+            return response_model.model_validate({"result": True})
+
+        mock_api_request.side_effect = respond
+
+        with pytest.raises(APIBulkError) as error:
+            await api.product_archive_bulk(list(range(250)))
+
+        assert error.value.response.result is True
+        assert [(e.index, len(e.items)) for e in error.value.errors] == [(1, 100)]
+
+    @pytest.mark.asyncio
+    async def test_posting_fbs_package_label_bulk(self, api, mock_api_request):
+        """Тест получения отдельного файла для каждой части по 20 отправлений."""
+        async def respond(*args, payload=None, response_model=None, **kwargs):
+            return response_model.model_validate({
+                "file_content": ",".join(payload["posting_number"]), "file_name": "labels.pdf",
+                "content_type": "application/pdf",
+            })
+
+        mock_api_request.side_effect = respond
+        postings = [f"1-{i}" for i in range(45)]
+
+        labels = await api.posting_fbs_package_label_bulk(postings)
+
+        assert [label.file_content.split(",") for label in labels] == [postings[:20], postings[20:40], postings[40:]]
+
+    @pytest.mark.asyncio
+    async def test_products_delete_bulk(self, api, mock_api_request):
+        """Тест объединения статусов удаления по частям из 500 товаров."""
+        async def respond(*args, payload=None, response_model=None, **kwargs):
+            return response_model.model_validate({
+                "status": [{"offer_id": item["offer_id"], "is_deleted": True} for item in payload["products"]]
+            })
+
+        mock_api_request.side_effect = respond
+
+        result = await api.products_delete_bulk([str(i) for i in range(1200)])
+
+        assert mock_api_request.call_count == 3
+        assert len(result.status) == 1200
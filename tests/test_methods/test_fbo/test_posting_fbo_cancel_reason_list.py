@@ -46,6 +46,7 @@ class TestPostingFBOCancelReasonList:
             method="post",
             api_version="v1",
             endpoint="posting/fbo/cancel-reason/list",
+            response_model=PostingFBOCancelReasonListResponse,
         )
 
         assert isinstance(response, PostingFBOCancelReasonListResponse)
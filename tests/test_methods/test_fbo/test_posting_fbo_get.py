@@ -88,7 +88,8 @@ class TestPostingFBOGet:
             method="post",
             api_version="v2",
             endpoint="posting/fbo/get",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBOGetResponse,
         )
 
         assert isinstance(response, PostingFBOGetResponse)
@@ -113,7 +113,8 @@ class TestPostingFBOList:
             method="post",
             api_version="v2",
             endpoint="posting/fbo/list",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBOListResponse,
         )
 
         assert isinstance(response, PostingFBOListResponse)
@@ -0,0 +1,60 @@
+"""Тесты параллельной выборки отправлений FBO с делением периода."""
+import datetime
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.ozonapi.seller.common.enumerations.requests import SortingDirection
+from src.ozonapi.seller.core.pagination import parse_datetime
+from src.ozonapi.seller.schemas.entities.postings import PostingFilter
+from src.ozonapi.seller.schemas.fbo import PostingFBOListRequest
+
+START = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+POSTINGS = [
+    {"posting_number": f"0-{i}", "created_at": START + datetime.timedelta(hours=i)} for i in range(45)
+]
+
+
+@pytest.fixture
+def fbo_pages(mock_api_request):
+    """Отвечает страницами отправлений FBO с учетом периода, offset и предельного offset."""
+    calls = []
+
+    async def respond(*args, payload=None, response_model=None, **kwargs):
+        # Запрос должен сериализоваться в JSON так же, как при отправке
+        payload = json.loads(json.dumps(payload))
+        calls.append(payload)
+        assert payload["offset"] <= 20
+        since, to = parse_datetime(payload["filter"]["since"]), parse_datetime(payload["filter"]["to"])
+        postings = [p for p in POSTINGS if since <= p["created_at"] <= to]
+        if payload["dir"] == "desc":
+            postings.reverse()
+        page = postings[payload["offset"]:payload["offset"] + payload["limit"]]
+        return {"result": [{"posting_number": p["posting_number"]} for p in page]}
+
+    mock_api_request.side_effect = respond
+    with patch("src.ozonapi.seller.methods.fbo.posting_fbo_list.POSTING_FBO_LIST_MAX_OFFSET", 20):
+        yield calls
+
+
+class TestPostingFBOListAll:
+    """Тесты метода posting_fbo_list_all."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("direction", [SortingDirection.ASC, SortingDirection.DESC])
+    async def test_splits_period_at_offset_ceiling(self, api, fbo_pages, direction):
+        """Тест выборки всех отправлений при превышении предельного offset."""
+        request = PostingFBOListRequest(
+            dir=direction,
+            filter=PostingFilter(since=START, to_=START + datetime.timedelta(hours=44)),
+            limit=10,
+        )
+
+        postings = await api.posting_fbo_list_all(request)
+
+        expected = [p["posting_number"] for p in POSTINGS]
+        if direction == SortingDirection.DESC:
+            expected.reverse()
+        assert [p["posting_number"] for p in postings] == expected
+        assert len(fbo_pages) > 5
@@ -29,7 +29,8 @@ class TestPostingFBSArbitration:
             method="post",
             api_version="v2",
             endpoint="posting/fbs/arbitration",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSArbitrationResponse,
         )
 
         assert isinstance(response, PostingFBSArbitrationResponse)
@@ -29,7 +29,8 @@ class TestPostingFBSAwaitingDelivery:
             method="post",
             api_version="v2",
             endpoint="posting/fbs/awaiting-delivery",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSAwaitingDeliveryResponse,
         )
 
         assert isinstance(response, PostingFBSAwaitingDeliveryResponse)
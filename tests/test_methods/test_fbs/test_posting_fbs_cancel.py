@@ -31,7 +31,8 @@ class TestPostingFBSCancel:
             method="post",
             api_version="v2",
             endpoint="posting/fbs/cancel",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSCancelResponse,
         )
 
         assert isinstance(response, PostingFBSCancelResponse)
@@ -65,7 +65,8 @@ class TestPostingFBSCancelReason:
             method="post",
             api_version="v1",
             endpoint="posting/fbs/cancel-reason",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSCancelReasonResponse,
         )
 
         assert isinstance(response, PostingFBSCancelReasonResponse)
@@ -46,6 +46,7 @@ class TestPostingFBSCancelReasonList:
             method="post",
             api_version="v2",
             endpoint="posting/fbs/cancel-reason/list",
+            response_model=PostingFBSCancelReasonListResponse,
         )
 
         assert isinstance(response, PostingFBSCancelReasonListResponse)
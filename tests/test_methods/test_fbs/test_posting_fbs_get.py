@@ -135,7 +135,8 @@ class TestPostingFBSGet:
             method="post",
             api_version="v3",
             endpoint="posting/fbs/get",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSGetResponse,
         )
 
         assert isinstance(response, PostingFBSGetResponse)
@@ -2,6 +2,7 @@ import datetime
 
 import pytest
 
+from src.ozonapi.seller.methods.fbs.posting_fbs_get_by_barcode import _PostingFBSGetByBarcodeResult
 from src.ozonapi.seller.schemas.fbs import PostingFBSGetByBarcodeResponse
 
 
@@ -50,7 +51,8 @@ class TestPostingFBSGetByBarcode:
             method="post",
             api_version="v2",
             endpoint="posting/fbs/get-by-barcode",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=_PostingFBSGetByBarcodeResult,
         )
 
         assert isinstance(response, PostingFBSGetByBarcodeResponse)
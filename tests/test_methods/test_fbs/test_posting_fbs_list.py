@@ -196,7 +196,8 @@ class TestPostingFBSList:
             method="post",
             api_version="v3",
             endpoint="posting/fbs/list",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSListResponse,
         )
 
         assert isinstance(response, PostingFBSListResponse)
@@ -32,7 +32,8 @@ class TestPostingFBSMultiBoxQty(object):
             method="post",
             api_version="v3",
             endpoint="posting/multi-box-qty/set",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSMultiBoxQtySetResponse,
         )
 
         assert isinstance(response, PostingFBSMultiBoxQtySetResponse)
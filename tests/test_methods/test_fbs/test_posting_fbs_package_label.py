@@ -31,7 +31,8 @@ class TestPostingFBSPackageLabel:
             method="post",
             api_version="v2",
             endpoint="posting/fbs/package-label",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSPackageLabelResponse,
         )
 
         assert isinstance(response, PostingFBSPackageLabelResponse)
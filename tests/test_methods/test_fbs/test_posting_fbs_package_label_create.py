@@ -40,7 +40,8 @@ class TestPostingFBSPackageLabelCreate:
             method="post",
             api_version="v2",
             endpoint="posting/fbs/package-label/create",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSPackageLabelCreateResponse,
         )
 
         assert isinstance(response, PostingFBSPackageLabelCreateResponse)
@@ -36,7 +36,8 @@ class TestPostingFBSPackageLabelGet:
             method="post",
             api_version="v1",
             endpoint="posting/fbs/package-label/get",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSPackageLabelGetResponse,
         )
 
         assert isinstance(response, PostingFBSPackageLabelGetResponse)
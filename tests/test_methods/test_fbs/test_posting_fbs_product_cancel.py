@@ -38,7 +38,8 @@ class TestPostingFBSProductCancel:
             method="post",
             api_version="v2",
             endpoint="posting/fbs/product/cancel",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=PostingFBSProductCancelResponse,
         )
 
         assert isinstance(response, PostingFBSProductCancelResponse)
@@ -36,7 +36,8 @@ class TestPostingFBSProductChange:
             method="post",
             api_version="v2",
             endpoint="posting/fbs/product/change",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSProductChangeResponse,
         )
 
         assert isinstance(response, PostingFBSProductChangeResponse)
@@ -43,7 +43,8 @@ class TestPostingFBSProductCountryList:
             method="post",
             api_version="v2",
             endpoint="posting/fbs/product/country/list",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSProductCountryListResponse,
         )
 
         assert isinstance(response1, PostingFBSProductCountryListResponse)
@@ -32,7 +32,8 @@ class TestPostingFBSProductCountrySet:
             method="post",
             api_version="v2",
             endpoint="posting/fbs/product/country/set",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSProductCountrySetResponse,
         )
 
         assert isinstance(response, PostingFBSProductCountrySetResponse)
@@ -1,5 +1,7 @@
 import pytest
 
+from src.ozonapi.seller.core import ResponseMode
+from src.ozonapi.seller.methods.fbs.posting_fbs_restrictions import _PostingFBSRestrictionsResult
 from src.ozonapi.seller.schemas.fbs import PostingFBSRestrictionsResponse
 
 
@@ -38,7 +40,8 @@ class TestPostingFBSRestrictions:
             method="post",
             api_version="v1",
             endpoint="posting/fbs/restrictions",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=_PostingFBSRestrictionsResult,
         )
 
         assert isinstance(response, PostingFBSRestrictionsResponse)
@@ -50,3 +53,26 @@ class TestPostingFBSRestrictions:
         assert response.length == 500
         assert response.max_posting_price == 500000.0
         assert response.min_posting_price == 0.0
+
+    @pytest.mark.asyncio
+    async def test_posting_fbs_restrictions_dict_mode(self, api, mock_api_request):
+        """В режиме DICT метод возвращает содержимое поля result без валидации."""
+        result = {"posting_number": "76673629-0020-1", "max_posting_weight": 40000}
+
+        async def respond(*args, response_model=None, **kwargs):
+            assert response_model is _PostingFBSRestrictionsResult
+            assert api._get_response_mode() is ResponseMode.DICT
+            return {"result": result}
+
+        mock_api_request.side_effect = respond
+
+        from src.ozonapi.seller.schemas.fbs.v1__posting_fbs_restrictions import (
+            PostingFBSRestrictionsRequest
+        )
+
+        with api.response_mode(ResponseMode.DICT):
+            response = await api.posting_fbs_restrictions(
+                PostingFBSRestrictionsRequest(posting_number="76673629-0020-1")
+            )
+
+        assert response == result
@@ -194,7 +194,8 @@ class TestPostingFBSUnfulfilledList:
             method="post",
             api_version="v3",
             endpoint="posting/fbs/unfulfilled/list",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSUnfulfilledListResponse,
         )
         assert isinstance(response, PostingFBSUnfulfilledListResponse)
         assert response.result.count == 2
@@ -0,0 +1,37 @@
+"""Тесты параллельной выборки необработанных отправлений."""
+import datetime
+
+import pytest
+
+from src.ozonapi.seller.schemas.fbs import PostingFBSUnfulfilledListFilter, PostingFBSUnfulfilledListRequest
+
+
+class TestPostingFBSUnfulfilledListAll:
+    """Тесты метода posting_fbs_unfulfilled_list_all."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_remaining_offsets_by_count(self, api, mock_api_request):
+        """Тест запроса оставшихся страниц по общему количеству из первой страницы."""
+        postings = [{"posting_number": str(i)} for i in range(25)]
+        offsets = []
+
+        async def respond(*args, payload=None, **kwargs):
+            offset = payload["offset"] or 0
+            offsets.append(offset)
+            page = postings[offset:offset + payload["limit"]]
+            return {"result": {"postings": page, "count": len(postings)}}
+
+        mock_api_request.side_effect = respond
+
+        result = await api.posting_fbs_unfulfilled_list_all(
+            PostingFBSUnfulfilledListRequest(
+                filter=PostingFBSUnfulfilledListFilter(
+                    cutoff_from=datetime.datetime(2025, 1, 1),
+                    cutoff_to=datetime.datetime(2025, 1, 5),
+                ),
+                limit=10,
+            )
+        )
+
+        assert [p["posting_number"] for p in result] == [str(i) for i in range(25)]
+        assert sorted(offsets) == [0, 10, 20]
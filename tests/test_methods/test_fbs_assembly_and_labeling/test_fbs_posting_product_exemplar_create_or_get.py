@@ -61,7 +61,8 @@ class TestFBSPostingProductExemplarCreateOrGet:
             method="post",
             api_version="v6",
             endpoint="fbs/posting/product/exemplar/create-or-get",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=FBSPostingProductExemplarCreateOrGetResponse,
         )
 
         assert isinstance(response, FBSPostingProductExemplarCreateOrGetResponse)
@@ -53,7 +53,8 @@ class TestFBSPostingProductExemplarSet:
             method="post",
             api_version="v6",
             endpoint="fbs/posting/product/exemplar/set",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=FBSPostingProductExemplarSetResponse,
         )
 
         assert isinstance(response, FBSPostingProductExemplarSetResponse)
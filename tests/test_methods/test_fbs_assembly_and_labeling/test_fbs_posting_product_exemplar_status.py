@@ -59,7 +59,8 @@ class TestFBSPostingProductExemplarStatus:
             method="post",
             api_version="v5",
             endpoint="fbs/posting/product/exemplar/status",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=FBSPostingProductExemplarStatusResponse,
         )
 
         assert isinstance(response, FBSPostingProductExemplarStatusResponse)
@@ -27,7 +27,8 @@ class TestFBSPostingProductExemplarUpdate:
             method="post",
             api_version="v1",
             endpoint="fbs/posting/product/exemplar/update",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=FBSPostingProductExemplarUpdateResponse,
         )
 
         assert isinstance(response, FBSPostingProductExemplarUpdateResponse)
\ No newline at end of file
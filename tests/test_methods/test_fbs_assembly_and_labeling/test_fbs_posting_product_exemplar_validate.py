@@ -73,7 +73,8 @@ class TestFBSPostingProductExemplarValidate:
             method="post",
             api_version="v5",
             endpoint="fbs/posting/product/exemplar/validate",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=FBSPostingProductExemplarValidateResponse,
         )
 
         assert isinstance(response, FBSPostingProductExemplarValidateResponse)
@@ -166,7 +167,8 @@ class TestFBSPostingProductExemplarValidate:
             method="post",
             api_version="v5",
             endpoint="fbs/posting/product/exemplar/validate",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=FBSPostingProductExemplarValidateResponse,
         )
 
         assert isinstance(response, FBSPostingProductExemplarValidateResponse)
@@ -57,7 +57,8 @@ class TestPostingFBSShip:
             method="post",
             api_version="v4",
             endpoint="posting/fbs/ship",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSShipResponse,
         )
 
         assert isinstance(response, PostingFBSShipResponse)
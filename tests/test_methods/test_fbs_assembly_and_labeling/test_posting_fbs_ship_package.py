@@ -42,7 +42,8 @@ class TestPostingFBSShipPackage:
             method="post",
             api_version="v4",
             endpoint="posting/fbs/ship/package",
-            payload=request.model_dump(by_alias=True)
+            payload=request.model_dump(by_alias=True),
+            response_model=PostingFBSShipPackageResponse,
         )
 
         assert isinstance(response, PostingFBSShipPackageResponse)
@@ -0,0 +1,173 @@
+"""Тесты итераторов iter_* с автоматической пагинацией методов API."""
+import datetime
+
+import pytest
+
+from src.ozonapi.seller.schemas.attributes_and_characteristics import DescriptionCategoryAttributeValuesRequest
+from src.ozonapi.seller.schemas.fbo import PostingFBOListRequest
+from src.ozonapi.seller.schemas.fbs import (
+    PostingFBSListFilter,
+    PostingFBSListRequest,
+    PostingFBSUnfulfilledListFilter,
+    PostingFBSUnfulfilledListRequest,
+)
+from src.ozonapi.seller.schemas.entities.postings import PostingFilter
+from src.ozonapi.seller.schemas.prices_and_stocks import ProductInfoPricesRequest, ProductInfoStocksRequest
+from src.ozonapi.seller.schemas.products import (
+    ProductInfoAttributesRequest,
+    ProductListRequest,
+    ProductListResponseItem,
+)
+from src.ozonapi.seller.schemas.warehouses import DeliveryMethodListRequest
+
+NOW = datetime.datetime(2025, 1, 10)
+SINCE = NOW - datetime.timedelta(days=5)
+
+
+def serve_pages(mock_api_request, pages):
+    """Отвечает на запросы страницами по значению указателя пагинации в запросе."""
+    def respond(*args, payload=None, response_model=None, **kwargs):
+        for key in ("cursor", "last_id", "last_value_id", "offset"):
+            if key in payload:
+                return pages[payload[key] or 0 if key in ("offset", "last_value_id") else payload[key] or ""]
+        raise AssertionError(payload)
+
+    mock_api_request.side_effect = respond
+
+
+class TestIterators:
+    """Тесты итераторов iter_*."""
+
+    @pytest.mark.asyncio
+    async def test_iter_product_list(self, api, mock_api_request):
+        """Тест пагинации по last_id с валидацией элементов."""
+        def item(product_id):
+            return {
+                "archived": False, "has_fbo_stocks": False, "has_fbs_stocks": True,
+                "is_discounted": False, "product_id": product_id, "offer_id": str(product_id), "quants": [],
+            }
+
+        pages = {
+            "": {"result": {"items": [item(1), item(2)], "last_id": "a", "total": 3}},
+            "a": {"result": {"items": [item(3)], "last_id": "b", "total": 3}},
+        }
+
+        async def respond(*args, payload=None, response_model=None, **kwargs):
+            return response_model.model_validate(pages[payload["last_id"] or ""])
+
+        mock_api_request.side_effect = respond
+
+        items = [item async for item in api.iter_product_list(ProductListRequest(limit=2))]
+
+        assert [item.product_id for item in items] == [1, 2, 3]
+        assert all(isinstance(item, ProductListResponseItem) for item in items)
+        assert mock_api_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_iter_product_info_stocks_pages(self, api, mock_api_request):
+        """Тест пагинации по cursor с выдачей страниц."""
+        serve_pages(mock_api_request, {
+            "": {"items": [{"product_id": 1}], "cursor": "next", "total": 2},
+            "next": {"items": [{"product_id": 2}], "cursor": "", "total": 2},
+        })
+
+        pages = [page async for page in api.iter_product_info_stocks(ProductInfoStocksRequest(limit=1), pages=True)]
+
+        assert [page["items"][0]["product_id"] for page in pages] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_iter_product_info_prices(self, api, mock_api_request):
+        """Тест пагинации по cursor для цен."""
+        serve_pages(mock_api_request, {
+            "": {"items": [{"product_id": 1}], "cursor": "next", "total": 2},
+            "next": {"items": [{"product_id": 2}], "cursor": "end", "total": 2},
+            "end": {"items": [], "cursor": "", "total": 2},
+        })
+
+        items = [item async for item in api.iter_product_info_prices(ProductInfoPricesRequest(limit=1))]
+
+        assert [item["product_id"] for item in items] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_iter_product_info_attributes(self, api, mock_api_request):
+        """Тест пагинации по last_id для характеристик товаров."""
+        serve_pages(mock_api_request, {
+            "": {"result": [{"id": 1}], "last_id": "a", "total": 2},
+            "a": {"result": [{"id": 2}], "last_id": "", "total": 2},
+        })
+
+        items = [item async for item in api.iter_product_info_attributes(ProductInfoAttributesRequest(limit=1))]
+
+        assert [item["id"] for item in items] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_iter_description_category_attribute_values(self, api, mock_api_request):
+        """Тест пагинации по last_value_id."""
+        serve_pages(mock_api_request, {
+            0: {"result": [{"id": 10}, {"id": 11}], "has_next": True},
+            11: {"result": [{"id": 12}], "has_next": False},
+        })
+
+        items = [item async for item in api.iter_description_category_attribute_values(
+            DescriptionCategoryAttributeValuesRequest(
+                attribute_id=85, description_category_id=1, type_id=2, limit=2
+            )
+        )]
+
+        assert [item["id"] for item in items] == [10, 11, 12]
+
+    @pytest.mark.asyncio
+    async def test_iter_posting_fbs_list(self, api, mock_api_request):
+        """Тест пагинации по offset и has_next."""
+        serve_pages(mock_api_request, {
+            0: {"result": {"postings": [{"posting_number": "1"}, {"posting_number": "2"}], "has_next": True}},
+            2: {"result": {"postings": [{"posting_number": "3"}], "has_next": False}},
+        })
+
+        items = [item async for item in api.iter_posting_fbs_list(
+            PostingFBSListRequest(filter=PostingFBSListFilter(since=SINCE, to_=NOW), limit=2)
+        )]
+
+        assert [item["posting_number"] for item in items] == ["1", "2", "3"]
+
+    @pytest.mark.asyncio
+    async def test_iter_posting_fbs_unfulfilled_list(self, api, mock_api_request):
+        """Тест пагинации по offset и общему количеству."""
+        serve_pages(mock_api_request, {
+            0: {"result": {"postings": [{"posting_number": "1"}, {"posting_number": "2"}], "count": 3}},
+            2: {"result": {"postings": [{"posting_number": "3"}], "count": 3}},
+        })
+
+        items = [item async for item in api.iter_posting_fbs_unfulfilled_list(
+            PostingFBSUnfulfilledListRequest(
+                filter=PostingFBSUnfulfilledListFilter(cutoff_from=SINCE, cutoff_to=NOW),
+                limit=2,
+            )
+        )]
+
+        assert [item["posting_number"] for item in items] == ["1", "2", "3"]
+        assert mock_api_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_iter_posting_fbo_list(self, api, mock_api_request):
+        """Тест пагинации по offset до неполной страницы."""
+        serve_pages(mock_api_request, {
+            0: {"result": [{"posting_number": "1"}, {"posting_number": "2"}]},
+            2: {"result": []},
+        })
+
+        items = [item async for item in api.iter_posting_fbo_list(PostingFBOListRequest(filter=PostingFilter(since=SINCE, to_=NOW), limit=2))]
+
+        assert [item["posting_number"] for item in items] == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_iter_delivery_method_list(self, api, mock_api_request):
+        """Тест пагинации методов доставки по offset и has_next."""
+        serve_pages(mock_api_request, {
+            0: {"result": [{"id": 1}], "has_next": True},
+            1: {"result": [{"id": 2}], "has_next": False},
+        })
+
+        items = [item async for item in api.iter_delivery_method_list(DeliveryMethodListRequest(limit=1))]
+
+        assert [item["id"] for item in items] == [1, 2]
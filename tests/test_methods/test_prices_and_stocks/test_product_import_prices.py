@@ -43,7 +43,7 @@ class TestProductImportPrices:
 
         # Тестируем создание схемы и валидацию
         from src.ozonapi.seller.schemas.prices_and_stocks.v1__product_import_prices import (
-            ProductImportPricesRequest, ProductImportPricesItem
+            ProductImportPricesRequest, ProductImportPricesItem, ProductImportPricesResponse
         )
 
         # Должен пройти валидацию
@@ -57,11 +57,11 @@ class TestProductImportPrices:
             method="post",
             api_version="v1",
             endpoint="product/import/prices",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductImportPricesResponse,
         )
 
         # Проверяем ответ
-        from src.ozonapi.seller.schemas.prices_and_stocks.v1__product_import_prices import ProductImportPricesResponse
         assert isinstance(response, ProductImportPricesResponse)
         assert len(response.result) == 1
         assert response.result[0].product_id == 1386
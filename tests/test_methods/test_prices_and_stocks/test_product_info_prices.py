@@ -23,7 +23,8 @@ class TestProductInfoPrices:
             method="post",
             api_version="v5",
             endpoint="product/info/prices",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductInfoPricesResponse,
         )
         assert isinstance(response, ProductInfoPricesResponse)
         assert response.cursor == "test_cursor"
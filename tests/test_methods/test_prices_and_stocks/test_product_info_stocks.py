@@ -23,7 +23,8 @@ class TestProductInfoStocks:
             method="post",
             api_version="v4",
             endpoint="product/info/stocks",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductInfoStocksResponse,
         )
         assert isinstance(response, ProductInfoStocksResponse)
         assert response.cursor == "test_cursor"
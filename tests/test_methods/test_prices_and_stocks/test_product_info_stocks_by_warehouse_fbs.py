@@ -24,7 +24,8 @@ class TestProductInfoStocksByWarehouseFBS:
             method="post",
             api_version="v1",
             endpoint="product/info/stocks-by-warehouse/fbs",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductInfoStocksByWarehouseFBSResponse,
         )
         assert isinstance(response, ProductInfoStocksByWarehouseFBSResponse)
         assert response.result == []
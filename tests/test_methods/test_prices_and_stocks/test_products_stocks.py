@@ -22,7 +22,7 @@ class TestProductsStocks:
 
         # Должен пройти валидацию
         from src.ozonapi.seller.schemas.prices_and_stocks.v2__products_stocks import (
-            ProductsStocksRequest, ProductsStocksItem
+            ProductsStocksRequest, ProductsStocksItem, ProductsStocksResponse
         )
 
         request = ProductsStocksRequest(
@@ -44,11 +44,11 @@ class TestProductsStocks:
             method="post",
             api_version="v2",
             endpoint="products/stocks",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductsStocksResponse,
         )
 
         # Проверяем ответ
-        from src.ozonapi.seller.schemas.prices_and_stocks.v2__products_stocks import ProductsStocksResponse
         assert isinstance(response, ProductsStocksResponse)
         assert len(response.result) == 1
         assert response.result[0].warehouse_id == 22142605386000
@@ -23,7 +23,8 @@ class TestProductArchive:
             method="post",
             api_version="v1",
             endpoint="product/archive",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductArchiveResponse,
         )
         assert isinstance(response, ProductArchiveResponse)
         assert response.result is True
@@ -23,7 +23,8 @@ class TestProductAttributesUpdate:
             method="post",
             api_version="v1",
             endpoint="product/attributes/update",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductAttributesUpdateResponse,
         )
         assert isinstance(response, ProductAttributesUpdateResponse)
         assert response.task_id == 123456789
@@ -25,7 +25,8 @@ class TestProductImport:
             method="post",
             api_version="v3",
             endpoint="product/import",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductImportResponse,
         )
         assert isinstance(response, ProductImportResponse)
         assert response.result.task_id == 123456789
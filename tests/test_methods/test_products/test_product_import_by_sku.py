@@ -24,7 +24,8 @@ class TestProductImportBySku:
             method="post",
             api_version="v1",
             endpoint="product/import-by-sku",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductImportBySkuResponse,
         )
         assert isinstance(response, ProductImportBySkuResponse)
         assert response.task_id == 123456789
@@ -26,7 +26,8 @@ class TestProductImportInfo:
             method="post",
             api_version="v1",
             endpoint="product/import/info",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductImportInfoResponse,
         )
         assert isinstance(response, ProductImportInfoResponse)
         assert response.result.total == 0
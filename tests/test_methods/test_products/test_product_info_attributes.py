@@ -23,7 +23,8 @@ class TestProductInfoAttributes:
             method="post",
             api_version="v4",
             endpoint="product/info/attributes",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductInfoAttributesResponse,
         )
         assert isinstance(response, ProductInfoAttributesResponse)
         assert response.total == 0
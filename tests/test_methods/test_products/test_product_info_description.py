@@ -28,7 +28,8 @@ class TestProductInfoDescription:
             method="post",
             api_version="v1",
             endpoint="product/info/description",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductInfoDescriptionResponse,
         )
         assert isinstance(response, ProductInfoDescriptionResponse)
         assert response.result.id == 12345678
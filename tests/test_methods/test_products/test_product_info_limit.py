@@ -33,7 +33,8 @@ class TestProductInfoLimit:
             method="post",
             api_version="v4",
             endpoint="product/info/limit",
-            payload={}
+            payload={},
+            response_model=ProductInfoLimitResponse,
         )
         assert isinstance(response, ProductInfoLimitResponse)
         assert response.daily_create.limit == 1000
@@ -23,7 +23,8 @@ class TestProductInfoList:
             method="post",
             api_version="v3",
             endpoint="product/info/list",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductInfoListResponse,
         )
         assert isinstance(response, ProductInfoListResponse)
         assert response.items == []
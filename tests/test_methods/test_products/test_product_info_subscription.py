@@ -23,7 +23,8 @@ class TestProductInfoSubscription:
             method="post",
             api_version="v1",
             endpoint="product/info/subscription",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductInfoSubscriptionResponse,
         )
         assert isinstance(response, ProductInfoSubscriptionResponse)
         assert response.result == []
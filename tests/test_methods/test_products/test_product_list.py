@@ -25,7 +25,8 @@ class TestProductList:
             method="post",
             api_version="v3",
             endpoint="product/list",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductListResponse,
         )
         assert isinstance(response, ProductListResponse)
         assert response.result.total == 0
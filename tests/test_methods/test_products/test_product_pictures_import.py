@@ -50,7 +50,8 @@ class TestProductPicturesImport:
             method="post",
             api_version="v1",
             endpoint="product/pictures/import",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductPicturesImportResponse,
         )
         assert isinstance(response, ProductPicturesImportResponse)
         assert len(response.result.pictures) == 2
@@ -23,7 +23,8 @@ class TestProductPicturesInfo:
             method="post",
             api_version="v2",
             endpoint="product/pictures/info",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductPicturesInfoResponse,
         )
         assert isinstance(response, ProductPicturesInfoResponse)
         assert response.items == []
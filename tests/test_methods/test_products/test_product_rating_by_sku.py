@@ -23,7 +23,8 @@ class TestProductRatingBySku:
             method="post",
             api_version="v1",
             endpoint="product/rating-by-sku",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductRatingBySkuResponse,
         )
         assert isinstance(response, ProductRatingBySkuResponse)
         assert response.products == []
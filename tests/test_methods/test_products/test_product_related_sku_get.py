@@ -24,7 +24,8 @@ class TestProductRelatedSkuGet:
             method="post",
             api_version="v1",
             endpoint="product/related-sku/get",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductRelatedSkuGetResponse,
         )
         assert isinstance(response, ProductRelatedSkuGetResponse)
         assert response.items == []
@@ -23,7 +23,8 @@ class TestProductUnarchive:
             method="post",
             api_version="v1",
             endpoint="product/unarchive",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductUnarchiveResponse,
         )
         assert isinstance(response, ProductUnarchiveResponse)
         assert response.result is True
@@ -23,7 +23,8 @@ class TestProductUpdateOfferId:
             method="post",
             api_version="v1",
             endpoint="product/update/offer-id",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductUpdateOfferIdResponse,
         )
         assert isinstance(response, ProductUpdateOfferIdResponse)
         assert response.errors == []
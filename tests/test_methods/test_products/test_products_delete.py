@@ -23,7 +23,8 @@ class TestProductDelete:
             method="post",
             api_version="v2",
             endpoint="products/delete",
-            payload=request.model_dump()
+            payload=request.model_dump(),
+            response_model=ProductsDeleteResponse,
         )
         assert isinstance(response, ProductsDeleteResponse)
         assert response.status == []
@@ -0,0 +1,72 @@
+"""Тесты кеширования ответов справочных методов API."""
+import gc
+import weakref
+
+import pytest
+
+from src.ozonapi.seller import SellerAPI
+
+
+class TestCachedMethods:
+    """Тесты методов с декоратором cache_response."""
+
+    @pytest.mark.asyncio
+    async def test_new_instance_uses_cache(self, api, mock_api_request):
+        """Тест выдачи закешированного ответа новому экземпляру с тем же client_id без удержания экземпляров."""
+        mock_api_request.return_value = {"result": []}
+        await api.warehouse_list()
+
+        other = SellerAPI(client_id="test_client", api_key="test_api_key")
+        reference = weakref.ref(other)
+        await other.warehouse_list()
+        del other
+        gc.collect()
+
+        assert mock_api_request.call_count == 1
+        assert reference() is None
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_by_client_and_request(self, api, mock_api_request):
+        """Тест раздельного кеширования ответов разных client_id и запросов."""
+        mock_api_request.return_value = {"result": [], "has_next": False}
+        other = SellerAPI(client_id="other_client", api_key="test_api_key")
+
+        await api.warehouse_list()
+        await other.warehouse_list()
+        await api.delivery_method_list()
+
+        assert mock_api_request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self, api, mock_api_request):
+        """Тест повторного запроса после удаления ответа из кеша."""
+        mock_api_request.return_value = {"result": []}
+        await api.warehouse_list()
+
+        assert SellerAPI.invalidate_response_cache("test_client", "warehouse_list") == 1
+        await api.warehouse_list()
+
+        assert mock_api_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_can_be_disabled(self, api, mock_api_request):
+        """Тест отключения кеширования в конфигурации."""
+        mock_api_request.return_value = {"result": []}
+        api._config = api._config.model_copy(update={"response_cache": False})
+
+        await api.warehouse_list()
+        await api.warehouse_list()
+
+        assert mock_api_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bypass(self, api, mock_api_request):
+        """Тест запросов без кеша в блоке bypass_response_cache()."""
+        mock_api_request.return_value = {"result": []}
+        await api.warehouse_list()
+
+        with api.bypass_response_cache():
+            await api.warehouse_list()
+        await api.warehouse_list()
+
+        assert mock_api_request.call_count == 2
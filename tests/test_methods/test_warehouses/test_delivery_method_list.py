@@ -51,6 +51,7 @@ class TestDeliveryMethodList:
             api_version="v1",
             endpoint="delivery-method/list",
             payload=request.model_dump(),
+            response_model=DeliveryMethodListResponse,
         )
         assert isinstance(response, DeliveryMethodListResponse)
         assert len(response.result) == 1
@@ -101,6 +102,7 @@ class TestDeliveryMethodList:
             api_version="v1",
             endpoint="delivery-method/list",
             payload=request.model_dump(),
+            response_model=DeliveryMethodListResponse,
         )
         assert isinstance(response, DeliveryMethodListResponse)
         assert len(response.result) == 1
@@ -48,7 +48,8 @@ class TestWarehouseList:
             method="post",
             api_version="v1",
             endpoint="warehouse/list",
-            payload={'limit': 200, 'offset': 0}
+            payload={'limit': 200, 'offset': 0},
+            response_model=WarehouseListResponse,
         )
         assert isinstance(response, WarehouseListResponse)
         assert len(response.result) == 1
@@ -0,0 +1,94 @@
+import importlib
+import pathlib
+import subprocess
+import sys
+
+SRC_DIR = pathlib.Path(__file__).resolve().parents[2] / "src"
+
+# Предельное суммарное время импорта модулей библиотеки (без зависимостей) в секундах.
+# Заведомо больше обычного, чтобы тест не зависел от загрузки машины
+IMPORT_BUDGET = 1.5
+
+
+def import_profile(statement: str) -> dict[str, int]:
+    """Выполняет импорт в отдельном процессе с `-X importtime`.
+
+    Returns:
+        Собственное время импорта каждого модуля в микросекундах
+    """
+    code = f"import sys; sys.path.insert(0, {str(SRC_DIR)!r}); {statement}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_time, _, name = line[len("import time:"):].split("|")
+        if self_time.strip().isdigit():
+            profile[name.strip()] = int(self_time)
+    return profile
+
+
+def own_modules(profile: dict[str, int]) -> dict[str, int]:
+    return {name: time for name, time in profile.items() if name.split(".")[0] == "ozonapi"}
+
+
+class TestImportTime:
+    """Тесты отложенного импорта модулей библиотеки."""
+
+    def test_import_package(self):
+        """Проверяет, что `import ozonapi` не загружает методы API и схемы."""
+        modules = own_modules(import_profile("import ozonapi"))
+
+        assert "ozonapi" in modules
+        loaded = [name for name in modules if name.startswith(("ozonapi.seller.methods", "ozonapi.seller.schemas"))]
+        assert loaded == []
+        assert sum(modules.values()) / 1e6 < IMPORT_BUDGET
+
+    def test_import_schema(self):
+        """Проверяет, что импорт схемы загружает только ее модуль, а не весь раздел."""
+        modules = own_modules(import_profile(
+            "from ozonapi.seller.schemas.prices_and_stocks import ProductInfoStocksResponse"
+        ))
+
+        assert "ozonapi.seller.schemas.prices_and_stocks.v4__product_info_stocks" in modules
+        assert "ozonapi.seller.schemas.prices_and_stocks.v5__product_info_prices" not in modules
+        assert not any(name.startswith("ozonapi.seller.schemas.products.") for name in modules)
+        assert not any(name.startswith("ozonapi.seller.methods") for name in modules)
+
+    def test_import_seller_api(self):
+        """Проверяет время импорта SellerAPI и отложенное построение схем pydantic."""
+        modules = own_modules(import_profile("from ozonapi import SellerAPI"))
+
+        assert "ozonapi.seller.api" in modules
+        assert sum(modules.values()) / 1e6 < IMPORT_BUDGET
+
+        code = (
+            f"import sys; sys.path.insert(0, {str(SRC_DIR)!r}); "
+            "from ozonapi import SellerAPI; "
+            "from ozonapi.seller.common.schema import BaseModel; "
+            "models = []; "
+            "collect = lambda cls: [models.append(sub) or collect(sub) for sub in cls.__subclasses__()]; "
+            "collect(BaseModel); "
+            "print(len(models), sum(model.__pydantic_complete__ for model in models))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        total, built = map(int, result.stdout.split())
+        # Схемы строятся при первом использовании. При импорте строятся только схемы
+        # значений по умолчанию запросов, создаваемых в сигнатурах методов
+        assert total > 200
+        assert built <= 10
+
+    def test_lazy_exports(self):
+        """Проверяет, что все имена пакетов с отложенным импортом доступны."""
+        packages = ["src.ozonapi", "src.ozonapi.seller", "src.ozonapi.seller.methods", "src.ozonapi.seller.schemas"]
+        packages += [
+            "src.ozonapi.seller." + str(path.parent.relative_to(SRC_DIR / "ozonapi" / "seller")).replace("/", ".")
+            for path in (SRC_DIR / "ozonapi" / "seller" / "schemas").rglob("__init__.py")
+        ]
+        for name in packages:
+            package = importlib.import_module(name)
+            for export in package.__all__:
+                assert getattr(package, export) is not None, f"{name}.{export}"
+                assert export in dir(package)
@@ -0,0 +1,334 @@
+"""Тесты симулятора Seller API."""
+import asyncio
+import datetime
+import json
+import pathlib
+import random
+import re
+import time
+
+import aiohttp
+import pytest
+from pydantic import ValidationError
+
+from src.ozonapi.seller import SellerAPI
+from src.ozonapi.seller import schemas
+from src.ozonapi.seller.core import APIManager
+from src.ozonapi.seller.schemas.attributes_and_characteristics import DescriptionCategoryAttributeValuesRequest
+from src.ozonapi.seller.schemas.fbs import (
+    PostingFBSListFilter,
+    PostingFBSListRequest,
+    PostingFBSPackageLabelCreateRequest,
+    PostingFBSPackageLabelGetRequest,
+)
+from src.ozonapi.seller.schemas.prices_and_stocks import ProductInfoStocksRequest
+from src.ozonapi.seller.schemas.products import (
+    ProductImportInfoRequest,
+    ProductImportItem,
+    ProductImportRequest,
+    ProductInfoListRequest,
+    ProductListRequest,
+)
+from src.ozonapi.seller.simulator import (
+    ENDPOINTS,
+    PROFILES,
+    FaultProfile,
+    LatencyProfile,
+    OzonSimulator,
+    RateLimit,
+    SimulatorProfile,
+)
+
+METHODS_DIR = pathlib.Path(__file__).resolve().parents[2] / "src" / "ozonapi" / "seller" / "methods"
+HEADERS = {"Client-Id": "123456", "Api-Key": "test_api_key"}
+
+
+@pytest.fixture
+async def api_factory():
+    """Создает клиентов, направляющих запросы в симулятор."""
+    original_session_manager = APIManager._session_manager
+    original_initialized = APIManager._initialized
+    APIManager._session_manager = None
+    APIManager._initialized = False
+
+    def create(simulator: OzonSimulator, client_id: str = "123456", **config) -> SellerAPI:
+        api = SellerAPI(client_id=client_id, api_key="test_api_key")
+        api._config = api._config.model_copy(update={
+            "base_url": simulator.url,
+            "max_retries": 0,
+            "retry_min_wait": 0,
+            "retry_max_wait": 0,
+            "adaptive_rate_limit": False,
+            "response_cache": False,
+            "coalesce_requests": False,
+            **config,
+        })
+        return api
+
+    yield create
+    if APIManager._session_manager is not None:
+        await APIManager._session_manager.close_all()
+    APIManager._session_manager = original_session_manager
+    APIManager._initialized = original_initialized
+
+
+async def post(simulator: OzonSimulator, path: str, payload: dict, headers: dict = HEADERS) -> tuple[int, dict]:
+    async with aiohttp.ClientSession(headers=headers) as session:
+        async with session.post(simulator.url + path, json=payload) as response:
+            return response.status, await response.json()
+
+
+class TestSimulatorEndpoints:
+    """Тесты покрытия и ответов конечных точек."""
+
+    def test_covers_seller_api(self):
+        """Тест обслуживания всех конечных точек, которые вызывает SellerAPI."""
+        called = set()
+        for path in METHODS_DIR.rglob("*.py"):
+            source = path.read_text(encoding="utf-8")
+            for version, endpoint in re.findall(r'api_version="(v\d+)",\s*endpoint="([^"]+)"', source):
+                called.add(f"/{version}/{endpoint}")
+
+        assert called
+        assert called == set(ENDPOINTS)
+
+    @pytest.mark.asyncio
+    async def test_responses_match_schemas(self):
+        """Тест соответствия ответов всех конечных точек схемам ответов."""
+        async with OzonSimulator(SimulatorProfile(client_limit=None)) as simulator:
+            payloads = {
+                "/v3/product/import": {"items": [{"offer_id": "OFFER-1"}]},
+                "/v2/posting/fbs/package-label/create": {"posting_number": ["10000001-0001-1"]},
+            }
+            for path, endpoint in ENDPOINTS.items():
+                status, data = await post(simulator, path, payloads.get(path, {}))
+                if path in ("/v1/product/import/info", "/v1/posting/fbs/package-label/get"):
+                    assert status == 404
+                    continue
+                assert status == 200, path
+                getattr(schemas, endpoint.schema).model_validate(data["result"] if endpoint.wrap else data)
+
+    @pytest.mark.asyncio
+    async def test_unauthorized(self):
+        """Тест ответа 401 на запрос без заголовков авторизации."""
+        async with OzonSimulator() as simulator:
+            status, data = await post(simulator, "/v4/product/info/limit", {}, headers={})
+            assert status == 401
+            assert simulator.get_stats()["unauthorized"] == 1
+
+            status, _ = await post(simulator, "/v4/product/info/limit", {}, headers={"Authorization": "Bearer token"})
+            assert status == 200
+
+
+class TestSimulatorPagination:
+    """Тесты постраничной выборки синтетических наборов через SellerAPI."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_and_last_id(self, api_factory):
+        """Тест пагинации по cursor и last_id по всему каталогу."""
+        async with OzonSimulator(SimulatorProfile(client_limit=None, catalog_size=2500)) as simulator:
+            api = api_factory(simulator)
+            stocks = [item async for item in api.iter_product_info_stocks(ProductInfoStocksRequest(limit=1000))]
+            products = [item async for item in api.iter_product_list(ProductListRequest(limit=1000))]
+
+            assert len({item.product_id for item in stocks}) == 2500
+            assert [item.offer_id for item in products] == [f"OFFER-{i}" for i in range(2500)]
+            assert simulator.get_stats()["endpoints"]["/v4/product/info/stocks"]["requests"] == 3
+
+    @pytest.mark.asyncio
+    async def test_offset_and_last_value_id(self, api_factory):
+        """Тест пагинации по offset и last_value_id."""
+        profile = SimulatorProfile(client_limit=None, postings_count=1200, attribute_values_count=4500)
+        async with OzonSimulator(profile) as simulator:
+            api = api_factory(simulator)
+            now = datetime.datetime.now(datetime.timezone.utc)
+            request = PostingFBSListRequest(
+                filter=PostingFBSListFilter(since=now - datetime.timedelta(days=7), to_=now), limit=500,
+            )
+            postings = [item async for item in api.iter_posting_fbs_list(request)]
+            values = [item async for item in api.iter_description_category_attribute_values(
+                DescriptionCategoryAttributeValuesRequest(
+                    attribute_id=85, description_category_id=1, type_id=1, limit=2000,
+                )
+            )]
+
+            assert len({posting.posting_number for posting in postings}) == 1200
+            assert [value.id for value in values] == list(range(1, 4501))
+
+    @pytest.mark.asyncio
+    async def test_filter_by_products(self, api_factory):
+        """Тест выборки товаров каталога по идентификаторам из запроса."""
+        async with OzonSimulator(SimulatorProfile(client_limit=None, catalog_size=100)) as simulator:
+            api = api_factory(simulator)
+            response = await api.product_info_list(ProductInfoListRequest(offer_id=["OFFER-5", "OFFER-7", "UNKNOWN"]))
+
+            assert [item.offer_id for item in response.items] == ["OFFER-5", "OFFER-7"]
+            assert [item.id for item in response.items] == [100000005, 100000007]
+
+
+class TestSimulatorTasks:
+    """Тесты асинхронных заданий."""
+
+    @pytest.mark.asyncio
+    async def test_product_import(self, api_factory):
+        """Тест загрузки товаров: задание в очереди до истечения времени выполнения."""
+        async with OzonSimulator(SimulatorProfile(client_limit=None, task_duration=0.2)) as simulator:
+            api = api_factory(simulator)
+            item = ProductImportItem(
+                offer_id="NEW-1", name="Товар", description_category_id=1, new_description_category_id=None,
+                type_id=1, depth=1, height=1, width=1, dimension_unit="mm", weight=1, weight_unit="g",
+                price="100", vat="0",
+            )
+            task = await api.product_import(ProductImportRequest(items=[item]))
+
+            info = await api.product_import_info(ProductImportInfoRequest(task_id=task.result.task_id))
+            assert info.result.items[0].status == "pending"
+
+            await asyncio.sleep(0.25)
+            info = await api.product_import_info(ProductImportInfoRequest(task_id=task.result.task_id))
+            assert info.result.total == 1
+            assert info.result.items[0].status == "imported"
+            assert info.result.items[0].offer_id == "NEW-1"
+            assert info.result.items[0].product_id > 0
+
+    @pytest.mark.asyncio
+    async def test_package_label(self, api_factory):
+        """Тест формирования этикеток: задание выполняется и возвращает ссылку на файл."""
+        async with OzonSimulator(SimulatorProfile(client_limit=None, task_duration=0.2)) as simulator:
+            api = api_factory(simulator)
+            created = await api.posting_fbs_package_label_create(
+                PostingFBSPackageLabelCreateRequest(posting_number=["10000001-0001-1", "10000002-0001-1"])
+            )
+            task_id = created.result.tasks[0].task_id
+
+            label = await api.posting_fbs_package_label_get(PostingFBSPackageLabelGetRequest(task_id=task_id))
+            assert label.result.status == "pending"
+
+            await asyncio.sleep(0.25)
+            label = await api.posting_fbs_package_label_get(PostingFBSPackageLabelGetRequest(task_id=task_id))
+            assert label.result.status == "completed"
+            assert label.result.printed_postings_count == 2
+            async with aiohttp.ClientSession() as session:
+                async with session.get(label.result.file_url) as response:
+                    assert (await response.read()).startswith(b"%PDF")
+
+    @pytest.mark.asyncio
+    async def test_completed_tasks_evicted(self):
+        """Тест удаления выполненных заданий по истечении времени хранения."""
+        profile = SimulatorProfile(client_limit=None, task_duration=0, task_retention=0.05)
+        async with OzonSimulator(profile) as simulator:
+            payload = {"posting_number": ["10000001-0001-1"]}
+            for _ in range(5):
+                await post(simulator, "/v2/posting/fbs/package-label/create", payload)
+            assert len(simulator._tasks) == 10
+
+            await asyncio.sleep(0.1)
+            status, body = await post(simulator, "/v2/posting/fbs/package-label/create", payload)
+            assert status == 200
+            assert list(simulator._tasks) == [task["task_id"] for task in body["result"]["tasks"]]
+
+            status, _ = await post(simulator, "/v1/posting/fbs/package-label/get", {"task_id": 1})
+            assert status == 404
+
+
+class TestSimulatorLimitsAndFaults:
+    """Тесты лимитов запросов, задержек и сбоев."""
+
+    @pytest.mark.asyncio
+    async def test_client_limit(self):
+        """Тест ответов 429 при превышении лимита клиента, лимиты клиентов независимы."""
+        profile = SimulatorProfile(client_limit=RateLimit(requests=5), retry_after=0.5)
+        async with OzonSimulator(profile) as simulator:
+            async with aiohttp.ClientSession(headers=HEADERS) as session:
+                async def request(headers=None):
+                    async with session.post(simulator.url + "/v4/product/info/limit", json={}, headers=headers) as response:
+                        return response.status, response.headers.get("Retry-After")
+
+                results = await asyncio.gather(*(request() for _ in range(8)))
+                other = await request({"Client-Id": "other", "Api-Key": "key"})
+
+            assert sorted(status for status, _ in results) == [200] * 5 + [429] * 3
+            assert {retry_after for status, retry_after in results if status == 429} == {"0.5"}
+            assert other[0] == 200
+            assert simulator.get_stats()["throttled"] == 3
+
+    @pytest.mark.asyncio
+    async def test_endpoint_limit_with_client_retries(self, api_factory):
+        """Тест лимита конечной точки: клиент с повторами получает все ответы."""
+        profile = SimulatorProfile(
+            client_limit=None,
+            endpoint_limits={"/v4/product/info/limit": RateLimit(requests=2, period=0.2)},
+            retry_after=0.2,
+        )
+        async with OzonSimulator(profile) as simulator:
+            api = api_factory(simulator, max_retries=5, retry_min_wait=0.05, retry_max_wait=0.2)
+            responses = await asyncio.gather(*(api.product_info_limit() for _ in range(6)))
+
+            stats = simulator.get_stats()["endpoints"]["/v4/product/info/limit"]
+            assert len(responses) == 6
+            assert stats["ok"] == 6
+            assert stats["throttled"] > 0
+
+    @pytest.mark.asyncio
+    async def test_fault_burst(self, api_factory):
+        """Тест серии сбоев: все запросы во время серии получают 5xx, клиент повторяет запрос после нее."""
+        profile = SimulatorProfile(client_limit=None, faults=FaultProfile(burst_rate=1.0, burst_duration=0.3), seed=1)
+        async with OzonSimulator(profile) as simulator:
+            status, _ = await post(simulator, "/v4/product/info/limit", {})
+            simulator.profile.faults.burst_rate = 0.0
+            statuses = [(await post(simulator, "/v4/product/info/limit", {}))[0] for _ in range(3)]
+
+            assert status in (500, 502, 503)
+            assert all(status >= 500 for status in statuses)
+
+            api = api_factory(simulator, max_retries=5, retry_min_wait=0.1, retry_max_wait=0.2)
+            await api.product_info_limit()
+            stats = simulator.get_stats()["endpoints"]["/v4/product/info/limit"]
+            assert stats["ok"] == 1
+            assert stats["errors"] >= 4
+
+    @pytest.mark.asyncio
+    async def test_latency(self):
+        """Тест задержки ответов по профилю конечной точки."""
+        profile = SimulatorProfile(
+            client_limit=None, endpoint_latency={"/v4/product/info/limit": LatencyProfile(mean=0.1)},
+        )
+        async with OzonSimulator(profile) as simulator:
+            started = time.perf_counter()
+            await post(simulator, "/v4/product/info/limit", {})
+            slow = time.perf_counter() - started
+            started = time.perf_counter()
+            await post(simulator, "/v1/warehouse/list", {})
+            fast = time.perf_counter() - started
+
+            assert slow >= 0.1
+            assert fast < 0.1
+
+
+class TestSimulatorProfile:
+    """Тесты профилей симулятора."""
+
+    def test_latency_distributions(self):
+        """Тест среднего значения и границ задержки для распределений профиля."""
+        rng = random.Random(1)
+        for distribution in ("fixed", "uniform", "normal", "lognormal", "exponential"):
+            latency = LatencyProfile(distribution=distribution, mean=0.1, stddev=0.03, maximum=1.0)
+            samples = [latency.sample(rng) for _ in range(5000)]
+            assert all(0 <= sample <= 1.0 for sample in samples)
+            assert sum(samples) / len(samples) == pytest.approx(0.1, rel=0.1)
+
+    def test_load(self, tmp_path):
+        """Тест загрузки готового профиля и профиля из JSON-файла."""
+        assert SimulatorProfile.load("production") == PROFILES["production"]
+        assert SimulatorProfile.load("production") is not PROFILES["production"]
+
+        path = tmp_path / "profile.json"
+        path.write_text(json.dumps({"client_limit": {"requests": 10}, "faults": {"error_rate": 0.5}}))
+        profile = SimulatorProfile.load(str(path))
+        assert profile.client_limit.requests == 10
+        assert profile.faults.error_rate == 0.5
+
+    def test_unknown_endpoint(self):
+        """Тест ошибки при лимите для конечной точки, которую не обслуживает симулятор."""
+        with pytest.raises(ValidationError):
+            SimulatorProfile(endpoint_limits={"/v1/unknown": RateLimit(requests=1)})